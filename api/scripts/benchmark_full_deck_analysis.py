@@ -0,0 +1,108 @@
+"""Profile analysis of a protocol that touches every well on a full Flex deck.
+
+The protocol fills every free deck slot with a 96-well plate, a tip rack, or a
+module with a plate on it, and then has a single-channel pipette aspirate from
+and dispense into every well of every plate. Most of the analysis time goes to
+the motion planning for those moves.
+
+Run from the api directory:
+`pipenv run python scripts/benchmark_full_deck_analysis.py --repeat 3 --profile`
+"""
+
+import argparse
+import asyncio
+import cProfile
+import pstats
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from opentrons.protocol_reader import ProtocolReader
+from opentrons.protocol_runner.create_simulating_orchestrator import (
+    create_simulating_orchestrator,
+)
+from opentrons.protocol_runner.run_orchestrator import ParseMode
+
+
+_PROTOCOL = """
+requirements = {"robotType": "Flex", "apiLevel": "2.23"}
+
+def run(ctx):
+    ctx.load_trash_bin("A3")
+    tip_racks = [
+        ctx.load_labware("opentrons_flex_96_tiprack_50ul", slot)
+        for slot in ("C2", "B2")
+    ]
+    heater_shaker = ctx.load_module("heaterShakerModuleV1", "D1")
+    heater_shaker.close_labware_latch()
+    adapter = heater_shaker.load_adapter("opentrons_96_pcr_adapter")
+    temperature_module = ctx.load_module("temperature module gen2", "C1")
+    plates = [
+        adapter.load_labware("nest_96_wellplate_100ul_pcr_full_skirt"),
+        temperature_module.load_labware("nest_96_wellplate_100ul_pcr_full_skirt"),
+    ] + [
+        ctx.load_labware("nest_96_wellplate_100ul_pcr_full_skirt", slot)
+        for slot in ("A1", "A2", "B1", "B3", "C3", "D2", "D3")
+    ]
+    pipette = ctx.load_instrument("flex_1channel_50", "left", tip_racks=tip_racks)
+
+    pipette.pick_up_tip()
+    for source, destination in zip(plates, plates[1:] + plates[:1]):
+        for source_well, destination_well in zip(source.wells(), destination.wells()):
+            pipette.aspirate(5, source_well)
+            pipette.dispense(5, destination_well.top())
+    pipette.drop_tip()
+"""
+
+
+async def _analyze(protocol_path: Path) -> float:
+    source = await ProtocolReader().read_saved(files=[protocol_path], directory=None)
+    orchestrator = await create_simulating_orchestrator(
+        robot_type=source.robot_type, protocol_config=source.config
+    )
+    await orchestrator.load(
+        protocol_source=source,
+        parse_mode=ParseMode.NORMAL,
+        run_time_param_values=None,
+        run_time_param_paths=None,
+    )
+    start = time.perf_counter()
+    result = await orchestrator.run(deck_configuration=[])
+    elapsed = time.perf_counter() - start
+    assert not result.state_summary.errors, result.state_summary.errors
+    return elapsed
+
+
+def main() -> None:  # noqa: D103
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="also profile one more analysis, and print the slowest functions",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        protocol_path = Path(directory) / "full_deck.py"
+        protocol_path.write_text(_PROTOCOL)
+
+        timings = [asyncio.run(_analyze(protocol_path)) for _ in range(args.repeat)]
+        print(
+            f"median of {args.repeat}: {statistics.median(timings):.3f} s,"
+            f" best {min(timings):.3f} s"
+        )
+
+        if args.profile:
+            profiler = cProfile.Profile()
+            profiler.enable()
+            asyncio.run(_analyze(protocol_path))
+            profiler.disable()
+            pstats.Stats(profiler).sort_stats("cumulative").print_stats(
+                "geometry.py", 25
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Measure how many heater-shaker status polls per second a driver can make.
+
+This runs the heater-shaker emulator on a local socket, connects a real
+`HeaterShakerDriver` to it, and polls the temperature, speed, and labware
+latch status in a loop, the same reads that the module poller makes. It polls
+once by awaiting each read before starting the next, and once with
+`HeaterShakerReader`, which starts the reads together so the connection can
+send them on one line.
+
+The emulator answers instantly, so ``--latency-ms`` adds a delay to every line
+it handles, standing in for the USB round trip and the firmware's handling.
+
+Run from the api directory:
+`pipenv run python scripts/benchmark_module_polling.py --seconds 5 --latency-ms 0 2`
+"""
+
+import argparse
+import asyncio
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from opentrons.drivers.heater_shaker.driver import HeaterShakerDriver
+from opentrons.hardware_control.emulation.connection_handler import ConnectionHandler
+from opentrons.hardware_control.emulation.heater_shaker import HeaterShakerEmulator
+from opentrons.hardware_control.emulation.parser import Parser
+from opentrons.hardware_control.emulation.settings import Settings
+from opentrons.hardware_control.modules.heater_shaker import HeaterShakerReader
+
+
+class _SlowHeaterShakerEmulator(HeaterShakerEmulator):
+    """A heater-shaker emulator that takes a while to answer each line."""
+
+    def __init__(self, latency_seconds: float) -> None:
+        super().__init__(parser=Parser(), settings=Settings().heatershaker)
+        self._latency_seconds = latency_seconds
+
+    def handle(self, line: str) -> Optional[str]:
+        time.sleep(self._latency_seconds)
+        return super().handle(line)
+
+
+def _start_emulator(latency_seconds: float) -> int:
+    """Serve an emulator from another thread, and return its port."""
+    started = threading.Event()
+    port = 0
+
+    def _handle_exception(
+        loop: asyncio.AbstractEventLoop, context: Dict[str, Any]
+    ) -> None:
+        # The emulator's connection handler fails when a driver disconnects.
+        if not isinstance(context.get("exception"), asyncio.IncompleteReadError):
+            loop.default_exception_handler(context)
+
+    async def _serve() -> None:
+        nonlocal port
+        asyncio.get_running_loop().set_exception_handler(_handle_exception)
+        server = await asyncio.start_server(
+            ConnectionHandler(_SlowHeaterShakerEmulator(latency_seconds)),
+            "127.0.0.1",
+            0,
+        )
+        port = server.sockets[0].getsockname()[1]
+        started.set()
+        await server.serve_forever()
+
+    threading.Thread(target=asyncio.run, args=(_serve(),), daemon=True).start()
+    started.wait()
+    return port
+
+
+async def _polls_per_second(port: int, seconds: float, concurrent: bool) -> float:
+    driver = await HeaterShakerDriver.create(
+        port=f"socket://127.0.0.1:{port}", loop=None
+    )
+    reader = HeaterShakerReader(driver=driver)
+    polls = 0
+    start = time.perf_counter()
+    try:
+        while time.perf_counter() - start < seconds:
+            if concurrent:
+                await reader.read()
+            else:
+                await reader.read_temperature()
+                await reader.read_rpm()
+                await reader.read_labware_latch()
+            polls += 1
+    finally:
+        await driver.disconnect()
+    return polls / (time.perf_counter() - start)
+
+
+def main() -> None:  # noqa: D103
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--latency-ms", type=float, nargs="+", default=[0.0, 2.0])
+    args = parser.parse_args()
+
+    print(f"{'latency (ms)':>12} {'one at a time':>14} {'together':>10}")
+    for latency_ms in args.latency_ms:
+        port = _start_emulator(latency_ms / 1000)
+        row = f"{latency_ms:>12.1f}"
+        for concurrent, width in ((False, 14), (True, 10)):
+            rate = asyncio.run(_polls_per_second(port, args.seconds, concurrent))
+            row += f" {rate:>{width}.1f}"
+        print(row + "  polls/s")
+
+
+if __name__ == "__main__":
+    main()
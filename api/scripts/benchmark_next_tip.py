@@ -0,0 +1,181 @@
+"""Measure `TipView.get_next_tip()` for every valid nozzle layout.
+
+For each nozzle layout of the Flex single-channel, 8-channel, and 96-channel
+pipettes, this loads several tip racks into a `TipStore` and then picks up
+tips with automatic tip tracking until every rack is used up, the same way
+`InstrumentContext.pick_up_tip()` does: it asks each rack in turn for its next
+tip, and picks up from the first rack that has one.
+
+Run from the api directory:
+`pipenv run python scripts/benchmark_next_tip.py --racks 10`
+"""
+
+import argparse
+import time
+from typing import List, Tuple
+
+from opentrons_shared_data.labware import load_definition
+from opentrons_shared_data.labware.labware_definition import (
+    labware_definition_type_adapter,
+)
+from opentrons_shared_data.pipette import load_data as load_pipette_data
+from opentrons_shared_data.pipette import (
+    pipette_load_name_conversions as pipette_load_name,
+)
+from opentrons_shared_data.pipette.types import (
+    PipetteModel,
+    PipetteNameType,
+    PipetteOEMType,
+)
+
+from opentrons.hardware_control.nozzle_manager import NozzleMap
+from opentrons.protocol_engine import commands
+from opentrons.protocol_engine.actions import SucceedCommandAction
+from opentrons.protocol_engine.resources.pipette_data_provider import (
+    VirtualPipetteDataProvider,
+)
+from opentrons.protocol_engine.state import update_types
+from opentrons.protocol_engine.state.tips import TipStore, TipView
+from opentrons.protocol_engine.types import DeckSlotLocation
+from opentrons.types import DeckSlotName
+
+
+_PIPETTE_ID = "pipette-id"
+_PIPETTES = [
+    PipetteNameType.P1000_SINGLE_FLEX,
+    PipetteNameType.P1000_MULTI_FLEX,
+    PipetteNameType.P1000_96,
+]
+_CORNERS = ["A1", "H1", "A12", "H12"]
+
+
+def _get_layouts(
+    provider: VirtualPipetteDataProvider, pipette_model: str
+) -> List[Tuple[str, NozzleMap]]:
+    """Get every valid nozzle layout, starting from each corner that it includes."""
+    model = pipette_load_name.convert_pipette_model(PipetteModel(pipette_model))
+    valid_nozzle_maps = load_pipette_data.load_valid_nozzle_maps(
+        model.pipette_type,
+        model.pipette_channels,
+        model.pipette_version,
+        PipetteOEMType.OT,
+    )
+    layouts = []
+    for map_name, nozzles in valid_nozzle_maps.maps.items():
+        corners = [nozzle for nozzle in _CORNERS if nozzle in nozzles]
+        for starting_nozzle in corners or nozzles[:1]:
+            provider.configure_virtual_pipette_nozzle_layout(
+                _PIPETTE_ID, pipette_model, nozzles[0], nozzles[-1], starting_nozzle
+            )
+            layouts.append(
+                (
+                    f"{map_name} from {starting_nozzle}",
+                    provider.get_nozzle_layout_for_pipette(_PIPETTE_ID),
+                )
+            )
+    return layouts
+
+
+def _succeed(store: TipStore, state_update: update_types.StateUpdate) -> None:
+    store.handle_action(
+        SucceedCommandAction(
+            command=commands.Comment.model_construct(),  # type: ignore[call-arg]
+            state_update=state_update,
+        )
+    )
+
+
+def _use_every_tip(
+    pipette_config: update_types.PipetteConfigUpdate,
+    nozzle_map: NozzleMap,
+    rack_count: int,
+) -> Tuple[int, float]:
+    """Pick up tips until the racks run out. Return the pickups and time spent."""
+    definition = labware_definition_type_adapter.validate_python(
+        load_definition("opentrons_flex_96_tiprack_1000ul", 1)
+    )
+    rack_ids = [f"tip-rack-{i}" for i in range(rack_count)]
+    store = TipStore()
+    for rack_id in rack_ids:
+        _succeed(
+            store,
+            update_types.StateUpdate(
+                loaded_labware=update_types.LoadedLabwareUpdate(
+                    labware_id=rack_id,
+                    definition=definition,
+                    new_location=DeckSlotLocation(slotName=DeckSlotName.SLOT_A1),
+                    display_name=None,
+                    offset_id=None,
+                )
+            ),
+        )
+    _succeed(store, update_types.StateUpdate(pipette_config=pipette_config))
+    _succeed(
+        store,
+        update_types.StateUpdate(
+            pipette_nozzle_map=update_types.PipetteNozzleMapUpdate(
+                pipette_id=_PIPETTE_ID, nozzle_map=nozzle_map
+            )
+        ),
+    )
+
+    # The engine keeps one view per store, so searches can resume between pickups.
+    view = TipView(store.state)
+    pickups = 0
+    elapsed = 0.0
+    while True:
+        start = time.perf_counter()
+        for rack_id in rack_ids:
+            well_name = view.get_next_tip(
+                labware_id=rack_id,
+                num_tips=nozzle_map.tip_count,
+                starting_tip_name=None,
+                nozzle_map=nozzle_map,
+            )
+            if well_name is not None:
+                break
+        elapsed += time.perf_counter() - start
+        if well_name is None:
+            return pickups, elapsed
+        _succeed(
+            store,
+            update_types.StateUpdate(
+                tips_used=update_types.TipsUsedUpdate(
+                    pipette_id=_PIPETTE_ID, labware_id=rack_id, well_name=well_name
+                )
+            ),
+        )
+        pickups += 1
+
+
+def main() -> None:  # noqa: D103
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--racks", type=int, default=10)
+    args = parser.parse_args()
+
+    total_pickups = 0
+    total_elapsed = 0.0
+    for pipette_name in _PIPETTES:
+        provider = VirtualPipetteDataProvider()
+        config = provider.get_virtual_pipette_static_config(
+            pipette_name.value, _PIPETTE_ID, "v3"
+        )
+        pipette_config = update_types.PipetteConfigUpdate(
+            pipette_id=_PIPETTE_ID, serial_number="pipette-serial", config=config
+        )
+        for layout_name, nozzle_map in _get_layouts(provider, config.model):
+            pickups, elapsed = _use_every_tip(pipette_config, nozzle_map, args.racks)
+            total_pickups += pickups
+            total_elapsed += elapsed
+            print(
+                f"{pipette_name.value:>17} {layout_name:>20}: {pickups:>5} pickups,"
+                f" {elapsed / max(pickups, 1) * 1e6:8.1f} µs per pickup"
+            )
+    print(
+        f"{'all layouts':>38}: {total_pickups:>5} pickups,"
+        f" {total_elapsed / total_pickups * 1e6:8.1f} µs per pickup"
+    )
+
+
+if __name__ == "__main__":
+    main()
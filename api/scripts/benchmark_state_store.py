@@ -0,0 +1,111 @@
+"""Measure the per-action overhead of `StateStore.handle_action()`.
+
+This pushes a protocol's worth of simple commands through a real `StateStore`,
+the same way `ProtocolEngine` does during analysis: each command is queued,
+started, and succeeded, so every command costs three actions.
+
+Run from the api directory:
+`pipenv run python scripts/benchmark_state_store.py --commands 5000`
+"""
+
+import argparse
+import cProfile
+import pstats
+import time
+from datetime import datetime
+
+from opentrons_shared_data.deck import load as load_deck
+from opentrons_shared_data.robot import load as load_robot
+
+from opentrons.protocol_engine import commands
+from opentrons.protocol_engine.actions import (
+    PlayAction,
+    QueueCommandAction,
+    RunCommandAction,
+    SucceedCommandAction,
+)
+from opentrons.protocol_engine.state.config import Config
+from opentrons.protocol_engine.state.state import StateStore
+from opentrons.protocol_engine.state.update_types import StateUpdate
+from opentrons.protocol_engine.types import DeckType
+from opentrons.protocols.api_support.deck_type import STANDARD_OT2_DECK
+
+
+def _make_state_store() -> StateStore:
+    return StateStore(
+        config=Config(robot_type="OT-2 Standard", deck_type=DeckType.OT2_STANDARD),
+        deck_definition=load_deck(STANDARD_OT2_DECK, 5),
+        deck_fixed_labware=[],
+        robot_definition=load_robot("OT-2 Standard"),
+        is_door_open=False,
+        error_recovery_policy=lambda *args, **kwargs: None,  # type: ignore[arg-type]
+        notify_publishers=lambda: None,
+    )
+
+
+def _run_commands(state_store: StateStore, command_count: int) -> None:
+    created_at = datetime(year=2024, month=1, day=1)
+    state_store.handle_action(PlayAction(requested_at=created_at))
+    for index in range(command_count):
+        command_id = f"command-{index}"
+        params = commands.CommentParams(message=f"comment {index}")
+        state_store.handle_action(
+            QueueCommandAction(
+                command_id=command_id,
+                created_at=created_at,
+                request=commands.CommentCreate(params=params),
+                request_hash=None,
+            )
+        )
+        state_store.handle_action(
+            RunCommandAction(command_id=command_id, started_at=created_at)
+        )
+        state_store.handle_action(
+            SucceedCommandAction(
+                command=commands.Comment(
+                    id=command_id,
+                    key=command_id,
+                    status=commands.CommandStatus.SUCCEEDED,
+                    createdAt=created_at,
+                    startedAt=created_at,
+                    completedAt=created_at,
+                    params=params,
+                    result=commands.CommentResult(),
+                ),
+                state_update=StateUpdate(),
+            )
+        )
+
+
+def main() -> None:  # noqa: D103
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--commands", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--profile", action="store_true", help="Print the top cProfile entries."
+    )
+    args = parser.parse_args()
+
+    timings = []
+    for _ in range(args.repeat):
+        state_store = _make_state_store()
+        start = time.perf_counter()
+        _run_commands(state_store, args.commands)
+        timings.append(time.perf_counter() - start)
+
+    best = min(timings)
+    actions = args.commands * 3 + 1
+    print(
+        f"{args.commands} commands ({actions} actions): best of {args.repeat}"
+        f" {best:.4f} s, {best / actions * 1e6:.2f} us/action"
+    )
+
+    if args.profile:
+        state_store = _make_state_store()
+        profiler = cProfile.Profile()
+        profiler.runcall(_run_commands, state_store, args.commands)
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(20)
+
+
+if __name__ == "__main__":
+    main()
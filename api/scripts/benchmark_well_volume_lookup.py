@@ -0,0 +1,82 @@
+"""Measure converting between liquid heights and volumes in every Opentrons labware.
+
+For each inner well geometry in the Opentrons labware definitions, this times
+`find_volume_at_well_height()` and `find_height_at_well_volume()` over heights
+and volumes spread across the whole well, the way liquid tracking does before
+every aspirate and dispense. The first conversion for a geometry also builds
+its lookup tables, so that's reported separately.
+
+Run from the api directory:
+`pipenv run python scripts/benchmark_well_volume_lookup.py`
+"""
+
+import argparse
+import time
+from typing import Iterator, Tuple
+
+from opentrons_shared_data import get_shared_data_root
+from opentrons_shared_data.labware import load_definition
+from opentrons_shared_data.labware.labware_definition import (
+    InnerWellGeometry,
+    LabwareDefinition3,
+    labware_definition_type_adapter,
+)
+
+from opentrons.protocol_engine.state.frustum_helpers import (
+    find_height_at_well_volume,
+    find_volume_at_well_height,
+    get_well_volumetric_capacity,
+)
+
+
+def _get_geometries() -> Iterator[Tuple[str, InnerWellGeometry]]:
+    definitions_dir = get_shared_data_root() / "labware" / "definitions" / "3"
+    for labware_dir in sorted(definitions_dir.iterdir()):
+        version = max(int(path.stem) for path in labware_dir.glob("*.json"))
+        definition = labware_definition_type_adapter.validate_python(
+            load_definition(labware_dir.name, version, schema=3)
+        )
+        assert isinstance(definition, LabwareDefinition3)
+        for geometry_id, geometry in (definition.innerLabwareGeometry or {}).items():
+            yield f"{labware_dir.name}/{version} {geometry_id}", geometry
+
+
+def main() -> None:  # noqa: D103
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--points", type=int, default=50)
+    args = parser.parse_args()
+
+    total_conversions = 0
+    total_elapsed = 0.0
+    for name, geometry in _get_geometries():
+        start = time.perf_counter()
+        capacity = get_well_volumetric_capacity(geometry)
+        max_height = capacity[-1][0]
+        max_volume = sum(volume for _, volume in capacity)
+        find_volume_at_well_height(max_height / 2, geometry)
+        find_height_at_well_volume(max_volume / 2, geometry)
+        first = time.perf_counter() - start
+
+        # Stay strictly inside the well, since its very bottom is out of bounds.
+        fractions = [i / args.points for i in range(1, args.points)]
+        start = time.perf_counter()
+        for fraction in fractions:
+            find_volume_at_well_height(max_height * fraction, geometry)
+            find_height_at_well_volume(max_volume * fraction, geometry)
+        elapsed = time.perf_counter() - start
+
+        conversions = 2 * len(fractions)
+        total_conversions += conversions
+        total_elapsed += elapsed
+        print(
+            f"{name:>72}: first {first * 1e3:7.1f} ms,"
+            f" then {elapsed / conversions * 1e6:7.1f} µs per conversion"
+        )
+    print(
+        f"{'all geometries':>72}:"
+        f" {total_elapsed / total_conversions * 1e6:7.1f} µs per conversion"
+    )
+
+
+if __name__ == "__main__":
+    main()
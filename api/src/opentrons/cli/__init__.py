@@ -7,6 +7,7 @@ It is currently used by the Opentrons App to analyze protocols.
 import click
 
 from .analyze import analyze
+from .batch_analyze import batch_analyze
 
 
 @click.group()
@@ -19,3 +20,4 @@ def main() -> None:
 
 
 main.add_command(analyze)
+main.add_command(batch_analyze)
@@ -344,31 +344,9 @@ async def _do_analyze(
     return await orchestrator.run(deck_configuration=[])
 
 
-async def _analyze(
-    files_and_dirs: Sequence[Path],
-    rtp_values: str,
-    rtp_files: str,
-    outputs: Sequence[_Output],
-    check: bool,
-) -> int:
-    input_files = _get_input_files(files_and_dirs)
-    parsed_rtp_values = _get_runtime_parameter_values(rtp_values)
-    rtp_paths = _get_runtime_parameter_paths(rtp_files)
-
-    try:
-        protocol_source = await ProtocolReader().read_saved(
-            files=input_files,
-            directory=None,
-        )
-    except ProtocolFilesInvalidError as error:
-        raise click.ClickException(str(error))
-
-    analysis = await _do_analyze(protocol_source, parsed_rtp_values, rtp_paths)
-    return_code = _get_return_code(analysis)
-
-    if not outputs:
-        return return_code
-
+def _get_analyze_results(
+    protocol_source: ProtocolSource, analysis: RunResult
+) -> "AnalyzeResults":
     if len(analysis.state_summary.errors) > 0:
         if any(
             code_in_error_tree(
@@ -382,7 +360,7 @@ async def _analyze(
     else:
         result = AnalysisResult.OK
 
-    results = AnalyzeResults.model_construct(
+    return AnalyzeResults.model_construct(
         createdAt=datetime.now(tz=timezone.utc),
         files=[
             ProtocolFile.model_construct(name=f.path.name, role=f.role)
@@ -411,6 +389,34 @@ async def _analyze(
         liquidClasses=analysis.state_summary.liquidClasses,
     )
 
+
+async def _analyze(
+    files_and_dirs: Sequence[Path],
+    rtp_values: str,
+    rtp_files: str,
+    outputs: Sequence[_Output],
+    check: bool,
+) -> int:
+    input_files = _get_input_files(files_and_dirs)
+    parsed_rtp_values = _get_runtime_parameter_values(rtp_values)
+    rtp_paths = _get_runtime_parameter_paths(rtp_files)
+
+    try:
+        protocol_source = await ProtocolReader().read_saved(
+            files=input_files,
+            directory=None,
+        )
+    except ProtocolFilesInvalidError as error:
+        raise click.ClickException(str(error))
+
+    analysis = await _do_analyze(protocol_source, parsed_rtp_values, rtp_paths)
+    return_code = _get_return_code(analysis)
+
+    if not outputs:
+        return return_code
+
+    results = _get_analyze_results(protocol_source, analysis)
+
     _call_for_output_of_kind(
         "json",
         outputs,
@@ -0,0 +1,233 @@
+"""Opentrons batch analyze CLI."""
+import click
+
+from anyio import run
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Dict, List, Optional, Sequence, Tuple
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import textwrap
+import time
+
+from opentrons.protocol_reader import ProtocolReader, ProtocolFilesInvalidError
+from opentrons.protocols.api_support.definitions import MAX_SUPPORTED_VERSION
+
+from .analyze import (
+    AnalysisResult,
+    AnalyzeResults,
+    _do_analyze,
+    _get_analyze_results,
+)
+
+
+_log = logging.getLogger(__name__)
+
+_PROTOCOL_SUFFIXES = (".py", ".json")
+
+# The result recorded for a protocol whose files couldn't be read, or whose analysis
+# crashed, so there is no analysis for it.
+_ERROR_RESULT = "error"
+
+
+@dataclass(frozen=True)
+class _ProtocolTiming:
+    protocol: str
+    analysis: str
+    result: str
+    seconds: float
+    worker: int
+
+
+@click.command("batch-analyze")
+@click.argument(
+    "protocols_dir",
+    type=click.Path(exists=True, path_type=Path, file_okay=False, dir_okay=True),
+)
+@click.option(
+    "--output-dir",
+    help="Where to write each protocol's analysis, and the timing report.",
+    required=True,
+    type=click.Path(path_type=Path, file_okay=False, dir_okay=True),
+)
+@click.option(
+    "--jobs",
+    help="How many protocols to analyze at once. Defaults to the number of CPUs.",
+    type=click.IntRange(min=1),
+    default=None,
+)
+@click.option(
+    "--check",
+    help="Fail (via exit code) if any protocol had an error. If not specified, always succeed.",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--log-level",
+    help="Level of logs to capture.",
+    type=click.Choice(["DEBUG", "INFO", "WARNING", "ERROR"], case_sensitive=False),
+    default="WARNING",
+)
+def batch_analyze(
+    protocols_dir: Path,
+    output_dir: Path,
+    jobs: Optional[int],
+    check: bool,
+    log_level: str,
+) -> None:
+    """Analyze every protocol in a directory.
+
+    Each Python or JSON file directly in PROTOCOLS_DIR is analyzed as its own
+    protocol, and each subdirectory is analyzed as a single protocol made of all
+    of its files, the way `opentrons analyze` treats a directory.
+
+    Protocols are analyzed in parallel by worker processes that are started,
+    and warmed up, only once. Each protocol's analysis is written to
+    OUTPUT_DIR in the format of `opentrons analyze --json-output`, named after
+    the protocol. A report of how long each analysis took, and how it turned
+    out, is written to OUTPUT_DIR/timing.json.
+    """
+    protocols = _get_protocols(protocols_dir)
+    if not protocols:
+        raise click.UsageError(message=f"No protocols found in {protocols_dir}.")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    jobs = min(jobs or os.cpu_count() or 1, len(protocols))
+
+    start = time.perf_counter()
+    # Spawn the workers, instead of forking them, so they don't inherit any
+    # threads or event loop state from this process.
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_start_worker,
+        initargs=(log_level,),
+    ) as executor:
+        timings = list(
+            executor.map(
+                _analyze_protocol,
+                [name for name, _ in protocols],
+                [files for _, files in protocols],
+                [output_dir / f"{name}.json" for name, _ in protocols],
+            )
+        )
+    wall_seconds = time.perf_counter() - start
+
+    counts: Dict[str, int] = {}
+    for timing in timings:
+        counts[timing.result] = counts.get(timing.result, 0) + 1
+    report = {
+        "protocolsDir": str(protocols_dir),
+        "jobs": jobs,
+        "wallSeconds": wall_seconds,
+        "analysisSeconds": sum(timing.seconds for timing in timings),
+        "results": counts,
+        "protocols": [asdict(timing) for timing in timings],
+    }
+    (output_dir / "timing.json").write_text(json.dumps(report, indent=2))
+
+    click.echo(
+        f"Analyzed {len(timings)} protocols with {jobs} workers"
+        f" in {wall_seconds:.1f} s: "
+        + ", ".join(f"{count} {result}" for result, count in sorted(counts.items()))
+    )
+    if check and any(timing.result != AnalysisResult.OK.value for timing in timings):
+        sys.exit(-1)
+
+
+def _get_protocols(protocols_dir: Path) -> List[Tuple[str, List[Path]]]:
+    """Get the name and files of each protocol in a directory."""
+    protocols: List[Tuple[str, List[Path]]] = []
+    for entry in sorted(protocols_dir.iterdir()):
+        if entry.is_dir():
+            files = sorted(path for path in entry.glob("**/*") if path.is_file())
+            if files:
+                protocols.append((entry.name, files))
+        elif entry.suffix in _PROTOCOL_SUFFIXES:
+            protocols.append((entry.name, [entry]))
+    return protocols
+
+
+def _start_worker(log_level: str) -> None:
+    """Set up a worker process, and warm it up by analyzing tiny protocols.
+
+    The warm-up pays for what every analysis in a fresh process would otherwise
+    pay for itself: importing the protocol API, and loading the deck, pipette,
+    and labware definitions that nearly every protocol uses.
+    """
+    logging.basicConfig(level=getattr(logging, log_level.upper()))
+    with TemporaryDirectory() as temp_dir:
+        for robot_type, pipette, slot in [
+            ("OT-2", "p300_single_gen2", "1"),
+            ("Flex", "flex_1channel_1000", "D1"),
+        ]:
+            protocol_file = Path(temp_dir) / f"warm_up_{robot_type}.py"
+            protocol_file.write_text(
+                textwrap.dedent(
+                    f"""\
+                    requirements = {{
+                        "robotType": "{robot_type}",
+                        "apiLevel": "{MAX_SUPPORTED_VERSION}",
+                    }}
+                    def run(protocol):
+                        protocol.load_labware(
+                            "nest_96_wellplate_100ul_pcr_full_skirt", "{slot}"
+                        )
+                        protocol.load_instrument("{pipette}", "left")
+                    """
+                )
+            )
+            try:
+                run(_analyze, [protocol_file])
+            except Exception:
+                # This only makes the first real analysis slower.
+                _log.warning(f"Couldn't warm up for {robot_type}", exc_info=True)
+
+
+async def _analyze(protocol_files: Sequence[Path]) -> AnalyzeResults:
+    protocol_source = await ProtocolReader().read_saved(
+        files=protocol_files,
+        directory=None,
+    )
+    analysis = await _do_analyze(protocol_source, rtp_values={}, rtp_paths={})
+    return _get_analyze_results(protocol_source, analysis)
+
+
+def _analyze_protocol(
+    name: str, protocol_files: Sequence[Path], analysis_file: Path
+) -> _ProtocolTiming:
+    """Analyze one protocol in a worker process, and write its analysis."""
+    start = time.perf_counter()
+    try:
+        results = run(_analyze, protocol_files)
+    except ProtocolFilesInvalidError as error:
+        _log.error(f"Couldn't read {name}: {error}")
+        results = None
+    except Exception:
+        _log.exception(f"Couldn't analyze {name}")
+        results = None
+    seconds = time.perf_counter() - start
+
+    if results is None:
+        analysis_file.unlink(missing_ok=True)
+        return _ProtocolTiming(
+            protocol=name,
+            analysis="",
+            result=_ERROR_RESULT,
+            seconds=seconds,
+            worker=os.getpid(),
+        )
+    analysis_file.write_bytes(
+        results.model_dump_json(exclude_none=True).encode("utf-8")
+    )
+    return _ProtocolTiming(
+        protocol=name,
+        analysis=analysis_file.name,
+        result=results.result.value,
+        seconds=seconds,
+        worker=os.getpid(),
+    )
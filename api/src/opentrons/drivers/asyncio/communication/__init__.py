@@ -2,6 +2,7 @@ from .serial_connection import SerialConnection, AsyncResponseSerialConnection
 from opentrons.drivers.asyncio.communication.errors import (
     SerialException,
     NoResponse,
+    UnmatchedResponse,
     AlarmResponse,
     ErrorResponse,
     UnhandledGcode,
@@ -15,6 +16,7 @@ __all__ = [
     "AsyncSerial",
     "SerialException",
     "NoResponse",
+    "UnmatchedResponse",
     "AlarmResponse",
     "ErrorResponse",
     "UnhandledGcode",
@@ -19,6 +19,16 @@ class NoResponse(SerialException):
         self.command = command
 
 
+class UnmatchedResponse(SerialException):
+    def __init__(self, port: str, command: str, response: str) -> None:
+        super().__init__(
+            port=port,
+            description=f"Response '{response}' does not answer '{command}'",
+        )
+        self.command = command
+        self.response = response
+
+
 class FailedCommand(SerialException):
     def __init__(self, port: str, response: str) -> None:
         super().__init__(
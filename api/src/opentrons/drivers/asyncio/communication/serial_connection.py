@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Optional, List, Type
+from dataclasses import dataclass
+from typing import Collection, Dict, Optional, List, Set, Tuple, Type
 
 from opentrons.drivers.command_builder import CommandBuilder
 
@@ -12,12 +13,37 @@ from .errors import (
     ErrorResponse,
     BaseErrorCode,
     DefaultErrorCodes,
+    SerialException,
+    UnmatchedResponse,
 )
 from .async_serial import AsyncSerial
 
 log = logging.getLogger(__name__)
 
 
+def _gcode(data: str) -> str:
+    """Get the G-code that a command line starts with."""
+    words = data.split(maxsplit=1)
+    return words[0] if words else ""
+
+
+@dataclass
+class _PipelinedRequest:
+    """A command waiting to be sent on the same line as others."""
+
+    data: str
+    response: "asyncio.Future[str]"
+
+    def resolve(self, response: str) -> None:
+        # The request may have been cancelled while it waited.
+        if not self.response.done():
+            self.response.set_result(response)
+
+    def fail(self, error: Exception) -> None:
+        if not self.response.done():
+            self.response.set_exception(error)
+
+
 class SerialConnection:
     @classmethod
     async def _build_serial(
@@ -50,6 +76,7 @@ class SerialConnection:
         alarm_keyword: Optional[str] = None,
         reset_buffer_before_write: bool = False,
         error_codes: Type[BaseErrorCode] = DefaultErrorCodes,
+        pipelined_gcodes: Optional[Collection[str]] = None,
     ) -> "SerialConnection":
         """
         Create a connection.
@@ -72,6 +99,11 @@ class SerialConnection:
               every write
             error_codes: Enum class for error codes
                          (default: DefaultErrorCodes)
+            pipelined_gcodes: optional G-codes that may be sent together, on
+                              one line, when they are requested at the same
+                              time. The device must answer each of them in
+                              order, with a response that starts with its
+                              G-code.
 
         Returns: SerialConnection
         """
@@ -92,6 +124,7 @@ class SerialConnection:
             error_keyword=error_keyword or "error",
             alarm_keyword=alarm_keyword or "alarm",
             error_codes=error_codes,
+            pipelined_gcodes=pipelined_gcodes,
         )
 
     def __init__(
@@ -104,6 +137,7 @@ class SerialConnection:
         error_keyword: str,
         alarm_keyword: str,
         error_codes: Type[BaseErrorCode] = DefaultErrorCodes,
+        pipelined_gcodes: Optional[Collection[str]] = None,
     ) -> None:
         """
         Constructor
@@ -119,6 +153,8 @@ class SerialConnection:
             alarm_keyword: string that will cause an AlarmResponse
                            exception when detected
             error_codes: Enum class for error codes
+            pipelined_gcodes: G-codes that may be sent together, on one line,
+                              when they are requested at the same time
         """
         self._serial = serial
         self._port = port
@@ -129,6 +165,11 @@ class SerialConnection:
         self._error_keyword = error_keyword.lower()
         self._alarm_keyword = alarm_keyword.lower()
         self._error_codes = error_codes
+        self._pipelined_gcodes = frozenset(pipelined_gcodes or ())
+        # Pipelined requests waiting to be sent, by their retries and timeout.
+        self._pipelines: Dict[Tuple[int, Optional[float]], List[_PipelinedRequest]] = {}
+        # Tasks sending pipelines, kept so that they aren't garbage collected.
+        self._pipeline_tasks: Set["asyncio.Task[None]"] = set()
 
     async def send_command(
         self, command: CommandBuilder, retries: int = 0, timeout: Optional[float] = None
@@ -177,6 +218,10 @@ class SerialConnection:
 
         Raises: SerialException
         """
+        if _gcode(data) in self._pipelined_gcodes:
+            return await self._send_pipelined(
+                data=data, retries=retries, timeout=timeout
+            )
         async with self._send_data_lock, self._serial.timeout_override(
             "timeout", timeout
         ):
@@ -200,26 +245,186 @@ class SerialConnection:
             log.debug(f"{self.name}: Write -> {data_encode!r}")
             await self._serial.write(data=data_encode)
 
-            response = await self._serial.read_until(match=self._ack)
-            log.debug(f"{self.name}: Read <- {response!r}")
+            response = await self._read_response(command=data)
+            if response is not None:
+                return response
+
+            log.info(f"{self.name}: retry number {retry}/{retries}")
+
+            await self.on_retry()
+
+        raise NoResponse(port=self._port, command=data)
+
+    async def _read_response(self, command: str) -> Optional[str]:
+        """
+        Read the response to one command.
+
+        Args:
+            command: The sent command.
+
+        Returns: The processed response, or None if it timed out.
+
+        Raises: SerialException
+        """
+        response = await self._serial.read_until(match=self._ack)
+        log.debug(f"{self.name}: Read <- {response!r}")
+
+        if self._ack in response or self._error_keyword.encode() in response.lower():
+            # Remove ack from response
+            response = response.replace(self._ack, b"")
+            str_response = self.process_raw_response(
+                command=command, response=response.decode()
+            )
+            self.raise_on_error(response=str_response, request=command)
+            return str_response
 
-            if (
-                self._ack in response
-                or self._error_keyword.encode() in response.lower()
+        return None
+
+    async def _send_pipelined(
+        self, data: str, retries: int, timeout: Optional[float]
+    ) -> str:
+        """
+        Send data on the same line as any other pipelined data that is sent
+        before the connection is free, and return its response.
+
+        The first request of a pipeline starts a task to send it, so that
+        cancelling that request doesn't affect the others.
+
+        Args:
+            data: The data to send.
+            retries: number of times to retry in case of timeout
+            timeout: optional override of default timeout in seconds
+
+        Returns: The command response
+
+        Raises: SerialException
+        """
+        request = _PipelinedRequest(
+            data=data, response=asyncio.get_running_loop().create_future()
+        )
+        key = (retries, timeout)
+        pipeline = self._pipelines.setdefault(key, [])
+        pipeline.append(request)
+        if len(pipeline) == 1:
+            task = asyncio.get_running_loop().create_task(
+                self._run_pipeline(
+                    key=key, pipeline=pipeline, retries=retries, timeout=timeout
+                )
+            )
+            self._pipeline_tasks.add(task)
+            task.add_done_callback(self._pipeline_tasks.discard)
+        return await request.response
+
+    async def _run_pipeline(
+        self,
+        key: Tuple[int, Optional[float]],
+        pipeline: List[_PipelinedRequest],
+        retries: int,
+        timeout: Optional[float],
+    ) -> None:
+        """
+        Send a pipeline once the connection is free, failing its requests
+        if it can't be sent.
+
+        Args:
+            key: The pipeline's key in the pipelines waiting to be sent.
+            pipeline: The requests, which other requests may still join.
+            retries: number of times to retry in case of timeout
+            timeout: optional override of default timeout in seconds
+        """
+        try:
+            # Let requests that were started at the same time as the first join it.
+            await asyncio.sleep(0)
+            async with self._send_data_lock, self._serial.timeout_override(
+                "timeout", timeout
             ):
-                # Remove ack from response
-                response = response.replace(self._ack, b"")
-                str_response = self.process_raw_response(
-                    command=data, response=response.decode()
+                if self._pipelines.get(key) is pipeline:
+                    del self._pipelines[key]
+                await self._send_pipeline(pipeline=pipeline, retries=retries)
+        except BaseException as e:
+            if self._pipelines.get(key) is pipeline:
+                del self._pipelines[key]
+            error = (
+                e
+                if isinstance(e, Exception)
+                else SerialException(
+                    port=self._port, description="Pipelined command was abandoned"
                 )
-                self.raise_on_error(response=str_response, request=data)
-                return str_response
+            )
+            for request in pipeline:
+                request.fail(error)
+            if not isinstance(e, Exception):
+                raise
+
+    async def _send_pipeline(
+        self, pipeline: List[_PipelinedRequest], retries: int
+    ) -> None:
+        """
+        Send requests on one line, and resolve each with its response.
+
+        Args:
+            pipeline: The requests, in the order they were made.
+            retries: number of times to retry the requests that time out
+        """
+        pending = pipeline
+        for retry in range(retries + 1):
+            first = pending[0].data
+            terminator = first[len(first.rstrip()) :]
+            data_encode = (
+                " ".join(request.data.strip() for request in pending) + terminator
+            ).encode()
+            log.debug(f"{self.name}: Write -> {data_encode!r}")
+            await self._serial.write(data=data_encode)
+
+            try:
+                pending = await self._read_pipeline_responses(pipeline=pending)
+            except BaseException:
+                # Any responses left unread would be taken as the answers to
+                # the next command.
+                self._serial.reset_input_buffer()
+                raise
+            if not pending:
+                return
 
             log.info(f"{self.name}: retry number {retry}/{retries}")
 
             await self.on_retry()
 
-        raise NoResponse(port=self._port, command=data)
+        for request in pending:
+            request.fail(NoResponse(port=self._port, command=request.data))
+
+    async def _read_pipeline_responses(
+        self, pipeline: List[_PipelinedRequest]
+    ) -> List[_PipelinedRequest]:
+        """
+        Read the responses to requests that were sent on one line, in order.
+
+        Args:
+            pipeline: The requests, in the order they were sent.
+
+        Returns: The requests whose responses timed out.
+        """
+        for index, request in enumerate(pipeline):
+            try:
+                response = await self._read_response(command=request.data)
+            except SerialException as e:
+                request.fail(e)
+                continue
+            if response is None:
+                return pipeline[index:]
+            if _gcode(response) != _gcode(request.data):
+                # The responses are out of step with the requests, so none of
+                # the rest can be trusted.
+                self._serial.reset_input_buffer()
+                for unanswered in pipeline[index:]:
+                    unanswered.fail(
+                        UnmatchedResponse(
+                            port=self._port, command=unanswered.data, response=response
+                        )
+                    )
+                return []
+            request.resolve(response)
+        return []
 
     async def open(self) -> None:
         """Open the connection."""
@@ -315,6 +520,7 @@ class AsyncResponseSerialConnection(SerialConnection):
         alarm_keyword: Optional[str] = None,
         reset_buffer_before_write: bool = False,
         error_codes: Type[BaseErrorCode] = DefaultErrorCodes,
+        pipelined_gcodes: Optional[Collection[str]] = None,
         async_error_ack: Optional[str] = None,
         number_of_retries: int = 0,
     ) -> AsyncResponseSerialConnection:
@@ -342,6 +548,11 @@ class AsyncResponseSerialConnection(SerialConnection):
             number_of_retries: default number of retries
             error_codes: Enum class for error codes
                          (default: DefaultErrorCodes)
+            pipelined_gcodes: optional G-codes that may be sent together, on
+                              one line, when they are requested at the same
+                              time. The device must answer each of them in
+                              order, with a response that starts with its
+                              G-code.
 
         Returns: AsyncResponseSerialConnection
         """
@@ -364,6 +575,7 @@ class AsyncResponseSerialConnection(SerialConnection):
             async_error_ack=async_error_ack or "async",
             number_of_retries=number_of_retries,
             error_codes=error_codes,
+            pipelined_gcodes=pipelined_gcodes,
         )
 
     def __init__(
@@ -378,6 +590,7 @@ class AsyncResponseSerialConnection(SerialConnection):
         async_error_ack: str,
         number_of_retries: int = 0,
         error_codes: Type[BaseErrorCode] = DefaultErrorCodes,
+        pipelined_gcodes: Optional[Collection[str]] = None,
     ) -> None:
         """
         Constructor
@@ -396,6 +609,8 @@ class AsyncResponseSerialConnection(SerialConnection):
                              error when detected
             number_of_retries: default number of retries
             error_codes: Enum class for error codes
+            pipelined_gcodes: G-codes that may be sent together, on one line,
+                              when they are requested at the same time
         """
         super().__init__(
             serial=serial,
@@ -406,6 +621,7 @@ class AsyncResponseSerialConnection(SerialConnection):
             error_keyword=error_keyword,
             alarm_keyword=alarm_keyword,
             error_codes=error_codes,
+            pipelined_gcodes=pipelined_gcodes,
         )
         self._serial = serial
         self._port = port
@@ -453,12 +669,9 @@ class AsyncResponseSerialConnection(SerialConnection):
 
         Raises: SerialException
         """
-        async with super().send_data_lock, self._serial.timeout_override(
-            "timeout", timeout
-        ):
-            return await self._send_data(
-                data=data, retries=retries or self._number_of_retries
-            )
+        return await super().send_data(
+            data=data, retries=retries or self._number_of_retries, timeout=timeout
+        )
 
     async def _send_data(self, data: str, retries: int = 0) -> str:
         """
@@ -472,42 +685,47 @@ class AsyncResponseSerialConnection(SerialConnection):
 
         Raises: SerialException
         """
-        data_encode = data.encode()
-        retries = retries or self._number_of_retries
+        return await super()._send_data(
+            data=data, retries=retries or self._number_of_retries
+        )
 
-        for retry in range(retries + 1):
-            log.debug(f"{self._name}: Write -> {data_encode!r}")
-            await self._serial.write(data=data_encode)
+    async def _read_response(self, command: str) -> Optional[str]:
+        """
+        Read the response to one command, and any asynchronous errors that
+        arrive before it.
 
-            response: List[bytes] = []
+        Args:
+            command: The sent command.
+
+        Returns: The processed response, or None if it timed out.
+
+        Raises: SerialException
+        """
+        response: List[bytes] = []
+        response.append(await self._serial.read_until(match=self._ack))
+        log.debug(f"{self._name}: Read <- {response[-1]!r}")
+
+        while self._async_error_ack.encode() in response[-1].lower():
+            # check for multiple a priori async errors
             response.append(await self._serial.read_until(match=self._ack))
             log.debug(f"{self._name}: Read <- {response[-1]!r}")
 
-            while self._async_error_ack.encode() in response[-1].lower():
-                # check for multiple a priori async errors
-                response.append(await self._serial.read_until(match=self._ack))
-                log.debug(f"{self._name}: Read <- {response[-1]!r}")
-
-            for r in response:
-                if self._async_error_ack.encode() in r:
-                    # Remove ack from response
-                    ackless_response = r.replace(self._ack, b"")
-                    str_response = self.process_raw_response(
-                        command=data, response=ackless_response.decode()
-                    )
-                    self.raise_on_error(response=str_response, request=data)
-
-            if self._ack in response[-1]:
+        for r in response:
+            if self._async_error_ack.encode() in r:
                 # Remove ack from response
-                ackless_response = response[-1].replace(self._ack, b"")
+                ackless_response = r.replace(self._ack, b"")
                 str_response = self.process_raw_response(
-                    command=data, response=ackless_response.decode()
+                    command=command, response=ackless_response.decode()
                 )
-                self.raise_on_error(response=str_response, request=data)
-                return str_response
-
-            log.info(f"{self._name}: retry number {retry}/{retries}")
+                self.raise_on_error(response=str_response, request=command)
 
-            await self.on_retry()
+        if self._ack in response[-1]:
+            # Remove ack from response
+            ackless_response = response[-1].replace(self._ack, b"")
+            str_response = self.process_raw_response(
+                command=command, response=ackless_response.decode()
+            )
+            self.raise_on_error(response=str_response, request=command)
+            return str_response
 
-        raise NoResponse(port=self._port, command=data)
+        return None
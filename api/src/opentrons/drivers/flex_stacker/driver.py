@@ -42,6 +42,12 @@ FS_ACK = "OK\n"
 FS_ERROR_KEYWORD = "err"
 FS_ASYNC_ERROR_ACK = "async"
 DEFAULT_COMMAND_RETRIES = 0
+# The status reads that the poller makes together, which can share one line.
+FS_PIPELINED_GCODES = [
+    GCODE.GET_LIMIT_SWITCH.value,
+    GCODE.GET_PLATFORM_SENSOR.value,
+    GCODE.GET_DOOR_SWITCH.value,
+]
 GCODE_ROUNDING_PRECISION = 2
 
 # LED animation range values
@@ -308,6 +314,7 @@ class FlexStackerDriver(AbstractFlexStackerDriver):
             error_keyword=FS_ERROR_KEYWORD,
             async_error_ack=FS_ASYNC_ERROR_ACK,
             error_codes=StackerErrorCodes,
+            pipelined_gcodes=FS_PIPELINED_GCODES,
         )
         return cls(connection)
 
@@ -36,6 +36,12 @@ HS_ACK = "OK" + HS_COMMAND_TERMINATOR
 HS_ERROR_KEYWORD = "err"
 HS_ASYNC_ERROR_ACK = "async"
 DEFAULT_COMMAND_RETRIES = 0
+# The status reads that the poller makes together, which can share one line.
+HS_PIPELINED_GCODES = [
+    GCODE.GET_TEMPERATURE.value,
+    GCODE.GET_RPM.value,
+    GCODE.GET_LABWARE_LATCH_STATE.value,
+]
 
 
 class HeaterShakerDriver(AbstractHeaterShakerDriver):
@@ -60,6 +66,7 @@ class HeaterShakerDriver(AbstractHeaterShakerDriver):
             loop=loop,
             error_keyword=HS_ERROR_KEYWORD,
             async_error_ack=HS_ASYNC_ERROR_ACK,
+            pipelined_gcodes=HS_PIPELINED_GCODES,
         )
         return cls(connection=connection)
 
@@ -65,6 +65,13 @@ TC_GEN2_SERIAL_ACK = "\n"
 TC_GEN2_ACK = " OK" + TC_GEN2_SERIAL_ACK
 TC_GEN2_ERROR_WORD = "ERR"
 TC_GEN2_ASYNC_ERROR_ACK = "async"
+# The status reads that the poller makes together, which can share one line.
+# Only Gen2 firmware starts each response with its G-code.
+TC_GEN2_PIPELINED_GCODES = [
+    GCODE.GET_LID_STATUS.value,
+    GCODE.GET_LID_TEMP.value,
+    GCODE.GET_PLATE_TEMP.value,
+]
 
 SerialKind = Union[AsyncResponseSerialConnection, SerialConnection]
 
@@ -115,6 +122,7 @@ class ThermocyclerDriverFactory:
                 error_keyword=TC_GEN2_ERROR_WORD,
                 alarm_keyword="alarm",
                 async_error_ack=TC_GEN2_ASYNC_ERROR_ACK,
+                pipelined_gcodes=TC_GEN2_PIPELINED_GCODES,
             )
             return ThermocyclerDriverV2(async_connection)
         else:
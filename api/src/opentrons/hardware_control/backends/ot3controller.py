@@ -215,10 +215,13 @@ from ..types import HepaFanState, HepaUVState, StatusBarState
 from .types import HWStopCondition
 from .flex_protocol import FlexBackend
 from .status_bar_state import StatusBarStateController
-from opentrons_hardware.sensors.types import SensorDataType
+from opentrons_hardware.sensors.sensor_buffer import SensorRingBuffer
 
 log = logging.getLogger(__name__)
 
+# Enough room for a whole probe pass at the sensors' fastest sample rate.
+PROBE_SENSOR_BUFFER_SAMPLES = 2**16
+
 MapPayload = TypeVar("MapPayload")
 Wrapped = TypeVar("Wrapped", bound=Callable[..., Awaitable[Any]])
 
@@ -261,6 +264,14 @@ def requires_estop(func: Wrapped) -> Wrapped:
     return cast(Wrapped, wrapper)
 
 
+def _allocate_sensor_buffers(sensor_id: SensorId) -> Dict[SensorId, SensorRingBuffer]:
+    """Make a buffer for each sensor that a probe with `sensor_id` reads."""
+    sensor_ids = (
+        [SensorId.S0, SensorId.S1] if sensor_id == SensorId.BOTH else [sensor_id]
+    )
+    return {s_id: SensorRingBuffer(PROBE_SENSOR_BUFFER_SAMPLES) for s_id in sensor_ids}
+
+
 class OT3Controller(FlexBackend):
     """OT3 Hardware Controller Backend."""
 
@@ -1510,27 +1521,8 @@ class OT3Controller(FlexBackend):
                 "Liquid Presence Detection not available on this pipette."
             )
 
-        if response_queue is None:
-            response_capture: Optional[
-                Callable[[Dict[SensorId, List[SensorDataType]]], None]
-            ] = None
-        else:
-
-            def response_capture(data: Dict[SensorId, List[SensorDataType]]) -> None:
-                response_queue.put_nowait(
-                    {
-                        PipetteSensorId(sensor_id.value): [
-                            PipetteSensorData(
-                                sensor_type=PipetteSensorType(packet.sensor_type.value),
-                                _as_int=packet.to_int,
-                                _as_float=packet.to_float(),
-                            )
-                            for packet in packets
-                        ]
-                        for sensor_id, packets in data.items()
-                    }
-                )
-
+        sensor_id = sensor_id_for_instrument(probe)
+        sensor_buffers = _allocate_sensor_buffers(sensor_id)
         positions = await liquid_probe(
             messenger=self._messenger,
             tool=tool,
@@ -1542,10 +1534,26 @@ class OT3Controller(FlexBackend):
             plunger_impulse_time=plunger_impulse_time,
             num_baseline_reads=num_baseline_reads,
             z_offset_for_plunger_prep=z_offset_for_plunger_prep,
-            sensor_id=sensor_id_for_instrument(probe),
+            sensor_id=sensor_id,
             force_both_sensors=force_both_sensors,
-            emplace_data=response_capture,
+            sensor_buffers=sensor_buffers,
         )
+        if response_queue is not None:
+            response_queue.put_nowait(
+                {
+                    PipetteSensorId(s_id.value): [
+                        PipetteSensorData(
+                            sensor_type=PipetteSensorType.pressure,
+                            _as_int=as_int,
+                            _as_float=as_float,
+                        )
+                        for as_int, as_float in zip(
+                            buffer.raw().tolist(), buffer.values().tolist()
+                        )
+                    ]
+                    for s_id, buffer in sensor_buffers.items()
+                }
+            )
         for node, point in positions.items():
             self._position.update({node: point.motor_position})
             self._encoder_position.update({node: point.encoder_position})
@@ -1572,14 +1580,16 @@ class OT3Controller(FlexBackend):
         sensor_threshold_pf: float,
         probe: InstrumentProbeType = InstrumentProbeType.PRIMARY,
     ) -> bool:
+        sensor_id = sensor_id_for_instrument(probe)
         status = await capacitive_probe(
             messenger=self._messenger,
             tool=sensor_node_for_mount(mount),
             mover=axis_to_node(moving),
             distance=distance_mm,
             mount_speed=speed_mm_per_s,
-            sensor_id=sensor_id_for_instrument(probe),
+            sensor_id=sensor_id,
             relative_threshold_pf=sensor_threshold_pf,
+            sensor_buffers=_allocate_sensor_buffers(sensor_id),
         )
 
         self._position[axis_to_node(moving)] = status.motor_position
@@ -148,3 +148,9 @@ class HeaterShakerEmulator(AbstractEmulator):
     @staticmethod
     def get_terminator() -> bytes:
         return b"\n"
+
+    @staticmethod
+    def get_ack() -> bytes:
+        # Like the firmware, end each response with its own HS_ACK, and
+        # nothing after it.
+        return b""
@@ -21,7 +21,7 @@ from opentrons.drivers.flex_stacker.driver import (
 from opentrons.drivers.flex_stacker.abstract import AbstractFlexStackerDriver
 from opentrons.drivers.flex_stacker.simulator import SimulatingDriver
 from opentrons.hardware_control.execution_manager import ExecutionManager
-from opentrons.hardware_control.poller import Reader, Poller
+from opentrons.hardware_control.poller import Reader, Poller, read_concurrently
 from opentrons.hardware_control.modules import mod_abc, update
 from opentrons.hardware_control.modules.types import (
     FlexStackerStatus,
@@ -437,9 +437,11 @@ class FlexStackerReader(Reader):
         self.get_config = True
 
     async def read(self) -> None:
-        await self.get_limit_switch_status()
-        await self.get_platform_sensor_state()
-        await self.get_door_closed()
+        await read_concurrently(
+            self.get_limit_switch_status(),
+            self.get_platform_sensor_state(),
+            self.get_door_closed(),
+        )
         if self.get_config:
             await self.get_motion_parameters()
             self.get_config = False
@@ -11,7 +11,7 @@ from opentrons.drivers.heater_shaker.abstract import AbstractHeaterShakerDriver
 from opentrons.drivers.heater_shaker.simulator import SimulatingDriver
 from opentrons.drivers.types import Temperature, RPM, HeaterShakerLabwareLatchStatus
 from opentrons.hardware_control.execution_manager import ExecutionManager
-from opentrons.hardware_control.poller import Reader, Poller
+from opentrons.hardware_control.poller import Reader, Poller, read_concurrently
 from opentrons.hardware_control.modules import mod_abc, update
 from opentrons.hardware_control.modules.types import (
     ModuleDisconnectedCallback,
@@ -32,6 +32,8 @@ POLL_PERIOD = 1.0
 # to speed up simulation of heater-shaker protocols, but it's pretty silly
 # module simulation in PAPIv2 needs to be seriously rethought
 SIMULATING_POLL_PERIOD = POLL_PERIOD / 20.0
+IDLE_POLL_PERIOD = 5.0
+SIMULATING_IDLE_POLL_PERIOD = IDLE_POLL_PERIOD / 20.0
 
 DFU_PID = "df11"
 
@@ -75,12 +77,18 @@ class HeaterShaker(mod_abc.AbstractModule):
         if not simulating:
             driver = await HeaterShakerDriver.create(port=port, loop=hw_control_loop)
             poll_interval_seconds = poll_interval_seconds or POLL_PERIOD
+            idle_poll_interval_seconds = IDLE_POLL_PERIOD
         else:
             driver = SimulatingDriver(serial_number=sim_serial_number)
             poll_interval_seconds = poll_interval_seconds or SIMULATING_POLL_PERIOD
+            idle_poll_interval_seconds = SIMULATING_IDLE_POLL_PERIOD
 
         reader = HeaterShakerReader(driver=driver)
-        poller = Poller(reader=reader, interval=poll_interval_seconds)
+        poller = Poller(
+            reader=reader,
+            interval=poll_interval_seconds,
+            idle_interval=idle_poll_interval_seconds,
+        )
         module = cls(
             port=port,
             usb_port=usb_port,
@@ -399,14 +407,24 @@ class HeaterShakerReader(Reader):
         self._driver = driver
 
     async def read(self) -> None:
-        await self.read_temperature()
-        await self.read_rpm()
-        await self.read_labware_latch()
+        await read_concurrently(
+            self.read_temperature(), self.read_rpm(), self.read_labware_latch()
+        )
         self._set_error(None)
 
     def on_error(self, exception: Exception) -> None:
         self._set_error(exception)
 
+    def is_idle(self) -> bool:
+        """Whether the temperature and speed are holding at their targets, if any."""
+        return HeaterShaker._get_temperature_status(self.temperature) in (
+            TemperatureStatus.IDLE,
+            TemperatureStatus.HOLDING,
+        ) and HeaterShaker._get_speed_status(self.rpm) in (
+            SpeedStatus.IDLE,
+            SpeedStatus.HOLDING,
+        )
+
     async def read_temperature(self) -> None:
         self.temperature = await self._driver.get_temperature()
 
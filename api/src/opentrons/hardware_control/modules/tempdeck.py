@@ -24,6 +24,8 @@ log = logging.getLogger(__name__)
 
 TEMP_POLL_INTERVAL_SECS = 1.0
 SIM_TEMP_POLL_INTERVAL_SECS = TEMP_POLL_INTERVAL_SECS / 20.0
+TEMP_IDLE_POLL_INTERVAL_SECS = 5.0
+SIM_TEMP_IDLE_POLL_INTERVAL_SECS = TEMP_IDLE_POLL_INTERVAL_SECS / 20.0
 
 
 class TempDeck(mod_abc.AbstractModule):
@@ -65,14 +67,20 @@ class TempDeck(mod_abc.AbstractModule):
         if not simulating:
             driver = await TempDeckDriver.create(port=port, loop=hw_control_loop)
             poll_interval_seconds = poll_interval_seconds or TEMP_POLL_INTERVAL_SECS
+            idle_poll_interval_seconds = TEMP_IDLE_POLL_INTERVAL_SECS
         else:
             driver = SimulatingDriver(
                 sim_model=sim_model, serial_number=sim_serial_number
             )
             poll_interval_seconds = poll_interval_seconds or SIM_TEMP_POLL_INTERVAL_SECS
+            idle_poll_interval_seconds = SIM_TEMP_IDLE_POLL_INTERVAL_SECS
 
         reader = TempDeckReader(driver=driver)
-        poller = Poller(reader=reader, interval=poll_interval_seconds)
+        poller = Poller(
+            reader=reader,
+            interval=poll_interval_seconds,
+            idle_interval=idle_poll_interval_seconds,
+        )
         module = cls(
             port=port,
             usb_port=usb_port,
@@ -297,3 +305,10 @@ class TempDeckReader(Reader):
     async def read(self) -> None:
         """Read the module's current and target temperatures."""
         self.temperature = await self._driver.get_temperature()
+
+    def is_idle(self) -> bool:
+        """Whether the module is holding at its target, or has no target."""
+        return TempDeck._get_status(self.temperature) in (
+            TemperatureStatus.IDLE,
+            TemperatureStatus.HOLDING,
+        )
@@ -11,7 +11,7 @@ from opentrons.hardware_control.modules.types import (
     ModuleDisconnectedCallback,
     TemperatureStatus,
 )
-from opentrons.hardware_control.poller import Reader, Poller
+from opentrons.hardware_control.poller import Reader, Poller, read_concurrently
 
 from ..execution_manager import ExecutionManager
 from . import types, update, mod_abc
@@ -97,6 +97,8 @@ class Thermocycler(mod_abc.AbstractModule):
             poll_interval_seconds = poll_interval_seconds or SIM_POLLING_FREQUENCY_SEC
 
         reader = ThermocyclerReader(driver=driver)
+        # The lid can be opened and closed with its button at any time, so
+        # poll at a fixed interval even while the temperatures are holding.
         poller = Poller(reader=reader, interval=poll_interval_seconds)
         module = cls(
             port=port,
@@ -715,9 +717,11 @@ class ThermocyclerReader(Reader):
 
     async def read(self) -> None:
         """Poll the thermocycler."""
-        await self.read_lid_status()
-        await self.read_lid_temperature()
-        await self.read_block_temperature()
+        await read_concurrently(
+            self.read_lid_status(),
+            self.read_lid_temperature(),
+            self.read_block_temperature(),
+        )
 
     async def read_lid_status(self) -> None:
         self.lid_status = await self._driver.get_lid_status()
@@ -1,8 +1,10 @@
 import asyncio
 import contextlib
 import logging
+import time
 from abc import ABC, abstractmethod
-from typing import AsyncGenerator, List, Optional
+from dataclasses import dataclass
+from typing import AsyncGenerator, Awaitable, List, Optional
 from opentrons.hardware_control.modules.errors import AbsorbanceReaderDisconnectedError
 from opentrons_shared_data.errors.exceptions import ModuleCommunicationError
 
@@ -18,26 +20,103 @@ class Reader(ABC):
     def on_error(self, exception: Exception) -> None:
         """Handle an error from calling `read`."""
 
+    def is_idle(self) -> bool:
+        """Whether the data from the last read isn't expected to change soon.
+
+        For example, a module that isn't moving toward a target temperature
+        or speed is idle.
+        """
+        return False
+
+
+async def read_concurrently(*reads: Awaitable[None]) -> None:
+    """Run reads at the same time, so that a driver can send them together.
+
+    Every read finishes before the first error, if any, is raised, so none
+    are left running after a failed poll.
+    """
+    for result in await asyncio.gather(*reads, return_exceptions=True):
+        if isinstance(result, BaseException):
+            raise result
+
+
+@dataclass(frozen=True)
+class PollerMetrics:
+    """How often a poller has polled since it started."""
+
+    polls: int
+    """How many reads finished, successfully or not."""
+
+    idle_polls: int
+    """How many of those reads found the reader idle, and slowed polling down."""
+
+    errors: int
+    """How many of those reads raised an exception."""
+
+    read_seconds: float
+    """The total time spent reading."""
+
+    elapsed_seconds: float
+    """The time since polling started."""
+
+    @property
+    def poll_rate(self) -> float:
+        """The average number of polls per second."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.polls / self.elapsed_seconds
+
 
 class Poller:
     """A poller to call a given reader on an interval.
 
+    While the reader reports that it is idle, the poller backs off to a longer
+    interval. It goes back to the regular interval as soon as anything waits
+    for the next poll, so `wait_next_poll` never waits longer than it would
+    without the back-off.
+
     Args:
         reader: An interface to read data.
         interval: The poll interval, in seconds.
+        idle_interval: The poll interval while the reader is idle, in seconds.
+            If not specified, always poll at `interval`.
     """
 
     interval: float
+    idle_interval: float
 
-    def __init__(self, reader: Reader, interval: float) -> None:
+    def __init__(
+        self, reader: Reader, interval: float, idle_interval: Optional[float] = None
+    ) -> None:
         self.interval = interval
+        self.idle_interval = max(interval, idle_interval or interval)
         self._reader = reader
         self._read_lock: Optional["asyncio.Lock"] = None
+        self._poll_requested: Optional["asyncio.Event"] = None
         self._poll_waiters: List["asyncio.Future[None]"] = []
         self._poll_forever_task: Optional["asyncio.Task[None]"] = None
+        self._started_at: Optional[float] = None
+        self._polls = 0
+        self._idle_polls = 0
+        self._errors = 0
+        self._read_seconds = 0.0
+
+    @property
+    def metrics(self) -> PollerMetrics:
+        """Get how often this poller has polled since it started."""
+        return PollerMetrics(
+            polls=self._polls,
+            idle_polls=self._idle_polls,
+            errors=self._errors,
+            read_seconds=self._read_seconds,
+            elapsed_seconds=(
+                0.0 if self._started_at is None else time.monotonic() - self._started_at
+            ),
+        )
 
     async def start(self) -> None:
         if self._poll_forever_task is None:
+            self._started_at = time.monotonic()
             self._poll_forever_task = asyncio.create_task(self._poll_forever())
             await self.wait_next_poll()
 
@@ -64,6 +143,8 @@ class Poller:
 
         poll_future = asyncio.get_running_loop().create_future()
         self._poll_waiters.append(poll_future)
+        if self._poll_requested is not None:
+            self._poll_requested.set()
         await poll_future
 
     @contextlib.asynccontextmanager
@@ -78,6 +159,23 @@ class Poller:
         while True:
             await self._poll_once()
             await asyncio.sleep(self.interval)
+            if (
+                self.idle_interval > self.interval
+                and not self._poll_waiters
+                and self._reader.is_idle()
+            ):
+                await self._back_off()
+
+    async def _back_off(self) -> None:
+        """Wait out the rest of the idle interval, unless a poll is requested."""
+        self._idle_polls += 1
+        self._poll_requested = self._poll_requested or asyncio.Event()
+        self._poll_requested.clear()
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(
+                self._poll_requested.wait(),
+                timeout=self.idle_interval - self.interval,
+            )
 
     @staticmethod
     def _set_waiter_complete(
@@ -92,6 +190,7 @@ class Poller:
         """Trigger a single read, notifying listeners of success or error."""
         previous_waiters = self._poll_waiters
         self._poll_waiters = []
+        read_started_at = time.monotonic()
 
         try:
             async with self._use_read_lock():
@@ -99,14 +198,18 @@ class Poller:
         except asyncio.CancelledError:
             raise
         except AbsorbanceReaderDisconnectedError as e:
+            self._errors += 1
             for waiter in previous_waiters:
                 Poller._set_waiter_complete(waiter, None)
             self._reader.on_error(e)
         except Exception as e:
             log.exception("Polling exception")
+            self._errors += 1
             self._reader.on_error(e)
             for waiter in previous_waiters:
                 Poller._set_waiter_complete(waiter, e)
         else:
             for waiter in previous_waiters:
                 Poller._set_waiter_complete(waiter)
+        self._polls += 1
+        self._read_seconds += time.monotonic() - read_started_at
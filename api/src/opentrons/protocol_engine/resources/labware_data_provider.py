@@ -4,6 +4,7 @@ This module is a wrapper around existing, but older, internal APIs to
 abstract away rough edges until we can improve those underlying interfaces.
 """
 import logging
+from functools import lru_cache
 from anyio import to_thread
 
 from opentrons_shared_data.labware.labware_definition import (
@@ -12,6 +13,7 @@ from opentrons_shared_data.labware.labware_definition import (
     labware_definition_type_adapter,
 )
 
+from opentrons.protocols.api_support.constants import OPENTRONS_NAMESPACE
 from opentrons.protocols.labware import get_labware_definition
 
 # TODO (lc 09-26-2022) We should conditionally import ot2 or ot3 calibration
@@ -49,6 +51,8 @@ class LabwareDataProvider:
     def _get_labware_definition_sync(
         load_name: str, namespace: str, version: int
     ) -> LabwareDefinition:
+        if namespace.lower() == OPENTRONS_NAMESPACE:
+            return _get_opentrons_labware_definition(load_name.lower(), version)
         return labware_definition_type_adapter.validate_python(
             get_labware_definition(load_name, namespace, version)
         )
@@ -104,3 +108,17 @@ class LabwareDataProvider:
                 )
                 log.debug(message, exc_info=e)
                 return nominal_fallback
+
+
+@lru_cache(maxsize=None)
+def _get_opentrons_labware_definition(
+    load_name: str, version: int
+) -> LabwareDefinition:
+    """Get an Opentrons labware definition, validating it only the first time.
+
+    Opentrons definitions ship with the software and can't be changed, so every
+    request for the same one can share the same validated model.
+    """
+    return labware_definition_type_adapter.validate_python(
+        get_labware_definition(load_name, OPENTRONS_NAMESPACE, version)
+    )
@@ -22,6 +22,11 @@ class HandlesActions(ABC):
     """Abstract interface for an object that reacts to actions."""
 
     @abstractmethod
-    def handle_action(self, action: Action) -> None:
-        """React to a state-change action."""
+    def handle_action(self, action: Action) -> bool:
+        """React to a state-change action.
+
+        Returns:
+            Whether the action changed this store's state. Stores may return True
+            when unsure, but must never return False after changing state.
+        """
         ...
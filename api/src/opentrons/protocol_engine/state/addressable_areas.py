@@ -146,22 +146,26 @@ class AddressableAreaStore(HasState[AddressableAreaState], HandlesActions):
             robot_definition=robot_definition,
         )
 
-    def handle_action(self, action: Action) -> None:
+    def handle_action(self, action: Action) -> bool:
         """Modify state in reaction to an action."""
+        changed = False
         for state_update in get_state_updates(action):
             if state_update.addressable_area_used != update_types.NO_CHANGE:
-                self._add_addressable_area(
+                if self._add_addressable_area(
                     state_update.addressable_area_used.addressable_area_name
-                )
+                ):
+                    changed = True
 
         if isinstance(action, AddAddressableAreaAction):
-            self._add_addressable_area(action.addressable_area_name)
+            if self._add_addressable_area(action.addressable_area_name):
+                changed = True
         elif isinstance(action, SetDeckConfigurationAction):
             current_state = self._state
             if (
                 action.deck_configuration is not None
                 and not self._state.use_simulated_deck_config
             ):
+                changed = True
                 self._state.deck_configuration = action.deck_configuration
                 self._state.loaded_addressable_areas_by_name = (
                     self._get_addressable_areas_from_deck_configuration(
@@ -170,6 +174,8 @@ class AddressableAreaStore(HasState[AddressableAreaState], HandlesActions):
                     )
                 )
 
+        return changed
+
     @staticmethod
     def _get_addressable_areas_from_deck_configuration(
         deck_config: DeckConfigurationType, deck_definition: DeckDefinitionV5
@@ -195,8 +201,11 @@ class AddressableAreaStore(HasState[AddressableAreaState], HandlesActions):
                 )
         return {area.area_name: area for area in addressable_areas}
 
-    def _add_addressable_area(self, addressable_area_name: str) -> None:
-        if addressable_area_name not in self._state.loaded_addressable_areas_by_name:
+    def _add_addressable_area(self, addressable_area_name: str) -> bool:
+        """Load an addressable area, returning whether it wasn't already loaded."""
+        if addressable_area_name in self._state.loaded_addressable_areas_by_name:
+            return False
+        else:
             cutout_id = self._validate_addressable_area_for_simulation(
                 addressable_area_name
             )
@@ -214,6 +223,7 @@ class AddressableAreaStore(HasState[AddressableAreaState], HandlesActions):
             self._state.loaded_addressable_areas_by_name[
                 addressable_area.area_name
             ] = addressable_area
+            return True
 
     def _validate_addressable_area_for_simulation(
         self, addressable_area_name: str
@@ -271,7 +271,7 @@ class CommandStore(HasState[CommandState], HandlesActions):
             has_entered_error_recovery=False,
         )
 
-    def handle_action(self, action: Action) -> None:
+    def handle_action(self, action: Action) -> bool:
         """Modify state in reaction to an action."""
         match action:
             case QueueCommandAction():
@@ -299,7 +299,8 @@ class CommandStore(HasState[CommandState], HandlesActions):
             case SetErrorRecoveryPolicyAction():
                 self._handle_set_error_recovery_policy_action(action)
             case _:
-                pass
+                return False
+        return True
 
     def _handle_queue_command_action(self, action: QueueCommandAction) -> None:
         # TODO(mc, 2021-06-22): mypy has trouble with this automatic
@@ -25,14 +25,18 @@ class FileStore(HasState[FileState], HandlesActions):
         """Initialize a File store and its state."""
         self._state = FileState(file_ids=[])
 
-    def handle_action(self, action: Action) -> None:
+    def handle_action(self, action: Action) -> bool:
         """Modify state in reaction to an action."""
+        changed = False
         for state_update in get_state_updates(action):
-            self._handle_state_update(state_update)
+            changed = self._handle_state_update(state_update) or changed
+        return changed
 
-    def _handle_state_update(self, state_update: update_types.StateUpdate) -> None:
+    def _handle_state_update(self, state_update: update_types.StateUpdate) -> bool:
         if state_update.files_added != update_types.NO_CHANGE:
             self._state.file_ids.extend(state_update.files_added.file_ids)
+            return True
+        return False
 
 
 class FileView:
@@ -1,5 +1,7 @@
 """Helper functions for liquid-level related calculations inside a given frustum."""
-from typing import List, Tuple
+import weakref
+from bisect import bisect_left
+from typing import Callable, Dict, List, Tuple, TypeVar, Union
 from numpy import pi, iscomplex, roots, real
 from math import isclose
 
@@ -19,6 +21,70 @@ from opentrons_shared_data.labware.labware_definition import (
 )
 
 
+class _SortedTable:
+    """A segment's height/volume lookup table, with its keys sorted for bisection."""
+
+    def __init__(self, table: Dict[float, float]) -> None:
+        self._table = table
+        self._keys = list(table.keys())
+        self._values = list(table.values())
+        self._is_sorted = all(a < b for a, b in zip(self._keys, self._keys[1:]))
+
+    def get_nearest(self, target: float) -> float:
+        """Get the value of the first key that's closest to the target."""
+        keys = self._keys
+        if not self._is_sorted:
+            return self._table[min(keys, key=lambda x: abs(x - target))]
+        index = bisect_left(keys, target)
+        if index == len(keys) or (
+            index > 0 and abs(keys[index - 1] - target) <= abs(keys[index] - target)
+        ):
+            index -= 1
+        # Equally close keys can only come before this one, and the first one wins.
+        while index > 0 and abs(keys[index - 1] - target) == abs(keys[index] - target):
+            index -= 1
+        return self._values[index]
+
+
+_T = TypeVar("_T")
+
+# Tables derived from labware definitions, by the ID of the model they came from.
+_tables_by_height: Dict[int, _SortedTable] = {}
+_tables_by_volume: Dict[int, _SortedTable] = {}
+_volumetric_capacities: Dict[int, List[Tuple[float, float]]] = {}
+
+
+def _derive_once(owner: object, cache: Dict[int, _T], derive: Callable[[], _T]) -> _T:
+    """Derive something from part of a labware definition the first time it's needed.
+
+    Labware definitions are shared by all the labware loaded from them, so this
+    happens about once per definition. The result is dropped along with `owner`.
+    """
+    key = id(owner)
+    derived = cache.get(key)
+    if derived is None:
+        derived = derive()
+        cache[key] = derived
+        weakref.finalize(owner, cache.pop, key, None)
+    return derived
+
+
+def _get_table_by_height(
+    segment: Union[ConicalFrustum, SquaredConeSegment]
+) -> _SortedTable:
+    return _derive_once(
+        segment, _tables_by_height, lambda: _SortedTable(segment.height_to_volume_table)
+    )
+
+
+def _get_table_by_volume(
+    segment: Union[ConicalFrustum, SquaredConeSegment]
+) -> _SortedTable:
+    return _derive_once(
+        segment, _tables_by_volume, lambda: _SortedTable(segment.volume_to_height_table)
+    )
+
+
 def _reject_unacceptable_heights(
     potential_heights: List[float], max_height: float
 ) -> float:
@@ -89,9 +155,7 @@ def _volume_from_height_circular(
     target_height: float, segment: ConicalFrustum
 ) -> float:
     """Find the volume given a height within a circular frustum."""
-    heights = segment.height_to_volume_table.keys()
-    best_fit_height = min(heights, key=lambda x: abs(x - target_height))
-    return segment.height_to_volume_table[best_fit_height]
+    return _get_table_by_height(segment).get_nearest(target_height)
 
 
 def _volume_from_height_rectangular(
@@ -129,18 +193,14 @@ def _volume_from_height_squared_cone(
     target_height: float, segment: SquaredConeSegment
 ) -> float:
     """Find the volume given a height within a squared cone segment."""
-    heights = segment.height_to_volume_table.keys()
-    best_fit_height = min(heights, key=lambda x: abs(x - target_height))
-    return segment.height_to_volume_table[best_fit_height]
+    return _get_table_by_height(segment).get_nearest(target_height)
 
 
 def _height_from_volume_circular(
     target_volume: float, segment: ConicalFrustum
 ) -> float:
     """Find the height given a volume within a squared cone segment."""
-    volumes = segment.volume_to_height_table.keys()
-    best_fit_volume = min(volumes, key=lambda x: abs(x - target_volume))
-    return segment.volume_to_height_table[best_fit_volume]
+    return _get_table_by_volume(segment).get_nearest(target_volume)
 
 
 def _height_from_volume_rectangular(
@@ -194,9 +254,7 @@ def _height_from_volume_squared_cone(
     target_volume: float, segment: SquaredConeSegment
 ) -> float:
     """Find the height given a volume within a squared cone segment."""
-    volumes = segment.volume_to_height_table.keys()
-    best_fit_volume = min(volumes, key=lambda x: abs(x - target_volume))
-    return segment.volume_to_height_table[best_fit_volume]
+    return _get_table_by_volume(segment).get_nearest(target_volume)
 
 
 def _get_segment_capacity(segment: WellSegment) -> float:
@@ -246,6 +304,22 @@ def get_well_volumetric_capacity(
     well_geometry: InnerWellGeometry,
 ) -> List[Tuple[float, float]]:
     """Return the volumetric capacity of a well as a list of pairs relating segment heights to volumes."""
+    return list(_get_volumetric_capacity(well_geometry))
+
+
+def _get_volumetric_capacity(
+    well_geometry: InnerWellGeometry,
+) -> List[Tuple[float, float]]:
+    return _derive_once(
+        well_geometry,
+        _volumetric_capacities,
+        lambda: _compute_volumetric_capacity(well_geometry),
+    )
+
+
+def _compute_volumetric_capacity(
+    well_geometry: InnerWellGeometry,
+) -> List[Tuple[float, float]]:
     #  [(top_height_0, section_0_volume), (top_height_1, section_1_volume), ...]
     well_volume = []
 
@@ -366,7 +440,7 @@ def find_volume_at_well_height(
     # comparisons with SimulatedProbeResult objects aren't meaningful, just return
     if isinstance(target_height, SimulatedProbeResult):
         return target_height
-    volumetric_capacity = get_well_volumetric_capacity(well_geometry)
+    volumetric_capacity = _get_volumetric_capacity(well_geometry)
     max_height = volumetric_capacity[-1][0]
     if target_height < 0 or target_height > max_height:
         raise InvalidLiquidHeightFound("Invalid target height.")
@@ -434,7 +508,7 @@ def find_height_at_well_volume(
     if isinstance(target_volume, SimulatedProbeResult):
         return target_volume
 
-    volumetric_capacity = get_well_volumetric_capacity(well_geometry)
+    volumetric_capacity = _get_volumetric_capacity(well_geometry)
     max_volume = sum(row[1] for row in volumetric_capacity)
 
     if raise_error_if_result_invalid:
@@ -149,6 +149,19 @@ class GeometryView:
         self._pipettes = pipette_view
         self._addressable_areas = addressable_area_view
         self._last_drop_tip_location_spot: Dict[str, _TipDropSection] = {}
+        self._labware_parent_nominal_position_by_id: Dict[str, Point] = {}
+        self._labware_position_by_id: Dict[str, Point] = {}
+        self._all_obstacle_highest_z: Optional[float] = None
+
+    def clear_cached_positions(self) -> None:
+        """Forget memoized labware positions and obstacle heights.
+
+        Call this whenever labware, modules, or addressable areas change, since
+        those are what the memoized values are computed from.
+        """
+        self._labware_parent_nominal_position_by_id.clear()
+        self._labware_position_by_id.clear()
+        self._all_obstacle_highest_z = None
 
     @cached_property
     def absolute_deck_extents(self) -> _AbsoluteRobotExtents:
@@ -182,6 +195,11 @@ class GeometryView:
 
     def get_all_obstacle_highest_z(self) -> float:
         """Get the highest Z-point across all obstacles that the instruments need to fly over."""
+        if self._all_obstacle_highest_z is None:
+            self._all_obstacle_highest_z = self._get_all_obstacle_highest_z()
+        return self._all_obstacle_highest_z
+
+    def _get_all_obstacle_highest_z(self) -> float:
         highest_labware_z = max(
             (
                 self._get_highest_z_from_labware_data(lw_data)
@@ -294,6 +312,13 @@ class GeometryView:
 
     def get_labware_parent_nominal_position(self, labware_id: str) -> Point:
         """Get the position of the labware's uncalibrated parent (deck slot, module, or another labware)."""
+        position = self._labware_parent_nominal_position_by_id.get(labware_id)
+        if position is None:
+            position = self._get_labware_parent_nominal_position(labware_id)
+            self._labware_parent_nominal_position_by_id[labware_id] = position
+        return position
+
+    def _get_labware_parent_nominal_position(self, labware_id: str) -> Point:
         try:
             addressable_area_name = self.get_ancestor_slot_name(labware_id).id
         except errors.LocationIsStagingSlotError:
@@ -451,6 +476,13 @@ class GeometryView:
 
     def get_labware_position(self, labware_id: str) -> Point:
         """Get the calibrated origin of the labware."""
+        position = self._labware_position_by_id.get(labware_id)
+        if position is None:
+            position = self._get_labware_position(labware_id)
+            self._labware_position_by_id[labware_id] = position
+        return position
+
+    def _get_labware_position(self, labware_id: str) -> Point:
         origin_pos = self.get_labware_origin_position(labware_id)
         cal_offset = self._labware.get_labware_offset_vector(labware_id)
 
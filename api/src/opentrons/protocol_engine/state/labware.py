@@ -123,6 +123,17 @@ class LabwareState:
     deck_definition: DeckDefinitionV5
 
 
+def _changes_labware(state_update: update_types.StateUpdate) -> bool:
+    return (
+        state_update.loaded_labware != update_types.NO_CHANGE
+        or state_update.batch_loaded_labware != update_types.NO_CHANGE
+        or state_update.loaded_lid_stack != update_types.NO_CHANGE
+        or state_update.labware_location != update_types.NO_CHANGE
+        or state_update.batch_labware_location != update_types.NO_CHANGE
+        or state_update.labware_lid != update_types.NO_CHANGE
+    )
+
+
 class LabwareStore(HasState[LabwareState], HandlesActions):
     """Labware state container."""
 
@@ -164,9 +175,13 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
             deck_definition=deck_definition,
         )
 
-    def handle_action(self, action: Action) -> None:
+    def handle_action(self, action: Action) -> bool:
         """Modify state in reaction to an action."""
+        changed = False
         for state_update in get_state_updates(action):
+            if not _changes_labware(state_update):
+                continue
+            changed = True
             self._add_loaded_labware(state_update)
             self._add_batch_loaded_labwares(state_update)
             self._add_loaded_lid_stack(state_update)
@@ -184,6 +199,7 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
                 vector=action.request.vector,
             )
             self._add_labware_offset(labware_offset)
+            changed = True
 
         elif isinstance(action, AddLabwareDefinitionAction):
             uri = uri_from_details(
@@ -192,6 +208,9 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
                 version=action.definition.version,
             )
             self._state.definitions_by_uri[uri] = action.definition
+            changed = True
+
+        return changed
 
     def _add_labware_offset(self, labware_offset: LabwareOffset) -> None:
         """Add a new labware offset to state.
@@ -34,13 +34,16 @@ class LiquidClassStore(HasState[LiquidClassState], HandlesActions):
             liquid_class_record_to_id={},
         )
 
-    def handle_action(self, action: Action) -> None:
+    def handle_action(self, action: Action) -> bool:
         """Update the state in response to the action."""
+        changed = False
         for state_update in get_state_updates(action):
             if state_update.liquid_class_loaded != update_types.NO_CHANGE:
                 self._handle_liquid_class_loaded_update(
                     state_update.liquid_class_loaded
                 )
+                changed = True
+        return changed
 
     def _handle_liquid_class_loaded_update(
         self, state_update: update_types.LiquidClassLoadedUpdate
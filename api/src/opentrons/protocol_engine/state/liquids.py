@@ -24,10 +24,12 @@ class LiquidStore(HasState[LiquidState], HandlesActions):
         """Initialize a liquid store and its state."""
         self._state = LiquidState(liquids_by_id={})
 
-    def handle_action(self, action: Action) -> None:
+    def handle_action(self, action: Action) -> bool:
         """Modify state in reaction to an action."""
         if isinstance(action, AddLiquidAction):
             self._add_liquid(action)
+            return True
+        return False
 
     def _add_liquid(self, action: AddLiquidAction) -> None:
         """Add liquid to protocol liquids."""
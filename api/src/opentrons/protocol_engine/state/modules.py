@@ -204,6 +204,38 @@ class ModuleState:
     """
 
 
+_HEATER_SHAKER_RESULTS = (
+    heater_shaker.SetTargetTemperatureResult,
+    heater_shaker.DeactivateHeaterResult,
+    heater_shaker.SetAndWaitForShakeSpeedResult,
+    heater_shaker.DeactivateShakerResult,
+    heater_shaker.OpenLabwareLatchResult,
+    heater_shaker.CloseLabwareLatchResult,
+)
+
+_TEMPERATURE_MODULE_RESULTS = (
+    temperature_module.SetTargetTemperatureResult,
+    temperature_module.DeactivateTemperatureResult,
+)
+
+_THERMOCYCLER_RESULTS = (
+    thermocycler.SetTargetBlockTemperatureResult,
+    thermocycler.DeactivateBlockResult,
+    thermocycler.SetTargetLidTemperatureResult,
+    thermocycler.DeactivateLidResult,
+    thermocycler.OpenLidResult,
+    thermocycler.CloseLidResult,
+)
+
+_MODULE_COMMAND_RESULTS = (
+    LoadModuleResult,
+    CalibrateModuleResult,
+    *_HEATER_SHAKER_RESULTS,
+    *_TEMPERATURE_MODULE_RESULTS,
+    *_THERMOCYCLER_RESULTS,
+)
+
+
 class ModuleStore(HasState[ModuleState], HandlesActions):
     """Module state container."""
 
@@ -228,10 +260,11 @@ class ModuleStore(HasState[ModuleState], HandlesActions):
         )
         self._robot_type = config.robot_type
 
-    def handle_action(self, action: Action) -> None:
+    def handle_action(self, action: Action) -> bool:
         """Modify state in reaction to an action."""
+        changed = False
         if isinstance(action, SucceedCommandAction):
-            self._handle_command(action.command)
+            changed = self._handle_command(action.command)
 
         elif isinstance(action, AddModuleAction):
             self._add_module_substate(
@@ -242,14 +275,22 @@ class ModuleStore(HasState[ModuleState], HandlesActions):
                 requested_model=None,
                 module_live_data=action.module_live_data,
             )
+            changed = True
 
         for state_update in get_state_updates(action):
-            self._handle_state_update(state_update)
+            if not state_update.is_empty() and self._handle_state_update(state_update):
+                changed = True
+
+        return changed
 
-    def _handle_command(self, command: Command) -> None:
+    def _handle_command(self, command: Command) -> bool:
         # todo(mm, 2024-11-04): Delete this function. Port these isinstance()
         # checks to the update_types.StateUpdate mechanism.
 
+        # Most commands don't touch modules, so rule them out with a single check.
+        if not isinstance(command.result, _MODULE_COMMAND_RESULTS):
+            return False
+
         if isinstance(command.result, LoadModuleResult):
             slot_name = command.params.location.slotName
             self._add_module_substate(
@@ -268,48 +309,28 @@ class ModuleStore(HasState[ModuleState], HandlesActions):
                 location=command.result.location,
             )
 
-        if isinstance(
-            command.result,
-            (
-                heater_shaker.SetTargetTemperatureResult,
-                heater_shaker.DeactivateHeaterResult,
-                heater_shaker.SetAndWaitForShakeSpeedResult,
-                heater_shaker.DeactivateShakerResult,
-                heater_shaker.OpenLabwareLatchResult,
-                heater_shaker.CloseLabwareLatchResult,
-            ),
-        ):
+        if isinstance(command.result, _HEATER_SHAKER_RESULTS):
             self._handle_heater_shaker_commands(command)
 
-        if isinstance(
-            command.result,
-            (
-                temperature_module.SetTargetTemperatureResult,
-                temperature_module.DeactivateTemperatureResult,
-            ),
-        ):
+        if isinstance(command.result, _TEMPERATURE_MODULE_RESULTS):
             self._handle_temperature_module_commands(command)
 
-        if isinstance(
-            command.result,
-            (
-                thermocycler.SetTargetBlockTemperatureResult,
-                thermocycler.DeactivateBlockResult,
-                thermocycler.SetTargetLidTemperatureResult,
-                thermocycler.DeactivateLidResult,
-                thermocycler.OpenLidResult,
-                thermocycler.CloseLidResult,
-            ),
-        ):
+        if isinstance(command.result, _THERMOCYCLER_RESULTS):
             self._handle_thermocycler_module_commands(command)
 
-    def _handle_state_update(self, state_update: update_types.StateUpdate) -> None:
+        return True
+
+    def _handle_state_update(self, state_update: update_types.StateUpdate) -> bool:
+        changed = False
         if state_update.absorbance_reader_state_update != update_types.NO_CHANGE:
             self._handle_absorbance_reader_commands(
                 state_update.absorbance_reader_state_update
             )
+            changed = True
         if state_update.flex_stacker_state_update != update_types.NO_CHANGE:
             self._handle_flex_stacker_commands(state_update.flex_stacker_state_update)
+            changed = True
+        return changed
 
     def _add_module_substate(
         self,
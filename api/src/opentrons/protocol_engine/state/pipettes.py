@@ -147,18 +147,25 @@ class PipetteStore(HasState[PipetteState], HandlesActions):
             liquid_presence_detection_by_id={},
         )
 
-    def handle_action(self, action: Action) -> None:
+    def handle_action(self, action: Action) -> bool:
         """Modify state in reaction to an action."""
+        changed = False
         for state_update in get_state_updates(action):
+            if state_update.is_empty():
+                continue
             self._set_load_pipette(state_update)
             self._update_current_location(state_update)
             self._update_pipette_config(state_update)
             self._update_pipette_nozzle_map(state_update)
             self._update_tip_state(state_update)
             self._update_volumes(state_update)
+            changed = True
 
         if isinstance(action, SetPipetteMovementSpeedAction):
             self._state.movement_speed_by_id[action.pipette_id] = action.speed
+            changed = True
+
+        return changed
 
     def _set_load_pipette(self, state_update: update_types.StateUpdate) -> None:
         if state_update.loaded_pipette != update_types.NO_CHANGE:
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional, Sequence, TypeVar
+from typing import Any, Callable, Dict, Optional, Protocol, Sequence, TypeVar
 from typing_extensions import ParamSpec
 
 from opentrons_shared_data.deck.types import DeckDefinitionV5
@@ -14,7 +14,7 @@ from opentrons.util.change_notifier import ChangeNotifier
 
 from ..resources import DeckFixedLabware
 from ..actions import Action, ActionHandler
-from ._abstract_store import HasState, HandlesActions
+from ._abstract_store import HasState
 from .commands import CommandState, CommandStore, CommandView
 from .addressable_areas import (
     AddressableAreaState,
@@ -39,6 +39,40 @@ from ..types import DeckConfigurationType
 _ParamsT = ParamSpec("_ParamsT")
 _ReturnT = TypeVar("_ReturnT")
 
+# The substates that `GeometryView`'s memoized positions and heights derive from.
+_GEOMETRY_SUBSTATES = frozenset({"labware", "modules", "addressable_areas"})
+
+# The substates that `StateView.get_summary()` reads from.
+_SUMMARY_SUBSTATES = frozenset(
+    {
+        "commands",
+        "pipettes",
+        "labware",
+        "modules",
+        "liquids",
+        "liquid_classes",
+        "wells",
+        "files",
+    }
+)
+
+
+class _Substore(Protocol):
+    """A store that owns one field of `State`."""
+
+    @property
+    def state(self) -> Any:
+        ...
+
+    def handle_action(self, action: Action) -> bool:
+        ...
+
+
+class _SubstateView(Protocol):
+    """A view that reads one field of `State`."""
+
+    _state: Any
+
 
 @dataclass(frozen=True)
 class State:
@@ -232,21 +266,23 @@ class StateStore(StateView, ActionHandler):
         self._well_store = WellStore()
         self._file_store = FileStore()
 
-        self._substores: List[HandlesActions] = [
-            self._command_store,
-            self._pipette_store,
-            self._addressable_area_store,
-            self._labware_store,
-            self._module_store,
-            self._liquid_store,
-            self._liquid_class_store,
-            self._tip_store,
-            self._well_store,
-            self._file_store,
-        ]
+        # Keyed by the name of the `State` field that each substore owns.
+        self._substores: Dict[str, _Substore] = {
+            "commands": self._command_store,
+            "pipettes": self._pipette_store,
+            "addressable_areas": self._addressable_area_store,
+            "labware": self._labware_store,
+            "modules": self._module_store,
+            "liquids": self._liquid_store,
+            "liquid_classes": self._liquid_class_store,
+            "tips": self._tip_store,
+            "wells": self._well_store,
+            "files": self._file_store,
+        }
         self._config = config
         self._change_notifier = change_notifier or ChangeNotifier()
         self._notify_robot_server = notify_publishers
+        self._summary: Optional[StateSummary] = None
         self._initialize_state()
 
     def handle_action(self, action: Action) -> None:
@@ -256,10 +292,26 @@ class StateStore(StateView, ActionHandler):
             action: An action object representing a state change. Will be
                 passed to all substores so they can react accordingly.
         """
-        for substore in self._substores:
-            substore.handle_action(action)
+        changed_substates = {
+            name: substore.state
+            for name, substore in self._substores.items()
+            # Every substore must see every action, so this must not short-circuit.
+            if substore.handle_action(action)
+        }
+
+        if changed_substates:
+            self._update_state_views(changed_substates)
+
+    def get_summary(self) -> StateSummary:
+        """Get protocol run data.
 
-        self._update_state_views()
+        The summary is only rebuilt after the state that it summarizes changes,
+        so callers that poll it get the same object back until then, and must
+        not modify it.
+        """
+        if self._summary is None:
+            self._summary = super().get_summary()
+        return self._summary
 
     async def wait_for(
         self,
@@ -380,6 +432,18 @@ class StateStore(StateView, ActionHandler):
         self._tips = TipView(state.tips)
         self._wells = WellView(state.wells)
         self._files = FileView(state.files)
+        self._substate_views: Dict[str, _SubstateView] = {
+            "commands": self._commands,
+            "addressable_areas": self._addressable_areas,
+            "labware": self._labware,
+            "pipettes": self._pipettes,
+            "modules": self._modules,
+            "liquids": self._liquid,
+            "liquid_classes": self._liquid_classes,
+            "tips": self._tips,
+            "wells": self._wells,
+            "files": self._files,
+        }
 
         # Derived states
         self._geometry = GeometryView(
@@ -399,19 +463,19 @@ class StateStore(StateView, ActionHandler):
             module_view=self._modules,
         )
 
-    def _update_state_views(self) -> None:
-        """Update state view interfaces to use latest underlying values."""
-        next_state = self._get_next_state()
-        self._state = next_state
-        self._commands._state = next_state.commands
-        self._addressable_areas._state = next_state.addressable_areas
-        self._labware._state = next_state.labware
-        self._pipettes._state = next_state.pipettes
-        self._modules._state = next_state.modules
-        self._liquid._state = next_state.liquids
-        self._liquid_classes._state = next_state.liquid_classes
-        self._tips._state = next_state.tips
-        self._wells._state = next_state.wells
+    def _update_state_views(self, changed_substates: Dict[str, Any]) -> None:
+        """Update state view interfaces to use latest underlying values.
+
+        Only the views of substates that changed are re-pointed. Unchanged substates
+        are shared with the previous `State` value.
+        """
+        self._state = self._get_next_state()
+        for name, substate in changed_substates.items():
+            self._substate_views[name]._state = substate
+        if not _GEOMETRY_SUBSTATES.isdisjoint(changed_substates):
+            self._geometry.clear_cached_positions()
+        if not _SUMMARY_SUBSTATES.isdisjoint(changed_substates):
+            self._summary = None
         self._change_notifier.notify()
         if self._notify_robot_server is not None:
             self._notify_robot_server()
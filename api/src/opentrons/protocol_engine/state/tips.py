@@ -1,8 +1,8 @@
 """Tip state tracking."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
-from typing import Dict, Optional, List, Union
+from typing import Dict, Optional, List, Sequence, Tuple
 
 from opentrons.types import NozzleMapInterface
 from opentrons.protocol_engine.state import update_types
@@ -23,6 +23,11 @@ class TipRackWellState(Enum):
 
 TipRackStateByWellName = Dict[str, TipRackWellState]
 
+# The parts of a `TipView.get_next_tip()` call that its result depends on, besides
+# the tip rack: the number of tips, the starting tip, and, if there's a nozzle map,
+# its physical nozzle count, starting nozzle, and active column and row counts.
+_NextTipQuery = Tuple[int, Optional[str], Optional[Tuple[int, str, int, int]]]
+
 
 # todo(mm, 2024-10-10): This info is duplicated between here and PipetteState because
 # TipStore is using it to compute which tips a PickUpTip removes from the tip rack,
@@ -36,12 +41,34 @@ class _PipetteInfo:
     nozzle_map: NozzleMap
 
 
+@dataclass(frozen=True)
+class _NextTipSearch:
+    """The result of a `TipView.get_next_tip()` query on a tip rack.
+
+    Using tips never makes a tip cluster that a cluster search passed over
+    usable again, so if the only change to the tip rack since the search is that
+    more tips were used, the search can resume from the cluster it stopped at
+    instead of starting over.
+    """
+
+    result: Optional[str]
+    # The tip rack's used tip masks when the search was made.
+    used_tip_masks: Tuple[int, ...] = ()
+    # The critical (column, row) indices of each cluster to search, in order.
+    clusters: Sequence[Tuple[int, int]] = ()
+    resume_from: int = 0
+
+
 @dataclass
 class TipState:
     """State of all tips."""
 
     tips_by_labware_id: Dict[str, TipRackStateByWellName]
     column_by_labware_id: Dict[str, List[List[str]]]
+    # The (column, row) indices of each well in `column_by_labware_id`.
+    well_indices_by_labware_id: Dict[str, Dict[str, Tuple[int, int]]]
+    # For each column of each tip rack, a bitmask of its used tips, by row index.
+    used_tip_masks_by_labware_id: Dict[str, List[int]]
 
     pipette_info_by_pipette_id: Dict[str, _PipetteInfo]
 
@@ -56,13 +83,18 @@ class TipStore(HasState[TipState], HandlesActions):
         self._state = TipState(
             tips_by_labware_id={},
             column_by_labware_id={},
+            well_indices_by_labware_id={},
+            used_tip_masks_by_labware_id={},
             pipette_info_by_pipette_id={},
         )
 
-    def handle_action(self, action: Action) -> None:
+    def handle_action(self, action: Action) -> bool:
         """Modify state in reaction to an action."""
+        changed = False
         for state_update in get_state_updates(action):
-            self._handle_state_update(state_update)
+            if not state_update.is_empty():
+                self._handle_state_update(state_update)
+                changed = True
 
         if isinstance(action, ResetTipsAction):
             labware_id = action.labware_id
@@ -71,6 +103,11 @@ class TipStore(HasState[TipState], HandlesActions):
                 self._state.tips_by_labware_id[labware_id][
                     well_name
                 ] = TipRackWellState.CLEAN
+            used_tip_masks = self._state.used_tip_masks_by_labware_id[labware_id]
+            used_tip_masks[:] = [0] * len(used_tip_masks)
+            changed = True
+
+        return changed
 
     def _handle_state_update(self, state_update: update_types.StateUpdate) -> None:
         if state_update.pipette_config != update_types.NO_CHANGE:
@@ -102,35 +139,39 @@ class TipStore(HasState[TipState], HandlesActions):
             labware_id = state_update.loaded_labware.labware_id
             definition = state_update.loaded_labware.definition
             if definition.parameters.isTiprack:
-                self._state.tips_by_labware_id[labware_id] = {
-                    well_name: TipRackWellState.CLEAN
-                    for column in definition.ordering
-                    for well_name in column
-                }
-                self._state.column_by_labware_id[labware_id] = [
-                    column for column in definition.ordering
-                ]
+                self._add_tip_rack(labware_id, definition.ordering)
         if state_update.batch_loaded_labware != update_types.NO_CHANGE:
             for labware_id in state_update.batch_loaded_labware.new_locations_by_id:
                 definition = state_update.batch_loaded_labware.definitions_by_id[
                     labware_id
                 ]
                 if definition.parameters.isTiprack:
-                    self._state.tips_by_labware_id[labware_id] = {
-                        well_name: TipRackWellState.CLEAN
-                        for column in definition.ordering
-                        for well_name in column
-                    }
-                    self._state.column_by_labware_id[labware_id] = [
-                        column for column in definition.ordering
-                    ]
+                    self._add_tip_rack(labware_id, definition.ordering)
+
+    def _add_tip_rack(self, labware_id: str, ordering: List[List[str]]) -> None:
+        self._state.tips_by_labware_id[labware_id] = {
+            well_name: TipRackWellState.CLEAN
+            for column in ordering
+            for well_name in column
+        }
+        self._state.column_by_labware_id[labware_id] = [column for column in ordering]
+        self._state.well_indices_by_labware_id[labware_id] = {
+            well_name: (column_index, row_index)
+            for column_index, column in enumerate(ordering)
+            for row_index, well_name in enumerate(column)
+        }
+        self._state.used_tip_masks_by_labware_id[labware_id] = [0] * len(ordering)
 
     def _set_used_tips(self, pipette_id: str, well_name: str, labware_id: str) -> None:
         columns = self._state.column_by_labware_id.get(labware_id, [])
         wells = self._state.tips_by_labware_id.get(labware_id, {})
+        well_indices = self._state.well_indices_by_labware_id.get(labware_id, {})
+        used_tip_masks = self._state.used_tip_masks_by_labware_id.get(labware_id, [])
         nozzle_map = self._state.pipette_info_by_pipette_id[pipette_id].nozzle_map
         for well in wells_covered_dense(nozzle_map, well_name, columns):
             wells[well] = TipRackWellState.USED
+            column_index, row_index = well_indices[well]
+            used_tip_masks[column_index] |= 1 << row_index
 
 
 class TipView:
@@ -145,8 +186,11 @@ class TipView:
             state: Liquid state dataclass used for all calculations.
         """
         self._state = state
+        # Past get_next_tip() searches, to resume from. This only caches
+        # results computed from the state, so the view stays read-only.
+        self._next_tip_searches: Dict[str, Dict[_NextTipQuery, _NextTipSearch]] = {}
 
-    def get_next_tip(  # noqa: C901
+    def get_next_tip(
         self,
         labware_id: str,
         num_tips: int,
@@ -154,258 +198,92 @@ class TipView:
         nozzle_map: Optional[NozzleMapInterface],
     ) -> Optional[str]:
         """Get the next available clean tip. Does not support use of a starting tip if the pipette used is in a partial configuration."""
-        wells = self._state.tips_by_labware_id.get(labware_id, {})
-        columns = self._state.column_by_labware_id.get(labware_id, [])
-
-        # TODO(sf): I'm pretty sure this can be replaced with wells_covered_96 but I'm not quite sure how
-        def _identify_tip_cluster(
-            active_columns: int,
-            active_rows: int,
-            critical_column: int,
-            critical_row: int,
-            entry_well: str,
-        ) -> Optional[List[str]]:
-            tip_cluster: list[str] = []
-            for i in range(active_columns):
-                if entry_well == "A1" or entry_well == "H1":
-                    if critical_column - i >= 0:
-                        column = columns[critical_column - i]
-                    else:
-                        return None
-                elif entry_well == "A12" or entry_well == "H12":
-                    if critical_column + i < len(columns):
-                        column = columns[critical_column + i]
-                    else:
-                        return None
-                else:
-                    raise ValueError(
-                        f"Invalid entry well {entry_well} for tip cluster identification."
-                    )
-                for j in range(active_rows):
-                    if entry_well == "A1" or entry_well == "A12":
-                        if critical_row - j >= 0:
-                            well = column[critical_row - j]
-                        else:
-                            return None
-                    elif entry_well == "H1" or entry_well == "H12":
-                        if critical_row + j < len(column):
-                            well = column[critical_row + j]
-                        else:
-                            return None
-                    tip_cluster.append(well)
-
-            if any(well not in [*wells] for well in tip_cluster):
-                return None
-
-            return tip_cluster
-
-        def _validate_tip_cluster(
-            active_columns: int, active_rows: int, tip_cluster: List[str]
-        ) -> Union[str, int, None]:
-            if not any(wells[well] == TipRackWellState.USED for well in tip_cluster):
-                return tip_cluster[0]
-            elif all(wells[well] == TipRackWellState.USED for well in tip_cluster):
-                return None
-            else:
-                # In the case of an 8ch pipette where a column has mixed state tips we may simply progress to the next column in our search
-                if nozzle_map is not None and nozzle_map.physical_nozzle_count == 8:
-                    return None
-
-                # In the case of a 96ch we can attempt to index in by singular rows and columns assuming that indexed direction is safe
-                # The tip cluster list is ordered: Each row from a column in order by columns
-                tip_cluster_final_column: list[str] = []
-                for i in range(active_rows):
-                    tip_cluster_final_column.append(
-                        tip_cluster[((active_columns * active_rows) - 1) - i]
-                    )
-                tip_cluster_final_row: list[str] = []
-                for i in range(active_columns):
-                    tip_cluster_final_row.append(
-                        tip_cluster[(active_rows - 1) + (i * active_rows)]
-                    )
-                if all(
-                    wells[well] == TipRackWellState.USED
-                    for well in tip_cluster_final_column
-                ):
-                    return None
-                elif all(
-                    wells[well] == TipRackWellState.USED
-                    for well in tip_cluster_final_row
-                ):
-                    return None
-                else:
-                    # Tiprack has no valid tip selection, cannot progress
-                    return -1
-
-        # Search through the tiprack beginning at A1
-        def _cluster_search_A1(active_columns: int, active_rows: int) -> Optional[str]:
-            critical_column = active_columns - 1
-            critical_row = active_rows - 1
-
-            while critical_column < len(columns):
-                tip_cluster = _identify_tip_cluster(
-                    active_columns, active_rows, critical_column, critical_row, "A1"
-                )
-                if tip_cluster is not None:
-                    result = _validate_tip_cluster(
-                        active_columns, active_rows, tip_cluster
-                    )
-                    if isinstance(result, str):
-                        return result
-                    elif isinstance(result, int) and result == -1:
-                        return None
-                if critical_row + 1 < len(columns[0]):
-                    critical_row = critical_row + 1
-                else:
-                    critical_column += 1
-                    critical_row = active_rows - 1
-            return None
-
-        # Search through the tiprack beginning at A12
-        def _cluster_search_A12(active_columns: int, active_rows: int) -> Optional[str]:
-            critical_column = len(columns) - active_columns
-            critical_row = active_rows - 1
-
-            while critical_column >= 0:
-                tip_cluster = _identify_tip_cluster(
-                    active_columns, active_rows, critical_column, critical_row, "A12"
-                )
-                if tip_cluster is not None:
-                    result = _validate_tip_cluster(
-                        active_columns, active_rows, tip_cluster
-                    )
-                    if isinstance(result, str):
-                        return result
-                    elif isinstance(result, int) and result == -1:
-                        return None
-                if critical_row + 1 < len(columns[0]):
-                    critical_row = critical_row + 1
-                else:
-                    critical_column -= 1
-                    critical_row = active_rows - 1
-            return None
-
-        # Search through the tiprack beginning at H1
-        def _cluster_search_H1(active_columns: int, active_rows: int) -> Optional[str]:
-            critical_column = active_columns - 1
-            critical_row = len(columns[critical_column]) - active_rows
-
-            while critical_column <= len(columns):  # change to max size of labware
-                tip_cluster = _identify_tip_cluster(
-                    active_columns, active_rows, critical_column, critical_row, "H1"
-                )
-                if tip_cluster is not None:
-                    result = _validate_tip_cluster(
-                        active_columns, active_rows, tip_cluster
-                    )
-                    if isinstance(result, str):
-                        return result
-                    elif isinstance(result, int) and result == -1:
-                        return None
-                if critical_row - 1 >= 0:
-                    critical_row = critical_row - 1
-                else:
-                    critical_column += 1
-                    if critical_column >= len(columns):
-                        return None
-                    critical_row = len(columns[critical_column]) - active_rows
-            return None
-
-        # Search through the tiprack beginning at H12
-        def _cluster_search_H12(active_columns: int, active_rows: int) -> Optional[str]:
-            critical_column = len(columns) - active_columns
-            critical_row = len(columns[critical_column]) - active_rows
+        query: _NextTipQuery = (
+            num_tips,
+            starting_tip_name,
+            None
+            if nozzle_map is None
+            else (
+                nozzle_map.physical_nozzle_count,
+                nozzle_map.starting_nozzle,
+                len(nozzle_map.columns),
+                len(nozzle_map.rows),
+            ),
+        )
+        used_tip_masks = self._state.used_tip_masks_by_labware_id.get(labware_id)
+        if used_tip_masks is None:
+            return self._search_next_tip(
+                labware_id, num_tips, starting_tip_name, nozzle_map, None
+            ).result
+
+        current_masks = tuple(used_tip_masks)
+        searches = self._next_tip_searches.setdefault(labware_id, {})
+        search = searches.get(query)
+        if search is None or search.used_tip_masks != current_masks:
+            if search is not None and not _only_more_tips_used(
+                search.used_tip_masks, current_masks
+            ):
+                # Tips were reset, so skipped clusters may be usable again.
+                search = None
+            search = replace(
+                self._search_next_tip(
+                    labware_id, num_tips, starting_tip_name, nozzle_map, search
+                ),
+                used_tip_masks=current_masks,
+            )
+            searches[query] = search
+        return search.result
 
-            while critical_column >= 0:
-                tip_cluster = _identify_tip_cluster(
-                    active_columns, active_rows, critical_column, critical_row, "H12"
-                )
-                if tip_cluster is not None:
-                    result = _validate_tip_cluster(
-                        active_columns, active_rows, tip_cluster
-                    )
-                    if isinstance(result, str):
-                        return result
-                    elif isinstance(result, int) and result == -1:
-                        return None
-                if critical_row - 1 >= 0:
-                    critical_row = critical_row - 1
-                else:
-                    critical_column -= 1
-                    if critical_column < 0:
-                        return None
-                    critical_row = len(columns[critical_column]) - active_rows
-            return None
+    def _search_next_tip(
+        self,
+        labware_id: str,
+        num_tips: int,
+        starting_tip_name: Optional[str],
+        nozzle_map: Optional[NozzleMapInterface],
+        previous_search: Optional[_NextTipSearch],
+    ) -> _NextTipSearch:
+        columns = self._state.column_by_labware_id.get(labware_id, [])
+        used_tip_masks = self._state.used_tip_masks_by_labware_id.get(labware_id, [])
 
         if starting_tip_name is None and nozzle_map is not None and columns:
-            num_channels = nozzle_map.physical_nozzle_count
-            num_nozzle_cols = len(nozzle_map.columns)
-            num_nozzle_rows = len(nozzle_map.rows)
-            # Each pipette's cluster search is determined by the point of entry for a given pipette/configuration:
-            # - Single channel pipettes always search a tiprack top to bottom, left to right
-            # - Eight channel pipettes will begin at the top if the primary nozzle is H1 and at the bottom if
-            #   it is A1. The eight channel will always progress across the columns left to right.
-            # - 96 Channel pipettes will begin in the corner opposite their primary/starting nozzle (if starting nozzle = A1, enter tiprack at H12)
-            #   The 96 channel will then progress towards the opposite corner, either going up or down, left or right depending on configuration.
-
-            if num_channels == 1:
-                return _cluster_search_A1(num_nozzle_cols, num_nozzle_rows)
-            elif num_channels == 8:
-                if nozzle_map.starting_nozzle == "A1":
-                    return _cluster_search_H1(num_nozzle_cols, num_nozzle_rows)
-                elif nozzle_map.starting_nozzle == "H1":
-                    return _cluster_search_A1(num_nozzle_cols, num_nozzle_rows)
-            elif num_channels == 96:
-                if nozzle_map.starting_nozzle == "A1":
-                    return _cluster_search_H12(num_nozzle_cols, num_nozzle_rows)
-                elif nozzle_map.starting_nozzle == "A12":
-                    return _cluster_search_H1(num_nozzle_cols, num_nozzle_rows)
-                elif nozzle_map.starting_nozzle == "H1":
-                    return _cluster_search_A12(num_nozzle_cols, num_nozzle_rows)
-                elif nozzle_map.starting_nozzle == "H12":
-                    return _cluster_search_A1(num_nozzle_cols, num_nozzle_rows)
-                else:
-                    raise ValueError(
-                        f"Nozzle {nozzle_map.starting_nozzle} is an invalid starting tip for automatic tip pickup."
-                    )
-            else:
-                raise RuntimeError(
-                    "Invalid number of channels for automatic tip tracking."
+            entry_well = _get_cluster_search_entry_well(nozzle_map)
+            if entry_well is None:
+                return _NextTipSearch(result=None)
+            active_columns = len(nozzle_map.columns)
+            active_rows = len(nozzle_map.rows)
+            clusters: Sequence[Tuple[int, int]]
+            if previous_search is None or not previous_search.clusters:
+                clusters = _get_cluster_search_order(
+                    columns, active_columns, active_rows, entry_well
                 )
+                resume_from = 0
+            else:
+                clusters = previous_search.clusters
+                resume_from = previous_search.resume_from
+            return _cluster_search(
+                columns=columns,
+                used_tip_masks=used_tip_masks,
+                active_columns=active_columns,
+                active_rows=active_rows,
+                entry_well=entry_well,
+                # In the case of an 8ch pipette where a column has mixed state tips we may simply progress to the next column in our search
+                skip_mixed_clusters=nozzle_map.physical_nozzle_count == 8,
+                clusters=clusters,
+                resume_from=resume_from,
+            )
         else:
-            if columns and num_tips == len(columns[0]):  # Get next tips for 8-channel
-                column_head = [column[0] for column in columns]
-                starting_column_index = 0
-
-                if starting_tip_name:
-                    for idx, column in enumerate(columns):
-                        if starting_tip_name in column:
-                            if starting_tip_name not in column_head:
-                                starting_column_index = idx + 1
-                            else:
-                                starting_column_index = idx
-
-                for column in columns[starting_column_index:]:
-                    if not any(wells[well] == TipRackWellState.USED for well in column):
-                        return column[0]
-
-            elif num_tips == len(wells.keys()):  # Get next tips for 96 channel
-                if starting_tip_name and starting_tip_name != columns[0][0]:
-                    return None
-
-                if not any(
-                    tip_state == TipRackWellState.USED for tip_state in wells.values()
-                ):
-                    return next(iter(wells))
-
-            else:  # Get next tips for single channel
-                if starting_tip_name is not None:
-                    wells = _drop_wells_before_starting_tip(wells, starting_tip_name)
-
-                for well_name, tip_state in wells.items():
-                    if tip_state == TipRackWellState.CLEAN:
-                        return well_name
-        return None
+            return _NextTipSearch(
+                result=_get_next_tip_without_cluster_search(
+                    columns=columns,
+                    wells=self._state.tips_by_labware_id.get(labware_id, {}),
+                    well_indices=self._state.well_indices_by_labware_id.get(
+                        labware_id, {}
+                    ),
+                    used_tip_masks=used_tip_masks,
+                    num_tips=num_tips,
+                    starting_tip_name=starting_tip_name,
+                )
+            )
 
     def get_pipette_channels(self, pipette_id: str) -> int:
         """Return the given pipette's number of channels."""
@@ -443,15 +321,185 @@ class TipView:
         return well_state == TipRackWellState.CLEAN
 
 
-def _drop_wells_before_starting_tip(
-    wells: TipRackStateByWellName, starting_tip_name: str
-) -> TipRackStateByWellName:
-    """Drop any wells that come before the starting tip and return the remaining ones after."""
-    seen_starting_well = False
-    remaining_wells = {}
-    for well_name, tip_state in wells.items():
-        if well_name == starting_tip_name:
-            seen_starting_well = True
-        if seen_starting_well:
-            remaining_wells[well_name] = tip_state
-    return remaining_wells
+def _only_more_tips_used(
+    old_used_tip_masks: Tuple[int, ...], new_used_tip_masks: Tuple[int, ...]
+) -> bool:
+    """Get whether every tip that was used before is still used."""
+    return len(old_used_tip_masks) == len(new_used_tip_masks) and all(
+        old & ~new == 0 for old, new in zip(old_used_tip_masks, new_used_tip_masks)
+    )
+
+
+def _get_cluster_search_entry_well(nozzle_map: NozzleMapInterface) -> Optional[str]:
+    """Get the corner of the tip rack that a pipette's cluster search should start from."""
+    num_channels = nozzle_map.physical_nozzle_count
+    # Each pipette's cluster search is determined by the point of entry for a given pipette/configuration:
+    # - Single channel pipettes always search a tiprack top to bottom, left to right
+    # - Eight channel pipettes will begin at the top if the primary nozzle is H1 and at the bottom if
+    #   it is A1. The eight channel will always progress across the columns left to right.
+    # - 96 Channel pipettes will begin in the corner opposite their primary/starting nozzle (if starting nozzle = A1, enter tiprack at H12)
+    #   The 96 channel will then progress towards the opposite corner, either going up or down, left or right depending on configuration.
+    if num_channels == 1:
+        return "A1"
+    elif num_channels == 8:
+        return {"A1": "H1", "H1": "A1"}.get(nozzle_map.starting_nozzle)
+    elif num_channels == 96:
+        entry_well = {"A1": "H12", "A12": "H1", "H1": "A12", "H12": "A1"}.get(
+            nozzle_map.starting_nozzle
+        )
+        if entry_well is None:
+            raise ValueError(
+                f"Nozzle {nozzle_map.starting_nozzle} is an invalid starting tip for automatic tip pickup."
+            )
+        return entry_well
+    else:
+        raise RuntimeError("Invalid number of channels for automatic tip tracking.")
+
+
+def _get_cluster_search_order(
+    columns: List[List[str]], active_columns: int, active_rows: int, entry_well: str
+) -> List[Tuple[int, int]]:
+    """Get the critical (column, row) indices of each cluster to search, in order.
+
+    A search moves through the rows of one column before moving to the next
+    column, going away from the entry well in both directions. A cluster's
+    critical well is its corner farthest from the entry well.
+    """
+    if entry_well in ("A1", "H1"):
+        column_indices = range(active_columns - 1, len(columns))
+    else:
+        column_indices = range(len(columns) - active_columns, -1, -1)
+    clusters: List[Tuple[int, int]] = []
+    for column_index in column_indices:
+        if entry_well in ("A1", "A12"):
+            row_indices = range(active_rows - 1, len(columns[0]))
+        else:
+            row_indices = range(len(columns[column_index]) - active_rows, -1, -1)
+        clusters.extend((column_index, row_index) for row_index in row_indices)
+    return clusters
+
+
+def _cluster_search(
+    columns: List[List[str]],
+    used_tip_masks: List[int],
+    active_columns: int,
+    active_rows: int,
+    entry_well: str,
+    skip_mixed_clusters: bool,
+    clusters: Sequence[Tuple[int, int]],
+    resume_from: int,
+) -> _NextTipSearch:
+    """Find the first cluster of clean tips, searching from `clusters[resume_from]`."""
+    # Clusters extend from their critical well back towards the entry well.
+    column_step = -1 if entry_well in ("A1", "H1") else 1
+    row_step = -1 if entry_well in ("A1", "A12") else 1
+
+    for index in range(resume_from, len(clusters)):
+        critical_column, critical_row = clusters[index]
+        final_column = critical_column + column_step * (active_columns - 1)
+        final_row = critical_row + row_step * (active_rows - 1)
+        first_row = min(critical_row, final_row)
+        if (
+            not 0 <= final_column < len(columns)
+            or first_row < 0
+            or first_row + active_rows > len(columns[critical_column])
+        ):
+            continue
+
+        cluster_rows_mask = ((1 << active_rows) - 1) << first_row
+        used_tips_by_column = [
+            used_tip_masks[column_index] & cluster_rows_mask
+            for column_index in range(
+                critical_column, final_column + column_step, column_step
+            )
+        ]
+        if not any(used_tips_by_column):
+            return _NextTipSearch(
+                result=columns[critical_column][critical_row],
+                clusters=clusters,
+                resume_from=index,
+            )
+        elif skip_mixed_clusters or all(
+            used_tips == cluster_rows_mask for used_tips in used_tips_by_column
+        ):
+            continue
+
+        # In the case of a 96ch we can attempt to index in by singular rows and columns assuming that indexed direction is safe
+        final_row_mask = 1 << final_row
+        if used_tips_by_column[-1] == cluster_rows_mask or all(
+            used_tips & final_row_mask for used_tips in used_tips_by_column
+        ):
+            continue
+
+        # Tiprack has no valid tip selection, cannot progress
+        return _NextTipSearch(result=None, clusters=clusters, resume_from=index)
+
+    return _NextTipSearch(result=None, clusters=clusters, resume_from=len(clusters))
+
+
+def _get_next_tip_without_cluster_search(
+    columns: List[List[str]],
+    wells: TipRackStateByWellName,
+    well_indices: Dict[str, Tuple[int, int]],
+    used_tip_masks: List[int],
+    num_tips: int,
+    starting_tip_name: Optional[str],
+) -> Optional[str]:
+    if columns and num_tips == len(columns[0]):  # Get next tips for 8-channel
+        return _get_next_clean_column(columns, used_tip_masks, starting_tip_name)
+
+    elif num_tips == len(wells.keys()):  # Get next tips for 96 channel
+        if starting_tip_name and starting_tip_name != columns[0][0]:
+            return None
+
+        if not any(used_tip_masks):
+            return next(iter(wells))
+        return None
+
+    else:  # Get next tips for single channel
+        starting_indices = (0, 0)
+        if starting_tip_name is not None:
+            if starting_tip_name not in well_indices:
+                return None
+            starting_indices = well_indices[starting_tip_name]
+        return _get_next_clean_tip(columns, used_tip_masks, *starting_indices)
+
+
+def _get_next_clean_column(
+    columns: List[List[str]],
+    used_tip_masks: List[int],
+    starting_tip_name: Optional[str],
+) -> Optional[str]:
+    column_head = [column[0] for column in columns]
+    starting_column_index = 0
+
+    if starting_tip_name:
+        for idx, column in enumerate(columns):
+            if starting_tip_name in column:
+                if starting_tip_name not in column_head:
+                    starting_column_index = idx + 1
+                else:
+                    starting_column_index = idx
+
+    for column_index in range(starting_column_index, len(columns)):
+        if not used_tip_masks[column_index]:
+            return columns[column_index][0]
+    return None
+
+
+def _get_next_clean_tip(
+    columns: List[List[str]],
+    used_tip_masks: List[int],
+    starting_column_index: int,
+    starting_row_index: int,
+) -> Optional[str]:
+    for column_index in range(starting_column_index, len(columns)):
+        clean_tips = ~used_tip_masks[column_index] & (
+            (1 << len(columns[column_index])) - 1
+        )
+        if column_index == starting_column_index:
+            clean_tips &= ~((1 << starting_row_index) - 1)
+        if clean_tips:
+            # The lowest set bit is the first clean tip in the column.
+            return columns[column_index][(clean_tips & -clean_tips).bit_length() - 1]
+    return None
@@ -460,6 +460,12 @@ class StateUpdate:
 
     addressable_area_used: AddressableAreaUsedUpdate | NoChangeType = NO_CHANGE
 
+    def is_empty(self) -> bool:
+        """Return whether this update leaves every part of engine state unchanged."""
+        # NO_CHANGE is a singleton, so an identity check is enough, and much cheaper
+        # than going through dataclasses.fields() and __eq__().
+        return all(value is NO_CHANGE for value in self.__dict__.values())
+
     def append(self, other: Self) -> Self:
         """Apply another `StateUpdate` "on top of" this one.
 
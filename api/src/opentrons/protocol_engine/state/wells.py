@@ -52,15 +52,20 @@ class WellStore(HasState[WellState], HandlesActions):
         """Initialize a well store and its state."""
         self._state = WellState(loaded_volumes={}, probed_heights={}, probed_volumes={})
 
-    def handle_action(self, action: Action) -> None:
+    def handle_action(self, action: Action) -> bool:
         """Modify state in reaction to an action."""
+        changed = False
         for state_update in get_state_updates(action):
             if state_update.liquid_loaded != update_types.NO_CHANGE:
                 self._handle_liquid_loaded_update(state_update.liquid_loaded)
+                changed = True
             if state_update.liquid_probed != update_types.NO_CHANGE:
                 self._handle_liquid_probed_update(state_update.liquid_probed)
+                changed = True
             if state_update.liquid_operated != update_types.NO_CHANGE:
                 self._handle_liquid_operated_update(state_update.liquid_operated)
+                changed = True
+        return changed
 
     def _handle_liquid_loaded_update(
         self, state_update: update_types.LiquidLoadedUpdate
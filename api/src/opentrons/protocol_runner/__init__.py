@@ -13,6 +13,7 @@ from .protocol_runner import (
     AnyRunner,
 )
 from .run_orchestrator import RunOrchestrator
+from .run_time_parameter_loader import RunTimeParameterLoader
 
 __all__ = [
     "AbstractRunner",
@@ -23,4 +24,5 @@ __all__ = [
     "LiveRunner",
     "AnyRunner",
     "RunOrchestrator",
+    "RunTimeParameterLoader",
 ]
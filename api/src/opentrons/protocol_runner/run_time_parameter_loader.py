@@ -0,0 +1,93 @@
+"""Validate a protocol's run-time parameters without setting up a run."""
+from typing import List, Optional
+
+from anyio import to_thread
+
+from opentrons import protocol_reader
+from opentrons.protocol_api import ParameterContext
+from opentrons.protocol_engine.types import (
+    CSVRuntimeParamPaths,
+    PrimitiveRunTimeParamValuesType,
+    RunTimeParameter,
+)
+from opentrons.protocol_reader import JsonProtocolConfig, ProtocolSource
+from opentrons.protocols.parse import PythonParseMode
+from opentrons.protocols.types import PythonProtocol
+
+from .python_protocol_wrappers import (
+    LEGACY_JSON_SCHEMA_VERSION_CUTOFF,
+    PythonAndLegacyFileReader,
+    PythonProtocolExecutor,
+)
+
+
+class RunTimeParameterLoader:
+    """Read a protocol and check run-time parameter values against it.
+
+    This reads and validates the same way that loading the protocol into a
+    `RunOrchestrator` does, but without creating a hardware API or a Protocol
+    Engine, so it's a cheap way to find out a protocol's parameters before
+    deciding whether to run it.
+    """
+
+    def __init__(
+        self,
+        python_and_legacy_file_reader: Optional[PythonAndLegacyFileReader] = None,
+        python_protocol_executor: Optional[PythonProtocolExecutor] = None,
+    ) -> None:
+        """Initialize the loader with its dependencies."""
+        self._protocol_file_reader = (
+            python_and_legacy_file_reader or PythonAndLegacyFileReader()
+        )
+        self._protocol_executor = python_protocol_executor or PythonProtocolExecutor()
+        self._parameter_context: Optional[ParameterContext] = None
+
+    @property
+    def run_time_parameters(self) -> List[RunTimeParameter]:
+        """Parameter definitions defined by the protocol, if any.
+
+        If `load()` raised, this only contains the parameters that were validated
+        before the error, with their default values.
+        """
+        if self._parameter_context is not None:
+            return self._parameter_context.export_parameters_for_analysis()
+        return []
+
+    async def load(
+        self,
+        protocol_source: ProtocolSource,
+        python_parse_mode: PythonParseMode,
+        run_time_param_values: Optional[PrimitiveRunTimeParamValuesType],
+        run_time_param_paths: Optional[CSVRuntimeParamPaths],
+    ) -> None:
+        """Read the protocol and validate the given run-time parameter values.
+
+        The protocol is parsed, and its `add_parameters()` function run,
+        in a worker thread.
+        """
+        config = protocol_source.config
+        if (
+            isinstance(config, JsonProtocolConfig)
+            and config.schema_version >= LEGACY_JSON_SCHEMA_VERSION_CUTOFF
+        ):
+            # These protocols can't define run-time parameters.
+            return
+
+        labware_definitions = await protocol_reader.extract_labware_definitions(
+            protocol_source=protocol_source
+        )
+        protocol = await to_thread.run_sync(
+            self._protocol_file_reader.read,
+            protocol_source,
+            labware_definitions,
+            python_parse_mode,
+        )
+        if isinstance(protocol, PythonProtocol):
+            self._parameter_context = ParameterContext(api_version=protocol.api_level)
+            await to_thread.run_sync(
+                self._protocol_executor.extract_run_parameters,
+                protocol,
+                self._parameter_context,
+                run_time_param_values,
+                run_time_param_paths,
+            )
@@ -268,11 +268,11 @@ def _get_standard_labware_definition(
         )
 
     namespace = namespace.lower()
-    def_path = _get_path_to_labware(load_name, namespace, checked_version)
 
     try:
-        with open(def_path, "rb") as f:
-            labware_def = json.loads(f.read().decode("utf-8"))
+        labware_def = json.loads(
+            _read_labware_file(load_name, namespace, checked_version).decode("utf-8")
+        )
     except FileNotFoundError:
         raise FileNotFoundError(
             f'Labware "{load_name}" not found with version {checked_version} '
@@ -281,6 +281,21 @@ def _get_standard_labware_definition(
     return labware_def  # type: ignore[no-any-return]
 
 
+def _read_labware_file(load_name: str, namespace: str, version: int) -> bytes:
+    if namespace == OPENTRONS_NAMESPACE:
+        # Go through shared data, which can serve these from its definition index.
+        try:
+            return load_shared_data(
+                STANDARD_DEFS_PATH / "3" / load_name / f"{version}.json"
+            )
+        except FileNotFoundError:
+            return load_shared_data(
+                STANDARD_DEFS_PATH / "2" / load_name / f"{version}.json"
+            )
+    with open(_get_path_to_labware(load_name, namespace, version), "rb") as f:
+        return f.read()
+
+
 def _get_path_to_labware(
     load_name: str, namespace: str, version: int, base_path: Optional[Path] = None
 ) -> Path:
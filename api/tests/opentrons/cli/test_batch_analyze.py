@@ -0,0 +1,84 @@
+"""Test batch analysis from the cli."""
+
+
+import json
+import textwrap
+from pathlib import Path
+
+from click.testing import CliRunner
+from opentrons.cli.batch_analyze import batch_analyze
+
+
+def _write_python_protocol(path: Path, run_body: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        textwrap.dedent(
+            """\
+            requirements = {"robotType": "OT-2", "apiLevel": "2.15"}
+            def run(protocol):
+            """
+        )
+        + textwrap.indent(textwrap.dedent(run_body), "    ")
+    )
+
+
+def test_batch_analyze(tmp_path: Path) -> None:
+    """It should analyze every protocol in a directory, and report how it went."""
+    protocols_dir = tmp_path / "protocols"
+    output_dir = tmp_path / "output"
+    _write_python_protocol(
+        protocols_dir / "ok.py",
+        """\
+        protocol.load_labware("opentrons_96_tiprack_300ul", "1")
+        """,
+    )
+    _write_python_protocol(
+        protocols_dir / "not-ok.py",
+        """\
+        raise RuntimeError("oh no")
+        """,
+    )
+    # A subdirectory is one protocol, even if it has several files.
+    _write_python_protocol(
+        protocols_dir / "multi-file" / "protocol.py",
+        """\
+        protocol.comment("hello")
+        """,
+    )
+    (protocols_dir / "multi-file" / "data.csv").write_text("a,b\n")
+    (protocols_dir / "unreadable.json").write_text("{")
+    (protocols_dir / "notes.txt").write_text("not a protocol")
+
+    result = CliRunner().invoke(
+        batch_analyze,
+        [str(protocols_dir), "--output-dir", str(output_dir), "--jobs", "2"],
+    )
+
+    assert result.exit_code == 0, result.output
+    report = json.loads((output_dir / "timing.json").read_text())
+    assert report["jobs"] == 2
+    assert report["results"] == {"ok": 2, "not-ok": 1, "error": 1}
+    assert {
+        timing["protocol"]: (timing["result"], timing["analysis"])
+        for timing in report["protocols"]
+    } == {
+        "multi-file": ("ok", "multi-file.json"),
+        "not-ok.py": ("not-ok", "not-ok.py.json"),
+        "ok.py": ("ok", "ok.py.json"),
+        "unreadable.json": ("error", ""),
+    }
+
+    analysis = json.loads((output_dir / "ok.py.json").read_text())
+    assert analysis["result"] == "ok"
+    assert [labware["loadName"] for labware in analysis["labware"]] == [
+        "opentrons_1_trash_1100ml_fixed",
+        "opentrons_96_tiprack_300ul",
+    ]
+    assert not (output_dir / "unreadable.json.json").exists()
+
+    result = CliRunner().invoke(
+        batch_analyze,
+        [str(protocols_dir), "--output-dir", str(output_dir), "--check"],
+    )
+
+    assert result.exit_code != 0
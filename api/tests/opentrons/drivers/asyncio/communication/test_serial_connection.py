@@ -1,3 +1,4 @@
+import asyncio
 from typing import Type, Union, AsyncGenerator
 import pytest
 from _pytest.fixtures import SubRequest
@@ -11,6 +12,8 @@ from opentrons.drivers.asyncio.communication.serial_connection import (
 )
 from opentrons.drivers.asyncio.communication.errors import (
     NoResponse,
+    SerialException,
+    UnmatchedResponse,
     AlarmResponse,
     ErrorResponse,
     UnhandledGcode,
@@ -286,3 +289,173 @@ def test_custom_error_code_raise_custom_exception() -> None:
     assert error.value.command == "G28"
     assert error.value.response == "ERR999:test"
     assert error.value.port == "test_port"
+
+
+@pytest.fixture
+async def pipelined_subject(
+    mock_serial_port: AsyncMock, ack: str
+) -> AsyncResponseSerialConnection:
+    """Create a test subject that pipelines some status reads."""
+    return AsyncResponseSerialConnection(
+        serial=mock_serial_port,
+        ack=ack,
+        name="name",
+        port="port",
+        retry_wait_time_seconds=0,
+        error_keyword="err",
+        alarm_keyword="alarm",
+        async_error_ack="async",
+        pipelined_gcodes=["M105", "M123", "M241"],
+    )
+
+
+async def test_send_pipelined_data(
+    mock_serial_port: AsyncMock,
+    pipelined_subject: AsyncResponseSerialConnection,
+    ack: str,
+) -> None:
+    """It should send concurrent pipelined reads on one line, and match the responses."""
+    mock_serial_port.read_until.side_effect = [
+        f"M105 T:0 C:25 {ack}".encode(),
+        f" M123 T:0 C:0 {ack}".encode(),
+        f" M241 STATUS:IDLE_OPEN {ack}".encode(),
+    ]
+
+    responses = await asyncio.gather(
+        pipelined_subject.send_data(data="M105\n"),
+        pipelined_subject.send_data(data="M123\n"),
+        pipelined_subject.send_data(data="M241\n"),
+    )
+
+    assert list(responses) == [
+        "M105 T:0 C:25",
+        "M123 T:0 C:0",
+        "M241 STATUS:IDLE_OPEN",
+    ]
+    mock_serial_port.write.assert_called_once_with(data=b"M105 M123 M241\n")
+    mock_serial_port.timeout_override.assert_called_once_with("timeout", None)
+
+
+async def test_send_pipelined_data_with_error(
+    mock_serial_port: AsyncMock,
+    pipelined_subject: AsyncResponseSerialConnection,
+    ack: str,
+) -> None:
+    """It should fail only the read that got an error response."""
+    mock_serial_port.read_until.side_effect = [
+        f"M105 T:0 C:25 {ack}".encode(),
+        f"ERR003:unhandled gcode {ack}".encode(),
+        f"M241 STATUS:IDLE_OPEN {ack}".encode(),
+    ]
+
+    temperature, rpm, latch = await asyncio.gather(
+        pipelined_subject.send_data(data="M105\n"),
+        pipelined_subject.send_data(data="M123\n"),
+        pipelined_subject.send_data(data="M241\n"),
+        return_exceptions=True,
+    )
+
+    assert temperature == "M105 T:0 C:25"
+    assert isinstance(rpm, ErrorResponse)
+    assert latch == "M241 STATUS:IDLE_OPEN"
+
+
+async def test_send_pipelined_data_unmatched(
+    mock_serial_port: AsyncMock,
+    pipelined_subject: AsyncResponseSerialConnection,
+    ack: str,
+) -> None:
+    """It should fail the rest of the reads once a response is out of step."""
+    mock_serial_port.read_until.side_effect = [
+        f"M105 T:0 C:25 {ack}".encode(),
+        f"M241 STATUS:IDLE_OPEN {ack}".encode(),
+    ]
+
+    temperature, rpm, latch = await asyncio.gather(
+        pipelined_subject.send_data(data="M105\n"),
+        pipelined_subject.send_data(data="M123\n"),
+        pipelined_subject.send_data(data="M241\n"),
+        return_exceptions=True,
+    )
+
+    assert temperature == "M105 T:0 C:25"
+    assert isinstance(rpm, UnmatchedResponse)
+    assert isinstance(latch, UnmatchedResponse)
+    mock_serial_port.reset_input_buffer.assert_called_once()
+
+
+async def test_send_pipelined_data_timeout(
+    mock_serial_port: AsyncMock,
+    pipelined_subject: AsyncResponseSerialConnection,
+    ack: str,
+) -> None:
+    """It should retry only the reads that timed out."""
+    mock_serial_port.read_until.side_effect = [
+        f"M105 T:0 C:25 {ack}".encode(),
+        b"",
+        f"M123 T:0 C:0 {ack}".encode(),
+        b"",
+    ]
+
+    temperature, rpm, latch = await asyncio.gather(
+        pipelined_subject.send_data(data="M105\n", retries=1),
+        pipelined_subject.send_data(data="M123\n", retries=1),
+        pipelined_subject.send_data(data="M241\n", retries=1),
+        return_exceptions=True,
+    )
+
+    assert temperature == "M105 T:0 C:25"
+    assert rpm == "M123 T:0 C:0"
+    assert isinstance(latch, NoResponse)
+    mock_serial_port.write.assert_has_calls(
+        calls=[call(data=b"M105 M123 M241\n"), call(data=b"M123 M241\n")]
+    )
+
+
+async def test_send_pipelined_data_first_request_cancelled(
+    mock_serial_port: AsyncMock,
+    pipelined_subject: AsyncResponseSerialConnection,
+    ack: str,
+) -> None:
+    """It should still answer the other reads if the one that started the line is cancelled."""
+    mock_serial_port.read_until.side_effect = [
+        f"M105 T:0 C:25 {ack}".encode(),
+        f"M123 T:0 C:0 {ack}".encode(),
+        f"M241 STATUS:IDLE_OPEN {ack}".encode(),
+    ]
+
+    first = asyncio.create_task(pipelined_subject.send_data(data="M105\n"))
+    others = asyncio.gather(
+        pipelined_subject.send_data(data="M123\n"),
+        pipelined_subject.send_data(data="M241\n"),
+    )
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert list(await others) == ["M123 T:0 C:0", "M241 STATUS:IDLE_OPEN"]
+    assert first.cancelled()
+    mock_serial_port.write.assert_called_once_with(data=b"M105 M123 M241\n")
+
+
+async def test_send_pipelined_data_abandoned(
+    mock_serial_port: AsyncMock,
+    pipelined_subject: AsyncResponseSerialConnection,
+    ack: str,
+) -> None:
+    """It should fail the reads, and drop unread responses, if the line is abandoned."""
+    mock_serial_port.read_until.side_effect = [
+        f"M105 T:0 C:25 {ack}".encode(),
+        asyncio.CancelledError(),
+    ]
+
+    temperature, rpm, latch = await asyncio.gather(
+        pipelined_subject.send_data(data="M105\n"),
+        pipelined_subject.send_data(data="M123\n"),
+        pipelined_subject.send_data(data="M241\n"),
+        return_exceptions=True,
+    )
+
+    assert temperature == "M105 T:0 C:25"
+    assert isinstance(rpm, SerialException)
+    assert isinstance(latch, SerialException)
+    mock_serial_port.reset_input_buffer.assert_called_once()
@@ -45,6 +45,7 @@ from opentrons_hardware.firmware_bindings.arbitration_id import ArbitrationId
 from opentrons_hardware.firmware_bindings.constants import (
     NodeId,
     PipetteName as FirmwarePipetteName,
+    SensorId,
     USBTarget,
 )
 from opentrons_hardware.drivers.can_bus.abstract_driver import AbstractCanDriver
@@ -60,6 +61,10 @@ from opentrons.hardware_control.types import (
     UpdateState,
     EstopState,
     CurrentConfig,
+    InstrumentProbeType,
+    PipetteSensorId,
+    PipetteSensorResponseQueue,
+    PipetteSensorType,
 )
 from opentrons.hardware_control.errors import (
     InvalidPipetteName,
@@ -777,6 +782,57 @@ async def test_liquid_probe(
     assert move_groups[1][0][head_node], move_groups[2][0][tool_node]
 
 
+async def test_liquid_probe_reports_buffered_data(
+    controller: OT3Controller,
+    fake_liquid_settings: LiquidProbeSettings,
+) -> None:
+    """It should report the sensor data that the probe streamed into its buffers."""
+    head_node = axis_to_node(Axis.by_mount(OT3Mount.LEFT))
+    tool_node = sensor_node_for_mount(OT3Mount.LEFT)
+    controller._pipettes_to_monitor_pressure = mock.MagicMock(  # type: ignore[method-assign]
+        return_value=[tool_node]
+    )
+
+    async def fake_liquid_probe(**kwargs: Any) -> Dict[NodeId, MotorPositionStatus]:
+        assert "emplace_data" not in kwargs
+        assert set(kwargs["sensor_buffers"].keys()) == {SensorId.S0, SensorId.S1}
+        kwargs["sensor_buffers"][SensorId.S0].extend([65536, 131072])
+        kwargs["sensor_buffers"][SensorId.S1].extend([-65536])
+        return {
+            head_node: MotorPositionStatus(
+                0.0, 0.0, True, True, MoveCompleteAck.stopped_by_condition
+            ),
+        }
+
+    response_queue = PipetteSensorResponseQueue()
+    with mock.patch(
+        "opentrons.hardware_control.backends.ot3controller.liquid_probe",
+        fake_liquid_probe,
+    ):
+        await controller.liquid_probe(
+            mount=OT3Mount.LEFT,
+            max_p_distance=70,
+            mount_speed=fake_liquid_settings.mount_speed,
+            plunger_speed=fake_liquid_settings.plunger_speed,
+            threshold_pascals=fake_liquid_settings.sensor_threshold_pascals,
+            plunger_impulse_time=fake_liquid_settings.plunger_impulse_time,
+            num_baseline_reads=fake_liquid_settings.samples_for_baselining,
+            z_offset_for_plunger_prep=2.0,
+            probe=InstrumentProbeType.BOTH,
+            response_queue=response_queue,
+        )
+
+    data = response_queue.get_nowait()
+    assert response_queue.empty()
+    assert [d.to_float() for d in data[PipetteSensorId.S0]] == [1.0, 2.0]
+    assert [d.to_float() for d in data[PipetteSensorId.S1]] == [-1.0]
+    assert all(
+        d.sensor_type == PipetteSensorType.pressure
+        for readings in data.values()
+        for d in readings
+    )
+
+
 async def test_tip_action(
     controller: OT3Controller,
     mock_move_group_run: mock.AsyncMock,
@@ -3,7 +3,7 @@ from typing import AsyncGenerator
 
 import pytest
 from decoy import Decoy, matchers
-from opentrons.hardware_control.poller import Poller, Reader
+from opentrons.hardware_control.poller import Poller, Reader, read_concurrently
 
 
 POLLING_INTERVAL = 0.1
@@ -179,3 +179,42 @@ async def test_poller_cancelled_wait(
 
     await asyncio.sleep(2 * subject.interval)
     assert wait_task_2.done() is True
+
+
+async def test_poller_backs_off_while_idle(decoy: Decoy, mock_reader: Reader) -> None:
+    """It should poll less often while idle, but not slow down waiters."""
+    decoy.when(mock_reader.is_idle()).then_return(True)
+    subject = Poller(reader=mock_reader, interval=POLLING_INTERVAL, idle_interval=100.0)
+    await subject.start()
+
+    try:
+        await asyncio.sleep(4 * POLLING_INTERVAL)
+        decoy.verify(await mock_reader.read(), times=1)
+
+        await asyncio.wait_for(subject.wait_next_poll(), timeout=4 * POLLING_INTERVAL)
+        decoy.verify(await mock_reader.read(), times=2)
+    finally:
+        await subject.stop()
+
+    metrics = subject.metrics
+    assert metrics.polls == 2
+    assert metrics.idle_polls == 1
+    assert metrics.errors == 0
+    assert metrics.poll_rate > 0
+
+
+async def test_read_concurrently_finishes_every_read() -> None:
+    """It should let the other reads finish before raising a read's error."""
+    finished = []
+
+    async def _fail() -> None:
+        raise RuntimeError("oh no")
+
+    async def _read() -> None:
+        await asyncio.sleep(0.01)
+        finished.append(True)
+
+    with pytest.raises(RuntimeError, match="oh no"):
+        await read_concurrently(_fail(), _read(), _read())
+
+    assert finished == [True, True]
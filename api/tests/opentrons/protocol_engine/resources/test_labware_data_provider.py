@@ -46,3 +46,17 @@ async def test_labware_hash_match() -> None:
     )
 
     assert hash_labware_def(labware_dict) == hash_labware_def(labware_model_dict)
+
+
+async def test_labware_data_reuses_standard_definitions() -> None:
+    """It should only read and validate each standard definition once."""
+    subject = LabwareDataProvider()
+
+    first = await subject.get_labware_definition(
+        load_name="opentrons_96_tiprack_300ul", namespace="opentrons", version=1
+    )
+    second = await subject.get_labware_definition(
+        load_name="OPENTRONS_96_TIPRACK_300UL", namespace="Opentrons", version=1
+    )
+
+    assert first is second
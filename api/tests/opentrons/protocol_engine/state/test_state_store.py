@@ -6,12 +6,22 @@ import pytest
 from decoy import Decoy
 
 from opentrons_shared_data.deck.types import DeckDefinitionV5
+from opentrons_shared_data.labware.labware_definition import LabwareDefinition
+from opentrons.types import DeckSlotName
 from opentrons.util.change_notifier import ChangeNotifier
 
-from opentrons.protocol_engine.actions import PlayAction
+from opentrons.protocol_engine import commands
+from opentrons.protocol_engine.actions import (
+    PlayAction,
+    QueueCommandAction,
+    RunCommandAction,
+    SetDeckConfigurationAction,
+    SucceedCommandAction,
+)
+from opentrons.protocol_engine.state import update_types
 from opentrons.protocol_engine.state.config import Config
 from opentrons.protocol_engine.state.state import State, StateStore
-from opentrons.protocol_engine.types import DeckType
+from opentrons.protocol_engine.types import DeckSlotLocation, DeckType
 
 
 @pytest.fixture
@@ -91,6 +101,98 @@ def test_notify_on_state_change(
     decoy.verify(change_notifier.notify(), times=1)
 
 
+def test_no_notify_without_state_change(
+    decoy: Decoy,
+    change_notifier: ChangeNotifier,
+    subject: StateStore,
+) -> None:
+    """It should keep the same state and not notify when no substore changed."""
+    result_1 = subject.state
+    subject.handle_action(SetDeckConfigurationAction(deck_configuration=None))
+    result_2 = subject.state
+
+    assert result_1 is result_2
+    decoy.verify(change_notifier.notify(), times=0)
+
+
+def test_summary_rebuilt_on_state_change(subject: StateStore) -> None:
+    """It should reuse its summary until the state that it summarizes changes."""
+    summary_1 = subject.get_summary()
+    subject.handle_action(SetDeckConfigurationAction(deck_configuration=None))
+    summary_2 = subject.get_summary()
+    subject.handle_action(PlayAction(requested_at=datetime(year=2021, month=1, day=1)))
+    summary_3 = subject.get_summary()
+
+    assert summary_2 is summary_1
+    assert summary_3 is not summary_1
+    assert summary_3.status != summary_1.status
+    assert summary_3.startedAt == datetime(year=2021, month=1, day=1)
+
+
+def test_geometry_follows_labware_moves(
+    subject: StateStore, well_plate_def: LabwareDefinition
+) -> None:
+    """It should not serve stale labware positions after labware moves."""
+
+    def succeed(command_id: str, state_update: update_types.StateUpdate) -> None:
+        now = datetime(year=2021, month=1, day=1)
+        params = commands.CommentParams(message="hello")
+        subject.handle_action(
+            QueueCommandAction(
+                request=commands.CommentCreate(params=params),
+                request_hash=None,
+                created_at=now,
+                command_id=command_id,
+            )
+        )
+        subject.handle_action(RunCommandAction(command_id=command_id, started_at=now))
+        subject.handle_action(
+            SucceedCommandAction(
+                command=commands.Comment(
+                    id=command_id,
+                    key=command_id,
+                    createdAt=now,
+                    startedAt=now,
+                    completedAt=now,
+                    status=commands.CommandStatus.SUCCEEDED,
+                    params=params,
+                ),
+                state_update=state_update,
+            )
+        )
+
+    succeed(
+        "load-labware",
+        update_types.StateUpdate(
+            loaded_labware=update_types.LoadedLabwareUpdate(
+                labware_id="labware-id",
+                definition=well_plate_def,
+                new_location=DeckSlotLocation(slotName=DeckSlotName.SLOT_1),
+                display_name=None,
+                offset_id=None,
+            )
+        ),
+    )
+    position_in_slot_1 = subject.geometry.get_labware_position("labware-id")
+    highest_z = subject.geometry.get_all_obstacle_highest_z()
+
+    succeed(
+        "move-labware",
+        update_types.StateUpdate(
+            labware_location=update_types.LabwareLocationUpdate(
+                labware_id="labware-id",
+                new_location=DeckSlotLocation(slotName=DeckSlotName.SLOT_2),
+                offset_id=None,
+            )
+        ),
+    )
+    position_in_slot_2 = subject.geometry.get_labware_position("labware-id")
+
+    assert position_in_slot_2 != position_in_slot_1
+    assert position_in_slot_2.x > position_in_slot_1.x
+    assert subject.geometry.get_all_obstacle_highest_z() == highest_z
+
+
 async def test_wait_for(
     decoy: Decoy,
     change_notifier: ChangeNotifier,
@@ -880,6 +880,94 @@ def test_reset_tips(
     assert get_result() == "A1"
 
 
+def test_next_tip_automatic_tip_tracking_after_use_and_reset(
+    subject: TipStore,
+    load_labware_action: actions.SucceedCommandAction,
+    supported_tip_fixture: pipette_definition.SupportedTipsDefinition,
+    available_sensors: AvailableSensorDefinition,
+) -> None:
+    """It should keep finding the next tip as tips are used and reset."""
+    subject.handle_action(load_labware_action)
+    nozzle_map = get_default_nozzle_map(PipetteNameType.P300_SINGLE_GEN2)
+
+    config_update = update_types.PipetteConfigUpdate(
+        pipette_id="pipette-id",
+        serial_number="pipette-serial",
+        config=LoadedStaticPipetteData(
+            channels=1,
+            max_volume=15,
+            min_volume=3,
+            model="gen a",
+            display_name="display name",
+            flow_rates=FlowRates(
+                default_aspirate={},
+                default_dispense={},
+                default_blow_out={},
+            ),
+            tip_configuration_lookup_table={15: supported_tip_fixture},
+            nominal_tip_overlap={},
+            nozzle_offset_z=1.23,
+            home_position=4.56,
+            nozzle_map=nozzle_map,
+            back_left_corner_offset=Point(x=1, y=2, z=3),
+            front_right_corner_offset=Point(x=4, y=5, z=6),
+            pipette_lld_settings={},
+            plunger_positions={
+                "top": 0.0,
+                "bottom": 5.0,
+                "blow_out": 19.0,
+                "drop_tip": 20.0,
+            },
+            shaft_ul_per_mm=5.0,
+            available_sensors=available_sensors,
+        ),
+    )
+    subject.handle_action(
+        actions.SucceedCommandAction(
+            state_update=update_types.StateUpdate(pipette_config=config_update),
+            command=_dummy_command(),
+        )
+    )
+
+    # One view, like the engine's, so that searches resume as tips are used.
+    view = TipView(subject.state)
+
+    def get_result() -> str | None:
+        return view.get_next_tip(
+            labware_id="cool-labware",
+            num_tips=1,
+            starting_tip_name=None,
+            nozzle_map=nozzle_map,
+        )
+
+    def use_tip(well_name: str) -> None:
+        subject.handle_action(
+            actions.SucceedCommandAction(
+                command=_dummy_command(),
+                state_update=update_types.StateUpdate(
+                    tips_used=update_types.TipsUsedUpdate(
+                        pipette_id="pipette-id",
+                        labware_id="cool-labware",
+                        well_name=well_name,
+                    )
+                ),
+            )
+        )
+
+    assert get_result() == "A1"
+    assert get_result() == "A1"
+    use_tip("B1")
+    assert get_result() == "A1"
+    use_tip("A1")
+    assert get_result() == "C1"
+    for well_name in ["C1", "D1", "E1", "F1", "G1", "H1"]:
+        use_tip(well_name)
+    assert get_result() == "A2"
+
+    subject.handle_action(actions.ResetTipsAction(labware_id="cool-labware"))
+    assert get_result() == "A1"
+
+
 def test_handle_pipette_config_action(
     subject: TipStore,
     supported_tip_fixture: pipette_definition.SupportedTipsDefinition,
@@ -91,3 +91,11 @@ def test_reduce() -> None:
             offset_id=None,
         )
     )
+
+
+def test_is_empty() -> None:
+    """It should report whether any part of the update would change state."""
+    assert update_types.StateUpdate().is_empty()
+    assert not update_types.StateUpdate(
+        files_added=update_types.FilesAddedUpdate(file_ids=["file-id"])
+    ).is_empty()
@@ -0,0 +1,71 @@
+"""Smoke tests for RunTimeParameterLoader."""
+from pathlib import Path
+
+import pytest
+
+from opentrons.protocol_engine.types import EnumParameter, NumberParameter
+from opentrons.protocol_reader import ProtocolReader
+from opentrons.protocol_runner import RunTimeParameterLoader
+from opentrons.protocols.parameters.exceptions import ParameterValueError
+from opentrons.protocols.parse import PythonParseMode
+
+
+async def test_load_python_run_time_parameters(
+    python_protocol_file_with_run_time_params: Path,
+) -> None:
+    """It should validate values against the protocol's parameter definitions."""
+    protocol_source = await ProtocolReader().read_saved(
+        files=[python_protocol_file_with_run_time_params],
+        directory=None,
+    )
+    subject = RunTimeParameterLoader()
+
+    await subject.load(
+        protocol_source=protocol_source,
+        python_parse_mode=PythonParseMode.NORMAL,
+        run_time_param_values={"aspirate_volume": 40.2},
+        run_time_param_paths=None,
+    )
+
+    aspirate_volume, mount = subject.run_time_parameters
+    assert isinstance(aspirate_volume, NumberParameter)
+    assert aspirate_volume.value == 40.2
+    assert isinstance(mount, EnumParameter)
+    assert mount.value == "left"
+
+
+async def test_load_invalid_run_time_parameter_value(
+    python_protocol_file_with_run_time_params: Path,
+) -> None:
+    """It should raise for a value that the protocol doesn't allow."""
+    protocol_source = await ProtocolReader().read_saved(
+        files=[python_protocol_file_with_run_time_params],
+        directory=None,
+    )
+    subject = RunTimeParameterLoader()
+
+    with pytest.raises(ParameterValueError):
+        await subject.load(
+            protocol_source=protocol_source,
+            python_parse_mode=PythonParseMode.NORMAL,
+            run_time_param_values={"aspirate_volume": 99},
+            run_time_param_paths=None,
+        )
+
+
+async def test_load_json_protocol(json_protocol_file: Path) -> None:
+    """It should find no parameters in a JSON protocol."""
+    protocol_source = await ProtocolReader().read_saved(
+        files=[json_protocol_file],
+        directory=None,
+    )
+    subject = RunTimeParameterLoader()
+
+    await subject.load(
+        protocol_source=protocol_source,
+        python_parse_mode=PythonParseMode.NORMAL,
+        run_time_param_values=None,
+        run_time_param_paths=None,
+    )
+
+    assert subject.run_time_parameters == []
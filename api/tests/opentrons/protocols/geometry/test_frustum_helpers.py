@@ -323,3 +323,31 @@ def test_height_at_volume_within_section(well: List[Any]) -> None:
             segment, _get_segment_capacity(segment), segment_height
         )
         assert isclose(height, segment_height)
+
+
+@pytest.mark.parametrize("well", fake_frusta())
+def test_volume_and_height_circular_use_nearest_table_entry(well: List[Any]) -> None:
+    """It should look up the table entry closest to the target, the first one on ties."""
+    for segment in well:
+        if segment.shape != "conical":
+            continue
+        heights = list(segment.height_to_volume_table)
+        volumes = list(segment.volume_to_height_table)
+        targets = [-1.0, 1e6]
+        for keys in (heights, volumes):
+            # Exact keys, points halfway between keys, and points just off of those.
+            for low, high in zip(keys[::37], keys[1::37]):
+                middle = (low + high) / 2
+                targets.extend([low, middle, middle - 1e-9, middle + 1e-9])
+
+        for target in targets:
+            nearest_height = min(heights, key=lambda x: abs(x - target))
+            nearest_volume = min(volumes, key=lambda x: abs(x - target))
+            assert (
+                _volume_from_height_circular(target_height=target, segment=segment)
+                == segment.height_to_volume_table[nearest_height]
+            )
+            assert (
+                _height_from_volume_circular(target_volume=target, segment=segment)
+                == segment.volume_to_height_table[nearest_volume]
+            )
@@ -14,7 +14,10 @@ from typing import (
     TypeVar,
     Type,
     Set,
+    Iterable,
+    FrozenSet,
 )
+from dataclasses import dataclass
 
 import logging
 
@@ -56,6 +59,63 @@ MessageListenerCallbackFilter = Callable[[ArbitrationId], bool]
 """A function used to filter incoming messages. Returns true to accept message."""
 
 
+@dataclass(frozen=True, init=False)
+class ArbitrationIdFilter:
+    """A MessageListenerCallbackFilter that the CanMessenger can index.
+
+    Listeners registered with an arbitrary filter function have that function
+    called for every incoming message. Listeners registered with one of these are
+    instead looked up by message id and originating node id, so they cost nothing
+    for messages they are not interested in.
+    """
+
+    message_ids: Optional[FrozenSet[int]]
+    """Accepted message ids, or None to accept any message id."""
+
+    originating_node_ids: Optional[FrozenSet[int]]
+    """Accepted originating node ids, or None to accept any node."""
+
+    def __init__(
+        self,
+        message_ids: Optional[Iterable[MessageId]] = None,
+        originating_node_ids: Optional[Iterable[NodeId]] = None,
+    ) -> None:
+        """Constructor.
+
+        Args:
+            message_ids: Message ids to accept. Accept all if None.
+            originating_node_ids: Originating node ids to accept. Accept all if None.
+        """
+        object.__setattr__(
+            self,
+            "message_ids",
+            frozenset(message_ids) if message_ids is not None else None,
+        )
+        object.__setattr__(
+            self,
+            "originating_node_ids",
+            frozenset(originating_node_ids)
+            if originating_node_ids is not None
+            else None,
+        )
+
+    def __call__(self, arbitration_id: ArbitrationId) -> bool:
+        """Return true to accept the message."""
+        return (
+            self.message_ids is None
+            or arbitration_id.parts.message_id in self.message_ids
+        ) and (
+            self.originating_node_ids is None
+            or arbitration_id.parts.originating_node_id in self.originating_node_ids
+        )
+
+
+_ListenerKey = Tuple[Optional[int], Optional[int]]
+_ListenerEntry = Tuple[
+    int, MessageListenerCallback, Optional[MessageListenerCallbackFilter]
+]
+
+
 _AckResponses = Union[ErrorMessage, Acknowledgement]
 _AckPacket = Tuple[ArbitrationId, _AckResponses]
 _Acks = List[_AckPacket]
@@ -137,10 +197,7 @@ class AcknowledgeListener:
         """Send the message and wait for an Ack."""
         try:
             self._can_messenger.add_listener(
-                self,
-                lambda arbitration_id: bool(
-                    arbitration_id.parts.message_id in _AckIdFilter
-                ),
+                self, ArbitrationIdFilter(message_ids=_AckIdFilter)
             )
             self._event.clear()
             if self._exclusive:
@@ -188,9 +245,15 @@ class CanMessenger:
         """
         self._drive = driver
         self._listeners: Dict[
-            MessageListenerCallback,
-            Tuple[MessageListenerCallback, Optional[MessageListenerCallbackFilter]],
+            MessageListenerCallback, Tuple[_ListenerEntry, List[_ListenerKey]]
+        ] = {}
+        # Listeners bucketed by (message id, originating node id), where None
+        # matches anything. Listeners with plain filter functions go in the
+        # (None, None) bucket and have their filter checked on every message.
+        self._listener_index: Dict[
+            _ListenerKey, Dict[MessageListenerCallback, _ListenerEntry]
         ] = {}
+        self._listener_sequence = 0
         self._task: Optional[asyncio.Task[None]] = None
         self._access_lock = asyncio.Lock()
         self._exclusive_condvar = asyncio.Condition(self._access_lock)
@@ -231,8 +294,9 @@ class CanMessenger:
         )
         data = message.payload.serialize()
         log.debug(
-            f"Sending -->\n\tarbitration_id: {arbitration_id},\n\t"
-            f"payload: {message.payload}"
+            "Sending -->\n\tarbitration_id: %s,\n\tpayload: %s",
+            arbitration_id,
+            message.payload,
         )
         try:
             await self._drive.send(
@@ -348,13 +412,62 @@ class CanMessenger:
         listener: MessageListenerCallback,
         filter: Optional[MessageListenerCallbackFilter] = None,
     ) -> None:
-        """Add a message listener."""
-        self._listeners[listener] = listener, filter
+        """Add a message listener.
+
+        Pass an ArbitrationIdFilter rather than a filter function where possible so
+        that the listener is only considered for the messages it accepts.
+        """
+        self.remove_listener(listener)
+        self._listener_sequence += 1
+        if isinstance(filter, ArbitrationIdFilter):
+            message_ids: Iterable[Optional[int]] = (
+                filter.message_ids if filter.message_ids is not None else [None]
+            )
+            node_ids: Iterable[Optional[int]] = (
+                filter.originating_node_ids
+                if filter.originating_node_ids is not None
+                else [None]
+            )
+            keys: List[_ListenerKey] = [
+                (message_id, node_id)
+                for message_id in message_ids
+                for node_id in node_ids
+            ]
+            entry: _ListenerEntry = (self._listener_sequence, listener, None)
+        else:
+            keys = [(None, None)]
+            entry = (self._listener_sequence, listener, filter)
+        for key in keys:
+            self._listener_index.setdefault(key, {})[listener] = entry
+        self._listeners[listener] = entry, keys
 
     def remove_listener(self, listener: MessageListenerCallback) -> None:
         """Remove a message listener."""
         if listener in self._listeners:
-            self._listeners.pop(listener)
+            _, keys = self._listeners.pop(listener)
+            for key in keys:
+                bucket = self._listener_index[key]
+                del bucket[listener]
+                if not bucket:
+                    del self._listener_index[key]
+
+    def _listeners_for(self, arbitration_id: ArbitrationId) -> List[_ListenerEntry]:
+        """Get the listeners that may accept a message, in registration order."""
+        message_id = arbitration_id.parts.message_id
+        node_id = arbitration_id.parts.originating_node_id
+        buckets = [
+            bucket
+            for bucket in (
+                self._listener_index.get((message_id, node_id)),
+                self._listener_index.get((message_id, None)),
+                self._listener_index.get((None, node_id)),
+                self._listener_index.get((None, None)),
+            )
+            if bucket
+        ]
+        if len(buckets) == 1:
+            return list(buckets[0].values())
+        return sorted(entry for bucket in buckets for entry in bucket.values())
 
     async def _read_task_shield(self) -> None:
         while True:
@@ -380,11 +493,14 @@ class CanMessenger:
                 try:
                     build = message_definition.payload_type.build(message.data)
                     log.debug(
-                        f"Received <--\n\tarbitration_id: {message.arbitration_id},\n\t"
-                        f"payload: {build}"
+                        "Received <--\n\tarbitration_id: %s,\n\tpayload: %s",
+                        message.arbitration_id,
+                        build,
                     )
                     handled = False
-                    for listener, filter in self._listeners.values():
+                    for _, listener, filter in self._listeners_for(
+                        message.arbitration_id
+                    ):
                         if filter and not filter(message.arbitration_id):
                             continue
                         listener(message_definition(payload=build), message.arbitration_id)  # type: ignore[arg-type]
@@ -394,13 +510,13 @@ class CanMessenger:
                             message.arbitration_id.parts.message_id
                             == MessageId.error_message
                         ):
-                            log.error(f"Asynchronous error message ignored: {message}")
+                            log.error("Asynchronous error message ignored: %s", message)
                         else:
-                            log.info(f"Message ignored: {message}")
+                            log.info("Message ignored: %s", message)
                 except BinarySerializableException:
-                    log.exception(f"Failed to build from {message}")
+                    log.exception("Failed to build from %s", message)
             else:
-                log.error(f"Message {message} is not recognized.")
+                log.error("Message %s is not recognized.", message)
 
     @property
     def exclusive_writer(self) -> asyncio.Lock:
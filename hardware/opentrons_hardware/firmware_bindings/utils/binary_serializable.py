@@ -2,8 +2,18 @@
 
 from __future__ import annotations
 import struct
-from dataclasses import dataclass, fields, astuple
-from typing import TypeVar, Generic, Type, Optional, Dict, Any, Sequence
+from dataclasses import dataclass, fields
+from typing import (
+    TypeVar,
+    Generic,
+    Type,
+    Optional,
+    Dict,
+    Any,
+    Sequence,
+    Tuple,
+    Callable,
+)
 
 from opentrons_shared_data.errors.exceptions import (
     InternalMessageFormatError,
@@ -166,6 +176,52 @@ class Int8Field(IntFieldBase):
     FORMAT = "b"
 
 
+class _Codec:
+    """A precompiled packer/unpacker for one BinarySerializable subclass.
+
+    Working out the format string and walking the dataclass fields is only done
+    once per class; after that a message is a single `struct` pack or unpack.
+    """
+
+    def __init__(self, serializable_type: Type[BinarySerializable]) -> None:
+        dataclass_fields = fields(serializable_type)
+        try:
+            field_formats = "".join(v.type.FORMAT for v in dataclass_fields)
+        except AttributeError as e:
+            raise InvalidFieldException(
+                "All fields must be of type BinaryFieldBase", b"", e
+            )
+        self.format_string = f"{serializable_type.ENDIAN}{field_formats}"
+        self.struct = struct.Struct(self.format_string)
+        self.size = self.struct.size
+        self.names = tuple(v.name for v in dataclass_fields)
+        # we have to do message index special until we update to python 3.10 since we can't make it a kw_only arg
+        # 3.10 has an updated dataclass field option that will make this go away, see payloads.py
+        self.init_fields: Tuple[Tuple[int, str, Callable[[Any], Any]], ...] = tuple(
+            (i, v.name, _field_builder(v.type))
+            for i, v in enumerate(dataclass_fields)
+            if v.name != "message_index"
+        )
+        self.message_index: Optional[Tuple[int, Callable[[Any], Any]]] = next(
+            (
+                (i, _field_builder(v.type))
+                for i, v in enumerate(dataclass_fields)
+                if v.name == "message_index"
+            ),
+            None,
+        )
+
+
+def _field_builder(field_type: Type[BinaryFieldBase[Any]]) -> Callable[[Any], Any]:
+    # Fields that don't customize build() can skip the extra classmethod call.
+    if getattr(field_type.build, "__func__", None) is BinaryFieldBase.build.__func__:  # type: ignore[attr-defined]
+        return field_type
+    return field_type.build
+
+
+_codecs: Dict[type, _Codec] = {}
+
+
 @dataclass
 class BinarySerializable:
     """Base class of a dataclass that can be serialized/deserialized into bytes.
@@ -185,10 +241,11 @@ class BinarySerializable:
         Returns:
             Byte buffer
         """
-        string = self._get_format_string()
-        vals = [x.value for x in astuple(self)]
+        codec = self._get_codec()
         try:
-            return struct.pack(string, *vals)
+            return codec.struct.pack(
+                *(getattr(self, name).value for name in codec.names)
+            )
         except struct.error as e:
             raise SerializationException(e)
 
@@ -209,33 +266,30 @@ class BinarySerializable:
         Returns:
             cls
         """
+        codec = cls._get_codec()
         try:
-            format_string = cls._get_format_string()
-            size = cls.get_size()
             # ignore bytes beyond the size of message.
-            b = struct.unpack(format_string, data[:size])
-            # we have to do message index special until we update to python 3.10 since we can't make it a kw_only arg
-            # 3.10 has an updated dataclass field option that will make this go away, see payloads.py
-            args = {
-                v.name: v.type.build(b[i])
-                for i, v in enumerate(fields(cls))
-                if not (v.name == "message_index")
-            }
-            message_index = next(
-                (
-                    v.type.build(b[i])
-                    for i, v in enumerate(fields(cls))
-                    if v.name == "message_index"
-                ),
-                None,
+            b = codec.struct.unpack_from(data)
+            ret_instance = cls(
+                **{name: builder(b[i]) for i, name, builder in codec.init_fields}
             )
-            ret_instance = cls(**args)
-            if message_index is not None:
-                ret_instance.message_index = message_index  # type: ignore[attr-defined]
+            if codec.message_index is not None:
+                index_position, index_builder = codec.message_index
+                ret_instance.message_index = index_builder(b[index_position])  # type: ignore[attr-defined]
             return ret_instance
         except struct.error as e:
             raise InvalidFieldException("Bad data for field", data, e)
 
+    @classmethod
+    def _get_codec(cls) -> _Codec:
+        """Get the compiled codec for this class, creating it on first use."""
+        try:
+            return _codecs[cls]
+        except KeyError:
+            codec = _Codec(cls)
+            _codecs[cls] = codec
+            return codec
+
     @classmethod
     def _get_format_string(cls) -> str:
         """Get the `struct` format string for this class.
@@ -243,22 +297,12 @@ class BinarySerializable:
         Returns:
             a string
         """
-        dataclass_fields = fields(cls)
-        try:
-            format_string = (
-                f"{cls.ENDIAN}{''.join(v.type.FORMAT for v in dataclass_fields)}"
-            )
-        except AttributeError as e:
-            raise InvalidFieldException(
-                "All fields must be of type BinaryFieldBase", b"", e
-            )
-
-        return format_string
+        return cls._get_codec().format_string
 
     @classmethod
     def get_size(cls) -> int:
         """Get the size of the serializable in bytes."""
-        return struct.calcsize(cls._get_format_string())
+        return cls._get_codec().size
 
 
 class LittleEndianMixIn:
@@ -0,0 +1,368 @@
+"""Plan every move in a move list at once, using NumPy arrays.
+
+The functions in `move_utils` plan one move at a time, looping over its axes with
+NumPy scalars. That's easy to follow, but the per-call overhead adds up quickly
+on long move lists, and `MoveManager` replans the whole list on every blending
+iteration.
+
+`MoveArrays` does the same math on whole columns of the move list at once. It is
+meant to produce exactly the same moves as `move_utils.build_move()` and exactly
+the same verdict as `move_utils.all_blended()`, so every operation here mirrors
+its scalar counterpart, down to the order in which axes are visited.
+"""
+from typing import Generic, List, Sequence, TYPE_CHECKING
+
+import numpy as np
+
+from opentrons_hardware.hardware_control.motion_planning.move_utils import (
+    FLOAT_THRESHOLD,
+    max_acceleration_along,
+)
+from opentrons_hardware.hardware_control.motion_planning.types import (
+    AxisKey,
+    Block,
+    Move,
+    SystemConstraints,
+)
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+
+def _square(values: "NDArray[np.float64]") -> "NDArray[np.float64]":
+    """Square each value the same way `np.float64.__pow__` does.
+
+    Squaring an array with a scalar exponent takes a multiply fast path, which
+    can round differently in the last bit than the `pow()` that a NumPy scalar
+    uses. An array exponent goes through `pow()` like the scalar does.
+    """
+    return np.power(values, np.full_like(values, 2.0))
+
+
+def _less_or_close(
+    constraint: "NDArray[np.float64]", values: "NDArray[np.float64]"
+) -> "NDArray[np.bool_]":
+    """Check each value like `move_utils.check_less_or_close` does."""
+    return (np.abs(values) <= constraint) | np.isclose(values, constraint)
+
+
+class MoveArrays(Generic[AxisKey]):
+    """The parts of a move list that blending doesn't change, as arrays.
+
+    Blending only ever changes the speeds of a move list's moves. Their axes,
+    directions, distances and speed limits stay the same, so this extracts them
+    once and then plans the list as many times as blending needs.
+
+    Args:
+        moves: The move list to plan, including the dummy moves at either end.
+        constraints: System constraints. Must cover every axis of the moves.
+    """
+
+    def __init__(
+        self, moves: Sequence[Move[AxisKey]], constraints: SystemConstraints[AxisKey]
+    ) -> None:
+        """Extract the fixed parts of a move list."""
+        assert len(moves) >= 2, "Move list must at least contain its dummy moves"
+        self._axes = list(moves[0].unit_vector.keys())
+        self._unit_vectors: "NDArray[np.float64]" = np.array(
+            [[move.unit_vector[axis] for axis in self._axes] for move in moves],
+            dtype=np.float64,
+        )
+        self._distances: "NDArray[np.float64]" = np.array(
+            [move.distance for move in moves], dtype=np.float64
+        )
+        self._max_speeds: "NDArray[np.float64]" = np.array(
+            [move.max_speed for move in moves], dtype=np.float64
+        )
+        # Only the moves between the dummies are ever built.
+        self._max_accelerations: "NDArray[np.float64]" = np.array(
+            [
+                max_acceleration_along(move.unit_vector, constraints)
+                for move in moves[1:-1]
+            ],
+            dtype=np.float64,
+        )
+        self._axis_max_acceleration = np.array(
+            [constraints[axis].max_acceleration for axis in self._axes]
+        )
+        self._axis_max_speed_discont = np.array(
+            [constraints[axis].max_speed_discont for axis in self._axes]
+        )
+        self._axis_max_direction_change_speed_discont = np.array(
+            [
+                constraints[axis].max_direction_change_speed_discont
+                for axis in self._axes
+            ]
+        )
+        # Like the scalar functions, ignore the direction of neighbors that don't move.
+        moving = (self._distances > FLOAT_THRESHOLD)[:, np.newaxis]
+        self._neighbor_unit_vectors = np.where(moving, self._unit_vectors, 0.0)
+
+    def build_moves(self, moves: Sequence[Move[AxisKey]]) -> List[Move[AxisKey]]:
+        """Build every move between the dummies, like `move_utils.build_move()`.
+
+        Args:
+            moves: The move list this was created from, possibly with the speeds
+                from a previous blending iteration.
+
+        Returns:
+            The built moves, not including the dummy moves.
+        """
+        assert len(moves) == len(self._distances), "Move list does not match"
+        initial_speeds = np.array([move.initial_speed for move in moves])
+        final_speeds = np.array([move.final_speed for move in moves])
+
+        with np.errstate(all="ignore"):
+            # Every branch of an np.where() is evaluated, including ones that
+            # divide by the zero components of axes that aren't moving.
+            initial_speed = self._find_initial_speeds(initial_speeds, final_speeds)
+            final_speed = self._find_final_speeds(initial_speeds, final_speeds)
+            final_speed = self._achievable_finals(initial_speed, final_speed)
+            return self._build_blocks(moves[1:-1], initial_speed, final_speed)
+
+    def all_blended(self, built_moves: Sequence[Move[AxisKey]]) -> bool:
+        """Check whether built moves are blended, exactly like `move_utils.all_blended`.
+
+        Args:
+            built_moves: Moves returned by `build_moves()`.
+        """
+        if len(built_moves) < 2:
+            return True
+
+        block_distances = np.array(
+            [[block.distance for block in move.blocks] for move in built_moves]
+        )
+        # Add up the blocks in the same order that the built-in sum() does.
+        distance_sums = (
+            (0 + block_distances[:, 0]) + block_distances[:, 1]
+        ) + block_distances[:, 2]
+        distances = self._distances[1:-1]
+        if np.any(
+            (np.abs(distance_sums - distances) > FLOAT_THRESHOLD)
+            | ~np.isclose(distance_sums, distances)
+        ):
+            return False
+
+        first_unit_vectors = self._unit_vectors[1:-2]
+        second_unit_vectors = self._unit_vectors[2:-1]
+        final_speeds = np.array(
+            [move.blocks[-1].final_speed for move in built_moves[:-1]]
+        )[:, np.newaxis]
+        initial_speeds = np.array(
+            [move.blocks[0].initial_speed for move in built_moves[1:]]
+        )[:, np.newaxis]
+        axis_final_speeds = final_speeds * first_unit_vectors
+        axis_initial_speeds = initial_speeds * second_unit_vectors
+
+        same_direction = first_unit_vectors * second_unit_vectors > 0
+        discont_limit = np.where(
+            same_direction,
+            self._axis_max_speed_discont,
+            self._axis_max_direction_change_speed_discont,
+        )
+        under_limit = _less_or_close(discont_limit, axis_final_speeds) | _less_or_close(
+            discont_limit, axis_initial_speeds
+        )
+        speeds_match = same_direction & (
+            np.abs(axis_initial_speeds - axis_final_speeds) < FLOAT_THRESHOLD
+        )
+        return bool(np.all(speeds_match | under_limit))
+
+    def _find_initial_speeds(
+        self,
+        initial_speeds: "NDArray[np.float64]",
+        final_speeds: "NDArray[np.float64]",
+    ) -> "NDArray[np.float64]":
+        """Vectorized `move_utils.find_initial_speed()`."""
+        speed = initial_speeds[1:-1].copy()
+        prev_final_speed = final_speeds[:-2]
+        unit_vectors = self._unit_vectors[1:-1]
+        prev_unit_vectors = self._neighbor_unit_vectors[:-2]
+        for index in range(len(self._axes)):
+            component = unit_vectors[:, index]
+            prev_component = prev_unit_vectors[:, index]
+            moving = ~(np.abs(component * speed) < FLOAT_THRESHOLD)
+
+            from_stop = (prev_component == 0) | (prev_final_speed == 0)
+            direction = prev_component * component
+            same_direction = direction > 0
+            if np.any(moving & ~from_stop & ~same_direction & ~(direction < 0)):
+                assert False, "planning initial speed failed"
+
+            discont = self._axis_max_speed_discont[index]
+            limit = np.where(
+                from_stop,
+                np.abs(discont / component),
+                np.where(
+                    same_direction,
+                    np.abs(
+                        np.maximum(np.abs(prev_final_speed * prev_component), discont)
+                        / component
+                    ),
+                    np.abs(
+                        self._axis_max_direction_change_speed_discont[index] / component
+                    ),
+                ),
+            )
+            speed = np.where(moving, np.minimum(limit, speed), speed)
+        return speed
+
+    def _find_final_speeds(
+        self,
+        initial_speeds: "NDArray[np.float64]",
+        final_speeds: "NDArray[np.float64]",
+    ) -> "NDArray[np.float64]":
+        """Vectorized `move_utils.find_final_speed()`."""
+        speed = final_speeds[1:-1].copy()
+        next_initial_speed = initial_speeds[2:]
+        unit_vectors = self._unit_vectors[1:-1]
+        next_unit_vectors = self._neighbor_unit_vectors[2:]
+        for index in range(len(self._axes)):
+            component = unit_vectors[:, index]
+            next_component = next_unit_vectors[:, index]
+            moving = ~(np.abs(component * speed) < FLOAT_THRESHOLD)
+
+            stopping = (next_component == 0) | (next_initial_speed == 0)
+            direction = next_component * component
+            same_direction = direction > 0
+            if np.any(moving & ~stopping & ~same_direction & ~(direction < 0)):
+                assert False, "planning final speed failed"
+
+            discont = self._axis_max_speed_discont[index]
+            limit = np.where(
+                stopping,
+                np.abs(discont / component),
+                np.where(
+                    same_direction,
+                    np.abs(
+                        np.maximum(discont, np.abs(next_initial_speed * next_component))
+                        / component
+                    ),
+                    np.abs(
+                        self._axis_max_direction_change_speed_discont[index] / component
+                    ),
+                ),
+            )
+            speed = np.where(moving, np.minimum(limit, speed), speed)
+        return speed
+
+    def _achievable_finals(
+        self,
+        initial_speed: "NDArray[np.float64]",
+        final_speed: "NDArray[np.float64]",
+    ) -> "NDArray[np.float64]":
+        """Vectorized `move_utils.achievable_final()`."""
+        unit_vectors = self._unit_vectors[1:-1]
+        distances = self._distances[1:-1]
+        for index in range(len(self._axes)):
+            component = unit_vectors[:, index]
+            max_final_velocity_sq = (
+                _square(initial_speed * component)
+                + 2 * self._axis_max_acceleration[index] * distances
+            )
+            max_final_velocity = (
+                np.copysign(
+                    np.sqrt(max_final_velocity_sq) / component,
+                    final_speed - initial_speed,
+                )
+                + initial_speed
+            )
+            final_speed = np.where(
+                component != 0,
+                np.copysign(
+                    np.minimum(np.abs(max_final_velocity), np.abs(final_speed)),
+                    final_speed,
+                ),
+                final_speed,
+            )
+        return final_speed
+
+    def _build_blocks(
+        self,
+        moves: Sequence[Move[AxisKey]],
+        initial_speed: "NDArray[np.float64]",
+        final_speed: "NDArray[np.float64]",
+    ) -> List[Move[AxisKey]]:
+        """Vectorized `move_utils.build_blocks()`, applied to each move."""
+        distances = self._distances[1:-1]
+        max_speeds = self._max_speeds[1:-1]
+        initial_too_fast = ~(
+            (np.abs(initial_speed) <= max_speeds)
+            | np.isclose(np.abs(initial_speed), max_speeds)
+        )
+        final_too_fast = ~(
+            (np.abs(final_speed) <= max_speeds)
+            | np.isclose(np.abs(final_speed), max_speeds)
+        )
+        if np.any(initial_too_fast | final_too_fast):
+            # Fail on the same move, and with the same message, as build_blocks().
+            index = int(np.argmax(initial_too_fast | final_too_fast))
+            name, speed = (
+                ("initial", initial_speed[index])
+                if initial_too_fast[index]
+                else ("final", final_speed[index])
+            )
+            assert False, f"{name} speed {speed} exceeds max speed {max_speeds[index]}"
+
+        max_acceleration = self._max_accelerations
+        initial_speed_sq = _square(initial_speed)
+        final_speed_sq = _square(final_speed)
+        max_achievable_speed = np.sqrt(
+            0.5 * (2 * max_acceleration * distances + initial_speed_sq + final_speed_sq)
+        )
+        top_speed_sq = _square(np.minimum(max_achievable_speed, max_speeds))
+        first_distance = np.abs(top_speed_sq - initial_speed_sq) / (
+            2 * max_acceleration
+        )
+        final_distance = np.abs(top_speed_sq - final_speed_sq) / (2 * max_acceleration)
+
+        # Trim the top speed of triangle moves that overshoot. See build_blocks().
+        trimmed = first_distance + final_distance > (distances + FLOAT_THRESHOLD)
+        trimmed_speed_sq = np.maximum(initial_speed_sq, final_speed_sq)
+        trimmed_first_distance = np.abs(trimmed_speed_sq - initial_speed_sq) / (
+            2 * max_acceleration
+        )
+        trimmed_final_distance = np.abs(trimmed_speed_sq - final_speed_sq) / (
+            2 * max_acceleration
+        )
+        first_distance_after_trim = np.where(
+            trimmed, trimmed_first_distance, first_distance
+        )
+        final_distance_after_trim = np.where(
+            trimmed, trimmed_final_distance, final_distance
+        )
+        coasts = first_distance_after_trim + final_distance_after_trim < (
+            distances - FLOAT_THRESHOLD
+        )
+        coast_distance = (
+            distances - first_distance_after_trim
+        ) - final_distance_after_trim
+
+        built: List[Move[AxisKey]] = []
+        for index, move in enumerate(moves):
+            first = Block(
+                initial_speed=initial_speed[index],
+                acceleration=max_acceleration[index],
+                distance=first_distance[index],
+            )
+            final = Block(
+                initial_speed=first.final_speed,
+                acceleration=-max_acceleration[index],
+                distance=final_distance[index],
+            )
+            if trimmed[index]:
+                # Like build_blocks(), this changes the distances without
+                # recomputing the blocks' other fields.
+                first.distance = trimmed_first_distance[index]
+                final.initial_speed = first.final_speed
+                final.distance = trimmed_final_distance[index]
+            if coasts[index]:
+                coast = Block(
+                    initial_speed=final.initial_speed,
+                    acceleration=np.float64(0),
+                    distance=coast_distance[index],
+                )
+            else:
+                coast = Block(np.float64(0), np.float64(0), np.float64(0))
+            built.append(move.with_blocks((first, coast, final)))
+        return built
@@ -2,6 +2,7 @@
 import logging
 from typing import List, Tuple, Generic
 from opentrons_hardware.hardware_control.motion_planning import move_utils
+from opentrons_hardware.hardware_control.motion_planning.move_arrays import MoveArrays
 from opentrons_hardware.hardware_control.motion_planning.types import (
     Coordinates,
     Move,
@@ -67,25 +68,14 @@ class MoveManager(Generic[AxisKey]):
         self._clear_blend_log()
         to_blend = self._get_initial_moves_from_targets(origin, target_list)
         assert to_blend, "Check target list"
+        # Blending only changes the moves' speeds, so set up their geometry once.
+        move_arrays = MoveArrays(to_blend, self._constraints)
         for i in range(iteration_limit):
             log.debug(f"Motion blending iteration: {i}")
-            blend_log = []
-            moveiter = iter(to_blend)
-            first = next(moveiter)
-            middle = next(moveiter)
-            while True:
-                try:
-                    last = next(moveiter)
-                    blend_log.append(
-                        move_utils.build_move(middle, first, last, self._constraints)
-                    )
-                    first = middle
-                    middle = last
-                except StopIteration:
-                    if blend_log:
-                        self._blend_log.append(blend_log)
-                    break
-            if move_utils.all_blended(self._constraints, self._blend_log[i]):
+            blend_log = move_arrays.build_moves(to_blend)
+            if blend_log:
+                self._blend_log.append(blend_log)
+            if move_arrays.all_blended(self._blend_log[i]):
                 log.debug(
                     f"built {len(self._blend_log[i])} moves with "
                     f"{sum(list(m.nonzero_blocks for m in self._blend_log[i]))} "
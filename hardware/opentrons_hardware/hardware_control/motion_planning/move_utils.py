@@ -407,6 +407,26 @@ def achievable_final(
     return final_speed
 
 
+def max_acceleration_along(
+    unit_vector: Coordinates[AxisKey, np.float64],
+    constraints: SystemConstraints[AxisKey],
+) -> np.float64:
+    """Get the largest acceleration along a unit vector that keeps every axis in limits."""
+    max_acc: np.typing.NDArray[np.float64] = np.array(
+        [
+            constraints[axis].max_acceleration if unit_vector[axis] else 0.0
+            for axis in unit_vector.keys()
+        ]
+    )
+    max_acc_magnitude = np.linalg.norm(max_acc)
+    acc_v = max_acc_magnitude * vectorize(unit_vector)
+
+    for a_i, max_acc_i in zip(acc_v, max_acc):
+        if abs(a_i) > max_acc_i:
+            acc_v *= max_acc_i / a_i
+    return cast(np.float64, np.linalg.norm(acc_v))
+
+
 def build_blocks(
     unit_vector: Coordinates[AxisKey, np.float64],
     initial_speed: np.float64,
@@ -432,19 +452,7 @@ def build_blocks(
         abs(final_speed), max_speed
     ), f"final speed {final_speed} exceeds max speed {max_speed}"
 
-    max_acc: np.typing.NDArray[np.float64] = np.array(
-        [
-            constraints[axis].max_acceleration if unit_vector[axis] else 0.0
-            for axis in unit_vector.keys()
-        ]
-    )
-    max_acc_magnitude = np.linalg.norm(max_acc)
-    acc_v = max_acc_magnitude * vectorize(unit_vector)
-
-    for a_i, max_acc_i in zip(acc_v, max_acc):
-        if abs(a_i) > max_acc_i:
-            acc_v *= max_acc_i / a_i
-    max_acceleration = np.linalg.norm(acc_v)
+    max_acceleration = max_acceleration_along(unit_vector, constraints)
 
     initial_speed_sq = initial_speed**2
     final_speed_sq = final_speed**2
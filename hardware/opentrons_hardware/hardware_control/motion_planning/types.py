@@ -1,5 +1,6 @@
 """Motion planning types."""
 from __future__ import annotations
+import copy
 import logging
 import dataclasses
 import numpy as np
@@ -143,6 +144,17 @@ class Move(Generic[AxisKey]):
         self.final_speed = _final_speed()
         self.nonzero_blocks = len([b for b in self.blocks if b.time])
 
+    def with_blocks(self, blocks: Tuple[Block, Block, Block]) -> Move[AxisKey]:
+        """Return a copy of this move that executes with different blocks.
+
+        The unit vector was already verified when this move was created, so unlike
+        the constructor, this doesn't verify it again.
+        """
+        move = copy.copy(self)
+        move.blocks = blocks
+        move.__post_init__()
+        return move
+
     @classmethod
     def build_dummy(cls, for_axes: Iterable[AxisKey]) -> Move[AxisKey]:
         """Return a Move with dummy values."""
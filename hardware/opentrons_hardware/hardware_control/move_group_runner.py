@@ -2,7 +2,7 @@
 import asyncio
 from collections import defaultdict
 import logging
-from typing import List, Set, Tuple, Iterator, Union, Optional
+from typing import Awaitable, Callable, List, Set, Tuple, Iterator, Union, Optional
 import numpy as np
 import time
 
@@ -89,6 +89,7 @@ log = logging.getLogger(__name__)
 _AcceptableMoves = Union[MoveCompleted, TipActionResponse]
 _CompletionPacket = Tuple[ArbitrationId, _AcceptableMoves]
 _Completions = List[_CompletionPacket]
+_GroupUploader = Callable[[int], Awaitable[None]]
 
 
 class MoveGroupRunner:
@@ -163,16 +164,28 @@ class MoveGroupRunner:
             The current position after the move for all the axes that
             acknowledged completing moves.
 
-        This function first prepares all connected devices to move (by sending
-        all the data for the moves over) and then executes the move with a
-        single call.
+        This function first prepares all connected devices to move by sending
+        them the data for the first move group, and then executes the move
+        groups one after another. While each group executes, the data for the
+        next one is sent, so that it is ready to go as soon as the group before
+        it completes.
 
         prep() and execute() can be used to replace a single call to run() to
         ensure tighter timing, if you want something else to start as soon as
         possible to the actual execution of the move.
         """
-        await self.prep(can_messenger)
-        return await self.execute(can_messenger)
+        if not self._has_moves(self._move_groups):
+            log.debug("No moves. Nothing to do.")
+            return {}
+        await self._clear_groups(can_messenger)
+        await self._send_group(can_messenger, 0)
+        self._is_prepped = True
+        move_completion_data = await self._move(
+            can_messenger,
+            self._start_at_index,
+            upload_group=lambda group_i: self._send_group(can_messenger, group_i),
+        )
+        return self._accumulate_move_completions(move_completion_data)
 
     @staticmethod
     def _accumulate_move_completions(
@@ -257,15 +270,19 @@ class MoveGroupRunner:
 
     async def _send_groups(self, can_messenger: CanMessenger) -> None:
         """Send commands to set up the message groups."""
-        for group_i, group in enumerate(self._move_groups):
-            for seq_i, sequence in enumerate(group):
-                for node, step in sequence.items():
-                    await can_messenger.send(
-                        node_id=node,
-                        message=self._get_message_type(
-                            step, group_i + self._start_at_index, seq_i
-                        ),
-                    )
+        for group_i in range(len(self._move_groups)):
+            await self._send_group(can_messenger, group_i)
+
+    async def _send_group(self, can_messenger: CanMessenger, group_i: int) -> None:
+        """Send commands to set up one message group."""
+        for seq_i, sequence in enumerate(self._move_groups[group_i]):
+            for node, step in sequence.items():
+                await can_messenger.send(
+                    node_id=node,
+                    message=self._get_message_type(
+                        step, group_i + self._start_at_index, seq_i
+                    ),
+                )
 
     def _convert_velocity(
         self, velocity: Union[float, np.float64], interrupts: int
@@ -399,10 +416,13 @@ class MoveGroupRunner:
         return TipActionRequest(payload=tip_action_payload)
 
     async def _move(
-        self, can_messenger: CanMessenger, start_at_index: int
+        self,
+        can_messenger: CanMessenger,
+        start_at_index: int,
+        upload_group: Optional[_GroupUploader] = None,
     ) -> _Completions:
         """Run all the move groups."""
-        scheduler = MoveScheduler(self._move_groups, start_at_index)
+        scheduler = MoveScheduler(self._move_groups, start_at_index, upload_group)
         try:
             can_messenger.add_listener(scheduler)
             completions = await scheduler.run(can_messenger)
@@ -414,13 +434,28 @@ class MoveGroupRunner:
 class MoveScheduler:
     """A message listener that manages the sending of execute move group messages."""
 
-    def __init__(self, move_groups: MoveGroups, start_at_index: int = 0) -> None:
-        """Constructor."""
+    def __init__(
+        self,
+        move_groups: MoveGroups,
+        start_at_index: int = 0,
+        upload_group: Optional[_GroupUploader] = None,
+    ) -> None:
+        """Constructor.
+
+        Args:
+            move_groups: The move groups to run.
+            start_at_index: The group id of the first move group.
+            upload_group: If specified, called with the index of each move
+                group after the first, to send its moves while the move group
+                before it executes. Otherwise, every move group must already
+                have been sent.
+        """
         # For each move group create a set identifying the node and seq id.
         self._moves: List[Set[Tuple[int, int]]] = []
         self._durations: List[float] = []
         self._stop_condition: List[List[MoveStopCondition]] = []
         self._start_at_index = start_at_index
+        self._upload_group = upload_group
         self._expected_tip_action_motors = []
 
         for move_group in move_groups:
@@ -655,6 +690,17 @@ class MoveScheduler:
                 f"Recoverable firmware errors during {group_id}: {self._errors}"
             )
 
+    async def _upload_next_group(self, group_id: int) -> None:
+        """Send the moves for the group after group_id while group_id executes."""
+        next_group = group_id - self._start_at_index + 1
+        if self._upload_group is None or next_group >= len(self._moves):
+            return
+        if self._should_stop:
+            # This group has already failed, so nothing else will run. Skip the
+            # upload; _send_stop_if_necessary stops the motors.
+            return
+        await self._upload_group(next_group)
+
     async def _run_one_group(self, group_id: int, can_messenger: CanMessenger) -> None:
         self._event.clear()
 
@@ -681,6 +727,10 @@ class MoveScheduler:
         start_time = time.time()
 
         try:
+            await self._upload_next_group(group_id)
+            # The upload overlaps this group's execution, but the time it takes
+            # doesn't count toward this group's timeout.
+            start_time = time.time()
             # The staged timeout handles some times when a move takes a liiiittle extra
             await asyncio.wait_for(
                 self._event.wait(),
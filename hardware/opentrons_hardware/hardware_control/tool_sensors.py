@@ -5,7 +5,6 @@ from functools import partial
 from typing import (
     Union,
     List,
-    Iterator,
     Tuple,
     Dict,
     Callable,
@@ -51,6 +50,7 @@ from opentrons_hardware.sensors.sensor_types import (
     CapacitiveSensor,
 )
 from opentrons_hardware.sensors.scheduler import SensorScheduler
+from opentrons_hardware.sensors.sensor_buffer import SensorRingBuffer
 from opentrons_hardware.drivers.can_bus.can_messenger import CanMessenger
 from opentrons_hardware.hardware_control.motion import (
     MoveStopCondition,
@@ -275,8 +275,14 @@ async def liquid_probe(
     emplace_data: Optional[
         Callable[[Dict[SensorId, List[SensorDataType]]], None]
     ] = None,
+    sensor_buffers: Optional[Dict[SensorId, SensorRingBuffer]] = None,
 ) -> Dict[NodeId, MotorPositionStatus]:
-    """Move the mount and pipette simultaneously while reading from the pressure sensor."""
+    """Move the mount and pipette simultaneously while reading from the pressure sensor.
+
+    If sensor_buffers has a buffer for a sensor, that sensor's raw readings are
+    streamed into it instead of being queued one by one, and are not passed to
+    emplace_data.
+    """
     sensor_driver = SensorDriver()
     threshold_fixed_point = threshold_pascals * sensor_fixed_point_conversion
     sensor_binding = None
@@ -343,7 +349,9 @@ async def liquid_probe(
 
     raise_z_runner = MoveGroupRunner(move_groups=[[raise_z]])
     listeners = {
-        s_id: LogListener(messenger, pressure_sensors[s_id])
+        s_id: LogListener(
+            messenger, pressure_sensors[s_id], (sensor_buffers or {}).get(s_id)
+        )
         for s_id in pressure_sensors.keys()
     }
 
@@ -402,6 +410,7 @@ async def capacitive_probe(
     response_queue: Optional[
         asyncio.Queue[dict[SensorId, list[SensorDataType]]]
     ] = None,
+    sensor_buffers: Optional[Dict[SensorId, SensorRingBuffer]] = None,
 ) -> MotorPositionStatus:
     """Move the specified tool down until its capacitive sensor triggers.
 
@@ -410,6 +419,10 @@ async def capacitive_probe(
 
     The direction is sgn(distance)*sgn(speed), so you can set the direction
     either by negating speed or negating distance.
+
+    If sensor_buffers has a buffer for a sensor, that sensor's raw readings are
+    streamed into it instead of being queued one by one, and are not put in
+    response_queue.
     """
     sensor_driver = SensorDriver()
     pipette_present = tool in [NodeId.pipette_left, NodeId.pipette_right]
@@ -452,7 +465,9 @@ async def capacitive_probe(
     runner = MoveGroupRunner(move_groups=[[sensor_group]])
 
     listeners = {
-        s_id: LogListener(messenger, capacitive_sensors[s_id])
+        s_id: LogListener(
+            messenger, capacitive_sensors[s_id], (sensor_buffers or {}).get(s_id)
+        )
         for s_id in capacitive_sensors.keys()
     }
     async with AsyncExitStack() as binding_stack:
@@ -505,17 +520,12 @@ async def capacitive_pass(
 
     runner = MoveGroupRunner(move_groups=[[sensor_group]])
     await runner.prep(messenger)
-    async with sensor_scheduler.capture_output(sensor_info, messenger) as output_queue:
+    async with sensor_scheduler.stream_output(sensor_info, messenger) as buffer:
         await runner.execute(messenger)
-
-    def _drain() -> Iterator[float]:
-        while True:
-            try:
-                yield output_queue.get_nowait()
-            except asyncio.QueueEmpty:
-                break
-
-    return list(_drain())
+    if buffer.metrics.dropped:
+        LOG.warning(f"Dropped {buffer.metrics.dropped} capacitive readings")
+    readings: List[float] = buffer.values().tolist()
+    return readings
 
 
 @asynccontextmanager
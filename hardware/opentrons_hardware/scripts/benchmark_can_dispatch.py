@@ -0,0 +1,178 @@
+"""Measure CanMessenger dispatch latency on a simulated bus under listener load.
+
+A simulated driver feeds sensor data frames from one node into a CanMessenger that
+also has many unrelated listeners registered, the way it does while sensors are
+streaming and move groups are running. The unrelated listeners are registered
+either with plain filter functions, which are checked for every frame, or with
+ArbitrationIdFilters, which the messenger indexes.
+
+Run with `python -m opentrons_hardware.scripts.benchmark_can_dispatch`.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List, Optional
+
+from opentrons_hardware.drivers.can_bus.abstract_driver import AbstractCanDriver
+from opentrons_hardware.drivers.can_bus.can_messenger import (
+    ArbitrationIdFilter,
+    CanMessenger,
+    MessageListenerCallbackFilter,
+)
+from opentrons_hardware.firmware_bindings.arbitration_id import (
+    ArbitrationId,
+    ArbitrationIdParts,
+)
+from opentrons_hardware.firmware_bindings.constants import (
+    FunctionCode,
+    MessageId,
+    NodeId,
+)
+from opentrons_hardware.firmware_bindings.message import CanMessage
+from opentrons_hardware.firmware_bindings.messages.messages import MessageDefinition
+
+_SENSOR_NODE = NodeId.pipette_left
+_OTHER_NODES = [NodeId.gantry_x, NodeId.gantry_y, NodeId.head, NodeId.gripper]
+_OTHER_MESSAGES = [
+    MessageId.move_completed,
+    MessageId.acknowledgement,
+    MessageId.motor_position_response,
+    MessageId.peripheral_status_response,
+]
+
+
+class SimulatedBusDriver(AbstractCanDriver):
+    """A driver that replays a fixed number of frames as fast as they are read."""
+
+    def __init__(self, frame: CanMessage, count: int) -> None:
+        """Constructor."""
+        self._frame = frame
+        self._remaining = count
+        self.last_read = 0.0
+
+    async def send(self, message: CanMessage) -> None:
+        """Discard sent messages."""
+
+    async def read(self) -> CanMessage:
+        """Hand out the next frame, yielding to the loop like a real driver."""
+        await asyncio.sleep(0)
+        if self._remaining == 0:
+            # Nothing else is coming; park until the messenger is stopped.
+            await asyncio.Event().wait()
+        self._remaining -= 1
+        self.last_read = time.perf_counter()
+        return self._frame
+
+    def shutdown(self) -> None:
+        """Nothing to clean up."""
+
+
+class _UnrelatedListener:
+    def __call__(
+        self, message: MessageDefinition, arbitration_id: ArbitrationId
+    ) -> None:
+        raise RuntimeError("unrelated listener should not be called")
+
+
+def _sensor_frame() -> CanMessage:
+    return CanMessage(
+        arbitration_id=ArbitrationId(
+            parts=ArbitrationIdParts(
+                message_id=MessageId.read_sensor_response,
+                node_id=NodeId.host,
+                function_code=FunctionCode.network_management,
+                originating_node_id=_SENSOR_NODE,
+            )
+        ),
+        data=bytes(64),
+    )
+
+
+def _function_filter(
+    message_id: MessageId, node_id: NodeId
+) -> MessageListenerCallbackFilter:
+    def _filter(arbitration_id: ArbitrationId) -> bool:
+        return (
+            MessageId(arbitration_id.parts.message_id) == message_id
+            and NodeId(arbitration_id.parts.originating_node_id) == node_id
+        )
+
+    return _filter
+
+
+async def _measure(listeners: int, frames: int, indexed: bool) -> List[float]:
+    driver = SimulatedBusDriver(_sensor_frame(), frames)
+    messenger = CanMessenger(driver)
+    latencies: List[float] = []
+    done = asyncio.Event()
+
+    def _sensor_listener(
+        message: MessageDefinition, arbitration_id: ArbitrationId
+    ) -> None:
+        latencies.append(time.perf_counter() - driver.last_read)
+        if len(latencies) == frames:
+            done.set()
+
+    for i in range(listeners):
+        message_id = _OTHER_MESSAGES[i % len(_OTHER_MESSAGES)]
+        node_id = _OTHER_NODES[i % len(_OTHER_NODES)]
+        filter: Optional[MessageListenerCallbackFilter] = (
+            ArbitrationIdFilter(
+                message_ids=[message_id], originating_node_ids=[node_id]
+            )
+            if indexed
+            else _function_filter(message_id, node_id)
+        )
+        messenger.add_listener(_UnrelatedListener(), filter)
+
+    messenger.add_listener(
+        _sensor_listener,
+        ArbitrationIdFilter(
+            message_ids=[MessageId.read_sensor_response],
+            originating_node_ids=[_SENSOR_NODE],
+        )
+        if indexed
+        else _function_filter(MessageId.read_sensor_response, _SENSOR_NODE),
+    )
+    async with messenger:
+        await done.wait()
+    return latencies
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--listeners",
+        type=int,
+        nargs="+",
+        default=[1, 10, 50, 200],
+        help="Numbers of unrelated listeners to register.",
+    )
+    parser.add_argument(
+        "--frames",
+        type=int,
+        default=20000,
+        help="Number of sensor frames to dispatch per measurement.",
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'listeners':>10} {'filter fn mean (us)':>20} {'p99':>8}"
+        f" {'indexed mean (us)':>18} {'p99':>8}"
+    )
+    for listeners in args.listeners:
+        row = f"{listeners:>10}"
+        for indexed, width in ((False, 20), (True, 18)):
+            latencies = asyncio.run(_measure(listeners, args.frames, indexed))
+            mean = statistics.mean(latencies) * 1e6
+            p99 = statistics.quantiles(latencies, n=100)[98] * 1e6
+            row += f" {mean:>{width}.1f} {p99:>8.1f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
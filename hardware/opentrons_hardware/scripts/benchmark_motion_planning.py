@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Measure how long MoveManager takes to plan paths of various lengths.
+
+This compares `MoveManager.plan_motion()`, which plans each blending iteration
+with `MoveArrays`, against the previous approach of calling `move_utils.build_move()`
+and `move_utils.blended()` move by move. It also checks that both produce exactly
+the same moves.
+
+Run with `python -m opentrons_hardware.scripts.benchmark_motion_planning`.
+"""
+import argparse
+import logging
+import random
+import time
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+from opentrons_hardware.hardware_control.motion_planning import move_utils
+from opentrons_hardware.hardware_control.motion_planning.move_manager import MoveManager
+from opentrons_hardware.hardware_control.motion_planning.types import (
+    AxisConstraints,
+    Coordinates,
+    Move,
+    MoveTarget,
+    SystemConstraints,
+)
+
+AXES = ["X", "Y", "Z", "A"]
+
+CONSTRAINTS: SystemConstraints[str] = {
+    "X": AxisConstraints.build(
+        max_acceleration=1000,
+        max_speed_discont=40,
+        max_direction_change_speed_discont=20,
+        max_speed=500,
+    ),
+    "Y": AxisConstraints.build(
+        max_acceleration=1000,
+        max_speed_discont=40,
+        max_direction_change_speed_discont=20,
+        max_speed=500,
+    ),
+    "Z": AxisConstraints.build(
+        max_acceleration=200,
+        max_speed_discont=15,
+        max_direction_change_speed_discont=5,
+        max_speed=100,
+    ),
+    "A": AxisConstraints.build(
+        max_acceleration=200,
+        max_speed_discont=15,
+        max_direction_change_speed_discont=5,
+        max_speed=100,
+    ),
+}
+
+Plan = Tuple[bool, List[List[Move[str]]]]
+
+
+def _legacy_plan_motion(
+    manager: MoveManager[str],
+    origin: Coordinates[str, np.float64],
+    targets: List[MoveTarget[str]],
+    iteration_limit: int,
+) -> Plan:
+    to_blend = manager._get_initial_moves_from_targets(origin, targets)
+    blend_log: List[List[Move[str]]] = []
+    for _ in range(iteration_limit):
+        built = [
+            move_utils.build_move(move, prev_move, next_move, CONSTRAINTS)
+            for prev_move, move, next_move in zip(to_blend, to_blend[1:], to_blend[2:])
+        ]
+        blend_log.append(built)
+        if move_utils.all_blended(CONSTRAINTS, built):
+            return True, blend_log
+        to_blend = manager._add_dummy_start_end_to_moves(built)
+    return False, blend_log
+
+
+def _make_path(
+    segments: int, rng: random.Random
+) -> Tuple[Coordinates[str, np.float64], List[MoveTarget[str]]]:
+    origin = {axis: np.float64(0) for axis in AXES}
+    position = np.zeros(len(AXES))
+    targets: List[MoveTarget[str]] = []
+    while len(targets) < segments:
+        step = np.array([rng.choice([-10.0, -2.0, 0.0, 2.0, 10.0]) for _ in AXES])
+        if not step.any():
+            continue
+        position = position + step
+        targets.append(
+            MoveTarget.build(dict(zip(AXES, position)), rng.choice([50.0, 200.0]))
+        )
+    return origin, targets
+
+
+def _timed(func: Callable[[], Plan], repeats: int) -> Tuple[float, Plan]:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--segments",
+        type=int,
+        nargs="+",
+        default=[100, 1000, 10000],
+        help="Numbers of path segments to benchmark.",
+    )
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--iteration-limit", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    # The scalar planner logs on every axis of every move, which would swamp both.
+    logging.disable(logging.INFO)
+    rng = random.Random(args.seed)
+    manager = MoveManager(CONSTRAINTS)
+
+    print(
+        f"{'segments':>10} {'moves':>8} {'iterations':>11} "
+        f"{'legacy (s)':>11} {'arrays (s)':>11} {'speedup':>8}"
+    )
+    for segments in args.segments:
+        origin, targets = _make_path(segments, rng)
+        legacy_time, legacy = _timed(
+            lambda: _legacy_plan_motion(manager, origin, targets, args.iteration_limit),
+            args.repeats,
+        )
+        arrays_time, planned = _timed(
+            lambda: manager.plan_motion(origin, targets, args.iteration_limit),
+            args.repeats,
+        )
+        converged, blend_log = planned
+        # If it doesn't converge, the manager leaves the dummy moves in place.
+        moves = blend_log[-1] if converged else blend_log[-1][1:-1]
+        assert (converged, moves) == (
+            legacy[0],
+            legacy[1][-1],
+        ), "MoveArrays planned different moves"
+        print(
+            f"{segments:>10} {len(moves):>8} {len(blend_log):>11} "
+            f"{legacy_time:>11.4f} {arrays_time:>11.4f} "
+            f"{legacy_time / arrays_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""Measure the dead time between move groups on a simulated bus.
+
+A simulated driver stands in for the motor nodes: it takes a fixed time to put
+each frame on the bus, acknowledges the requests that are sent with
+ensure_send, and completes each move segment of an executed move group after
+the segment's duration. The same multi-group move is run once by sending every
+group before executing any of them, with prep() and execute(), and once with
+run(), which sends each group while the group before it executes.
+
+For each, this reports how long it took for the first group to start moving,
+how long the whole move took, and the mean gap between groups: the time from
+the last completion of one group to the execute request for the next one
+reaching the nodes.
+
+Run with `python -m opentrons_hardware.scripts.benchmark_move_group_upload`.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Dict, List, Tuple
+
+from numpy import float64
+
+from opentrons_hardware.drivers.can_bus.abstract_driver import AbstractCanDriver
+from opentrons_hardware.drivers.can_bus.can_messenger import CanMessenger
+from opentrons_hardware.firmware_bindings.arbitration_id import (
+    ArbitrationId,
+    ArbitrationIdParts,
+)
+from opentrons_hardware.firmware_bindings.constants import (
+    FunctionCode,
+    MessageId,
+    MoveAckId,
+    NodeId,
+)
+from opentrons_hardware.firmware_bindings.message import CanMessage
+from opentrons_hardware.firmware_bindings.messages.messages import get_definition
+from opentrons_hardware.firmware_bindings.messages.payloads import (
+    AddToMoveGroupRequestPayload,
+    EmptyPayload,
+    MoveCompletedPayload,
+    MoveGroupRequestPayload,
+)
+from opentrons_hardware.firmware_bindings.messages.fields import (
+    MotorPositionFlagsField,
+)
+from opentrons_hardware.firmware_bindings.utils import (
+    Int32Field,
+    UInt8Field,
+    UInt32Field,
+)
+from opentrons_hardware.hardware_control.constants import interrupts_per_sec
+from opentrons_hardware.hardware_control.motion import (
+    MoveGroups,
+    MoveGroupSingleAxisStep,
+)
+from opentrons_hardware.hardware_control.move_group_runner import MoveGroupRunner
+
+_NODES = [NodeId.gantry_x, NodeId.gantry_y, NodeId.head_l]
+_ACKNOWLEDGED = {
+    MessageId.clear_all_move_groups_request,
+    MessageId.execute_move_group_request,
+}
+
+
+class SimulatedMotionDriver(AbstractCanDriver):
+    """A driver that acts like motor nodes that run the moves they are sent."""
+
+    def __init__(self, nodes: List[NodeId], frame_seconds: float) -> None:
+        """Constructor."""
+        self._nodes = nodes
+        self._frame_seconds = frame_seconds
+        self._incoming: asyncio.Queue[CanMessage] = asyncio.Queue()
+        # Each group's move segments, by sequence id, as (node, duration).
+        self._groups: Dict[int, Dict[int, List[Tuple[NodeId, float]]]] = {}
+        self._tasks: List[asyncio.Task[None]] = []
+        self.completed_at: Dict[int, float] = {}
+        self.executed_at: Dict[int, float] = {}
+
+    async def send(self, message: CanMessage) -> None:
+        """Put a message on the bus, and act on it."""
+        await asyncio.sleep(self._frame_seconds)
+        message_id = MessageId(message.arbitration_id.parts.message_id)
+        definition = get_definition(message_id)
+        assert definition, f"Unknown message {message_id}"
+        payload = definition.payload_type.build(message.data)
+        assert isinstance(payload, EmptyPayload)
+        if isinstance(payload, AddToMoveGroupRequestPayload):
+            segments = self._groups.setdefault(payload.group_id.value, {})
+            segments.setdefault(payload.seq_id.value, []).append(
+                (
+                    NodeId(message.arbitration_id.parts.node_id),
+                    payload.duration.value / interrupts_per_sec,
+                )
+            )
+        elif message_id == MessageId.clear_all_move_groups_request:
+            self._groups.clear()
+        elif message_id == MessageId.execute_move_group_request:
+            assert isinstance(payload, MoveGroupRequestPayload)
+            group_id = payload.group_id.value
+            self.executed_at[group_id] = time.perf_counter()
+            segments = self._groups.pop(group_id, {})
+            self._tasks.append(asyncio.create_task(self._execute(group_id, segments)))
+        if message_id in _ACKNOWLEDGED:
+            for node in self._nodes:
+                ack = EmptyPayload()
+                ack.message_index = payload.message_index
+                self._reply(node, MessageId.acknowledgement, ack.serialize())
+
+    async def _execute(
+        self, group_id: int, segments: Dict[int, List[Tuple[NodeId, float]]]
+    ) -> None:
+        for seq_id in sorted(segments):
+            await asyncio.sleep(max(duration for _, duration in segments[seq_id]))
+            for node, _ in segments[seq_id]:
+                completion = MoveCompletedPayload(
+                    group_id=UInt8Field(group_id),
+                    seq_id=UInt8Field(seq_id),
+                    current_position_um=UInt32Field(0),
+                    encoder_position_um=Int32Field(0),
+                    position_flags=MotorPositionFlagsField(0),
+                    ack_id=UInt8Field(MoveAckId.complete_without_condition.value),
+                )
+                completion.message_index = UInt32Field(0)
+                self._reply(node, MessageId.move_completed, completion.serialize())
+        self.completed_at[group_id] = time.perf_counter()
+
+    def _reply(self, node: NodeId, message_id: MessageId, data: bytes) -> None:
+        self._incoming.put_nowait(
+            CanMessage(
+                arbitration_id=ArbitrationId(
+                    parts=ArbitrationIdParts(
+                        message_id=message_id,
+                        node_id=NodeId.host,
+                        function_code=FunctionCode.network_management,
+                        originating_node_id=node,
+                    )
+                ),
+                data=data,
+            )
+        )
+
+    async def read(self) -> CanMessage:
+        """Read the next reply from the nodes."""
+        return await self._incoming.get()
+
+    def shutdown(self) -> None:
+        """Stop any moves that are still running."""
+        for task in self._tasks:
+            task.cancel()
+
+    def gaps(self) -> List[float]:
+        """Get the time between each group completing and the next executing."""
+        return [
+            self.executed_at[group_id + 1] - completed_at
+            for group_id, completed_at in self.completed_at.items()
+            if group_id + 1 in self.executed_at
+        ]
+
+
+def _move_groups(groups: int, segments: int, segment_seconds: float) -> MoveGroups:
+    """Build move groups where every node moves in every segment of every group."""
+    return [
+        [
+            {
+                node: MoveGroupSingleAxisStep(
+                    distance_mm=float64(segment_seconds * 10),
+                    velocity_mm_sec=float64(10),
+                    duration_sec=float64(segment_seconds),
+                    acceleration_mm_sec_sq=float64(0),
+                )
+                for node in _NODES
+            }
+            for _ in range(segments)
+        ]
+        for _ in range(groups)
+    ]
+
+
+async def _measure(
+    move_groups: MoveGroups, frame_seconds: float, pipelined: bool
+) -> Tuple[float, float, float]:
+    driver = SimulatedMotionDriver(_NODES, frame_seconds)
+    runner = MoveGroupRunner(move_groups)
+    async with CanMessenger(driver) as messenger:
+        start = time.perf_counter()
+        if pipelined:
+            await runner.run(messenger)
+        else:
+            await runner.prep(messenger)
+            await runner.execute(messenger)
+        elapsed = time.perf_counter() - start
+    driver.shutdown()
+    gaps = driver.gaps()
+    return (
+        driver.executed_at[0] - start,
+        elapsed,
+        statistics.mean(gaps) if gaps else 0.0,
+    )
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--groups", type=int, default=10, help="Move groups to run.")
+    parser.add_argument(
+        "--segments", type=int, default=3, help="Move segments in each group."
+    )
+    parser.add_argument(
+        "--segment-ms", type=float, default=20.0, help="Duration of each segment."
+    )
+    parser.add_argument(
+        "--frame-ms",
+        type=float,
+        nargs="+",
+        default=[0.1, 0.5, 1.0],
+        help="Time to send each frame.",
+    )
+    args = parser.parse_args()
+
+    move_groups = _move_groups(args.groups, args.segments, args.segment_ms / 1000)
+    moving = args.groups * args.segments * args.segment_ms / 1000
+    print(f"{args.groups} groups, {moving:.3f} s of motion")
+    print(
+        f"{'':>10} {'prep + execute':>30} {'run':>30}\n"
+        f"{'frame (ms)':>10}"
+        + f" {'start (ms)':>10} {'total (s)':>9} {'gap (ms)':>9}" * 2
+    )
+    for frame_ms in args.frame_ms:
+        row = f"{frame_ms:>10.2f}"
+        for pipelined in (False, True):
+            start, elapsed, gap = asyncio.run(
+                _measure(move_groups, frame_ms / 1000, pipelined)
+            )
+            row += f" {start * 1000:>10.2f} {elapsed:>9.3f} {gap * 1000:>9.2f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
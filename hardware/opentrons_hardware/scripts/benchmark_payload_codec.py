@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Measure how many CAN payloads per second can be decoded and encoded.
+
+This compares the compiled per-class codecs used by `BinarySerializable.build()`
+and `BinarySerializable.serialize()` against the previous approach of working out
+the format string and walking the dataclass fields for every frame.
+
+Run with `python -m opentrons_hardware.scripts.benchmark_payload_codec`.
+"""
+import argparse
+import struct
+import time
+from dataclasses import astuple, fields
+from typing import Callable, List, Tuple, Type
+
+from opentrons_hardware.firmware_bindings import utils
+from opentrons_hardware.firmware_bindings.messages import payloads
+
+
+def _legacy_build(
+    cls: Type[utils.BinarySerializable], data: bytes
+) -> utils.BinarySerializable:
+    format_string = f"{cls.ENDIAN}{''.join(v.type.FORMAT for v in fields(cls))}"
+    size = struct.calcsize(format_string)
+    b = struct.unpack(format_string, data[:size])
+    args = {
+        v.name: v.type.build(b[i])
+        for i, v in enumerate(fields(cls))
+        if not (v.name == "message_index")
+    }
+    message_index = next(
+        (
+            v.type.build(b[i])
+            for i, v in enumerate(fields(cls))
+            if v.name == "message_index"
+        ),
+        None,
+    )
+    ret_instance = cls(**args)
+    if message_index is not None:
+        ret_instance.message_index = message_index  # type: ignore[attr-defined]
+    return ret_instance
+
+
+def _legacy_serialize(obj: utils.BinarySerializable) -> bytes:
+    cls = type(obj)
+    format_string = f"{cls.ENDIAN}{''.join(v.type.FORMAT for v in fields(cls))}"
+    return struct.pack(format_string, *(x.value for x in astuple(obj)))
+
+
+def _frames_per_second(func: Callable[[], object], frames: int) -> float:
+    start = time.perf_counter()
+    for _ in range(frames):
+        func()
+    return frames / (time.perf_counter() - start)
+
+
+def _sample_payloads() -> List[utils.BinarySerializable]:
+    sensor = payloads.ReadFromSensorResponsePayload.build(bytes(64))
+    move = payloads.MoveCompletedPayload.build(bytes(64))
+    return [sensor, move]
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--frames",
+        type=int,
+        default=200000,
+        help="Number of frames to decode and encode per measurement.",
+    )
+    args = parser.parse_args()
+
+    print(f"{'payload':>32} {'op':>10} {'legacy (f/s)':>14} {'codec (f/s)':>14}")
+    for payload in _sample_payloads():
+        cls = type(payload)
+        data = payload.serialize()
+        rows: List[Tuple[str, Callable[[], object], Callable[[], object]]] = [
+            (
+                "decode",
+                lambda: _legacy_build(cls, data),
+                lambda: cls.build(data),
+            ),
+            (
+                "encode",
+                lambda: _legacy_serialize(payload),
+                payload.serialize,
+            ),
+        ]
+        for op, legacy, codec in rows:
+            assert legacy() == codec()
+            legacy_rate = _frames_per_second(legacy, args.frames)
+            codec_rate = _frames_per_second(codec, args.frames)
+            print(
+                f"{cls.__name__:>32} {op:>10} {legacy_rate:>14.0f} {codec_rate:>14.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,408 @@
+"""Columnar ingestion and batch analysis of CAN motion logs.
+
+This reads the same logs as can_log_motion_analyzer, but instead of building
+a record object for each message, it decodes the messages it cares about into
+NumPy columns, one table per kind of message. Analyses then run over whole
+columns at once.
+
+Ingesting a log is still a pass over every line, so the tables are cached next
+to the log in a .npz file, and later runs over the same log load that instead.
+"""
+import io
+import os
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from opentrons_hardware.firmware_bindings.constants import NodeId
+from opentrons_hardware.hardware_control.constants import interrupts_per_sec
+from opentrons_hardware.scripts.can_log_motion_analyzer import (
+    _ARB_RE,
+    _ERROR_RE,
+    _EXECUTE_RE,
+    _MOVE_COMPLETE_RE,
+    _MOVE_RE,
+)
+
+# Bump this when the tables change, so old caches are rebuilt.
+_CACHE_VERSION = 1
+_CACHE_SUFFIX = ".motion.npz"
+
+Column = npt.NDArray[Any]
+Table = Dict[str, Column]
+
+# The column holding the node each kind of message is about.
+_NODE_COLUMN = {
+    "completions": "sender",
+    "errors": "sender",
+    "moves": "dest",
+    "executes": "dest",
+}
+
+
+@dataclass
+class MotionLog:
+    """The motion messages in a CAN log, as one table of columns per message kind.
+
+    Every table has `time` (seconds), `sender` and `dest` (node ids), and
+    `index` (message index) columns, sorted by time.
+
+    - completions: `seq_id`, `motor_pos` and `encoder_pos` (mm)
+    - moves: `seq_id`, `duration` (s), `velocity` (mm/s), `acceleration`
+      (mm/s^2), `velocity_encoded` and `acceleration_encoded`
+    - executes: nothing else
+    - errors: `error_type`
+    """
+
+    completions: Table
+    moves: Table
+    executes: Table
+    errors: Table
+
+    def tables(self) -> Dict[str, Table]:
+        """Get the tables by name."""
+        return {
+            "completions": self.completions,
+            "moves": self.moves,
+            "executes": self.executes,
+            "errors": self.errors,
+        }
+
+    def select(
+        self,
+        name: str,
+        nodes: Optional[Set[NodeId]] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Table:
+        """Get the rows of a table that are about some nodes, between two dates."""
+        table = self.tables()[name]
+        # Like date_limited, keep the records at exactly since or until.
+        start = np.searchsorted(table["time"], since.timestamp()) if since else None
+        stop = (
+            np.searchsorted(table["time"], until.timestamp(), side="right")
+            if until
+            else None
+        )
+        rows = {column: values[start:stop] for column, values in table.items()}
+        if nodes is None:
+            return rows
+        node_ids = [node.value for node in nodes]
+        if name == "executes":
+            node_ids.append(NodeId.broadcast.value)
+        mask = np.isin(rows[_NODE_COLUMN[name]], node_ids)
+        return {column: values[mask] for column, values in rows.items()}
+
+
+class _TableBuilder:
+    """Collects rows of text fields from a log, and converts them all at once."""
+
+    def __init__(self, pattern: "re.Pattern[str]", columns: Dict[str, str]) -> None:
+        self._pattern = pattern
+        self._columns = {"time": "f8", "sender": "u1", "dest": "u1"}
+        self._columns.update(columns)
+        self._fields = tuple(columns)
+        self._rows: List[Tuple[object, ...]] = []
+
+    def add(self, time: float, sender: int, dest: int, line: str) -> None:
+        data = self._pattern.search(line)
+        assert data, f"Could not parse {self._pattern.pattern} from {line}"
+        # group() with one name returns a string, not a tuple.
+        fields = (
+            data.group(*self._fields)
+            if len(self._fields) > 1
+            else (data[self._fields[0]],)
+        )
+        self._rows.append((time, sender, dest) + fields)
+
+    def build(self) -> Table:
+        values = zip(*self._rows) if self._rows else ([] for _ in self._columns)
+        table = {
+            name: np.array(column).astype(dtype)
+            for (name, dtype), column in zip(self._columns.items(), values)
+        }
+        order = np.argsort(table["time"], kind="stable")
+        return {name: column[order] for name, column in table.items()}
+
+
+class _Ingester:
+    """Decodes log lines into tables."""
+
+    def __init__(self) -> None:
+        self._builders = {
+            (False, "MoveCompletedPayload"): _TableBuilder(
+                _MOVE_COMPLETE_RE,
+                {
+                    "index": "u4",
+                    "seq_id": "u1",
+                    "current_position": "f8",
+                    "encoder_position": "f8",
+                },
+            ),
+            (False, "ErrorMessagePayload"): _TableBuilder(
+                _ERROR_RE, {"index": "u4", "error": "U64"}
+            ),
+            (True, "AddLinearMoveRequestPayload"): _TableBuilder(
+                _MOVE_RE,
+                {
+                    "index": "u4",
+                    "seq_id": "u1",
+                    "duration": "i8",
+                    "velocity": "i8",
+                    "acceleration": "i8",
+                    "acceleration_unit": "U3",
+                },
+            ),
+            (True, "ExecuteMoveGroupRequestPayload"): _TableBuilder(
+                _EXECUTE_RE, {"index": "u4"}
+            ),
+        }
+        self._nodes = {node.name: node.value for node in NodeId}
+        self._seconds: Dict[str, float] = {}
+
+    def _timestamp(self, dirline: str) -> float:
+        """Get the time of a direction line, as seconds since the epoch.
+
+        Parsing a date is slow, and many messages share the same second.
+        """
+        second, _, rest = dirline.partition(".")
+        if not rest:
+            second = " ".join(dirline.split(" ")[:3])
+        whole = self._seconds.get(second)
+        if whole is None:
+            whole = datetime.strptime(second + "+0000", "%b %d %H:%M:%S%z").timestamp()
+            self._seconds[second] = whole
+        if not rest:
+            return whole
+        return whole + float("0." + rest.split(" ", 1)[0])
+
+    def ingest(self, logfile: io.TextIOBase) -> MotionLog:
+        lines = iter(logfile)
+        for dirline in lines:
+            if "Sending -->" in dirline:
+                sending = True
+            elif "Received <--" in dirline:
+                sending = False
+            else:
+                continue
+            arbline = next(lines, "")
+            payline = next(lines, "")
+            # "\tpayload: MoveCompletedPayload(message_index=..."
+            payload = payline.partition("(")[0].rpartition(" ")[2]
+            builder = self._builders.get((sending, payload))
+            if not builder:
+                continue
+            arb = _ARB_RE.search(arbline)
+            assert arb, f"Could not find arbitration details in {arbline}"
+            builder.add(
+                self._timestamp(dirline),
+                self._nodes[arb["originating_node_id"]],
+                self._nodes[arb["node_id"]],
+                payline,
+            )
+        return self._tables()
+
+    def _tables(self) -> MotionLog:
+        """Build the tables, with the same conversions as the log records."""
+        completions = self._builders[(False, "MoveCompletedPayload")].build()
+        completions["motor_pos"] = completions.pop("current_position") / 1000
+        completions["encoder_pos"] = completions.pop("encoder_position") / 1000
+
+        errors = self._builders[(False, "ErrorMessagePayload")].build()
+        errors["error_type"] = errors.pop("error")
+
+        moves = self._builders[(True, "AddLinearMoveRequestPayload")].build()
+        acceleration_unit = np.where(moves.pop("acceleration_unit") == "_um", 1000, 1)
+        moves["velocity_encoded"] = moves.pop("velocity")
+        moves["acceleration_encoded"] = moves.pop("acceleration")
+        moves["duration"] = moves["duration"] / interrupts_per_sec
+        moves["velocity"] = moves["velocity_encoded"] / (2**31) * interrupts_per_sec
+        moves["acceleration"] = (
+            moves["acceleration_encoded"]
+            / (2**31)
+            * interrupts_per_sec
+            * interrupts_per_sec
+            / acceleration_unit
+        )
+
+        return MotionLog(
+            completions=completions,
+            moves=moves,
+            executes=self._builders[(True, "ExecuteMoveGroupRequestPayload")].build(),
+            errors=errors,
+        )
+
+
+def ingest(logfile: io.TextIOBase) -> MotionLog:
+    """Decode the motion messages in a log into tables."""
+    return _Ingester().ingest(logfile)
+
+
+def cache_path(log_path: Path) -> Path:
+    """Get where the tables for a log are cached."""
+    return log_path.with_name(log_path.name + _CACHE_SUFFIX)
+
+
+def _source_key(log_path: Path) -> Column:
+    stat = os.stat(log_path)
+    return np.array([_CACHE_VERSION, stat.st_size, stat.st_mtime_ns], dtype="i8")
+
+
+def _load_cache(log_path: Path) -> Optional[MotionLog]:
+    try:
+        with np.load(cache_path(log_path), allow_pickle=False) as cache:
+            if not np.array_equal(cache["source"], _source_key(log_path)):
+                return None
+            tables: Dict[str, Table] = {name: {} for name in _NODE_COLUMN}
+            for key in cache.files:
+                if key != "source":
+                    name, _, column = key.partition(".")
+                    tables[name][column] = cache[key]
+    except (OSError, KeyError, ValueError):
+        return None
+    return MotionLog(**tables)
+
+
+def _save_cache(log_path: Path, log: MotionLog) -> None:
+    columns = {
+        f"{name}.{column}": values
+        for name, table in log.tables().items()
+        for column, values in table.items()
+    }
+    try:
+        # np.savez adds .npz if the name doesn't already end with it.
+        np.savez(cache_path(log_path), source=_source_key(log_path), **columns)
+    except OSError as e:
+        print(f"Could not cache tables for {log_path}: {e}")
+
+
+def load(log_path: Path, use_cache: bool = True) -> MotionLog:
+    """Get the tables for a log file, from its cache if it's up to date."""
+    if use_cache:
+        cached = _load_cache(log_path)
+        if cached is not None:
+            return cached
+    with open(log_path, "r") as logfile:
+        log = ingest(logfile)
+    if use_cache:
+        _save_cache(log_path, log)
+    return log
+
+
+@dataclass
+class NodeSummary:
+    """Motion statistics for one node."""
+
+    node: NodeId
+    completions: int
+    max_position_error_mm: float
+    mean_position_error_mm: float
+    max_velocity_mm_s: float
+    moves: int
+    commanded_seconds: float
+    commanded_distance_mm: float
+    errors: int
+    errors_per_minute: float
+    error_types: Dict[str, int]
+
+    def format(self) -> str:
+        """Format for printing."""
+        types = ", ".join(f"{name}={count}" for name, count in self.error_types.items())
+        return (
+            f"{self.node.name}: completions={self.completions}, "
+            f"position error max={self.max_position_error_mm:.3f}mm "
+            f"mean={self.mean_position_error_mm:.3f}mm, "
+            f"max velocity={self.max_velocity_mm_s:.1f}mm/s, "
+            f"moves={self.moves}, commanded {self.commanded_distance_mm:.1f}mm "
+            f"in {self.commanded_seconds:.1f}s, errors={self.errors} "
+            f"({self.errors_per_minute:.2f}/min){': ' + types if types else ''}"
+        )
+
+
+def _per_node(nodes: Column, values: Column, size: int) -> Column:
+    return np.bincount(nodes, weights=values, minlength=size)
+
+
+def _max_per_node(nodes: Column, values: Column, size: int) -> Column:
+    result = np.zeros(size)
+    np.maximum.at(result, nodes, values)
+    return result
+
+
+def _max_velocity_per_node(completions: Table, size: int) -> Column:
+    """Get the fastest encoder speed between consecutive completions of each node."""
+    order = np.lexsort((completions["time"], completions["sender"]))
+    sender = completions["sender"][order]
+    time = completions["time"][order]
+    position = completions["encoder_pos"][order]
+    dt = np.diff(time)
+    valid = (sender[1:] == sender[:-1]) & (dt > 0)
+    velocity = np.abs(np.diff(position)[valid] / dt[valid])
+    return _max_per_node(sender[1:][valid], velocity, size)
+
+
+def summarize(
+    log: MotionLog,
+    nodes: Set[NodeId],
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> List[NodeSummary]:
+    """Summarize the motion of each node."""
+    size = max(node.value for node in NodeId) + 1
+    completions = log.select("completions", nodes, since, until)
+    moves = log.select("moves", nodes, since, until)
+    errors = log.select("errors", nodes, since, until)
+
+    senders = completions["sender"]
+    completion_counts = np.bincount(senders, minlength=size)
+    position_error = np.abs(completions["motor_pos"] - completions["encoder_pos"])
+    max_error = _max_per_node(senders, position_error, size)
+    total_error = _per_node(senders, position_error, size)
+    max_velocity = _max_velocity_per_node(completions, size)
+
+    dests = moves["dest"]
+    duration = moves["duration"]
+    distance = np.abs(
+        duration * moves["velocity"] + 0.5 * moves["acceleration"] * duration**2
+    )
+    move_counts = np.bincount(dests, minlength=size)
+    commanded_seconds = _per_node(dests, duration, size)
+    commanded_distance = _per_node(dests, distance, size)
+
+    error_counts = np.bincount(errors["sender"], minlength=size)
+    times = np.concatenate([completions["time"], moves["time"], errors["time"]])
+    minutes = (times.max() - times.min()) / 60 if len(times) > 1 else 0.0
+
+    summaries = []
+    for node in sorted(nodes, key=lambda n: n.value):
+        n = node.value
+        if not (completion_counts[n] or move_counts[n] or error_counts[n]):
+            continue
+        types, counts = np.unique(
+            errors["error_type"][errors["sender"] == n], return_counts=True
+        )
+        summaries.append(
+            NodeSummary(
+                node=node,
+                completions=int(completion_counts[n]),
+                max_position_error_mm=float(max_error[n]),
+                mean_position_error_mm=float(
+                    total_error[n] / completion_counts[n] if completion_counts[n] else 0
+                ),
+                max_velocity_mm_s=float(max_velocity[n]),
+                moves=int(move_counts[n]),
+                commanded_seconds=float(commanded_seconds[n]),
+                commanded_distance_mm=float(commanded_distance[n]),
+                errors=int(error_counts[n]),
+                errors_per_minute=float(error_counts[n] / minutes if minutes else 0),
+                error_types={
+                    str(name): int(count) for name, count in zip(types, counts)
+                },
+            )
+        )
+    return summaries
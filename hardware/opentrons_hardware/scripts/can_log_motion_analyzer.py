@@ -20,6 +20,7 @@ from typing import (
 )
 from typing_extensions import Literal
 from itertools import chain, tee
+from pathlib import Path
 
 from opentrons_hardware.firmware_bindings.constants import NodeId
 from opentrons_hardware.hardware_control.constants import interrupts_per_sec
@@ -468,12 +469,15 @@ def position_log(records: Iterator[MoveComplete]) -> Iterator[PositionLogEntry]:
         )
 
 
-Operation = Literal["print-positions", "print-errors", "plot-positions", "print-motion"]
+Operation = Literal[
+    "print-positions", "print-errors", "plot-positions", "print-motion", "summarize"
+]
 OPERATIONS: List[Operation] = [
     "print-positions",
     "print-motion",
     "print-errors",
     "plot-positions",
+    "summarize",
 ]
 
 
@@ -537,8 +541,12 @@ def main(
     since: Optional[datetime],
     until: Optional[datetime],
     annotate_errors: bool,
+    use_cache: bool = True,
 ) -> None:
     """Main function."""
+    if operation == "summarize":
+        _summarize(logfile, nodes, since, until, use_cache)
+        return
     records_to_check = date_limited(records(logfile), since, until)
     if operation == "print-positions":
         _print_positions(records_to_check, nodes, annotate_errors)
@@ -741,6 +749,25 @@ def _verify_nodes(nodes: Optional[List[str]]) -> Iterator[NodeId]:
         yield node_element
 
 
+def _summarize(
+    logfile: io.TextIOBase,
+    nodes: Set[NodeId],
+    since: Optional[datetime],
+    until: Optional[datetime],
+    use_cache: bool,
+) -> None:
+    # Imported here because can_log_columns uses the parsers in this module.
+    from opentrons_hardware.scripts import can_log_columns
+
+    log_path = Path(getattr(logfile, "name", ""))
+    if log_path.is_file():
+        log = can_log_columns.load(log_path, use_cache)
+    else:
+        log = can_log_columns.ingest(logfile)
+    for summary in can_log_columns.summarize(log, nodes, since, until):
+        print(summary.format())
+
+
 def _date_from_spec(userstr: str) -> Optional[datetime]:
     if not userstr:
         return None
@@ -787,6 +814,11 @@ if __name__ == "__main__":
         action="store_true",
         help="Print out big error messages in log processing",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="For summarize, parse the whole log instead of using or writing a cache",
+    )
     args = parser.parse_args()
     nodes = set(_verify_nodes(args.node))
     main(
@@ -796,4 +828,5 @@ if __name__ == "__main__":
         _date_from_spec(args.since),
         _date_from_spec(args.until),
         args.annotate_errors,
+        not args.no_cache,
     )
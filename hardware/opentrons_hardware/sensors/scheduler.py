@@ -18,6 +18,7 @@ from opentrons_hardware.firmware_bindings.constants import (
 from opentrons_hardware.firmware_bindings.arbitration_id import ArbitrationId
 
 from opentrons_hardware.drivers.can_bus.can_messenger import (
+    ArbitrationIdFilter,
     CanMessenger,
     WaitableCallback,
     MultipleMessagesWaitableCallback,
@@ -31,6 +32,7 @@ from opentrons_hardware.firmware_bindings.messages.message_definitions import (
     BaselineSensorRequest,
     SensorThresholdResponse,
     ReadFromSensorResponse,
+    BatchReadFromSensorResponse,
     BaselineSensorResponse,
     PeripheralStatusResponse,
     BindSensorOutputRequest,
@@ -53,6 +55,7 @@ from opentrons_hardware.firmware_bindings.messages.fields import (
 )
 from opentrons_hardware.sensors.types import SensorDataType
 from opentrons_hardware.sensors.sensor_types import SensorInformation
+from opentrons_hardware.sensors.sensor_buffer import SensorRingBuffer
 
 from opentrons_hardware.sensors.utils import (
     ReadSensorInformation,
@@ -69,6 +72,9 @@ from opentrons_hardware.firmware_bindings.utils import (
 log = logging.getLogger(__name__)
 ResponseType = TypeVar("ResponseType", bound=MessageDefinition)
 
+# Enough for a minute of samples at 1 kHz.
+DEFAULT_STREAM_CAPACITY = 60000
+
 
 def _format_sensor_response(response: MessageDefinition) -> SensorDataType:
     if isinstance(response, BaselineSensorResponse):
@@ -88,23 +94,14 @@ class SensorScheduler:
     @staticmethod
     def _create_filter(
         node_id: Optional[NodeId] = None, message_id: Optional[MessageId] = None
-    ) -> Optional[Callable[[ArbitrationId], bool]]:
+    ) -> Optional[ArbitrationIdFilter]:
         """Create listener filter by NodeId and MessageId."""
         if not node_id and not message_id:
             return None
-
-        def _filter(arbitration_id: ArbitrationId) -> bool:
-            return (
-                NodeId(arbitration_id.parts.originating_node_id) == node_id
-                if node_id
-                else True
-            ) and (
-                MessageId(arbitration_id.parts.message_id) == message_id
-                if message_id
-                else True
-            )
-
-        return _filter
+        return ArbitrationIdFilter(
+            message_ids=[message_id] if message_id else None,
+            originating_node_ids=[node_id] if node_id else None,
+        )
 
     async def run_baseline(
         self,
@@ -439,6 +436,29 @@ class SensorScheduler:
                     f"received error {str(error)} trying to write unbind sensor output on {str(target_sensor.node_id)}"
                 )
 
+    @staticmethod
+    async def _bind_output(
+        target_sensor: SensorInformation,
+        can_messenger: CanMessenger,
+        binding: SensorOutputBinding,
+    ) -> None:
+        error = await can_messenger.ensure_send(
+            node_id=target_sensor.node_id,
+            message=BindSensorOutputRequest(
+                payload=BindSensorOutputRequestPayload(
+                    sensor=SensorTypeField(target_sensor.sensor_type),
+                    sensor_id=SensorIdField(target_sensor.sensor_id),
+                    binding=SensorOutputBindingField(binding.value),
+                )
+            ),
+            expected_nodes=[target_sensor.node_id],
+        )
+        if error != ErrorCode.ok:
+            action = "unbind" if binding == SensorOutputBinding.none else "bind"
+            log.error(
+                f"received error {str(error)} trying to {action} sensor output on {str(target_sensor.node_id)}"
+            )
+
     @asynccontextmanager
     async def capture_output(
         self,
@@ -459,54 +479,72 @@ class SensorScheduler:
             if isinstance(message, ErrorMessage):
                 log.error(f"Received error message {str(message)}")
 
-        def _filter(arbitration_id: ArbitrationId) -> bool:
-            return (
-                NodeId(arbitration_id.parts.originating_node_id)
-                == target_sensor.node_id
-            ) and (
-                MessageId(arbitration_id.parts.message_id)
-                == MessageId.read_sensor_response
-                or MessageId(arbitration_id.parts.message_id) == MessageId.error_message
-            )
+        _filter = ArbitrationIdFilter(
+            message_ids=[MessageId.read_sensor_response, MessageId.error_message],
+            originating_node_ids=[target_sensor.node_id],
+        )
 
         can_messenger.add_listener(_logging_listener, _filter)
-        error = await can_messenger.ensure_send(
-            node_id=target_sensor.node_id,
-            message=BindSensorOutputRequest(
-                payload=BindSensorOutputRequestPayload(
-                    sensor=SensorTypeField(target_sensor.sensor_type),
-                    sensor_id=SensorIdField(target_sensor.sensor_id),
-                    binding=SensorOutputBindingField(SensorOutputBinding.report.value),
-                )
-            ),
-            expected_nodes=[target_sensor.node_id],
+        await self._bind_output(
+            target_sensor, can_messenger, SensorOutputBinding.report
         )
-        if error != ErrorCode.ok:
-            log.error(
-                f"received error {str(error)} trying to bind sensor output on {str(target_sensor.node_id)}"
-            )
-
         try:
             yield response_queue
         finally:
             can_messenger.remove_listener(_logging_listener)
-            error = await can_messenger.ensure_send(
-                node_id=target_sensor.node_id,
-                message=BindSensorOutputRequest(
-                    payload=BindSensorOutputRequestPayload(
-                        sensor=SensorTypeField(target_sensor.sensor_type),
-                        sensor_id=SensorIdField(target_sensor.sensor_id),
-                        binding=SensorOutputBindingField(
-                            SensorOutputBinding.none.value
-                        ),
-                    )
-                ),
-                expected_nodes=[target_sensor.node_id],
+            await self._bind_output(
+                target_sensor, can_messenger, SensorOutputBinding.none
             )
-            if error != ErrorCode.ok:
-                log.error(
-                    f"received error {str(error)} trying to write unbind sensor output on {str(target_sensor.node_id)}"
+
+    @asynccontextmanager
+    async def stream_output(
+        self,
+        target_sensor: SensorInformation,
+        can_messenger: CanMessenger,
+        capacity: int = DEFAULT_STREAM_CAPACITY,
+    ) -> AsyncIterator[SensorRingBuffer]:
+        """While acquired, stream the sensor's logging output into a ring buffer.
+
+        Unlike capture_output, this doesn't convert or queue each sample. The
+        raw samples are stored as they arrive, and the buffer can be read at
+        any time, during or after the capture. If more than `capacity` samples
+        arrive, the oldest ones are overwritten, and counted in the buffer's
+        metrics as dropped.
+        """
+        buffer = SensorRingBuffer(capacity)
+
+        def _stream_listener(message: MessageDefinition, arb_id: ArbitrationId) -> None:
+            if isinstance(message, ReadFromSensorResponse):
+                buffer.append(message.payload.sensor_data.value)
+            elif isinstance(message, BatchReadFromSensorResponse):
+                buffer.extend_from_bytes(
+                    message.payload.sensor_data.value,
+                    message.payload.data_length.value,
                 )
+            elif isinstance(message, ErrorMessage):
+                log.error(f"Received error message {str(message)}")
+
+        _filter = ArbitrationIdFilter(
+            message_ids=[
+                MessageId.read_sensor_response,
+                MessageId.batch_read_sensor_response,
+                MessageId.error_message,
+            ],
+            originating_node_ids=[target_sensor.node_id],
+        )
+
+        can_messenger.add_listener(_stream_listener, _filter)
+        await self._bind_output(
+            target_sensor, can_messenger, SensorOutputBinding.report
+        )
+        try:
+            yield buffer
+        finally:
+            can_messenger.remove_listener(_stream_listener)
+            await self._bind_output(
+                target_sensor, can_messenger, SensorOutputBinding.none
+            )
+            log.debug(f"Streamed {target_sensor}: {buffer.metrics}")
 
     @asynccontextmanager
     async def monitor_exceed_max_threshold(
@@ -537,14 +575,10 @@ class SensorScheduler:
                     )
                 )
 
-        def _filter(arbitration_id: ArbitrationId) -> bool:
-            node_id_match = any(
-                NodeId(arbitration_id.parts.originating_node_id) == s.node_id
-                for s in target_sensors
-            )
-            return (node_id_match) and (
-                MessageId(arbitration_id.parts.message_id) == MessageId.error_message
-            )
+        _filter = ArbitrationIdFilter(
+            message_ids=[MessageId.error_message],
+            originating_node_ids=[s.node_id for s in target_sensors],
+        )
 
         for sensor in target_sensors:
             error = await can_messenger.ensure_send(
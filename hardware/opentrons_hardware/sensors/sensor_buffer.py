@@ -0,0 +1,151 @@
+"""Preallocated storage for streamed sensor samples."""
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+import numpy.typing as npt
+
+from opentrons_hardware.sensors.types import sensor_fixed_point_conversion
+
+# Sensor data is sent over CAN as little-endian, signed fixed point values.
+SAMPLE_DTYPE = np.dtype("<i4")
+
+
+@dataclass(frozen=True)
+class SensorStreamMetrics:
+    """How a sensor stream has gone so far."""
+
+    #: Samples received, including any that were dropped.
+    samples: int
+    #: Samples that were overwritten before they were read.
+    dropped: int
+    #: Seconds from the first sample to the last one.
+    elapsed_seconds: float
+
+    @property
+    def sample_rate(self) -> float:
+        """Samples received per second."""
+        if self.samples < 2 or self.elapsed_seconds <= 0:
+            return 0.0
+        return (self.samples - 1) / self.elapsed_seconds
+
+
+class SensorRingBuffer:
+    """A fixed-size buffer of the most recent raw samples from one sensor.
+
+    Samples are stored as they arrive over CAN, without converting them, in
+    memory that is allocated once. Every sample is written twice, half the
+    buffer apart, so the most recent samples are always contiguous and can be
+    read as a view without copying. Once the buffer is full, each new sample
+    overwrites the oldest one, and counts as dropped.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """Allocate a buffer for `capacity` samples."""
+        if capacity < 1:
+            raise ValueError("A sensor buffer must hold at least one sample.")
+        self._capacity = capacity
+        self._data: npt.NDArray[np.int32] = np.zeros(2 * capacity, dtype=SAMPLE_DTYPE)
+        # Where the next sample goes, in the first half of the buffer.
+        self._head = 0
+        self._count = 0
+        self._samples = 0
+        self._first_sample_at: Optional[float] = None
+        self._last_sample_at = 0.0
+
+    @property
+    def capacity(self) -> int:
+        """The most samples that this buffer holds."""
+        return self._capacity
+
+    def __len__(self) -> int:
+        """The number of samples in the buffer."""
+        return self._count
+
+    def append(self, sample: int) -> None:
+        """Add one raw sample."""
+        self._data[self._head] = sample
+        self._data[self._head + self._capacity] = sample
+        self._head = (self._head + 1) % self._capacity
+        self._count = min(self._count + 1, self._capacity)
+        self._received(1)
+
+    def extend(self, samples: npt.ArrayLike) -> None:
+        """Add raw samples, oldest first."""
+        new = np.asarray(samples, dtype=SAMPLE_DTYPE).ravel()[-self._capacity :]
+        received = np.size(samples)
+        if received == 0:
+            return
+        # Write in at most two pieces, wrapping around the end of the first half.
+        first = min(len(new), self._capacity - self._head)
+        for start, piece in ((self._head, new[:first]), (0, new[first:])):
+            self._data[start : start + len(piece)] = piece
+            self._data[
+                start + self._capacity : start + self._capacity + len(piece)
+            ] = piece
+        self._head = (self._head + len(new)) % self._capacity
+        self._count = min(self._count + len(new), self._capacity)
+        self._received(received)
+
+    def extend_from_bytes(self, data: bytes, count: int) -> None:
+        """Add `count` raw samples from the bytes of a batch sensor response."""
+        self.extend(np.frombuffer(data, dtype=SAMPLE_DTYPE, count=count))
+
+    def _received(self, samples: int) -> None:
+        now = time.monotonic()
+        if self._first_sample_at is None:
+            self._first_sample_at = now
+        self._last_sample_at = now
+        self._samples += samples
+
+    def raw(self) -> npt.NDArray[np.int32]:
+        """A read-only view of the buffered raw samples, oldest first.
+
+        The view shares memory with the buffer, so it changes as samples
+        arrive; copy it to keep it.
+        """
+        start = self._head + self._capacity - self._count
+        view = self._data[start : start + self._count]
+        view.flags.writeable = False
+        return view
+
+    def values(self) -> npt.NDArray[np.float64]:
+        """The buffered samples in sensor units, oldest first."""
+        return self.raw() / sensor_fixed_point_conversion
+
+    def clear(self) -> None:
+        """Empty the buffer, and reset its metrics."""
+        self._head = 0
+        self._count = 0
+        self._samples = 0
+        self._first_sample_at = None
+        self._last_sample_at = 0.0
+
+    @property
+    def metrics(self) -> SensorStreamMetrics:
+        """How the stream into this buffer has gone so far."""
+        return SensorStreamMetrics(
+            samples=self._samples,
+            dropped=self._samples - self._count,
+            elapsed_seconds=(
+                self._last_sample_at - self._first_sample_at
+                if self._first_sample_at is not None
+                else 0.0
+            ),
+        )
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """Write the buffered raw samples to a .npy file, and return its path.
+
+        Read it back with `load_sensor_capture`.
+        """
+        path = Path(path).with_suffix(".npy")
+        np.save(path, self.raw(), allow_pickle=False)
+        return path
+
+
+def load_sensor_capture(path: Union[str, Path]) -> npt.NDArray[np.int32]:
+    """Memory-map raw samples that were saved with `SensorRingBuffer.save`."""
+    return np.load(Path(path), mmap_mode="r", allow_pickle=False)  # type: ignore[no-any-return]
@@ -49,6 +49,7 @@ from opentrons_hardware.firmware_bindings.messages.message_definitions import (
 )
 from .sensor_abc import AbstractSensorDriver
 from .scheduler import SensorScheduler
+from .sensor_buffer import SensorRingBuffer
 from . import SENSOR_LOG_NAME
 
 LOG = getLogger(__name__)
@@ -227,12 +228,18 @@ class SensorDriver(AbstractSensorDriver):
 
 
 class LogListener:
-    """Capture incoming sensor messages."""
+    """Capture incoming sensor messages.
+
+    By default, each sample is queued as a SensorDataType and logged. If a
+    SensorRingBuffer is given, samples are stored in it as raw values instead,
+    which keeps up with higher sample rates. Read them from the buffer.
+    """
 
     def __init__(
         self,
         messenger: CanMessenger,
         sensor: Union[PressureSensor, CapacitiveSensor],
+        buffer: Optional[SensorRingBuffer] = None,
     ) -> None:
         """Build the capturer."""
         self.response_queue: asyncio.Queue[SensorDataType] = asyncio.Queue()
@@ -243,9 +250,13 @@ class LogListener:
         self.sensor = sensor
         self.type = sensor.sensor.sensor_type
         self.id = sensor.sensor.sensor_id
+        self.buffer = buffer
 
     def get_data(self) -> Optional[List[SensorDataType]]:
-        """Return the sensor data captured by this listener."""
+        """Return the sensor data queued by this listener.
+
+        A listener with a buffer doesn't queue its data, so this returns None.
+        """
         if self.response_queue.empty():
             return None
         data: List[SensorDataType] = []
@@ -263,6 +274,10 @@ class LogListener:
         """Finish the capture."""
         self.messenger.remove_listener(self)
         SENSOR_LOG.info(f"Data capture for {self.tool.name} ended {time.time()}")
+        if self.buffer is not None:
+            SENSOR_LOG.info(
+                f"Data capture for {self.tool.name} {self.id.name}: {self.buffer.metrics}"
+            )
 
     def set_stop_ack(self, message_index: int = 0) -> None:
         """Tell the Listener which message index to wait for."""
@@ -277,6 +292,51 @@ class LogListener:
             SENSOR_LOG.error("Did not receive the full data set from the sensor")
         self.event = None
 
+    def _handle_read(
+        self,
+        message: message_definitions.ReadFromSensorResponse,
+        arbitration_id: ArbitrationId,
+    ) -> None:
+        if self.buffer is not None:
+            self.buffer.append(message.payload.sensor_data.value)
+            return
+        data = sensor_types.SensorDataType.build(
+            message.payload.sensor_data, message.payload.sensor
+        )
+        self.response_queue.put_nowait(data)
+        SENSOR_LOG.info(
+            f"Revieved from {arbitration_id}: {message.payload.sensor_id}:{message.payload.sensor}: {data}"
+        )
+
+    def _handle_batch_read(
+        self,
+        message: message_definitions.BatchReadFromSensorResponse,
+        arbitration_id: ArbitrationId,
+    ) -> None:
+        data_length = message.payload.data_length.value
+        data_bytes = message.payload.sensor_data.value
+        if self.buffer is not None:
+            if (
+                message.payload.sensor_id.value == self.id
+                and message.payload.sensor.value == self.type
+            ):
+                self.buffer.extend_from_bytes(data_bytes, data_length)
+            return
+        data_ints = [
+            int.from_bytes(data_bytes[i * 4 : i * 4 + 4], byteorder="little")
+            for i in range(data_length)
+        ]
+        data_floats = [
+            sensor_types.SensorDataType.build(d, message.payload.sensor)
+            for d in data_ints
+        ]
+
+        for d in data_floats:
+            self.response_queue.put_nowait(d)
+        SENSOR_LOG.info(
+            f"Revieved from {arbitration_id}: {message.payload.sensor_id}:{message.payload.sensor}: {data_floats}"
+        )
+
     def __call__(
         self,
         message: MessageDefinition,
@@ -293,30 +353,9 @@ class LogListener:
             ):
                 # ignore sensor responses from other sensors
                 return
-            data = sensor_types.SensorDataType.build(
-                message.payload.sensor_data, message.payload.sensor
-            )
-            self.response_queue.put_nowait(data)
-            SENSOR_LOG.info(
-                f"Revieved from {arbitration_id}: {message.payload.sensor_id}:{message.payload.sensor}: {data}"
-            )
+            self._handle_read(message, arbitration_id)
         if isinstance(message, message_definitions.BatchReadFromSensorResponse):
-            data_length = message.payload.data_length.value
-            data_bytes = message.payload.sensor_data.value
-            data_ints = [
-                int.from_bytes(data_bytes[i * 4 : i * 4 + 4], byteorder="little")
-                for i in range(data_length)
-            ]
-            data_floats = [
-                sensor_types.SensorDataType.build(d, message.payload.sensor)
-                for d in data_ints
-            ]
-
-            for d in data_floats:
-                self.response_queue.put_nowait(d)
-            SENSOR_LOG.info(
-                f"Revieved from {arbitration_id}: {message.payload.sensor_id}:{message.payload.sensor}: {data_floats}"
-            )
+            self._handle_batch_read(message, arbitration_id)
         if isinstance(message, message_definitions.Acknowledgement):
             if (
                 self.event is not None
@@ -18,6 +18,7 @@ from opentrons_hardware.firmware_bindings.arbitration_id import (
     ArbitrationIdParts,
 )
 from opentrons_hardware.drivers.can_bus.can_messenger import (
+    ArbitrationIdFilter,
     CanMessenger,
     MessageListenerCallback,
     WaitableCallback,
@@ -436,6 +437,104 @@ async def test_filter_messages(
     listener.assert_not_called()
 
 
+@pytest.mark.parametrize(
+    argnames=["arbitration_id_filter", "expected_call"],
+    argvalues=[
+        [ArbitrationIdFilter(), True],
+        [ArbitrationIdFilter(message_ids=[MessageId.get_move_group_request]), True],
+        [ArbitrationIdFilter(message_ids=[MessageId.move_completed]), False],
+        [ArbitrationIdFilter(originating_node_ids=[NodeId.gantry_x]), True],
+        [ArbitrationIdFilter(originating_node_ids=[NodeId.gantry_y]), False],
+        [
+            ArbitrationIdFilter(
+                message_ids=[MessageId.get_move_group_request],
+                originating_node_ids=[NodeId.gantry_y, NodeId.gantry_x],
+            ),
+            True,
+        ],
+        [
+            ArbitrationIdFilter(
+                message_ids=[MessageId.get_move_group_request],
+                originating_node_ids=[NodeId.gantry_y],
+            ),
+            False,
+        ],
+    ],
+)
+async def test_indexed_filter_messages(
+    subject: CanMessenger,
+    incoming_messages: Queue[CanMessage],
+    arbitration_id_filter: ArbitrationIdFilter,
+    expected_call: bool,
+) -> None:
+    """It should only call listeners whose arbitration id filter matches."""
+    arbitration_id = ArbitrationId(
+        parts=ArbitrationIdParts(
+            message_id=MessageId.get_move_group_request,
+            node_id=0,
+            function_code=0,
+            originating_node_id=NodeId.gantry_x,
+        )
+    )
+    incoming_messages.put_nowait(
+        CanMessage(arbitration_id=arbitration_id, data=b"\x00\x00\x00\x01\1")
+    )
+
+    listener = Mock(spec=MessageListenerCallback)
+    subject.add_listener(listener, arbitration_id_filter)
+
+    subject.start()
+    while not incoming_messages.empty():
+        await asyncio.sleep(0.01)
+    subject.remove_listener(listener)
+    await subject.stop()
+
+    assert arbitration_id_filter(arbitration_id) == expected_call
+    assert listener.called == expected_call
+
+
+async def test_listeners_called_in_registration_order(
+    subject: CanMessenger, incoming_messages: Queue[CanMessage]
+) -> None:
+    """It should call matching listeners in the order they were added."""
+    incoming_messages.put_nowait(
+        CanMessage(
+            arbitration_id=ArbitrationId(
+                parts=ArbitrationIdParts(
+                    message_id=MessageId.get_move_group_request,
+                    node_id=0,
+                    function_code=0,
+                    originating_node_id=NodeId.gantry_x,
+                )
+            ),
+            data=b"\x00\x00\x00\x01\1",
+        )
+    )
+    calls: List[str] = []
+    first = Mock(side_effect=lambda *args: calls.append("first"))
+    second = Mock(side_effect=lambda *args: calls.append("second"))
+    third = Mock(side_effect=lambda *args: calls.append("third"))
+    ignored = Mock(spec=MessageListenerCallback)
+    subject.add_listener(
+        first, ArbitrationIdFilter(originating_node_ids=[NodeId.gantry_x])
+    )
+    subject.add_listener(second)
+    subject.add_listener(
+        third, ArbitrationIdFilter(message_ids=[MessageId.get_move_group_request])
+    )
+    subject.add_listener(ignored, ArbitrationIdFilter(message_ids=[]))
+    subject.remove_listener(second)
+    subject.add_listener(second)
+
+    subject.start()
+    while not incoming_messages.empty():
+        await asyncio.sleep(0.01)
+    await subject.stop()
+
+    assert calls == ["first", "third", "second"]
+    ignored.assert_not_called()
+
+
 async def test_waitable_callback_context() -> None:
     """It should add itself and remove itself using context manager."""
     mock_messenger = Mock(spec=CanMessenger)
@@ -0,0 +1 @@
+"""Tests for firmware binding utils."""
@@ -0,0 +1,93 @@
+"""Tests for BinarySerializable."""
+from dataclasses import dataclass
+
+import pytest
+
+from opentrons_hardware.firmware_bindings import utils
+from opentrons_hardware.firmware_bindings.utils.binary_serializable import (
+    InvalidFieldException,
+    SerializationException,
+)
+from opentrons_hardware.firmware_bindings.messages import payloads
+
+
+@dataclass
+class _BigEndian(utils.BinarySerializable):
+    first: utils.UInt16Field
+    second: utils.Int8Field
+    third: utils.UInt32Field
+
+
+@dataclass
+class _LittleEndian(utils.LittleEndianBinarySerializable):
+    first: utils.UInt16Field
+    second: utils.Int8Field
+    third: utils.UInt32Field
+
+
+@dataclass
+class _NotAField(utils.BinarySerializable):
+    value: int
+
+
+def test_round_trip_big_endian() -> None:
+    """It should serialize and build big endian fields."""
+    obj = _BigEndian(
+        first=utils.UInt16Field(0x0102),
+        second=utils.Int8Field(-1),
+        third=utils.UInt32Field(0x03040506),
+    )
+    data = obj.serialize()
+    assert data == b"\x01\x02\xff\x03\x04\x05\x06"
+    assert _BigEndian.get_size() == len(data)
+    assert _BigEndian.build(data) == obj
+
+
+def test_round_trip_little_endian() -> None:
+    """It should serialize and build little endian fields."""
+    obj = _LittleEndian(
+        first=utils.UInt16Field(0x0102),
+        second=utils.Int8Field(-1),
+        third=utils.UInt32Field(0x03040506),
+    )
+    data = obj.serialize()
+    assert data == b"\x02\x01\xff\x06\x05\x04\x03"
+    assert _LittleEndian.build(data) == obj
+
+
+def test_build_ignores_extra_bytes() -> None:
+    """It should ignore padding beyond the size of the message."""
+    built = _BigEndian.build(b"\x01\x02\xff\x03\x04\x05\x06\x00\x00")
+    assert isinstance(built, _BigEndian)
+    assert built.third == utils.UInt32Field(0x03040506)
+
+
+def test_build_too_short() -> None:
+    """It should raise if there is not enough data."""
+    with pytest.raises(InvalidFieldException):
+        _BigEndian.build(b"\x01\x02")
+
+
+def test_serialize_bad_value() -> None:
+    """It should raise if a value does not fit its field."""
+    obj = _BigEndian(
+        first=utils.UInt16Field(0x10000),
+        second=utils.Int8Field(0),
+        third=utils.UInt32Field(0),
+    )
+    with pytest.raises(SerializationException):
+        obj.serialize()
+
+
+def test_non_field_type() -> None:
+    """It should reject dataclass fields that are not binary fields."""
+    with pytest.raises(InvalidFieldException):
+        _NotAField.get_size()
+
+
+def test_build_sets_message_index() -> None:
+    """It should build the message index even though it is not an init field."""
+    payload = payloads.ErrorMessagePayload.build(b"\x00\x00\x00\x07\x00\x01\x00\x02")
+    assert isinstance(payload, payloads.ErrorMessagePayload)
+    assert payload.message_index == utils.UInt32Field(7)
+    assert payload.serialize() == b"\x00\x00\x00\x07\x00\x01\x00\x02"
@@ -0,0 +1,132 @@
+"""Tests for vectorized move planning."""
+import re
+
+import numpy as np
+import pytest
+from hypothesis import given, settings, strategies as st
+from typing import List, Tuple
+
+from opentrons_hardware.hardware_control.motion_planning import move_utils
+from opentrons_hardware.hardware_control.motion_planning.move_arrays import MoveArrays
+from opentrons_hardware.hardware_control.motion_planning.move_manager import MoveManager
+from opentrons_hardware.hardware_control.motion_planning.types import (
+    AxisConstraints,
+    Coordinates,
+    Move,
+    MoveTarget,
+    SystemConstraints,
+)
+
+AXES = ["X", "Y", "Z", "A"]
+
+
+@st.composite
+def generate_constraints(draw: st.DrawFn) -> SystemConstraints[str]:
+    """Create system constraints using Hypothesis."""
+    return {
+        axis: AxisConstraints.build(
+            max_acceleration=draw(st.integers(min_value=10, max_value=5000)),
+            max_speed_discont=draw(st.integers(min_value=11, max_value=50)),
+            max_direction_change_speed_discont=draw(
+                st.integers(min_value=1, max_value=10)
+            ),
+            max_speed=draw(st.integers(min_value=50, max_value=500)),
+        )
+        for axis in AXES
+    }
+
+
+@st.composite
+def generate_path(
+    draw: st.DrawFn,
+) -> Tuple[Coordinates[str, np.float64], List[MoveTarget[str]]]:
+    """Create a path that changes direction and speed using Hypothesis."""
+    origin = {axis: np.float64(0) for axis in AXES}
+    steps = draw(
+        st.lists(
+            st.tuples(
+                st.lists(
+                    st.sampled_from([-20.0, -1.0, -0.3, 0.0, 0.0, 0.3, 1.0, 20.0]),
+                    min_size=len(AXES),
+                    max_size=len(AXES),
+                ).filter(lambda step: any(step)),
+                st.floats(min_value=1, max_value=500),
+            ),
+            min_size=1,
+            max_size=15,
+        )
+    )
+    position = np.zeros(len(AXES))
+    targets = []
+    for step, max_speed in steps:
+        position = position + np.array(step)
+        targets.append(MoveTarget.build(dict(zip(AXES, position)), max_speed))
+    return origin, targets
+
+
+def _with_dummies(moves: List[Move[str]]) -> List[Move[str]]:
+    dummy = Move.build_dummy(AXES)
+    return [dummy, *moves, dummy]
+
+
+@settings(deadline=None)
+@given(constraints=generate_constraints(), path=generate_path())
+def test_matches_scalar_planning(
+    constraints: SystemConstraints[str],
+    path: Tuple[Coordinates[str, np.float64], List[MoveTarget[str]]],
+) -> None:
+    """It should build exactly the moves that the scalar functions build."""
+    origin, targets = path
+    to_blend = _with_dummies(
+        list(move_utils.targets_to_moves(origin, targets, constraints))
+    )
+    subject = MoveArrays(to_blend, constraints)
+
+    for _ in range(5):
+        try:
+            expected = [
+                move_utils.build_move(move, prev_move, next_move, constraints)
+                for prev_move, move, next_move in zip(
+                    to_blend, to_blend[1:], to_blend[2:]
+                )
+            ]
+        except AssertionError as error:
+            # Some paths can't be planned. They should fail the same way.
+            with pytest.raises(AssertionError, match=re.escape(str(error))):
+                subject.build_moves(to_blend)
+            return
+        assert subject.build_moves(to_blend) == expected
+        assert subject.all_blended(expected) == move_utils.all_blended(
+            constraints, expected
+        )
+        to_blend = _with_dummies(expected)
+
+
+def test_all_blended_rejects_mismatched_junction() -> None:
+    """It should catch a junction whose speeds don't meet constraints."""
+    constraints: SystemConstraints[str] = {
+        axis: AxisConstraints.build(
+            max_acceleration=100,
+            max_speed_discont=10,
+            max_direction_change_speed_discont=5,
+            max_speed=100,
+        )
+        for axis in AXES
+    }
+    origin = {axis: np.float64(0) for axis in AXES}
+    targets = [
+        MoveTarget.build({"X": 50, "Y": 0, "Z": 0, "A": 0}, 100),
+        MoveTarget.build({"X": 0, "Y": 0, "Z": 0, "A": 0}, 100),
+    ]
+    to_blend = _with_dummies(
+        list(move_utils.targets_to_moves(origin, targets, constraints))
+    )
+    subject = MoveArrays(to_blend, constraints)
+
+    # The initial moves run at full speed straight into a direction change.
+    assert not move_utils.all_blended(constraints, to_blend[1:-1])
+    assert not subject.all_blended(to_blend[1:-1])
+
+    converged, blend_log = MoveManager(constraints).plan_motion(origin, targets)
+    assert converged
+    assert subject.all_blended(blend_log[-1])
@@ -1,6 +1,6 @@
 """Tests for the move scheduler."""
 import pytest
-from typing import List, Any
+from typing import List, Any, Tuple
 from numpy import float64, float32, int32
 from mock import AsyncMock, call, MagicMock, patch
 from opentrons_shared_data.errors.exceptions import (
@@ -962,6 +962,59 @@ async def test_multi_group_move(
     assert position[4][1].payload.current_position_um.value == 12000
 
 
+async def test_run_sends_next_group_while_executing(
+    mock_can_messenger: AsyncMock, move_group_multiple: MoveGroups
+) -> None:
+    """It should send each group's moves while the group before it executes."""
+    listeners: List[MessageListenerCallback] = []
+    mock_can_messenger.add_listener = MagicMock(
+        side_effect=lambda listener, *args: listeners.append(listener)
+    )
+    mock_can_messenger.remove_listener = MagicMock()
+
+    def _listener(message: MessageDefinition, arbitration_id: ArbitrationId) -> None:
+        for listener in listeners:
+            listener(message, arbitration_id)
+
+    mock_sender = MockSendMoveCompleter(move_group_multiple, _listener)
+    sent: List[Tuple[str, int]] = []
+
+    def _record(action: str, group_id: int) -> None:
+        if not sent or sent[-1] != (action, group_id):
+            sent.append((action, group_id))
+
+    async def _send(node_id: NodeId, message: MessageDefinition) -> None:
+        _record("add", message.payload.group_id.value)  # type: ignore[attr-defined]
+        await mock_sender.mock_send(node_id, message)
+
+    async def _ensure_send(
+        node_id: NodeId,
+        message: MessageDefinition,
+        timeout: float = 3,
+        expected_nodes: List[NodeId] = [],
+    ) -> ErrorCode:
+        if isinstance(message, md.ExecuteMoveGroupRequest):
+            _record("execute", message.payload.group_id.value)
+        return await mock_sender.mock_ensure_send(
+            node_id, message, timeout, expected_nodes
+        )
+
+    mock_can_messenger.send.side_effect = _send
+    mock_can_messenger.ensure_send.side_effect = _ensure_send
+    subject = MoveGroupRunner(move_groups=move_group_multiple)
+    position = await subject.run(can_messenger=mock_can_messenger)
+
+    assert sent == [
+        ("add", 0),
+        ("execute", 0),
+        ("add", 1),
+        ("execute", 1),
+        ("add", 2),
+        ("execute", 2),
+    ]
+    assert position[NodeId.pipette_left].motor_position == 12
+
+
 async def test_multi_gripper_group_move(
     mock_can_messenger: AsyncMock, move_group_gripper_multiple: MoveGroups
 ) -> None:
@@ -18,9 +18,10 @@ from opentrons_hardware.firmware_bindings.arbitration_id import (
     ArbitrationIdParts,
 )
 
-from opentrons_hardware.firmware_bindings.utils import Int32Field
+from opentrons_hardware.firmware_bindings.utils import Int32Field, UInt8Field
 
 from opentrons_hardware.firmware_bindings.messages.fields import (
+    BatchSensorDataField,
     SensorIdField,
     SensorTypeField,
     SensorOutputBindingField,
@@ -30,12 +31,14 @@ from opentrons_hardware.firmware_bindings.messages.fields import (
 
 from opentrons_hardware.firmware_bindings.messages.message_definitions import (
     ReadFromSensorResponse,
+    BatchReadFromSensorResponse,
     BindSensorOutputRequest,
     ErrorMessage,
 )
 from opentrons_hardware.firmware_bindings.messages.payloads import (
     BindSensorOutputRequestPayload,
     ReadFromSensorResponsePayload,
+    BatchReadFromSensorResponsePayload,
     ErrorMessagePayload,
 )
 
@@ -110,6 +113,72 @@ async def test_capture_output(
         assert value == index
 
 
+async def test_stream_output(
+    mock_messenger: mock.AsyncMock,
+    can_message_notifier: MockCanMessageNotifier,
+) -> None:
+    """Test that single and batched data is streamed into a buffer."""
+    subject = scheduler.SensorScheduler()
+    arbitration_id = ArbitrationId(
+        parts=ArbitrationIdParts(
+            message_id=ReadFromSensorResponse.message_id,
+            node_id=NodeId.host,
+            originating_node_id=NodeId.pipette_left,
+            function_code=0,
+        )
+    )
+    async with subject.stream_output(
+        sensor_types.SensorInformation(
+            sensor_type=SensorType.pressure,
+            sensor_id=SensorId.S0,
+            node_id=NodeId.pipette_left,
+        ),
+        mock_messenger,
+        capacity=8,
+    ) as buffer:
+        for i in range(3):
+            can_message_notifier.notify(
+                ReadFromSensorResponse(
+                    payload=ReadFromSensorResponsePayload(
+                        sensor=SensorTypeField(SensorType.pressure.value),
+                        sensor_id=SensorIdField(SensorId.S0),
+                        sensor_data=Int32Field(-i << 16),
+                    )
+                ),
+                arbitration_id,
+            )
+        batch = b"".join(
+            (i << 16).to_bytes(4, "little", signed=True) for i in range(3, 9)
+        )
+        can_message_notifier.notify(
+            BatchReadFromSensorResponse(
+                payload=BatchReadFromSensorResponsePayload(
+                    sensor=SensorTypeField(SensorType.pressure.value),
+                    sensor_id=SensorIdField(SensorId.S0),
+                    data_length=UInt8Field(6),
+                    sensor_data=BatchSensorDataField(
+                        batch.ljust(BatchSensorDataField.NUM_BYTES, b"\0")
+                    ),
+                )
+            ),
+            arbitration_id,
+        )
+    mock_messenger.ensure_send.assert_called_with(
+        node_id=NodeId.pipette_left,
+        message=BindSensorOutputRequest(
+            payload=BindSensorOutputRequestPayload(
+                sensor=SensorTypeField(SensorType.pressure),
+                sensor_id=SensorIdField(SensorId.S0),
+                binding=SensorOutputBindingField(SensorOutputBinding.none.value),
+            )
+        ),
+        expected_nodes=[NodeId.pipette_left],
+    )
+    assert buffer.values().tolist() == [-1, -2, 3, 4, 5, 6, 7, 8]
+    assert buffer.metrics.samples == 9
+    assert buffer.metrics.dropped == 1
+
+
 async def test_capture_error_max_threshold(
     mock_messenger: mock.AsyncMock, can_message_notifier: MockCanMessageNotifier
 ) -> None:
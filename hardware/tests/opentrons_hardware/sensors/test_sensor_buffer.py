@@ -0,0 +1,78 @@
+"""Tests for the sensor ring buffer."""
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from opentrons_hardware.sensors.sensor_buffer import (
+    SensorRingBuffer,
+    load_sensor_capture,
+)
+
+
+def test_append_and_wrap() -> None:
+    """It should keep the most recent samples, oldest first."""
+    subject = SensorRingBuffer(4)
+    assert len(subject) == 0
+    assert subject.raw().tolist() == []
+
+    for sample in range(3):
+        subject.append(sample)
+    assert subject.raw().tolist() == [0, 1, 2]
+    assert subject.metrics.dropped == 0
+
+    for sample in range(3, 7):
+        subject.append(sample)
+    assert subject.raw().tolist() == [3, 4, 5, 6]
+    assert subject.metrics.samples == 7
+    assert subject.metrics.dropped == 3
+
+
+@pytest.mark.parametrize("chunk", [1, 3, 4, 10])
+def test_extend(chunk: int) -> None:
+    """It should store chunks of samples, however they line up with the end."""
+    subject = SensorRingBuffer(4)
+    samples = np.arange(10, dtype=np.int32)
+    for start in range(0, len(samples), chunk):
+        subject.extend(samples[start : start + chunk])
+    assert subject.raw().tolist() == [6, 7, 8, 9]
+    assert subject.metrics.samples == 10
+    assert subject.metrics.dropped == 6
+
+
+def test_views_do_not_copy() -> None:
+    """It should hand out read-only views of its storage."""
+    subject = SensorRingBuffer(4)
+    subject.extend([1, 2, 3, 4, 5])
+    view = subject.raw()
+    assert np.shares_memory(view, subject.raw())
+    with pytest.raises(ValueError):
+        view[0] = 0
+
+
+def test_extend_from_bytes() -> None:
+    """It should read signed fixed point samples from batch data."""
+    subject = SensorRingBuffer(8)
+    data = np.array([-1 << 16, 2 << 16, 3 << 16], dtype="<i4").tobytes()
+    subject.extend_from_bytes(data + bytes(8), 3)
+    assert subject.values().tolist() == [-1.0, 2.0, 3.0]
+
+
+def test_save_and_load(tmp_path: Path) -> None:
+    """It should save samples to a file that can be memory-mapped."""
+    subject = SensorRingBuffer(4)
+    subject.extend([1, 2, 3, 4, 5, 6])
+    path = subject.save(tmp_path / "capture")
+    loaded = load_sensor_capture(path)
+    assert isinstance(loaded, np.memmap)
+    assert loaded.tolist() == [3, 4, 5, 6]
+
+
+def test_clear() -> None:
+    """It should forget its samples and metrics."""
+    subject = SensorRingBuffer(4)
+    subject.extend([1, 2, 3, 4, 5, 6])
+    subject.clear()
+    assert len(subject) == 0
+    assert subject.metrics.samples == 0
+    assert subject.metrics.sample_rate == 0.0
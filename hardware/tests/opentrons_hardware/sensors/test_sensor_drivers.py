@@ -20,6 +20,7 @@ from opentrons_hardware.firmware_bindings.utils import (
     UInt32Field,
     Int32Field,
 )
+from opentrons_hardware.firmware_bindings.messages.fields import BatchSensorDataField
 
 from opentrons_hardware.firmware_bindings.messages.message_definitions import (
     BaselineSensorRequest,
@@ -32,6 +33,7 @@ from opentrons_hardware.firmware_bindings.messages.message_definitions import (
     BindSensorOutputRequest,
     PeripheralStatusRequest,
     PeripheralStatusResponse,
+    BatchReadFromSensorResponse,
 )
 from opentrons_hardware.firmware_bindings.messages.messages import MessageDefinition
 from opentrons_hardware.firmware_bindings.messages.payloads import (
@@ -43,6 +45,7 @@ from opentrons_hardware.firmware_bindings.messages.payloads import (
     BindSensorOutputRequestPayload,
     PeripheralStatusResponsePayload,
     BaselineSensorResponsePayload,
+    BatchReadFromSensorResponsePayload,
 )
 from opentrons_hardware.firmware_bindings.messages.fields import (
     SensorTypeField,
@@ -57,7 +60,8 @@ from opentrons_hardware.sensors.sensor_types import (
     BaseSensorType,
     ThresholdSensorType,
 )
-from opentrons_hardware.sensors.sensor_driver import SensorDriver
+from opentrons_hardware.sensors.sensor_buffer import SensorRingBuffer
+from opentrons_hardware.sensors.sensor_driver import SensorDriver, LogListener
 from opentrons_hardware.firmware_bindings.constants import SensorOutputBinding
 
 
@@ -692,3 +696,39 @@ async def test_peripheral_status(
     mock_messenger.send.side_effect = responder
     status = await sensor_driver.get_device_status(mock_messenger, sensor_type, timeout)
     assert status
+
+
+async def test_log_listener_with_buffer(
+    mock_messenger: mock.AsyncMock,
+    can_message_notifier: MockCanMessageNotifier,
+    pressure_sensor: PressureSensor,
+) -> None:
+    """It should store readings in the buffer instead of queueing them."""
+    buffer = SensorRingBuffer(8)
+    subject = LogListener(mock_messenger, pressure_sensor, buffer)
+    arbitration_id = ArbitrationId(
+        parts=ArbitrationIdParts(
+            message_id=BatchReadFromSensorResponse.message_id,
+            node_id=NodeId.host,
+            function_code=0,
+            originating_node_id=NodeId.pipette_left,
+        )
+    )
+    batch = b"".join((i << 16).to_bytes(4, "little", signed=True) for i in range(3))
+    async with subject:
+        for sensor_id in (SensorId.S0, SensorId.S1):
+            can_message_notifier.notify(
+                BatchReadFromSensorResponse(
+                    payload=BatchReadFromSensorResponsePayload(
+                        sensor=SensorTypeField(SensorType.pressure.value),
+                        sensor_id=SensorIdField(sensor_id),
+                        data_length=UInt8Field(3),
+                        sensor_data=BatchSensorDataField(
+                            batch.ljust(BatchSensorDataField.NUM_BYTES, b"\0")
+                        ),
+                    )
+                ),
+                arbitration_id,
+            )
+    assert buffer.values().tolist() == [0.0, 1.0, 2.0]
+    assert subject.get_data() is None
@@ -21,6 +21,7 @@ from .persistence.fastapi_dependencies import (
 from .router import router
 from .service.logging import initialize_logging
 from .service.task_runner import set_up_task_runner
+from .protocols.analysis_executor import set_up_analysis_executor
 from .settings import RobotServerSettings, get_settings
 from .runs.dependencies import (
     start_light_control_task,
@@ -49,6 +50,7 @@ async def _lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         initialize_logging()
 
         await exit_stack.enter_async_context(set_up_task_runner(app.state))
+        await exit_stack.enter_async_context(set_up_analysis_executor(app.state))
 
         blinker = FrontButtonLightBlinker()
         exit_stack.push_async_callback(blinker.clean_up)
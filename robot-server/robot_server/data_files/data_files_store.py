@@ -10,6 +10,7 @@ import sqlalchemy.engine
 
 from robot_server.deletion_planner import FileUsageInfo
 from robot_server.persistence.database import sqlite_rowid
+from robot_server.persistence.sql_worker import SQLWorker
 from robot_server.persistence.tables import (
     data_files_table,
     analysis_csv_rtp_table,
@@ -37,10 +38,12 @@ class DataFilesStore:
     def __init__(
         self,
         sql_engine: sqlalchemy.engine.Engine,
+        sql_worker: SQLWorker,
         data_files_directory: Path,
     ) -> None:
         """Create a new DataFilesStore."""
         self._sql_engine = sql_engine
+        self._sql_worker = sql_worker
         self._data_files_directory = data_files_directory
 
     def get_file_info_by_hash(self, file_hash: str) -> Optional[DataFileInfo]:
@@ -60,8 +63,7 @@ class DataFilesStore:
             "file_hash": file_info.file_hash,
         }
         statement = sqlalchemy.insert(data_files_table).values(file_info_dict)
-        with self._sql_engine.begin() as transaction:
-            transaction.execute(statement)
+        await self._sql_worker.write(lambda transaction: transaction.execute(statement))
 
     def get(self, data_file_id: str) -> DataFileInfo:
         """Get data file info from the database."""
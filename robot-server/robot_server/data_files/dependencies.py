@@ -16,8 +16,10 @@ from robot_server.settings import get_settings
 from robot_server.persistence.fastapi_dependencies import (
     get_active_persistence_directory,
     get_sql_engine,
+    get_sql_worker,
 )
 from robot_server.persistence.file_and_directory_names import DATA_FILES_DIRECTORY
+from robot_server.persistence.sql_worker import SQLWorker
 from robot_server.deletion_planner import DataFileDeletionPlanner
 from .data_files_store import DataFilesStore
 from .file_auto_deleter import DataFileAutoDeleter
@@ -48,13 +50,16 @@ async def get_data_files_directory(
 async def get_data_files_store(
     app_state: Annotated[AppState, Depends(get_app_state)],
     sql_engine: Annotated[SQLEngine, Depends(get_sql_engine)],
+    sql_worker: Annotated[SQLWorker, Depends(get_sql_worker)],
     data_files_directory: Annotated[Path, Depends(get_data_files_directory)],
 ) -> DataFilesStore:
     """Get a singleton DataFilesStore to keep track of uploaded data files."""
     async with _data_files_store_init_lock:
         data_files_store = _data_files_store_accessor.get_from(app_state)
         if data_files_store is None:
-            data_files_store = DataFilesStore(sql_engine, data_files_directory)
+            data_files_store = DataFilesStore(
+                sql_engine, sql_worker, data_files_directory
+            )
             _data_files_store_accessor.set_on(app_state, data_files_store)
         return data_files_store
 
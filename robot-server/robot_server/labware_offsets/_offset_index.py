@@ -0,0 +1,149 @@
+"""An in-memory index of active labware offsets."""
+
+from __future__ import annotations
+
+from typing import AbstractSet, Final, Iterable, TypeVar
+
+from opentrons.protocol_engine import ModuleModel
+from opentrons.protocol_engine.types import (
+    OnAddressableAreaOffsetLocationSequenceComponent,
+    OnLabwareOffsetLocationSequenceComponent,
+    OnModuleOffsetLocationSequenceComponent,
+)
+
+from .models import (
+    DO_NOT_FILTER,
+    DoNotFilterType,
+    ReturnedLabwareOffsetLocationSequenceComponents,
+    StoredLabwareOffset,
+)
+
+
+_ComponentKey = tuple[str, str]
+_K = TypeVar("_K")
+
+_EMPTY: Final[AbstractSet[int]] = frozenset()
+
+
+class LabwareOffsetIndex:
+    """Active labware offsets, indexed for `LabwareOffsetStore.search()`.
+
+    Offsets are identified by their row IDs in the labware offset table,
+    and searches return them in row ID order, like the database would.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty index."""
+        self._offsets_by_row_id: dict[int, StoredLabwareOffset] = {}
+        self._row_ids_by_offset_id: dict[str, int] = {}
+        self._row_ids_by_definition_uri: dict[str, set[int]] = {}
+        # Keyed by each component's (kind, primary value), like they're stored in SQL.
+        self._row_ids_by_component: dict[_ComponentKey, set[int]] = {}
+        self._row_ids_by_component_kind: dict[str, set[int]] = {}
+
+    def add(self, row_id: int, offset: StoredLabwareOffset) -> None:
+        """Add an active offset. Adding one that's already present does nothing."""
+        if row_id in self._offsets_by_row_id:
+            return
+        self._offsets_by_row_id[row_id] = offset
+        self._row_ids_by_offset_id[offset.id] = row_id
+        self._row_ids_by_definition_uri.setdefault(offset.definitionUri, set()).add(
+            row_id
+        )
+        for key in _component_keys(offset.locationSequence):
+            self._row_ids_by_component.setdefault(key, set()).add(row_id)
+            self._row_ids_by_component_kind.setdefault(key[0], set()).add(row_id)
+
+    def remove(self, offset_id: str) -> None:
+        """Remove an offset, if it's present."""
+        row_id = self._row_ids_by_offset_id.pop(offset_id, None)
+        if row_id is None:
+            return
+        offset = self._offsets_by_row_id.pop(row_id)
+        _discard(self._row_ids_by_definition_uri, offset.definitionUri, row_id)
+        for key in _component_keys(offset.locationSequence):
+            _discard(self._row_ids_by_component, key, row_id)
+            _discard(self._row_ids_by_component_kind, key[0], row_id)
+
+    def clear(self) -> None:
+        """Remove every offset."""
+        self._offsets_by_row_id.clear()
+        self._row_ids_by_offset_id.clear()
+        self._row_ids_by_definition_uri.clear()
+        self._row_ids_by_component.clear()
+        self._row_ids_by_component_kind.clear()
+
+    def search(
+        self,
+        id_filter: str | DoNotFilterType,
+        definition_uri_filter: str | DoNotFilterType,
+        location_addressable_area_filter: str | DoNotFilterType,
+        location_module_model_filter: ModuleModel | None | DoNotFilterType,
+        location_definition_uri_filter: str | None | DoNotFilterType,
+    ) -> list[StoredLabwareOffset]:
+        """Return the offsets matching every filter, in row ID order.
+
+        See `LabwareOffsetStore.search()` for what the filters mean.
+        """
+        required: list[AbstractSet[int]] = []
+        excluded_kinds: list[str] = []
+
+        if id_filter is not DO_NOT_FILTER:
+            row_id = self._row_ids_by_offset_id.get(id_filter)
+            required.append(_EMPTY if row_id is None else {row_id})
+        if definition_uri_filter is not DO_NOT_FILTER:
+            required.append(
+                self._row_ids_by_definition_uri.get(definition_uri_filter, _EMPTY)
+            )
+        location_filters: list[tuple[str, str | None | DoNotFilterType]] = [
+            ("onAddressableArea", location_addressable_area_filter),
+            (
+                "onModule",
+                location_module_model_filter.value
+                if isinstance(location_module_model_filter, ModuleModel)
+                else location_module_model_filter,
+            ),
+            ("onLabware", location_definition_uri_filter),
+        ]
+        for kind, value in location_filters:
+            if value is None:
+                excluded_kinds.append(kind)
+            elif value is not DO_NOT_FILTER:
+                required.append(self._row_ids_by_component.get((kind, value), _EMPTY))
+
+        candidates: AbstractSet[int]
+        if required:
+            # Intersecting starting from the smallest set keeps this proportional to
+            # the most selective filter's matches, not the number of offsets.
+            required.sort(key=len)
+            candidates = set(required[0]).intersection(*required[1:])
+        else:
+            candidates = self._offsets_by_row_id.keys()
+        for kind in excluded_kinds:
+            candidates = candidates - self._row_ids_by_component_kind.get(kind, _EMPTY)
+
+        return [self._offsets_by_row_id[row_id] for row_id in sorted(candidates)]
+
+
+def _component_keys(
+    location_sequence: Iterable[ReturnedLabwareOffsetLocationSequenceComponents],
+) -> set[_ComponentKey]:
+    keys: set[_ComponentKey] = set()
+    for component in location_sequence:
+        if isinstance(component, OnLabwareOffsetLocationSequenceComponent):
+            keys.add((component.kind, component.labwareUri))
+        elif isinstance(component, OnModuleOffsetLocationSequenceComponent):
+            keys.add((component.kind, component.moduleModel.value))
+        elif isinstance(component, OnAddressableAreaOffsetLocationSequenceComponent):
+            keys.add((component.kind, component.addressableAreaName))
+        else:
+            keys.add((component.storedKind, component.primaryValue))
+    return keys
+
+
+def _discard(row_ids_by_key: dict[_K, set[int]], key: _K, row_id: int) -> None:
+    row_ids = row_ids_by_key.get(key)
+    if row_ids is not None:
+        row_ids.discard(row_id)
+        if not row_ids:
+            del row_ids_by_key[key]
@@ -85,8 +85,7 @@ async def post_labware_offsets(  # noqa: D103
         )
     ]
 
-    for new_offset in new_offsets:
-        store.add(new_offset)
+    await store.add_many(new_offsets)
 
     stored_offsets = [
         StoredLabwareOffset.model_construct(
@@ -13,6 +13,7 @@ from opentrons.protocol_engine.types import (
     OnLabwareOffsetLocationSequenceComponent,
 )
 
+from robot_server.persistence.sql_worker import SQLWorker
 from robot_server.persistence.tables import (
     labware_offset_table,
     labware_offset_location_sequence_components_table,
@@ -29,6 +30,7 @@ from .models import (
 import sqlalchemy
 import sqlalchemy.exc
 
+from ._offset_index import LabwareOffsetIndex
 from ._search_query_builder import SearchQueryBuilder
 
 ReturnedLabwareOffsetLocationSequence = Sequence[
@@ -50,37 +52,78 @@ class IncomingStoredLabwareOffset:
 class LabwareOffsetStore:
     """A persistent store for labware offsets, to support the `/labwareOffsets` endpoints."""
 
-    def __init__(self, sql_engine: sqlalchemy.engine.Engine) -> None:
+    def __init__(
+        self, sql_engine: sqlalchemy.engine.Engine, sql_worker: SQLWorker
+    ) -> None:
         """Initialize the store.
 
         Params:
             sql_engine: The SQL database to use as backing storage. Assumed to already
                 have all the proper tables set up.
+            sql_worker: The worker to write new offsets through.
+                It must write to the same database as `sql_engine`.
         """
         self._sql_engine = sql_engine
-
-    def add(
+        self._sql_worker = sql_worker
+        # Loaded from the database the first time it's needed, then kept up to date.
+        self._index: LabwareOffsetIndex | None = None
+        # Bumped by every delete, so that an add can tell if one happened while it
+        # was waiting for the worker.
+        self._deletions = 0
+
+    async def add(
         self,
         offset: IncomingStoredLabwareOffset,
     ) -> None:
         """Store a new labware offset."""
-        with self._sql_engine.begin() as transaction:
-            offset_row_id = transaction.execute(
-                sqlalchemy.insert(labware_offset_table).values(
-                    _pydantic_to_sql_offset(offset)
-                )
-            ).inserted_primary_key.row_id
-            transaction.execute(
-                sqlalchemy.insert(
-                    labware_offset_location_sequence_components_table
-                ).values(
-                    list(
-                        _pydantic_to_sql_location_sequence_iterator(
-                            offset, offset_row_id
+        await self.add_many([offset])
+
+    async def add_many(
+        self,
+        offsets: Sequence[IncomingStoredLabwareOffset],
+    ) -> None:
+        """Store new labware offsets, in order, in a single transaction."""
+
+        def insert(transaction: sqlalchemy.engine.Connection) -> list[int]:
+            offset_row_ids: list[int] = []
+            for offset in offsets:
+                offset_row_id: int = transaction.execute(
+                    sqlalchemy.insert(labware_offset_table).values(
+                        _pydantic_to_sql_offset(offset)
+                    )
+                ).inserted_primary_key.row_id
+                transaction.execute(
+                    sqlalchemy.insert(
+                        labware_offset_location_sequence_components_table
+                    ).values(
+                        list(
+                            _pydantic_to_sql_location_sequence_iterator(
+                                offset, offset_row_id
+                            )
                         )
                     )
                 )
-            )
+                offset_row_ids.append(offset_row_id)
+            return offset_row_ids
+
+        deletions = self._deletions
+        offset_row_ids = await self._sql_worker.write(insert)
+        if self._deletions != deletions:
+            # A delete that ran after the insert committed may have deactivated
+            # these offsets, so the index can't tell whether to add them.
+            self._index = None
+        elif self._index is not None:
+            for offset_row_id, offset in zip(offset_row_ids, offsets):
+                self._index.add(
+                    offset_row_id,
+                    StoredLabwareOffset(
+                        id=offset.id,
+                        createdAt=offset.createdAt,
+                        definitionUri=offset.definitionUri,
+                        locationSequence=offset.locationSequence,
+                        vector=offset.vector,
+                    ),
+                )
 
     def search(
         self,
@@ -96,24 +139,19 @@ class LabwareOffsetStore:
         # robot-server and api. We should try to clean that up, or at least avoid
         # making it worse.
     ) -> list[StoredLabwareOffset]:
-        """Return all matching labware offsets in order from oldest-added to newest."""
-        builder = (
-            SearchQueryBuilder()
-            .do_active_filter(True)
-            .do_id_filter(id_filter)
-            .do_definition_uri_filter(definition_uri_filter)
-            .do_on_addressable_area_filter(location_addressable_area_filter)
-            .do_on_module_filter(location_module_model_filter)
-            .do_on_labware_filter(location_definition_uri_filter)
-        )
-        query = builder.build_query()
+        """Return all matching labware offsets in order from oldest-added to newest.
 
-        with self._sql_engine.begin() as transaction:
-            result = transaction.execute(query).all()
-
-        if len(result) == 0:
-            return []
-        return list(_collate_sql_to_pydantic(result))
+        Each location filter matches offsets whose location sequence has a matching
+        component anywhere in it, or, if the filter is `None`, no component of that
+        kind at all.
+        """
+        return self._get_index().search(
+            id_filter=id_filter,
+            definition_uri_filter=definition_uri_filter,
+            location_addressable_area_filter=location_addressable_area_filter,
+            location_module_model_filter=location_module_model_filter,
+            location_definition_uri_filter=location_definition_uri_filter,
+        )
 
     def delete(self, offset_id: str) -> StoredLabwareOffset:
         """Delete a labware offset by its ID. Return what was just deleted."""
@@ -136,7 +174,11 @@ class LabwareOffsetStore:
                 .values(active=False)
             )
 
-        return next(_collate_sql_to_pydantic(offset_rows))
+        self._deletions += 1
+        if self._index is not None:
+            self._index.remove(offset_id)
+        _, deleted_offset = next(_collate_sql_to_pydantic(offset_rows))
+        return deleted_offset
 
     def delete_all(self) -> None:
         """Delete all labware offsets."""
@@ -144,6 +186,21 @@ class LabwareOffsetStore:
             transaction.execute(
                 sqlalchemy.update(labware_offset_table).values(active=False)
             )
+        self._deletions += 1
+        if self._index is not None:
+            self._index.clear()
+
+    def _get_index(self) -> LabwareOffsetIndex:
+        if self._index is None:
+            query = SearchQueryBuilder().do_active_filter(True).build_query()
+            with self._sql_engine.begin() as transaction:
+                result = transaction.execute(query).all()
+            index = LabwareOffsetIndex()
+            if result:
+                for row_id, offset in _collate_sql_to_pydantic(result):
+                    index.add(row_id, offset)
+            self._index = index
+        return self._index
 
 
 class LabwareOffsetNotFoundError(KeyError):
@@ -219,12 +276,14 @@ def _sql_to_pydantic(
 
 def _collate_sql_to_pydantic(
     query_results: list[sqlalchemy.engine.Row],
-) -> Iterator[StoredLabwareOffset]:
+) -> Iterator[tuple[int, StoredLabwareOffset]]:
+    """Yield each offset in the results, with its row ID."""
     row_iter = iter(query_results)
     row: sqlalchemy.engine.Row | None = next(row_iter)
     while row:
+        row_id = row.row_id
         result, row = _sql_to_pydantic(row, row_iter)
-        yield result
+        yield row_id, result
 
 
 def _pydantic_to_sql_offset(
@@ -31,12 +31,16 @@ def create_sql_engine(path: Path) -> sqlalchemy.engine.Engine:
 
     If the file does not already exist, it will be created, empty.
     You must separately set up any tables you're expecting.
+
+    The database is put in write-ahead logging mode, so it may have `-wal` and `-shm`
+    files next to it while it's open.
     """
     sql_engine = sqlalchemy.create_engine(sql_utils.get_connection_url(path))
 
     try:
         sql_utils.enable_foreign_key_constraints(sql_engine)
         sql_utils.fix_transactions(sql_engine)
+        sql_utils.enable_write_ahead_logging(sql_engine)
 
     except Exception:
         sql_engine.dispose()
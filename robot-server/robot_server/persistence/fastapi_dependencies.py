@@ -25,6 +25,7 @@ from .persistence_directory import (
     prepare_active_subdirectory,
     prepare_root,
 )
+from .sql_worker import SQLWorker
 
 
 _log = logging.getLogger(__name__)
@@ -39,6 +40,7 @@ _active_persistence_directory_init_task_accessor = AppStateAccessor[
 _sql_engine_init_task_accessor = AppStateAccessor["asyncio.Task[SQLEngine]"](
     "persistence_sql_engine_init_task"
 )
+_sql_worker_accessor = AppStateAccessor[SQLWorker]("persistence_sql_worker")
 
 
 class DatabaseNotYetInitialized(ErrorDetails):
@@ -160,6 +162,9 @@ async def clean_up_persistence(app_state: AppState) -> None:
     root_directory_init_task = _root_persistence_directory_init_task_accessor.get_from(
         app_state=app_state
     )
+    sql_worker = _sql_worker_accessor.get_from(app_state=app_state)
+    if sql_worker is not None:
+        await to_thread.run_sync(sql_worker.close)
     if sql_engine_init_task is not None:
         sql_engine = await sql_engine_init_task
         sql_engine.dispose()
@@ -203,6 +208,22 @@ async def get_sql_engine(
         ) from exception
 
 
+async def get_sql_worker(
+    app_state: Annotated[AppState, Depends(get_app_state)],
+    sql_engine: Annotated[SQLEngine, Depends(get_sql_engine)],
+) -> SQLWorker:
+    """Return the server's singleton `SQLWorker` for writing to the database.
+
+    Like `get_sql_engine()`, this raises an HTTP-facing error if the database
+    hasn't finished initializing.
+    """
+    sql_worker = _sql_worker_accessor.get_from(app_state)
+    if sql_worker is None:
+        sql_worker = SQLWorker(sql_engine)
+        _sql_worker_accessor.set_on(app_state, sql_worker)
+    return sql_worker
+
+
 async def get_active_persistence_directory(
     app_state: Annotated[AppState, Depends(get_app_state)],
 ) -> Path:
@@ -13,4 +13,6 @@ LATEST_VERSION_DIRECTORY: Final = "10"
 DECK_CONFIGURATION_FILE: Final = "deck_configuration.json"
 PROTOCOLS_DIRECTORY: Final = "protocols"
 DATA_FILES_DIRECTORY: Final = "data_files"
+ANALYSIS_CACHE_DIRECTORY: Final = "analysis_cache"
+PROTOCOL_SUMMARIES_DIRECTORY: Final = "protocol_summaries"
 DB_FILE: Final = "robot_server.db"
@@ -0,0 +1,133 @@
+"""Run database writes on a dedicated thread, grouping concurrent ones together."""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, TypeVar, Union
+
+import sqlalchemy.engine
+
+
+_T = TypeVar("_T")
+
+# The most writes to group into a single transaction.
+_MAX_BATCH_SIZE = 64
+
+
+@dataclass
+class _PendingWrite:
+    function: Callable[[sqlalchemy.engine.Connection], Any]
+    future: "asyncio.Future[Any]"
+
+
+@dataclass
+class _Succeeded:
+    result: Any
+
+
+@dataclass
+class _Failed:
+    error: BaseException
+
+
+_Outcome = Union[_Succeeded, _Failed]
+
+
+class SQLWorker:
+    """Run database writes on a dedicated thread, so they don't block the event loop.
+
+    Writes that are submitted while an earlier batch of writes is executing are
+    queued, and then executed together in a single transaction. Committing a
+    transaction is the expensive part of a small SQLite write, so this lets the
+    server keep up when many clients write at once.
+
+    Within a batch, each write gets its own savepoint, so a write that raises is
+    rolled back without affecting the others.
+
+    Each batch takes the database's write lock when its transaction starts, so
+    writes on other connections wait for it instead of invalidating what the
+    batch has read.
+    """
+
+    def __init__(self, sql_engine: sqlalchemy.engine.Engine) -> None:
+        """Initialize the worker.
+
+        Args:
+            sql_engine: The engine to write through. Its transactions must support
+                savepoints and the `sqlite_begin_immediate` execution option.
+                See `server_utils.sql_utils.fix_transactions()`.
+        """
+        self._sql_engine = sql_engine.execution_options(sqlite_begin_immediate=True)
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="SQLWorker"
+        )
+        self._pending: List[_PendingWrite] = []
+        self._drain_task: Optional["asyncio.Task[None]"] = None
+
+    async def write(self, function: Callable[[sqlalchemy.engine.Connection], _T]) -> _T:
+        """Execute `function` on the worker thread, inside a transaction.
+
+        `function` may be executed in the same transaction as other writes, so it
+        must not commit, roll back, or otherwise end the transaction itself.
+
+        Returns:
+            Whatever `function` returns, once the transaction has been committed.
+
+        Raises:
+            Whatever `function` raises, after rolling back its changes.
+            Or, whatever error prevented the transaction from being committed.
+        """
+        future: "asyncio.Future[_T]" = asyncio.get_running_loop().create_future()
+        self._pending.append(_PendingWrite(function=function, future=future))
+        if self._drain_task is None:
+            self._drain_task = asyncio.create_task(self._drain())
+        # Cancelling the caller doesn't cancel the write.
+        # It may already be partway through a transaction with other writes.
+        return await asyncio.shield(future)
+
+    def close(self) -> None:
+        """Wait for the current batch of writes to finish, then stop the thread.
+
+        Writes that are still queued will fail.
+        """
+        self._executor.shutdown(wait=True)
+
+    async def _drain(self) -> None:
+        try:
+            while self._pending:
+                batch = self._pending[:_MAX_BATCH_SIZE]
+                del self._pending[:_MAX_BATCH_SIZE]
+                try:
+                    outcomes = await asyncio.get_running_loop().run_in_executor(
+                        self._executor,
+                        self._write_batch,
+                        [pending.function for pending in batch],
+                    )
+                except Exception as e:
+                    outcomes = [_Failed(e)] * len(batch)
+
+                for pending, outcome in zip(batch, outcomes):
+                    if pending.future.done():
+                        continue
+                    if isinstance(outcome, _Succeeded):
+                        pending.future.set_result(outcome.result)
+                    else:
+                        pending.future.set_exception(outcome.error)
+        finally:
+            self._drain_task = None
+
+    def _write_batch(
+        self, functions: List[Callable[[sqlalchemy.engine.Connection], Any]]
+    ) -> List[_Outcome]:
+        outcomes: List[_Outcome] = []
+        with self._sql_engine.begin() as transaction:
+            for function in functions:
+                savepoint = transaction.begin_nested()
+                try:
+                    result = function(transaction)
+                except Exception as e:
+                    savepoint.rollback()
+                    outcomes.append(_Failed(e))
+                else:
+                    savepoint.commit()
+                    outcomes.append(_Succeeded(result))
+        return outcomes
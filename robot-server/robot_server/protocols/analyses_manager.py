@@ -14,6 +14,8 @@ from robot_server.protocols.analysis_models import (
     AnalysisSummary,
 )
 from robot_server.protocols.analysis_store import AnalysisStore
+from robot_server.protocols.analysis_result_cache import AnalysisResultCache
+from robot_server.protocols.analysis_executor import AnalysisExecutor
 from robot_server.protocols import protocol_analyzer
 from robot_server.protocols.protocol_store import ProtocolResource
 from robot_server.service.task_runner import TaskRunner
@@ -31,9 +33,17 @@ class FailedToInitializeAnalyzer(Exception):
 class AnalysesManager:
     """A Collaborator that manages and provides an interface to Protocol Analyzers."""
 
-    def __init__(self, analysis_store: AnalysisStore, task_runner: TaskRunner) -> None:
+    def __init__(
+        self,
+        analysis_store: AnalysisStore,
+        task_runner: TaskRunner,
+        analysis_result_cache: Optional[AnalysisResultCache] = None,
+        analysis_executor: Optional[AnalysisExecutor] = None,
+    ) -> None:
         self._analysis_store = analysis_store
         self._task_runner = task_runner
+        self._analysis_result_cache = analysis_result_cache
+        self._analysis_executor = analysis_executor
 
     async def initialize_analyzer(
         self,
@@ -57,9 +67,11 @@ class AnalysesManager:
         analyzer = protocol_analyzer.create_protocol_analyzer(
             analysis_store=self._analysis_store,
             protocol_resource=protocol_resource,
+            analysis_result_cache=self._analysis_result_cache,
+            analysis_executor=self._analysis_executor,
         )
         try:
-            await analyzer.load_orchestrator(
+            await analyzer.load_run_time_parameters(
                 run_time_param_values=run_time_param_values,
                 run_time_param_paths=run_time_param_paths,
             )
@@ -0,0 +1,282 @@
+"""Run protocol analysis simulations in a bounded pool of worker processes.
+
+Simulating a protocol is CPU-heavy. Doing it on the server's event loop makes every
+other HTTP request and notification lag behind it, so when this executor is enabled,
+`ProtocolAnalyzer` hands the simulation off to a separate process and only does
+the cheap bookkeeping on the event loop.
+"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import multiprocessing
+import pickle
+from dataclasses import dataclass
+from logging import getLogger
+from multiprocessing.connection import Connection
+from multiprocessing.context import BaseContext
+from typing import AsyncGenerator, List, Optional, Set, Tuple, Union
+
+import anyio
+from fastapi import Depends
+from pydantic import BaseModel
+from typing_extensions import Annotated
+
+from opentrons.protocol_engine.types import (
+    CSVRuntimeParamPaths,
+    PrimitiveRunTimeParamValuesType,
+    RunTimeParameter,
+)
+from opentrons.protocol_reader import ProtocolSource
+import opentrons.protocol_runner.create_simulating_orchestrator as simulating_runner
+from opentrons.protocol_runner.run_orchestrator import ParseMode
+
+from server_utils.fastapi_utils.app_state import (
+    AppState,
+    AppStateAccessor,
+    get_app_state,
+)
+from robot_server.persistence.pydantic import json_to_pydantic, pydantic_to_json
+from robot_server.settings import get_settings
+
+from .analysis_result_cache import CachedAnalysisResult
+
+_log = getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class AnalysisWorkerRequest:
+    """Everything needed to simulate a protocol, in a worker process or not."""
+
+    protocol_source: ProtocolSource
+    run_time_param_values: Optional[PrimitiveRunTimeParamValuesType]
+    run_time_param_paths: Optional[CSVRuntimeParamPaths]
+
+
+class AnalysisWorkerResult(BaseModel):
+    """The outcome of simulating a protocol."""
+
+    runTimeParameters: List[RunTimeParameter]
+    result: CachedAnalysisResult
+
+
+class AnalysisWorkerDiedError(RuntimeError):
+    """Raised if a worker process exits before returning its result."""
+
+    def __init__(self, exit_code: Optional[int]) -> None:
+        """Initialize the error's message."""
+        super().__init__(
+            f"Analysis worker process exited unexpectedly with code {exit_code}."
+            " It may have exceeded its memory limit."
+        )
+
+
+# A worker replies with (True, serialized AnalysisWorkerResult)
+# or (False, the exception that the simulation raised).
+_WorkerReply = Tuple[bool, Union[str, BaseException]]
+
+
+async def simulate_analysis(request: AnalysisWorkerRequest) -> AnalysisWorkerResult:
+    """Simulate a protocol in this process.
+
+    Worker processes call this, and so does `ProtocolAnalyzer` when no
+    `AnalysisExecutor` is configured.
+    """
+    orchestrator = await simulating_runner.create_simulating_orchestrator(
+        robot_type=request.protocol_source.robot_type,
+        protocol_config=request.protocol_source.config,
+    )
+    await orchestrator.load(
+        protocol_source=request.protocol_source,
+        parse_mode=ParseMode.NORMAL,
+        run_time_param_values=request.run_time_param_values,
+        run_time_param_paths=request.run_time_param_paths,
+    )
+    result = await orchestrator.run(deck_configuration=[])
+    return AnalysisWorkerResult.model_construct(
+        runTimeParameters=result.parameters,
+        result=CachedAnalysisResult.model_construct(
+            commands=result.commands,
+            labware=result.state_summary.labware,
+            modules=result.state_summary.modules,
+            pipettes=result.state_summary.pipettes,
+            errors=result.state_summary.errors,
+            liquids=result.state_summary.liquids,
+            liquidClasses=result.state_summary.liquidClasses,
+            commandAnnotations=result.command_annotations,
+        ),
+    )
+
+
+def _picklable(error: BaseException) -> BaseException:
+    try:
+        pickle.loads(pickle.dumps(error))
+        return error
+    except Exception:
+        return RuntimeError(f"{type(error).__name__}: {error}")
+
+
+def _worker_main(connection: Connection, memory_limit_bytes: Optional[int]) -> None:
+    if memory_limit_bytes is not None:
+        import resource
+
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit_bytes, memory_limit_bytes))
+
+    while True:
+        try:
+            request: AnalysisWorkerRequest = connection.recv()
+        except EOFError:
+            return
+        reply: _WorkerReply
+        try:
+            reply = (True, pydantic_to_json(asyncio.run(simulate_analysis(request))))
+        except BaseException as error:
+            reply = (False, _picklable(error))
+        connection.send(reply)
+
+
+class _Worker:
+    """A single worker process and the pipe used to talk to it."""
+
+    def __init__(self, context: BaseContext, memory_limit_bytes: Optional[int]) -> None:
+        self._connection, child_connection = context.Pipe()
+        self._process: multiprocessing.process.BaseProcess = context.Process(  # type: ignore[attr-defined]
+            target=_worker_main,
+            args=(child_connection, memory_limit_bytes),
+            daemon=True,
+        )
+        self._process.start()
+        child_connection.close()
+
+    async def simulate(self, request: AnalysisWorkerRequest) -> _WorkerReply:
+        def _round_trip() -> _WorkerReply:
+            self._connection.send(request)
+            reply: _WorkerReply = self._connection.recv()
+            return reply
+
+        try:
+            return await anyio.to_thread.run_sync(
+                _round_trip,
+                # If we're cancelled, the caller kills this worker,
+                # which unblocks the orphaned thread.
+                cancellable=True,
+            )
+        except (EOFError, OSError) as error:
+            raise AnalysisWorkerDiedError(self._process.exitcode) from error
+
+    def kill(self) -> None:
+        self._process.kill()
+        self._connection.close()
+
+
+class AnalysisExecutor:
+    """Simulate protocols in a bounded pool of worker processes.
+
+    At most `max_workers` simulations run at once; further requests wait their turn.
+    Workers are started on demand and reused. Cancelling an `analyze()` call kills
+    the worker that was running it.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        memory_limit_bytes: Optional[int] = None,
+        mp_context: Optional[BaseContext] = None,
+    ) -> None:
+        """Initialize the executor. No processes are started until needed.
+
+        Args:
+            max_workers: The maximum number of simulations to run at once.
+            memory_limit_bytes: If provided, the address space limit of each
+                worker process. A simulation that exceeds it fails.
+            mp_context: The multiprocessing context to create workers with.
+                Defaults to "spawn", so workers don't inherit the server's threads.
+        """
+        assert max_workers > 0, f"max_workers must be above 0 but was {max_workers}"
+        self._memory_limit_bytes = memory_limit_bytes
+        self._context = mp_context or multiprocessing.get_context("spawn")
+        self._semaphore = asyncio.Semaphore(max_workers)
+        self._idle_workers: List[_Worker] = []
+        self._busy_workers: Set[_Worker] = set()
+
+    async def analyze(self, request: AnalysisWorkerRequest) -> AnalysisWorkerResult:
+        """Simulate a protocol in a worker process and return the result.
+
+        Raises:
+            AnalysisWorkerDiedError: The worker process exited mid-simulation.
+            Exception: Whatever the simulation itself raised.
+        """
+        async with self._semaphore:
+            worker = (
+                self._idle_workers.pop()
+                if self._idle_workers
+                else await anyio.to_thread.run_sync(
+                    _Worker, self._context, self._memory_limit_bytes
+                )
+            )
+            self._busy_workers.add(worker)
+            try:
+                succeeded, payload = await worker.simulate(request)
+            except BaseException:
+                # Cancelled, or the worker died. Either way it can't be reused.
+                worker.kill()
+                raise
+            finally:
+                self._busy_workers.discard(worker)
+
+            if not succeeded and isinstance(payload, MemoryError):
+                # Don't reuse a worker that ran out of memory.
+                worker.kill()
+            else:
+                self._idle_workers.append(worker)
+
+        if not succeeded:
+            assert isinstance(payload, BaseException)
+            raise payload
+        assert isinstance(payload, str)
+        return await anyio.to_thread.run_sync(
+            json_to_pydantic, AnalysisWorkerResult, payload
+        )
+
+    def shutdown(self) -> None:
+        """Kill all worker processes, including any that are mid-simulation."""
+        for worker in [*self._idle_workers, *self._busy_workers]:
+            worker.kill()
+        self._idle_workers.clear()
+        self._busy_workers.clear()
+
+
+_analysis_executor_accessor = AppStateAccessor[AnalysisExecutor]("analysis_executor")
+
+
+@contextlib.asynccontextmanager
+async def set_up_analysis_executor(app_state: AppState) -> AsyncGenerator[None, None]:
+    """Set up the server's global `AnalysisExecutor`, if it's enabled in settings.
+
+    When this context manager is exited, all worker processes are killed.
+    """
+    settings = get_settings()
+    if settings.analysis_worker_processes == 0:
+        yield
+        return
+
+    memory_limit_mb = settings.analysis_worker_memory_limit_mb
+    analysis_executor = AnalysisExecutor(
+        max_workers=settings.analysis_worker_processes,
+        memory_limit_bytes=(
+            memory_limit_mb * 1024 * 1024 if memory_limit_mb is not None else None
+        ),
+    )
+    _analysis_executor_accessor.set_on(app_state, analysis_executor)
+    try:
+        yield
+    finally:
+        analysis_executor.shutdown()
+        _analysis_executor_accessor.set_on(app_state, None)
+
+
+def get_analysis_executor(
+    app_state: Annotated[AppState, Depends(get_app_state)]
+) -> Optional[AnalysisExecutor]:
+    """Get the `AnalysisExecutor`, or None if analyses should run in-process."""
+    return _analysis_executor_accessor.get_from(app_state)
@@ -0,0 +1,175 @@
+"""A persistent, content-addressed cache of completed analysis results."""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections import deque
+from logging import getLogger
+from pathlib import Path
+from typing import Deque, List, Optional, Set
+
+import anyio
+from pydantic import BaseModel, ValidationError
+from typing_extensions import Final
+
+from opentrons import __version__ as opentrons_version
+from opentrons.protocol_engine import (
+    Command,
+    ErrorOccurrence,
+    LoadedPipette,
+    LoadedLabware,
+    LoadedModule,
+    Liquid,
+    LiquidClassRecordWithId,
+)
+from opentrons.protocol_engine.types import CommandAnnotation, RunTimeParameter
+from opentrons_shared_data.robot.types import RobotType
+
+from robot_server.persistence.pydantic import json_to_pydantic, pydantic_to_json
+
+_log = getLogger(__name__)
+
+# Completed analyses can be large, so keep enough to cover re-uploads of the
+# protocols that are actually in use without letting the directory grow unbounded.
+DEFAULT_MAX_CACHED_ANALYSES: Final = 20
+
+_FILE_SUFFIX: Final = ".json"
+
+
+class CachedAnalysisResult(BaseModel):
+    """The parts of a completed analysis that come out of simulating the protocol.
+
+    Everything else in a `CompletedAnalysis` is either specific to one analysis
+    resource (like its ID) or derived from these.
+    """
+
+    commands: List[Command]
+    labware: List[LoadedLabware]
+    modules: List[LoadedModule]
+    pipettes: List[LoadedPipette]
+    errors: List[ErrorOccurrence]
+    liquids: List[Liquid]
+    liquidClasses: List[LiquidClassRecordWithId]
+    commandAnnotations: List[CommandAnnotation]
+
+
+class AnalysisResultCache:
+    """A size-limited cache of analysis results, persisted as files in a directory.
+
+    Results are keyed by everything that goes into an analysis: the protocol's
+    content hash, its robot type, its run-time parameter values, and the versions
+    of the software that analyzed it. So if the same protocol files are analyzed
+    with the same parameters again, under any protocol ID, the stored result can
+    be reused instead of re-simulating the protocol.
+
+    When the cache is full, the oldest entries are evicted first.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        analyzer_version: str,
+        max_entries: int = DEFAULT_MAX_CACHED_ANALYSES,
+    ) -> None:
+        """Initialize the cache, picking up any entries already in `directory`.
+
+        Args:
+            directory: Where to store cached results. Must already exist.
+            analyzer_version: The analysis store's analyzer version, which is
+                folded into every key.
+            max_entries: The maximum number of results to keep.
+        """
+        assert max_entries > 0, f"Cache size must be above 0 but was {max_entries}"
+        self._directory = directory
+        self._analyzer_version = analyzer_version
+        self._max_entries = max_entries
+        existing = sorted(
+            directory.glob(f"*{_FILE_SUFFIX}"), key=lambda path: path.stat().st_mtime
+        )
+        self._keys_oldest_first: Deque[str] = deque(path.stem for path in existing)
+        self._keys: Set[str] = set(self._keys_oldest_first)
+        while len(self._keys_oldest_first) > self._max_entries:
+            self._evict_oldest()
+
+    def make_key(
+        self,
+        content_hash: str,
+        robot_type: RobotType,
+        run_time_parameters: List[RunTimeParameter],
+    ) -> str:
+        """Return the cache key for analyzing a protocol with the given parameters.
+
+        Args:
+            content_hash: The protocol's `FileHasher` content hash.
+            robot_type: The robot type the protocol is analyzed for.
+            run_time_parameters: The verified run-time parameters the analysis
+                will use, including their values and any CSV file IDs.
+        """
+        key_source = json.dumps(
+            {
+                "contentHash": content_hash,
+                "robotType": robot_type,
+                "runTimeParameters": [
+                    param.model_dump(mode="json", by_alias=True, exclude_none=True)
+                    for param in run_time_parameters
+                ],
+                "opentronsVersion": opentrons_version,
+                "analyzerVersion": self._analyzer_version,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[CachedAnalysisResult]:
+        """Return the cached result for `key`, or None if there isn't one."""
+        if key not in self._keys:
+            return None
+        path = self._path_for(key)
+        try:
+            serialized = await anyio.Path(path).read_text(encoding="utf-8")
+            return await anyio.to_thread.run_sync(
+                json_to_pydantic, CachedAnalysisResult, serialized
+            )
+        except (OSError, ValidationError):
+            _log.warning(f"Discarding unreadable cached analysis {path}", exc_info=True)
+            self._remove(key)
+            return None
+
+    async def insert(self, key: str, result: CachedAnalysisResult) -> None:
+        """Store a result under `key`, evicting the oldest entry if full.
+
+        If `key` is already cached, nothing changes, not even the entry's age.
+        """
+        if key in self._keys:
+            return
+        while len(self._keys_oldest_first) >= self._max_entries:
+            self._evict_oldest()
+
+        def _write() -> None:
+            path = self._path_for(key)
+            temp_path = path.with_suffix(".tmp")
+            temp_path.write_text(pydantic_to_json(result), encoding="utf-8")
+            os.replace(temp_path, path)
+
+        try:
+            await anyio.to_thread.run_sync(_write)
+        except OSError:
+            _log.warning(f"Failed to cache analysis result {key}", exc_info=True)
+            return
+        self._keys_oldest_first.append(key)
+        self._keys.add(key)
+
+    def _path_for(self, key: str) -> Path:
+        return self._directory / f"{key}{_FILE_SUFFIX}"
+
+    def _evict_oldest(self) -> None:
+        self._remove(self._keys_oldest_first[0])
+
+    def _remove(self, key: str) -> None:
+        self._keys.discard(key)
+        try:
+            self._keys_oldest_first.remove(key)
+        except ValueError:
+            pass
+        self._path_for(key).unlink(missing_ok=True)
@@ -24,6 +24,8 @@ from opentrons.protocol_engine import (
 )
 from opentrons.protocol_engine.protocol_engine import code_in_error_tree
 
+from robot_server.persistence.sql_worker import SQLWorker
+
 from .analysis_models import (
     AnalysisSummary,
     ProtocolAnalysis,
@@ -109,16 +111,23 @@ class AnalysisStore:
     def __init__(
         self,
         sql_engine: sqlalchemy.engine.Engine,
+        sql_worker: SQLWorker,
         completed_store: Optional[CompletedAnalysisStore] = None,
     ) -> None:
         """Initialize the `AnalysisStore`."""
         self._pending_store = _PendingAnalysisStore()
         self._completed_store = completed_store or CompletedAnalysisStore(
             sql_engine=sql_engine,
+            sql_worker=sql_worker,
             memory_cache=MemoryCache(_CACHE_MAX_SIZE, str, CompletedAnalysisResource),
             current_analyzer_version=_CURRENT_ANALYZER_VERSION,
         )
 
+    @property
+    def analyzer_version(self) -> str:
+        """The version string that completed analyses are stored with."""
+        return _CURRENT_ANALYZER_VERSION
+
     def add_pending(
         self,
         protocol_id: str,
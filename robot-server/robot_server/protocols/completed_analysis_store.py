@@ -11,6 +11,7 @@ import anyio
 from opentrons.protocols.parameters.types import PrimitiveAllowedTypes
 
 from robot_server.persistence.database import sqlite_rowid
+from robot_server.persistence.sql_worker import SQLWorker
 from robot_server.persistence.tables import (
     analysis_table,
     analysis_primitive_type_rtp_table,
@@ -118,6 +119,7 @@ class CompletedAnalysisStore:
     """
 
     _sql_engine: sqlalchemy.engine.Engine
+    _sql_worker: SQLWorker
     _current_analyzer_version: str
 
     # Parsing and validating blobs from the database into CompletedAnalysisResources
@@ -140,10 +142,12 @@ class CompletedAnalysisStore:
     def __init__(
         self,
         sql_engine: sqlalchemy.engine.Engine,
+        sql_worker: SQLWorker,
         memory_cache: MemoryCache[str, CompletedAnalysisResource],
         current_analyzer_version: str,
     ) -> None:
         self._sql_engine = sql_engine
+        self._sql_worker = sql_worker
         self._current_analyzer_version = current_analyzer_version
         self._memcache = memory_cache
         self._memcache_lock = asyncio.Lock()
@@ -253,20 +257,8 @@ class CompletedAnalysisStore:
 
     def get_ids_by_protocol(self, protocol_id: str) -> List[str]:
         """Like `get_by_protocol()`, but return only the ID of each analysis."""
-        statement = (
-            sqlalchemy.select(analysis_table.c.id)
-            .where(analysis_table.c.protocol_id == protocol_id)
-            .order_by(sqlite_rowid)
-        )
         with self._sql_engine.begin() as transaction:
-            results = transaction.execute(statement).all()
-
-        result_ids: List[str] = []
-        for row in results:
-            assert isinstance(row.id, str)
-            result_ids.append(row.id)
-
-        return result_ids
+            return _get_ids_by_protocol(transaction, protocol_id)
 
     def get_primitive_rtps_by_analysis_id(
         self, analysis_id: str
@@ -319,40 +311,44 @@ class CompletedAnalysisStore:
         Removes the oldest analyses in store if the number of analyses exceed
         the max allowed, and then adds the new analysis.
         """
-        analyses_ids = self.get_ids_by_protocol(completed_analysis_resource.protocol_id)
-
-        # Delete all analyses exceeding max number allowed,
-        # plus an additional one to create room for the new one.
-        # Most existing databases will not have multiple extra analyses per protocol
-        # but there would be some internally that added multiple analyses before
-        # we started capping the number of analyses.
-        analyses_to_delete = analyses_ids[: -MAX_ANALYSES_TO_STORE + 1]
-        for analysis_id in analyses_to_delete:
-            self._memcache.remove(analysis_id)
-
-        # Delete the RTP table rows that reference the analyses being deleted
-        delete_primitive_rtp_statement = (
-            analysis_primitive_type_rtp_table.delete().where(
-                analysis_primitive_type_rtp_table.c.analysis_id.in_(analyses_to_delete)
-            )
-        )
-        delete_csv_rtp_statement = analysis_csv_rtp_table.delete().where(
-            analysis_csv_rtp_table.c.analysis_id.in_(analyses_to_delete)
-        )
-        delete_statement = analysis_table.delete().where(
-            analysis_table.c.id.in_(analyses_to_delete)
-        )
-
         insert_statement = analysis_table.insert().values(
             await completed_analysis_resource.to_sql_values()
         )
         insert_rtp_statement = analysis_primitive_type_rtp_table.insert()
         insert_csv_rtp_statement = analysis_csv_rtp_table.insert()
 
-        with self._sql_engine.begin() as transaction:
-            transaction.execute(delete_primitive_rtp_statement)
-            transaction.execute(delete_csv_rtp_statement)
-            transaction.execute(delete_statement)
+        def make_room_and_insert(
+            transaction: sqlalchemy.engine.Connection,
+        ) -> List[str]:
+            analyses_ids = _get_ids_by_protocol(
+                transaction, completed_analysis_resource.protocol_id
+            )
+
+            # Delete all analyses exceeding max number allowed,
+            # plus an additional one to create room for the new one.
+            # Most existing databases will not have multiple extra analyses per protocol
+            # but there would be some internally that added multiple analyses before
+            # we started capping the number of analyses.
+            analyses_to_delete = analyses_ids[: -MAX_ANALYSES_TO_STORE + 1]
+
+            # Delete the RTP table rows that reference the analyses being deleted
+            transaction.execute(
+                analysis_primitive_type_rtp_table.delete().where(
+                    analysis_primitive_type_rtp_table.c.analysis_id.in_(
+                        analyses_to_delete
+                    )
+                )
+            )
+            transaction.execute(
+                analysis_csv_rtp_table.delete().where(
+                    analysis_csv_rtp_table.c.analysis_id.in_(analyses_to_delete)
+                )
+            )
+            transaction.execute(
+                analysis_table.delete().where(
+                    analysis_table.c.id.in_(analyses_to_delete)
+                )
+            )
             transaction.execute(insert_statement)
             for param in primitive_rtp_resources:
                 transaction.execute(
@@ -364,6 +360,28 @@ class CompletedAnalysisStore:
                     insert_csv_rtp_statement,
                     csv_param.to_sql_values(),
                 )
+            return analyses_to_delete
+
+        for analysis_id in await self._sql_worker.write(make_room_and_insert):
+            self._memcache.remove(analysis_id)
         self._memcache.insert(
             completed_analysis_resource.id, completed_analysis_resource
         )
+
+
+def _get_ids_by_protocol(
+    transaction: sqlalchemy.engine.Connection, protocol_id: str
+) -> List[str]:
+    statement = (
+        sqlalchemy.select(analysis_table.c.id)
+        .where(analysis_table.c.protocol_id == protocol_id)
+        .order_by(sqlite_rowid)
+    )
+    results = transaction.execute(statement).all()
+
+    result_ids: List[str] = []
+    for row in results:
+        assert isinstance(row.id, str)
+        result_ids.append(row.id)
+
+    return result_ids
@@ -2,9 +2,12 @@
 
 
 from asyncio import Lock as AsyncLock
+from functools import partial
 from pathlib import Path
+from typing import Optional
 from typing_extensions import Annotated
 
+import anyio
 from anyio import Path as AsyncPath
 from fastapi import Depends
 from robot_server.protocols.protocol_models import ProtocolKind
@@ -21,9 +24,15 @@ from robot_server.service.task_runner import TaskRunner, get_task_runner
 from robot_server.deletion_planner import ProtocolDeletionPlanner
 from robot_server.persistence.fastapi_dependencies import (
     get_sql_engine,
+    get_sql_worker,
     get_active_persistence_directory,
 )
-from robot_server.persistence.file_and_directory_names import PROTOCOLS_DIRECTORY
+from robot_server.persistence.file_and_directory_names import (
+    ANALYSIS_CACHE_DIRECTORY,
+    PROTOCOL_SUMMARIES_DIRECTORY,
+    PROTOCOLS_DIRECTORY,
+)
+from robot_server.persistence.sql_worker import SQLWorker
 from robot_server.settings import get_settings
 from .analyses_manager import AnalysesManager
 
@@ -32,6 +41,8 @@ from .protocol_store import (
     ProtocolStore,
 )
 from .analysis_store import AnalysisStore
+from .analysis_result_cache import AnalysisResultCache
+from .analysis_executor import AnalysisExecutor, get_analysis_executor
 
 
 _protocol_store_init_lock = AsyncLock()
@@ -39,6 +50,11 @@ _protocol_store_accessor = AppStateAccessor[ProtocolStore]("protocol_store")
 
 _analysis_store_accessor = AppStateAccessor[AnalysisStore]("analysis_store")
 
+_analysis_result_cache_init_lock = AsyncLock()
+_analysis_result_cache_accessor = AppStateAccessor[AnalysisResultCache](
+    "analysis_result_cache"
+)
+
 _analyses_manager_accessor = AppStateAccessor[AnalysesManager]("analyses_manager")
 _protocol_directory_init_lock = AsyncLock()
 _protocol_directory_accessor = AppStateAccessor[Path]("protocol_directory")
@@ -79,15 +95,19 @@ async def get_protocol_store(
     sql_engine: Annotated[SQLEngine, Depends(get_sql_engine)],
     protocol_directory: Annotated[Path, Depends(get_protocol_directory)],
     protocol_reader: Annotated[ProtocolReader, Depends(get_protocol_reader)],
+    persistence_directory: Annotated[Path, Depends(get_active_persistence_directory)],
 ) -> ProtocolStore:
     """Get a singleton ProtocolStore to keep track of created protocols."""
     async with _protocol_store_init_lock:
         protocol_store = _protocol_store_accessor.get_from(app_state)
         if protocol_store is None:
+            summaries_directory = persistence_directory / PROTOCOL_SUMMARIES_DIRECTORY
+            await AsyncPath(summaries_directory).mkdir(exist_ok=True)
             protocol_store = await ProtocolStore.rehydrate(
                 sql_engine=sql_engine,
                 protocols_directory=protocol_directory,
                 protocol_reader=protocol_reader,
+                summaries_directory=summaries_directory,
             )
             _protocol_store_accessor.set_on(app_state, protocol_store)
 
@@ -97,28 +117,61 @@ async def get_protocol_store(
 async def get_analysis_store(
     app_state: Annotated[AppState, Depends(get_app_state)],
     sql_engine: Annotated[SQLEngine, Depends(get_sql_engine)],
+    sql_worker: Annotated[SQLWorker, Depends(get_sql_worker)],
 ) -> AnalysisStore:
     """Get a singleton AnalysisStore to keep track of created analyses."""
     analysis_store = _analysis_store_accessor.get_from(app_state)
 
     if analysis_store is None:
-        analysis_store = AnalysisStore(sql_engine=sql_engine)
+        analysis_store = AnalysisStore(sql_engine=sql_engine, sql_worker=sql_worker)
         _analysis_store_accessor.set_on(app_state, analysis_store)
 
     return analysis_store
 
 
+async def get_analysis_result_cache(
+    app_state: Annotated[AppState, Depends(get_app_state)],
+    persistence_directory: Annotated[Path, Depends(get_active_persistence_directory)],
+    analysis_store: Annotated[AnalysisStore, Depends(get_analysis_store)],
+) -> AnalysisResultCache:
+    """Get a singleton AnalysisResultCache to reuse results of identical analyses."""
+    async with _analysis_result_cache_init_lock:
+        analysis_result_cache = _analysis_result_cache_accessor.get_from(app_state)
+        if analysis_result_cache is None:
+            cache_directory = persistence_directory / ANALYSIS_CACHE_DIRECTORY
+            await AsyncPath(cache_directory).mkdir(exist_ok=True)
+            analysis_result_cache = await anyio.to_thread.run_sync(
+                partial(
+                    AnalysisResultCache,
+                    directory=cache_directory,
+                    analyzer_version=analysis_store.analyzer_version,
+                )
+            )
+            _analysis_result_cache_accessor.set_on(app_state, analysis_result_cache)
+
+        return analysis_result_cache
+
+
 async def get_analyses_manager(
     app_state: Annotated[AppState, Depends(get_app_state)],
     analysis_store: Annotated[AnalysisStore, Depends(get_analysis_store)],
     task_runner: Annotated[TaskRunner, Depends(get_task_runner)],
+    analysis_result_cache: Annotated[
+        AnalysisResultCache, Depends(get_analysis_result_cache)
+    ],
+    analysis_executor: Annotated[
+        Optional[AnalysisExecutor], Depends(get_analysis_executor)
+    ],
 ) -> AnalysesManager:
     """Get a singleton AnalysesManager to keep track of analyzers."""
     analyses_manager = _analyses_manager_accessor.get_from(app_state)
 
     if analyses_manager is None:
         analyses_manager = AnalysesManager(
-            analysis_store=analysis_store, task_runner=task_runner
+            analysis_store=analysis_store,
+            task_runner=task_runner,
+            analysis_result_cache=analysis_result_cache,
+            analysis_executor=analysis_executor,
         )
         _analyses_manager_accessor.set_on(app_state, analyses_manager)
 
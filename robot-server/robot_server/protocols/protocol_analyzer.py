@@ -1,11 +1,9 @@
 """Protocol analysis module."""
 import logging
-import asyncio
 from typing import Optional, List
 
 from opentrons_shared_data.robot.types import RobotType
 
-import opentrons.protocol_runner.create_simulating_orchestrator as simulating_runner
 from opentrons.protocol_engine.errors import ErrorOccurrence
 from opentrons.util.performance_helpers import TrackingFunctions
 from opentrons.protocol_engine.types import (
@@ -14,16 +12,23 @@ from opentrons.protocol_engine.types import (
     CSVRuntimeParamPaths,
 )
 import opentrons.util.helpers as datetime_helper
-from opentrons.protocol_runner import (
-    RunOrchestrator,
-)
-from opentrons.protocol_runner.run_orchestrator import ParseMode
+from opentrons.protocol_runner import RunTimeParameterLoader
+from opentrons.protocols.parse import PythonParseMode
 
 
 import robot_server.errors.error_mappers as em
 
 from robot_server.protocols.protocol_store import ProtocolResource
 from robot_server.protocols.analysis_store import AnalysisStore
+from robot_server.protocols.analysis_result_cache import (
+    AnalysisResultCache,
+    CachedAnalysisResult,
+)
+from robot_server.protocols.analysis_executor import (
+    AnalysisExecutor,
+    AnalysisWorkerRequest,
+    simulate_analysis,
+)
 
 log = logging.getLogger(__name__)
 
@@ -35,11 +40,20 @@ class ProtocolAnalyzer:
         self,
         analysis_store: AnalysisStore,
         protocol_resource: ProtocolResource,
+        analysis_result_cache: Optional[AnalysisResultCache] = None,
+        analysis_executor: Optional[AnalysisExecutor] = None,
+        run_time_parameter_loader: Optional[RunTimeParameterLoader] = None,
     ) -> None:
         """Initialize the analyzer and its dependencies."""
         self._analysis_store = analysis_store
         self._protocol_resource = protocol_resource
-        self._orchestrator: Optional[RunOrchestrator] = None
+        self._analysis_result_cache = analysis_result_cache
+        self._analysis_executor = analysis_executor
+        self._run_time_parameter_loader = (
+            run_time_parameter_loader or RunTimeParameterLoader()
+        )
+        self._run_time_param_values: Optional[PrimitiveRunTimeParamValuesType] = None
+        self._run_time_param_paths: Optional[CSVRuntimeParamPaths] = None
 
     @property
     def protocol_resource(self) -> ProtocolResource:
@@ -48,25 +62,22 @@ class ProtocolAnalyzer:
 
     def get_verified_run_time_parameters(self) -> List[RunTimeParameter]:
         """Get the validated RTPs with values set by the client."""
-        assert self._orchestrator is not None
-        return self._orchestrator.get_run_time_parameters()
+        return self._run_time_parameter_loader.run_time_parameters
 
-    async def load_orchestrator(
+    async def load_run_time_parameters(
         self,
         run_time_param_values: Optional[PrimitiveRunTimeParamValuesType],
         run_time_param_paths: Optional[CSVRuntimeParamPaths],
     ) -> None:
-        """Load runner with the protocol and run time parameter values.
+        """Read the protocol and validate the run time parameter values to analyze it with.
 
-        Returns: The RunOrchestrator instance.
+        This doesn't set up a simulation. `analyze()` does that, if it needs to.
         """
-        self._orchestrator = await simulating_runner.create_simulating_orchestrator(
-            robot_type=self._protocol_resource.source.robot_type,
-            protocol_config=self._protocol_resource.source.config,
-        )
-        await self._orchestrator.load(
+        self._run_time_param_values = run_time_param_values
+        self._run_time_param_paths = run_time_param_paths
+        await self._run_time_parameter_loader.load(
             protocol_source=self._protocol_resource.source,
-            parse_mode=ParseMode.NORMAL,
+            python_parse_mode=PythonParseMode.NORMAL,
             run_time_param_values=run_time_param_values,
             run_time_param_paths=run_time_param_paths,
         )
@@ -78,37 +89,75 @@ class ProtocolAnalyzer:
     ) -> None:
         """Analyze a given protocol, storing the analysis when complete.
 
-        This method should only be called once the run orchestrator is loaded.
+        This method should only be called once the run time parameters are loaded.
         """
         assert self._protocol_resource is not None
-        assert self._orchestrator is not None
-        try:
-            result = await self._orchestrator.run(
-                deck_configuration=[],
+        run_time_parameters = self.get_verified_run_time_parameters()
+
+        cache_key: Optional[str] = None
+        if self._analysis_result_cache is not None:
+            cache_key = self._analysis_result_cache.make_key(
+                content_hash=self._protocol_resource.source.content_hash,
+                robot_type=self._protocol_resource.source.robot_type,
+                run_time_parameters=run_time_parameters,
             )
+            cached_result = await self._analysis_result_cache.get(cache_key)
+            if cached_result is not None:
+                log.info(f'Completed analysis "{analysis_id}" from cached result.')
+                await self._update_to_completed_analysis(
+                    analysis_id=analysis_id,
+                    run_time_parameters=run_time_parameters,
+                    result=cached_result,
+                )
+                return
+
+        request = AnalysisWorkerRequest(
+            protocol_source=self._protocol_resource.source,
+            run_time_param_values=self._run_time_param_values,
+            run_time_param_paths=self._run_time_param_paths,
+        )
+        try:
+            if self._analysis_executor is not None:
+                simulation = await self._analysis_executor.analyze(request)
+            else:
+                simulation = await simulate_analysis(request)
         except BaseException as error:
             await self.update_to_failed_analysis(
                 analysis_id=analysis_id,
                 protocol_robot_type=self._protocol_resource.source.robot_type,
                 error=error,
-                run_time_parameters=self._orchestrator.get_run_time_parameters(),
+                run_time_parameters=run_time_parameters,
             )
             return
 
         log.info(f'Completed analysis "{analysis_id}".')
 
+        await self._update_to_completed_analysis(
+            analysis_id=analysis_id,
+            run_time_parameters=simulation.runTimeParameters,
+            result=simulation.result,
+        )
+        if self._analysis_result_cache is not None and cache_key is not None:
+            await self._analysis_result_cache.insert(cache_key, simulation.result)
+
+    async def _update_to_completed_analysis(
+        self,
+        analysis_id: str,
+        run_time_parameters: List[RunTimeParameter],
+        result: CachedAnalysisResult,
+    ) -> None:
         await self._analysis_store.update(
             analysis_id=analysis_id,
             robot_type=self._protocol_resource.source.robot_type,
-            run_time_parameters=result.parameters,
+            run_time_parameters=run_time_parameters,
             commands=result.commands,
-            labware=result.state_summary.labware,
-            modules=result.state_summary.modules,
-            pipettes=result.state_summary.pipettes,
-            errors=result.state_summary.errors,
-            liquids=result.state_summary.liquids,
-            liquidClasses=result.state_summary.liquidClasses,
-            command_annotations=result.command_annotations,
+            labware=result.labware,
+            modules=result.modules,
+            pipettes=result.pipettes,
+            errors=result.errors,
+            liquids=result.liquids,
+            liquidClasses=result.liquidClasses,
+            command_annotations=result.commandAnnotations,
         )
 
     async def update_to_failed_analysis(
@@ -142,30 +191,17 @@ class ProtocolAnalyzer:
             command_annotations=[],
         )
 
-    def __del__(self) -> None:
-        """Stop the simulating run orchestrator.
-
-        Once the analyzer is no longer in use- either because analysis completed
-        or was not required, stop the orchestrator so that all its background tasks
-        are stopped timely and do not block server shutdown.
-        """
-        if self._orchestrator is not None:
-            if self._orchestrator.get_is_okay_to_clear():
-                asyncio.run_coroutine_threadsafe(
-                    self._orchestrator.stop(), asyncio.get_running_loop()
-                )
-            else:
-                log.warning(
-                    "Analyzer is no longer in use but orchestrator is busy. "
-                    "Cannot stop the orchestrator currently."
-                )
-
 
 def create_protocol_analyzer(
     analysis_store: AnalysisStore,
     protocol_resource: ProtocolResource,
+    analysis_result_cache: Optional[AnalysisResultCache] = None,
+    analysis_executor: Optional[AnalysisExecutor] = None,
 ) -> ProtocolAnalyzer:
     """Protocol analyzer factory function."""
     return ProtocolAnalyzer(
-        analysis_store=analysis_store, protocol_resource=protocol_resource
+        analysis_store=analysis_store,
+        protocol_resource=protocol_resource,
+        analysis_result_cache=analysis_result_cache,
+        analysis_executor=analysis_executor,
     )
@@ -0,0 +1,187 @@
+"""Persisted summaries of stored protocols' `ProtocolSource`s.
+
+Computing a `ProtocolSource` means reading and parsing every file of a protocol.
+Doing that for every stored protocol when the server boots is slow, so when a
+protocol is added, we also save a small summary that a `ProtocolSource` can be
+rebuilt from without touching the protocol's files.
+
+Summaries are only a cache. If one is missing or was written by a different
+software version, the protocol's `ProtocolSource` is recomputed from its files
+and the summary is rewritten.
+"""
+from __future__ import annotations
+
+import os
+from logging import getLogger
+from pathlib import Path
+from typing import Any, Dict, List, Literal, Optional, Union
+
+from pydantic import BaseModel, Field, ValidationError
+from typing_extensions import Final
+
+from opentrons import __version__ as opentrons_version
+from opentrons.protocol_reader import (
+    JsonProtocolConfig,
+    ProtocolFileRole,
+    ProtocolSource,
+    ProtocolSourceFile,
+    PythonProtocolConfig,
+)
+from opentrons.protocols.api_support.types import APIVersion
+from opentrons_shared_data.robot.types import RobotType
+
+
+_log = getLogger(__name__)
+
+_FILE_SUFFIX: Final = ".json"
+
+
+class _SummaryFile(BaseModel):
+    name: str
+    role: ProtocolFileRole
+
+
+class _JsonConfigSummary(BaseModel):
+    protocolType: Literal["json"] = "json"
+    schemaVersion: int
+
+
+class _PythonConfigSummary(BaseModel):
+    protocolType: Literal["python"] = "python"
+    apiVersion: str
+
+
+class ProtocolSourceSummary(BaseModel):
+    """Everything needed to rebuild a protocol's `ProtocolSource`.
+
+    File paths are stored relative to `directory`.
+    """
+
+    opentronsVersion: str
+    directory: str
+    contentHash: str
+    mainFile: str
+    files: List[_SummaryFile]
+    metadata: Dict[str, Any]
+    robotType: RobotType
+    config: Union[_JsonConfigSummary, _PythonConfigSummary] = Field(
+        ..., discriminator="protocolType"
+    )
+
+
+def summarize(source: ProtocolSource) -> Optional[ProtocolSourceSummary]:
+    """Summarize a `ProtocolSource`.
+
+    Returns:
+        The summary, or None if `source` can't be rebuilt exactly from a summary.
+        For example, if its metadata isn't plain JSON.
+    """
+    if source.directory is None or any(
+        f.path.parent != source.directory for f in source.files
+    ):
+        return None
+
+    config: Union[_JsonConfigSummary, _PythonConfigSummary]
+    if isinstance(source.config, JsonProtocolConfig):
+        config = _JsonConfigSummary(schemaVersion=source.config.schema_version)
+    else:
+        config = _PythonConfigSummary(apiVersion=str(source.config.api_version))
+
+    try:
+        summary = ProtocolSourceSummary(
+            opentronsVersion=opentrons_version,
+            directory=str(source.directory),
+            contentHash=source.content_hash,
+            mainFile=source.main_file.name,
+            files=[_SummaryFile(name=f.path.name, role=f.role) for f in source.files],
+            metadata=source.metadata,
+            robotType=source.robot_type,
+            config=config,
+        )
+        round_tripped = to_source(
+            ProtocolSourceSummary.model_validate_json(summary.model_dump_json())
+        )
+    except (ValueError, TypeError):
+        return None
+
+    return summary if round_tripped == source else None
+
+
+def to_source(summary: ProtocolSourceSummary) -> ProtocolSource:
+    """Rebuild a summarized `ProtocolSource`."""
+    directory = Path(summary.directory)
+    if isinstance(summary.config, _JsonConfigSummary):
+        config: Union[JsonProtocolConfig, PythonProtocolConfig] = JsonProtocolConfig(
+            schema_version=summary.config.schemaVersion
+        )
+    else:
+        config = PythonProtocolConfig(
+            api_version=APIVersion.from_string(summary.config.apiVersion)
+        )
+    return ProtocolSource(
+        directory=directory,
+        main_file=directory / summary.mainFile,
+        content_hash=summary.contentHash,
+        files=[
+            ProtocolSourceFile(path=directory / f.name, role=f.role)
+            for f in summary.files
+        ],
+        metadata=summary.metadata,
+        robot_type=summary.robotType,
+        config=config,
+    )
+
+
+class ProtocolSourceSummaryStore:
+    """Summaries persisted as one file per protocol ID in a directory."""
+
+    def __init__(self, directory: Path) -> None:
+        """Initialize the store.
+
+        Args:
+            directory: Where to store summaries. Must already exist.
+        """
+        self._directory = directory
+
+    def load_all(self) -> Dict[str, ProtocolSourceSummary]:
+        """Return every usable summary, keyed by protocol ID.
+
+        Summaries that can't be read, or that were written by a different software
+        version, are deleted and left out.
+        """
+        summaries: Dict[str, ProtocolSourceSummary] = {}
+        for path in self._directory.glob(f"*{_FILE_SUFFIX}"):
+            try:
+                summary = ProtocolSourceSummary.model_validate_json(path.read_bytes())
+            except (OSError, ValidationError):
+                _log.warning(f"Discarding unreadable protocol summary {path}")
+                path.unlink(missing_ok=True)
+                continue
+            if summary.opentronsVersion != opentrons_version:
+                path.unlink(missing_ok=True)
+                continue
+            summaries[path.stem] = summary
+        return summaries
+
+    def save(self, protocol_id: str, summary: ProtocolSourceSummary) -> bool:
+        """Persist a protocol's summary, replacing any existing one.
+
+        Returns:
+            Whether the summary was saved.
+        """
+        path = self._path_for(protocol_id)
+        temp_path = path.with_suffix(".tmp")
+        try:
+            temp_path.write_text(summary.model_dump_json(), encoding="utf-8")
+            os.replace(temp_path, path)
+        except OSError:
+            _log.warning(f"Failed to save protocol summary {path}", exc_info=True)
+            return False
+        return True
+
+    def remove(self, protocol_id: str) -> None:
+        """Delete a protocol's summary, if it has one."""
+        self._path_for(protocol_id).unlink(missing_ok=True)
+
+    def _path_for(self, protocol_id: str) -> Path:
+        return self._directory / f"{protocol_id}{_FILE_SUFFIX}"
@@ -9,6 +9,7 @@ from logging import getLogger
 from pathlib import Path
 from typing import Dict, List, Optional, Set
 
+import anyio
 from anyio import Path as AsyncPath, create_task_group
 import sqlalchemy
 
@@ -28,10 +29,19 @@ from robot_server.persistence.tables import (
     ProtocolKindSQLEnum,
 )
 from robot_server.protocols.protocol_models import ProtocolKind
+from robot_server.protocols.protocol_source_summaries import (
+    ProtocolSourceSummary,
+    ProtocolSourceSummaryStore,
+    summarize,
+    to_source,
+)
 
 
 _CACHE_ENTRIES = 32
 
+# How many `ProtocolSource`s rebuilt from summaries to keep in memory.
+_SOURCE_CACHE_ENTRIES = 32
+
 
 _log = getLogger(__name__)
 
@@ -98,6 +108,8 @@ class ProtocolStore:
         self,
         *,
         _sql_engine: sqlalchemy.engine.Engine,
+        _summary_store: Optional[ProtocolSourceSummaryStore],
+        _summaries_by_id: Dict[str, ProtocolSourceSummary],
         _sources_by_id: Dict[str, ProtocolSource],
     ) -> None:
         """Do not call directly.
@@ -105,12 +117,17 @@ class ProtocolStore:
         Use `create_empty()` or `rehydrate()` instead.
         """
         self._sql_engine = _sql_engine
+        self._summary_store = _summary_store
+        # Protocols whose sources are rebuilt from summaries when they're needed.
+        self._summaries_by_id = _summaries_by_id
+        # Protocols whose sources couldn't be summarized, so are kept in memory.
         self._sources_by_id = _sources_by_id
 
     @classmethod
     def create_empty(
         cls,
         sql_engine: sqlalchemy.engine.Engine,
+        summaries_directory: Optional[Path] = None,
     ) -> ProtocolStore:
         """Return a new, empty ProtocolStore.
 
@@ -121,8 +138,19 @@ class ProtocolStore:
                 see `add_tables_to_db()`.
                 This should have no protocol data currently stored.
                 If there is data, use `rehydrate()` instead.
+            summaries_directory: Where to persist summaries of protocols' sources,
+                or None to keep every `ProtocolSource` in memory instead.
         """
-        return cls(_sql_engine=sql_engine, _sources_by_id={})
+        return cls(
+            _sql_engine=sql_engine,
+            _summary_store=(
+                ProtocolSourceSummaryStore(summaries_directory)
+                if summaries_directory is not None
+                else None
+            ),
+            _summaries_by_id={},
+            _sources_by_id={},
+        )
 
     @classmethod
     async def rehydrate(
@@ -130,6 +158,7 @@ class ProtocolStore:
         sql_engine: sqlalchemy.engine.Engine,
         protocols_directory: Path,
         protocol_reader: ProtocolReader,
+        summaries_directory: Optional[Path] = None,
     ) -> ProtocolStore:
         """Return a new ProtocolStore, picking up where a former one left off.
 
@@ -148,6 +177,11 @@ class ProtocolStore:
                 named after its protocol ID.
             protocol_reader: An interface to compute `ProtocolSource`s from protocol
                 files while rehydrating.
+            summaries_directory: Where summaries of protocols' sources are persisted,
+                or None to keep every `ProtocolSource` in memory instead.
+                Protocols with a usable summary here aren't read while rehydrating.
+                Their `ProtocolSource`s are rebuilt from their summaries when
+                they're first needed.
         """
         # The SQL database is the canonical source of which protocols
         # have been added successfully.
@@ -155,16 +189,46 @@ class ProtocolStore:
             r.protocol_id for r in cls._sql_get_all_from_engine(sql_engine=sql_engine)
         )
 
-        sources_by_id = await _compute_protocol_sources(
+        await _check_protocol_subdirectories(
             expected_protocol_ids=expected_ids,
             protocols_directory=AsyncPath(protocols_directory),
+        )
+
+        summary_store = (
+            ProtocolSourceSummaryStore(summaries_directory)
+            if summaries_directory is not None
+            else None
+        )
+        summaries_by_id = (
+            await anyio.to_thread.run_sync(summary_store.load_all)
+            if summary_store is not None
+            else {}
+        )
+        for protocol_id, summary in list(summaries_by_id.items()):
+            # Recompute summaries that point somewhere else, like if the
+            # persistence directory has moved, and drop leftover ones.
+            if protocol_id not in expected_ids or Path(summary.directory) != Path(
+                protocols_directory / protocol_id
+            ):
+                assert summary_store is not None
+                summary_store.remove(protocol_id)
+                del summaries_by_id[protocol_id]
+
+        computed_sources = await _compute_protocol_sources(
+            protocol_ids=expected_ids - summaries_by_id.keys(),
+            protocols_directory=AsyncPath(protocols_directory),
             protocol_reader=protocol_reader,
         )
 
-        return ProtocolStore(
+        subject = ProtocolStore(
             _sql_engine=sql_engine,
-            _sources_by_id=sources_by_id,
+            _summary_store=summary_store,
+            _summaries_by_id=summaries_by_id,
+            _sources_by_id={},
         )
+        for protocol_id, source in computed_sources.items():
+            subject._add_source(protocol_id, source)
+        return subject
 
     def insert(self, resource: ProtocolResource) -> None:
         """Insert a protocol resource into the store.
@@ -179,7 +243,7 @@ class ProtocolStore:
                 protocol_kind=_http_protocol_kind_to_sql(resource.protocol_kind),
             )
         )
-        self._sources_by_id[resource.protocol_id] = resource.source
+        self._add_source(resource.protocol_id, resource.source)
         self._clear_caches()
 
     @lru_cache(maxsize=_CACHE_ENTRIES)
@@ -195,7 +259,7 @@ class ProtocolStore:
             created_at=sql_resource.created_at,
             protocol_key=sql_resource.protocol_key,
             protocol_kind=_sql_protocol_kind_to_http(sql_resource.protocol_kind),
-            source=self._sources_by_id[sql_resource.protocol_id],
+            source=self._get_source(sql_resource.protocol_id),
         )
 
     @lru_cache(maxsize=_CACHE_ENTRIES)
@@ -211,7 +275,7 @@ class ProtocolStore:
                 created_at=r.created_at,
                 protocol_key=r.protocol_key,
                 protocol_kind=_sql_protocol_kind_to_http(r.protocol_kind),
-                source=self._sources_by_id[r.protocol_id],
+                source=self._get_source(r.protocol_id),
             )
             for r in all_sql_resources
         ]
@@ -226,9 +290,9 @@ class ProtocolStore:
 
     def get_id_by_hash(self, hash: str) -> Optional[str]:
         """Get ID of protocol corresponding to the provided hash."""
-        for p in self.get_all():
-            if p.source.content_hash == hash:
-                return p.protocol_id
+        for protocol_id in self.get_all_ids():
+            if self._get_content_hash(protocol_id) == hash:
+                return protocol_id
         return None
 
     @lru_cache(maxsize=_CACHE_ENTRIES)
@@ -260,7 +324,11 @@ class ProtocolStore:
         """
         self._sql_remove(protocol_id=protocol_id)
 
-        deleted_source = self._sources_by_id.pop(protocol_id)
+        deleted_source = self._get_source(protocol_id)
+        self._sources_by_id.pop(protocol_id, None)
+        if self._summaries_by_id.pop(protocol_id, None) is not None:
+            assert self._summary_store is not None
+            self._summary_store.remove(protocol_id)
         protocol_dir = deleted_source.directory
 
         for source_file in deleted_source.files:
@@ -441,11 +509,68 @@ class ProtocolStore:
         if result.rowcount < 1:
             raise ProtocolNotFoundError(protocol_id=protocol_id)
 
+    def _add_source(self, protocol_id: str, source: ProtocolSource) -> None:
+        summary = summarize(source) if self._summary_store is not None else None
+        if (
+            summary is not None
+            and self._summary_store is not None
+            and self._summary_store.save(protocol_id, summary)
+        ):
+            self._summaries_by_id[protocol_id] = summary
+        else:
+            self._sources_by_id[protocol_id] = source
+
+    def _get_source(self, protocol_id: str) -> ProtocolSource:
+        try:
+            return self._sources_by_id[protocol_id]
+        except KeyError:
+            return self._get_summarized_source(protocol_id)
+
+    @lru_cache(maxsize=_SOURCE_CACHE_ENTRIES)
+    def _get_summarized_source(self, protocol_id: str) -> ProtocolSource:
+        return to_source(self._summaries_by_id[protocol_id])
+
+    def _get_content_hash(self, protocol_id: str) -> str:
+        try:
+            return self._summaries_by_id[protocol_id].contentHash
+        except KeyError:
+            return self._sources_by_id[protocol_id].content_hash
+
     def _clear_caches(self) -> None:
         self.get.cache_clear()
         self.get_all_ids.cache_clear()
         self.get_all.cache_clear()
         self.has.cache_clear()
+        self._get_summarized_source.cache_clear()
+
+
+async def _check_protocol_subdirectories(
+    expected_protocol_ids: Set[str],
+    protocols_directory: AsyncPath,
+) -> None:
+    """Check that there's a subdirectory for every expected protocol.
+
+    Raises:
+        SubdirectoryMissingError: A protocol's subdirectory is missing.
+    """
+    directory_members = [m async for m in protocols_directory.iterdir()]
+    directory_member_names = set(m.name for m in directory_members)
+    extra_members = directory_member_names - expected_protocol_ids
+    missing_members = expected_protocol_ids - directory_member_names
+
+    if extra_members:
+        # Extra members may be left over from prior interrupted writes
+        # and other kinds of failed insertions.
+        _log.warning(
+            f"Unexpected files or directories inside protocol storage directory:"
+            f" {extra_members}."
+            f" Ignoring them."
+        )
+
+    if missing_members:
+        raise SubdirectoryMissingError(
+            f"Missing subdirectories for protocols: {missing_members}"
+        )
 
 
 # TODO(mm, 2022-04-18):
@@ -456,7 +581,7 @@ class ProtocolStore:
 # * ProtocolStore.get(id) should continue to raise an exception if it failed to compute
 #   that protocol's ProtocolSource.
 async def _compute_protocol_sources(
-    expected_protocol_ids: Set[str],
+    protocol_ids: Set[str],
     protocols_directory: AsyncPath,
     protocol_reader: ProtocolReader,
 ) -> Dict[str, ProtocolSource]:
@@ -465,13 +590,14 @@ async def _compute_protocol_sources(
     We don't store these `ProtocolSource` objects in the SQL database because
     they're big, deep, complex, and unstable, so migrations and compatibility
     would be painful. Instead, we compute them based on the stored files,
-    and keep them in memory.
+    and keep them in memory or summarize them in a separate cache.
 
     Params:
-        expected_protocol_ids: The ID of every protocol for which to compute a
+        protocol_ids: The ID of every protocol for which to compute a
             `ProtocolSource`.
         protocols_directory: A directory containing one subdirectory per protocol
             named by protocol ID. Scanned for files to pass to `protocol_reader`.
+            See `_check_protocol_subdirectories()`.
         protocol_reader: An interface to use to compute `ProtocolSource`s.
 
     Returns:
@@ -484,25 +610,6 @@ async def _compute_protocol_sources(
     """
     sources_by_id: Dict[str, ProtocolSource] = {}
 
-    directory_members = [m async for m in protocols_directory.iterdir()]
-    directory_member_names = set(m.name for m in directory_members)
-    extra_members = directory_member_names - expected_protocol_ids
-    missing_members = expected_protocol_ids - directory_member_names
-
-    if extra_members:
-        # Extra members may be left over from prior interrupted writes
-        # and other kinds of failed insertions.
-        _log.warning(
-            f"Unexpected files or directories inside protocol storage directory:"
-            f" {extra_members}."
-            f" Ignoring them."
-        )
-
-    if missing_members:
-        raise SubdirectoryMissingError(
-            f"Missing subdirectories for protocols: {missing_members}"
-        )
-
     async def compute_source(
         protocol_id: str, protocol_subdirectory: AsyncPath
     ) -> None:
@@ -527,11 +634,11 @@ async def _compute_protocol_sources(
         # Use a TaskGroup instead of asyncio.gather() so,
         # if any task raises an unexpected exception,
         # it cancels every other task and raises an exception to signal the bug.
-        for protocol_id in expected_protocol_ids:
+        for protocol_id in protocol_ids:
             protocol_subdirectory = protocols_directory / protocol_id
             task_group.start_soon(compute_source, protocol_id, protocol_subdirectory)
 
-    for id in expected_protocol_ids:
+    for id in protocol_ids:
         assert id in sources_by_id
 
     return sources_by_id
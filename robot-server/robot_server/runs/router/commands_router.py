@@ -1,8 +1,9 @@
 """Router for /runs commands endpoints."""
 import textwrap
-from typing import Annotated, Final, Literal, Optional, Union
+from typing import Annotated, Final, Iterator, Literal, Optional, Union
 
 from fastapi import Depends, Query, status
+from fastapi.responses import StreamingResponse
 from server_utils.fastapi_utils.light_router import LightRouter
 
 from opentrons.protocol_engine import (
@@ -45,6 +46,8 @@ from .base_router import RunNotFound, RunStopped
 
 _DEFAULT_COMMAND_LIST_LENGTH: Final = 20
 
+_NDJSON_MEDIA_TYPE: Final = "application/x-ndjson"
+
 commands_router = LightRouter()
 
 
@@ -408,6 +411,65 @@ async def get_run_commands_as_pre_serialized_list(
     )
 
 
+@commands_router.get(
+    path="/runs/{runId}/commandsAsPreSerializedStream",
+    summary="Stream all commands of a completed run as newline-delimited JSON",
+    description=(
+        "Get all commands of a completed run as newline-delimited JSON"
+        " (`application/x-ndjson`), one pre-serialized command per line."
+        "**Warning:** This endpoint is experimental. We may change or remove it without warning."
+        "\n\n"
+        "This has the same availability rules as"
+        " `GET /runs/{runId}/commandsAsPreSerializedList`, but the commands are read"
+        " from the database and sent in chunks, so the robot never holds the whole"
+        " command list in memory."
+    ),
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {"content": {_NDJSON_MEDIA_TYPE: {}}},
+        status.HTTP_404_NOT_FOUND: {"model": ErrorBody[RunNotFound]},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {
+            "model": ErrorBody[PreSerializedCommandsNotAvailable]
+        },
+    },
+)
+async def get_run_commands_as_pre_serialized_stream(
+    runId: str,
+    run_data_manager: Annotated[RunDataManager, Depends(get_run_data_manager)],
+    includeFixitCommands: bool = Query(
+        True,
+        description="If `true`, return all commands (protocol, setup, fixit)."
+        " If `false`, only return safe commands (protocol, setup).",
+    ),
+) -> StreamingResponse:
+    """Stream all commands of a completed run as newline-delimited JSON.
+
+    Arguments:
+        runId: Requested run ID, from the URL
+        run_data_manager: Run data retrieval interface.
+        includeFixitCommands: If `true`, return all commands."
+            " If `false`, only return safe commands.
+    """
+    try:
+        command_chunks = run_data_manager.iter_commands_as_preserialized_chunks(
+            run_id=runId, include_fixit_commands=includeFixitCommands
+        )
+    except RunNotFoundError as e:
+        raise RunNotFound.from_exc(e).as_error(status.HTTP_404_NOT_FOUND) from e
+    except PreSerializedCommandsNotAvailableError as e:
+        raise PreSerializedCommandsNotAvailable.from_exc(e).as_error(
+            status.HTTP_503_SERVICE_UNAVAILABLE
+        ) from e
+
+    def _ndjson_lines() -> Iterator[str]:
+        for chunk in command_chunks:
+            yield "".join(f"{command}\n" for command in chunk)
+
+    # Starlette iterates sync generators in a worker thread,
+    # so the database reads don't block the event loop.
+    return StreamingResponse(_ndjson_lines(), media_type=_NDJSON_MEDIA_TYPE)
+
+
 @PydanticResponse.wrap_route(
     commands_router.get,
     path="/runs/{runId}/commands/{commandId}",
@@ -1,9 +1,12 @@
 """Control an active run with Actions."""
+import asyncio
+import contextlib
 import logging
 from datetime import datetime
+from itertools import takewhile
 from typing import Optional
 from typing_extensions import assert_never
-from opentrons.protocol_engine import ProtocolEngineError
+from opentrons.protocol_engine import CommandStatus, ProtocolEngineError
 from opentrons_shared_data.errors.exceptions import RoboticsInteractionError
 
 from robot_server.service.task_runner import TaskRunner
@@ -18,6 +21,11 @@ from robot_server.service.notifications import RunsPublisher, MaintenanceRunsPub
 
 log = logging.getLogger(__name__)
 
+# How often to write newly finalized commands to the database while a run is ongoing,
+# and the most commands to write at once.
+_COMMAND_PERSISTENCE_INTERVAL_SECONDS = 1.0
+_COMMAND_PERSISTENCE_BATCH_SIZE = 500
+
 
 class RunActionNotAllowedError(RoboticsInteractionError):
     """Error raised when a given run action is not allowed."""
@@ -126,9 +134,19 @@ class RunController:
     async def _run_protocol_and_insert_result(
         self, deck_configuration: DeckConfigurationType
     ) -> None:
-        result = await self._run_orchestrator_store.run(
-            deck_configuration=deck_configuration,
+        persistence_task = asyncio.create_task(
+            self._persist_finalized_commands_periodically()
         )
+        try:
+            result = await self._run_orchestrator_store.run(
+                deck_configuration=deck_configuration,
+            )
+        finally:
+            persistence_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await persistence_task
+
+        # Only the commands that weren't already persisted get written here.
         self._run_store.update_run_state(
             run_id=self._run_id,
             summary=result.state_summary,
@@ -136,3 +154,44 @@ class RunController:
             run_time_parameters=result.parameters,
         )
         self._runs_publisher.publish_pre_serialized_commands_notification(self._run_id)
+
+    async def _persist_finalized_commands_periodically(self) -> None:
+        """Write commands to the run store as they finalize, while the run executes.
+
+        Only the longest finalized prefix of the command list is written, so every
+        persisted row is final and `RunStore.update_run_state()` can keep it as-is.
+        """
+        persisted_count = 0
+        while True:
+            await asyncio.sleep(_COMMAND_PERSISTENCE_INTERVAL_SECONDS)
+            try:
+                persisted_count += self._persist_finalized_commands(persisted_count)
+            except Exception:
+                # The final update_run_state() will write whatever we failed to.
+                log.exception(f'Error persisting commands of run "{self._run_id}".')
+                return
+
+    def _persist_finalized_commands(self, first_index_in_run: int) -> int:
+        command_slice = self._run_orchestrator_store.get_command_slice(
+            cursor=first_index_in_run,
+            length=_COMMAND_PERSISTENCE_BATCH_SIZE,
+            include_fixit_commands=True,
+        )
+        if command_slice.cursor != first_index_in_run:
+            # The slice got clamped because there are no new commands.
+            return 0
+
+        finalized_commands = list(
+            takewhile(
+                lambda command: command.status
+                in (CommandStatus.SUCCEEDED, CommandStatus.FAILED),
+                command_slice.commands,
+            )
+        )
+        if finalized_commands:
+            self._run_store.insert_commands(
+                run_id=self._run_id,
+                commands=finalized_commands,
+                first_index_in_run=first_index_in_run,
+            )
+        return len(finalized_commands)
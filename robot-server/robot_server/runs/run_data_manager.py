@@ -1,7 +1,7 @@
 """Manage current and historical run data."""
 
 from datetime import datetime
-from typing import Dict, List, Optional, Callable, Union, Mapping, Sequence
+from typing import Dict, Iterator, List, Optional, Callable, Union, Mapping, Sequence
 
 from opentrons_shared_data.labware.labware_definition import LabwareDefinition
 from opentrons_shared_data.errors.exceptions import InvalidStoredData, EnumeratedError
@@ -545,6 +545,21 @@ class RunDataManager:
             run_id, include_fixit_commands
         )
 
+    def iter_commands_as_preserialized_chunks(
+        self, run_id: str, include_fixit_commands: bool
+    ) -> Iterator[List[str]]:
+        """Get all commands of a run as chunks of serialized json commands."""
+        if (
+            run_id == self._run_orchestrator_store.current_run_id
+            and not self._run_orchestrator_store.get_is_run_terminal()
+        ):
+            raise PreSerializedCommandsNotAvailableError(
+                "Pre-serialized commands are only available after a run has ended."
+            )
+        return self._run_store.iter_commands_as_preserialized_chunks(
+            run_id=run_id, include_fixit_commands=include_fixit_commands
+        )
+
     def set_error_recovery_rules(
         self, run_id: str, rules: List[ErrorRecoveryRule]
     ) -> None:
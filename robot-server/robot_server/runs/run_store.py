@@ -5,7 +5,7 @@ from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime
 from functools import lru_cache
-from typing import Dict, List, Optional, Literal, Union
+from typing import Dict, Iterator, List, Optional, Literal, Sequence, Union
 
 import sqlalchemy
 from pydantic import TypeAdapter, ValidationError
@@ -51,8 +51,14 @@ log = logging.getLogger(__name__)
 
 _CACHE_ENTRIES = 32
 
+_PRESERIALIZED_CHUNK_SIZE = 200
+
 _rtp_list_adapter = TypeAdapter(list[RunTimeParameter])
 
+_FINAL_COMMAND_STATUSES = frozenset(
+    {CommandStatusSQLEnum.SUCCEEDED, CommandStatusSQLEnum.FAILED}
+)
+
 
 @dataclass(frozen=True)
 class RunResource:
@@ -158,10 +164,15 @@ class RunStore:
             )
         )
 
-        delete_existing_commands = sqlalchemy.delete(run_command_table).where(
-            run_command_table.c.run_id == run_id
+        select_persisted_commands = (
+            sqlalchemy.select(
+                run_command_table.c.index_in_run,
+                run_command_table.c.command_id,
+                run_command_table.c.command_status,
+            )
+            .where(run_command_table.c.run_id == run_id)
+            .order_by(run_command_table.c.index_in_run)
         )
-        insert_command = sqlalchemy.insert(run_command_table)
 
         select_run_resource = sqlalchemy.select(*_run_columns).where(
             run_table.c.id == run_id
@@ -177,26 +188,25 @@ class RunStore:
                 raise RunNotFoundError(run_id=run_id)
 
             transaction.execute(update_run)
-            transaction.execute(delete_existing_commands)
-            for command_index, command in enumerate(commands):
+
+            # Commands that were already written by insert_commands() while the run
+            # was ongoing don't need to be rewritten. Only replace whatever comes
+            # after the longest prefix that still matches.
+            persisted_rows = transaction.execute(select_persisted_commands).all()
+            reusable_count = _count_reusable_command_rows(persisted_rows, commands)
+            if reusable_count < len(persisted_rows):
                 transaction.execute(
-                    insert_command,
-                    {
-                        "run_id": run_id,
-                        "index_in_run": command_index,
-                        "command_id": command.id,
-                        "command": pydantic_to_json(command),
-                        "command_intent": str(command.intent.value)
-                        if command.intent
-                        else CommandIntent.PROTOCOL,
-                        "command_error": pydantic_to_json(command.error)
-                        if command.error
-                        else None,
-                        "command_status": _convert_commands_status_to_sql_command_status(
-                            command.status
-                        ),
-                    },
+                    sqlalchemy.delete(run_command_table).where(
+                        run_command_table.c.run_id == run_id,
+                        run_command_table.c.index_in_run >= reusable_count,
+                    )
                 )
+            self._insert_commands(
+                transaction=transaction,
+                run_id=run_id,
+                commands=commands[reusable_count:],
+                first_index_in_run=reusable_count,
+            )
 
             run_row = transaction.execute(select_run_resource).one()
             action_rows = transaction.execute(select_actions).all()
@@ -207,6 +217,38 @@ class RunStore:
             raise maybe_run_resource.error
         return maybe_run_resource
 
+    def insert_commands(
+        self,
+        run_id: str,
+        commands: Sequence[Command],
+        first_index_in_run: int,
+    ) -> None:
+        """Append finalized commands to a run's persisted commands.
+
+        This lets commands be written as the run progresses, so that
+        `update_run_state()` only has to write whatever is left when the run ends.
+
+        Args:
+            run_id: The run to add the commands to.
+            commands: Commands that have reached a final status, in run order.
+            first_index_in_run: The index of the first given command
+                in the run's full list of commands.
+
+        Raises:
+            RunNotFoundError: Run ID was not found in the database.
+        """
+        with self._sql_engine.begin() as transaction:
+            if not self._run_exists(run_id, transaction):
+                raise RunNotFoundError(run_id=run_id)
+            self._insert_commands(
+                transaction=transaction,
+                run_id=run_id,
+                commands=commands,
+                first_index_in_run=first_index_in_run,
+            )
+
+        self.get_command.cache_clear()
+
     def insert_action(self, run_id: str, action: RunAction) -> None:
         """Insert a run action into the store.
 
@@ -552,6 +594,63 @@ class RunStore:
             commands_result = transaction.scalars(select_commands).all()
         return commands_result
 
+    def iter_commands_as_preserialized_chunks(
+        self,
+        run_id: str,
+        include_fixit_commands: bool,
+        chunk_size: int = _PRESERIALIZED_CHUNK_SIZE,
+    ) -> Iterator[List[str]]:
+        """Get all commands of the run as chunks of json command strings.
+
+        Unlike `get_all_commands_as_preserialized_list()`, this never holds more
+        than `chunk_size` commands in memory at once. Each chunk is read in its own
+        short transaction, resuming after the last `index_in_run` seen, so a slow
+        consumer doesn't keep the database locked.
+
+        Raises:
+            RunNotFoundError: The given run ID was not found. This is raised
+                immediately, not when the returned iterator is first advanced.
+        """
+        with self._sql_engine.begin() as transaction:
+            if not self._run_exists(run_id, transaction):
+                raise RunNotFoundError(run_id=run_id)
+
+        return self._iter_command_chunks(
+            run_id=run_id,
+            include_fixit_commands=include_fixit_commands,
+            chunk_size=chunk_size,
+        )
+
+    def _iter_command_chunks(
+        self, run_id: str, include_fixit_commands: bool, chunk_size: int
+    ) -> Iterator[List[str]]:
+        conditions = [run_command_table.c.run_id == run_id]
+        if not include_fixit_commands:
+            conditions.append(run_command_table.c.command_intent != "fixit")
+
+        last_index_in_run = -1
+        while True:
+            select_chunk = (
+                sqlalchemy.select(
+                    run_command_table.c.index_in_run, run_command_table.c.command
+                )
+                .where(
+                    *conditions,
+                    run_command_table.c.index_in_run > last_index_in_run,
+                )
+                .order_by(run_command_table.c.index_in_run)
+                .limit(chunk_size)
+            )
+            with self._sql_engine.begin() as transaction:
+                rows = transaction.execute(select_chunk).all()
+
+            if len(rows) == 0:
+                return
+            yield [row.command for row in rows]
+            if len(rows) < chunk_size:
+                return
+            last_index_in_run = rows[-1].index_in_run
+
     def get_command_errors_count(self, run_id: str) -> int:
         """Get run commands errors count from the store.
 
@@ -721,6 +820,28 @@ class RunStore:
         ).scalar_one()
         return result
 
+    @staticmethod
+    def _insert_commands(
+        transaction: sqlalchemy.engine.Connection,
+        run_id: str,
+        commands: Sequence[Command],
+        first_index_in_run: int,
+    ) -> None:
+        if len(commands) == 0:
+            return
+        # Passing a list of parameter sets makes SQLAlchemy use executemany().
+        transaction.execute(
+            sqlalchemy.insert(run_command_table),
+            [
+                _convert_command_to_sql_values(
+                    run_id=run_id,
+                    index_in_run=first_index_in_run + offset,
+                    command=command,
+                )
+                for offset, command in enumerate(commands)
+            ],
+        )
+
     def _clear_caches(self) -> None:
         self.has.cache_clear()
         self.get.cache_clear()
@@ -830,6 +951,47 @@ def _convert_state_to_sql_values(
     }
 
 
+def _convert_command_to_sql_values(
+    run_id: str, index_in_run: int, command: Command
+) -> Dict[str, object]:
+    return {
+        "run_id": run_id,
+        "index_in_run": index_in_run,
+        "command_id": command.id,
+        "command": pydantic_to_json(command),
+        "command_intent": str(command.intent.value)
+        if command.intent
+        else CommandIntent.PROTOCOL,
+        "command_error": pydantic_to_json(command.error) if command.error else None,
+        "command_status": _convert_commands_status_to_sql_command_status(
+            command.status
+        ),
+    }
+
+
+def _count_reusable_command_rows(
+    persisted_rows: Sequence[sqlalchemy.engine.Row],
+    commands: Sequence[Command],
+) -> int:
+    """Return how many leading persisted command rows can be kept as-is.
+
+    A row can be kept if it holds the same command at the same index, and both the
+    row and the command are in a final status, so the command can't have changed.
+    """
+    reusable_count = 0
+    for row, command in zip(persisted_rows, commands):
+        sql_status = _convert_commands_status_to_sql_command_status(command.status)
+        if (
+            row.index_in_run != reusable_count
+            or row.command_id != command.id
+            or row.command_status != sql_status
+            or sql_status not in _FINAL_COMMAND_STATUSES
+        ):
+            break
+        reusable_count += 1
+    return reusable_count
+
+
 def _parse_command(json_str: str) -> Command:
     """Parse a JSON string from the database into a `Command`."""
     return json_to_pydantic(CommandAdapter, json_str)
@@ -11,6 +11,11 @@ from server_utils.fastapi_utils.app_state import (
 )
 from ..notification_client import NotificationClient, get_notification_client
 from ..publisher_notifier import PublisherNotifier, get_pe_publisher_notifier
+from ..refetch_coalescer import (
+    DEFAULT_FLUSH_WINDOW_SECONDS,
+    RefetchCoalescer,
+    RefetchPublishCounts,
+)
 from .. import topics
 
 
@@ -37,10 +42,23 @@ class RunsPublisher:
     """Publishes protocol runs topics."""
 
     def __init__(
-        self, client: NotificationClient, publisher_notifier: PublisherNotifier
+        self,
+        client: NotificationClient,
+        publisher_notifier: PublisherNotifier,
+        refetch_flush_window_seconds: float = DEFAULT_FLUSH_WINDOW_SECONDS,
     ) -> None:
-        """Returns a configured Runs Publisher."""
-        self._client = client
+        """Returns a configured Runs Publisher.
+
+        Args:
+            client: The client to publish notifications with.
+            publisher_notifier: Invokes this publisher's callbacks on engine state changes.
+            refetch_flush_window_seconds: How long to collect refetch messages
+                before publishing them, so each topic is published at most once
+                per window. See `RefetchCoalescer`.
+        """
+        self._client = RefetchCoalescer(
+            client=client, flush_window_seconds=refetch_flush_window_seconds
+        )
         #  Variables and callbacks related to PE state changes.
         self._run_hooks: Optional[_RunHooks] = None
         self._engine_state_slice: Optional[_EngineStateSlice] = None
@@ -53,6 +71,11 @@ class RunsPublisher:
             ]
         )
 
+    @property
+    def refetch_counts(self) -> RefetchPublishCounts:
+        """How many refetch messages have been sent and suppressed so far."""
+        return self._client.counts
+
     def start_publishing_for_run(
         self,
         run_id: str,
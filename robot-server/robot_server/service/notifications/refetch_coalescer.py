@@ -0,0 +1,120 @@
+"""Batch refetch notifications so that bursts of them reach clients only once."""
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from .notification_client import NotificationClient
+from .topics import TopicName
+
+log: logging.Logger = logging.getLogger(__name__)
+
+
+DEFAULT_FLUSH_WINDOW_SECONDS = 0.05
+
+
+@dataclass(frozen=True)
+class RefetchPublishCounts:
+    """How many refetch messages a `RefetchCoalescer` has handled."""
+
+    sent: int
+    """Refetch messages actually published to the broker."""
+
+    suppressed: int
+    """Refetch messages dropped because the same topic was already pending."""
+
+
+class RefetchCoalescer:
+    """Publishes refetch messages through a `NotificationClient`, at most once per topic per flush.
+
+    The first refetch for a topic starts a flush window. Any further refetches for
+    the same topic before the window ends are dropped, because clients would refetch
+    the same data in response to each. When the window ends, every pending topic is
+    published once, in the order it was first requested.
+
+    Unsubscribe messages are never delayed. Pending refetches are flushed before an
+    unsubscribe is published, so clients still see a topic's final refetch first.
+
+    Args:
+        client: The client to publish messages with.
+        flush_window_seconds: How long to collect refetches before publishing them.
+            If this is 0, or there's no running event loop to schedule a flush on,
+            every refetch is published immediately.
+    """
+
+    def __init__(
+        self,
+        client: NotificationClient,
+        flush_window_seconds: float = DEFAULT_FLUSH_WINDOW_SECONDS,
+    ) -> None:
+        """Returns a configured RefetchCoalescer."""
+        assert (
+            flush_window_seconds >= 0
+        ), f"flush_window_seconds must not be negative but was {flush_window_seconds}"
+        self._client = client
+        self._flush_window_seconds = flush_window_seconds
+        # Used as an insertion-ordered set.
+        self._pending_topics: Dict[TopicName, None] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._sent = 0
+        self._suppressed = 0
+
+    @property
+    def counts(self) -> RefetchPublishCounts:
+        """How many refetch messages have been sent and suppressed so far."""
+        return RefetchPublishCounts(sent=self._sent, suppressed=self._suppressed)
+
+    def publish_advise_refetch(self, topic: TopicName) -> None:
+        """Publish a refetch message on `topic` when the current flush window ends."""
+        if topic in self._pending_topics:
+            self._suppressed += 1
+            return
+
+        self._pending_topics[topic] = None
+        if self._flush_handle is None:
+            self._schedule_flush()
+
+    def publish_advise_unsubscribe(self, topic: TopicName) -> None:
+        """Flush any pending refetches, then publish an unsubscribe message on `topic`."""
+        self.flush()
+        self._client.publish_advise_unsubscribe(topic=topic)
+
+    def flush(self) -> None:
+        """Publish all pending refetch messages now."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        topics = list(self._pending_topics)
+        self._pending_topics.clear()
+        for topic in topics:
+            self._client.publish_advise_refetch(topic=topic)
+            self._sent += 1
+
+        if topics:
+            log.debug(
+                "Published %d refetch messages (%d sent, %d suppressed in total).",
+                len(topics),
+                self._sent,
+                self._suppressed,
+            )
+
+    def _schedule_flush(self) -> None:
+        if self._flush_window_seconds == 0:
+            self.flush()
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
+            return
+        self._flush_handle = loop.call_later(
+            self._flush_window_seconds, self._flush_from_timer
+        )
+
+    def _flush_from_timer(self) -> None:
+        self._flush_handle = None
+        try:
+            self.flush()
+        except Exception:
+            log.exception("Failed to publish pending refetch messages.")
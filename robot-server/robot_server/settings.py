@@ -111,3 +111,23 @@ class RobotServerSettings(BaseSettings):
             "The maximum number of uploaded data files to allow before auto-deleting old ones."
         ),
     )
+
+    analysis_worker_processes: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "The maximum number of protocol analyses to simulate at once in separate"
+            " worker processes, so they don't block the server's event loop."
+            " 0 means analyses are simulated in the server process itself."
+        ),
+    )
+
+    analysis_worker_memory_limit_mb: typing.Optional[int] = Field(
+        default=None,
+        gt=0,
+        description=(
+            "The address space limit, in megabytes, of each analysis worker process."
+            " An analysis that exceeds it fails instead of exhausting the robot's"
+            " memory. Only applies when `analysis_worker_processes` is above 0."
+        ),
+    )
@@ -0,0 +1,195 @@
+"""Compare searching labware offsets in SQL with searching the in-memory index.
+
+This fills a temporary database with labware offsets spread over many labware
+definitions, modules, and deck slots, then times a mix of the searches that
+the app and protocol runs make, both with `SearchQueryBuilder` queries and with
+`LabwareOffsetStore`'s in-memory index. It also reports how long the index takes
+to load and roughly how much memory it holds, including the offsets themselves.
+
+Run from the robot-server directory:
+`pipenv run python -m scripts.benchmark_labware_offset_search --counts 1000 10000`
+"""
+
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from opentrons.protocol_engine import (
+    LabwareOffsetVector,
+    ModuleModel,
+    OnAddressableAreaOffsetLocationSequenceComponent,
+    OnLabwareOffsetLocationSequenceComponent,
+    OnModuleOffsetLocationSequenceComponent,
+)
+
+from robot_server.labware_offsets.models import DO_NOT_FILTER
+from robot_server.labware_offsets.store import (
+    IncomingStoredLabwareOffset,
+    LabwareOffsetStore,
+    _collate_sql_to_pydantic,
+)
+from robot_server.labware_offsets._search_query_builder import SearchQueryBuilder
+from robot_server.persistence.database import sql_engine_ctx
+from robot_server.persistence.sql_worker import SQLWorker
+from robot_server.persistence.tables import metadata
+
+
+_SLOTS = [f"{row}{column}" for row in "ABCD" for column in "123"]
+_MODULES = [
+    ModuleModel.MAGNETIC_BLOCK_V1,
+    ModuleModel.TEMPERATURE_MODULE_V2,
+    ModuleModel.HEATER_SHAKER_MODULE_V1,
+    ModuleModel.THERMOCYCLER_MODULE_V2,
+]
+_ADAPTERS = [f"opentrons/adapter_{i}/1" for i in range(5)]
+
+
+def _definition_uri(i: int) -> str:
+    return f"opentrons/labware_{i}/1"
+
+
+def _make_offset(
+    rng: random.Random, i: int, labware_count: int
+) -> IncomingStoredLabwareOffset:
+    location_sequence: List[object] = []
+    if rng.random() < 0.3:
+        location_sequence.append(
+            OnLabwareOffsetLocationSequenceComponent(labwareUri=rng.choice(_ADAPTERS))
+        )
+    if rng.random() < 0.4:
+        location_sequence.append(
+            OnModuleOffsetLocationSequenceComponent(moduleModel=rng.choice(_MODULES))
+        )
+    location_sequence.append(
+        OnAddressableAreaOffsetLocationSequenceComponent(
+            addressableAreaName=rng.choice(_SLOTS)
+        )
+    )
+    return IncomingStoredLabwareOffset(
+        id=f"offset-{i}",
+        createdAt=datetime.now(timezone.utc),
+        definitionUri=_definition_uri(rng.randrange(labware_count)),
+        locationSequence=location_sequence,  # type: ignore[arg-type]
+        vector=LabwareOffsetVector(x=1, y=2, z=3),
+    )
+
+
+def _make_searches(rng: random.Random, labware_count: int) -> List[Dict[str, object]]:
+    searches: List[Dict[str, object]] = []
+    for _ in range(50):
+        # What a protocol run does when it loads labware.
+        searches.append(
+            {
+                "definition_uri_filter": _definition_uri(rng.randrange(labware_count)),
+                "location_addressable_area_filter": rng.choice(_SLOTS),
+                "location_module_model_filter": None,
+                "location_definition_uri_filter": None,
+            }
+        )
+        searches.append(
+            {
+                "definition_uri_filter": _definition_uri(rng.randrange(labware_count)),
+                "location_addressable_area_filter": rng.choice(_SLOTS),
+                "location_module_model_filter": rng.choice(_MODULES),
+                "location_definition_uri_filter": None,
+            }
+        )
+        # What the app does when it looks up a single offset.
+        searches.append({"id_filter": f"offset-{rng.randrange(100)}"})
+    return searches
+
+
+def _time_per_search(
+    search: Callable[..., object], searches: List[Dict[str, object]], repeat: int
+) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for filters in searches:
+            search(**filters)
+        timings.append((time.perf_counter() - start) / len(searches))
+    return statistics.median(timings)
+
+
+async def _benchmark(count: int, repeat: int) -> None:
+    rng = random.Random(count)
+    labware_count = max(count // 20, 1)
+    with tempfile.TemporaryDirectory() as directory, sql_engine_ctx(
+        Path(directory) / "robot_server.db"
+    ) as sql_engine:
+        metadata.create_all(sql_engine)
+        sql_worker = SQLWorker(sql_engine)
+        store = LabwareOffsetStore(sql_engine, sql_worker)
+        await asyncio.gather(
+            *(store.add(_make_offset(rng, i, labware_count)) for i in range(count))
+        )
+        sql_worker.close()
+
+        def sql_search(
+            id_filter: object = DO_NOT_FILTER,
+            definition_uri_filter: object = DO_NOT_FILTER,
+            location_addressable_area_filter: object = DO_NOT_FILTER,
+            location_module_model_filter: object = DO_NOT_FILTER,
+            location_definition_uri_filter: object = DO_NOT_FILTER,
+        ) -> object:
+            query = (
+                SearchQueryBuilder()
+                .do_active_filter(True)
+                .do_id_filter(id_filter)  # type: ignore[arg-type]
+                .do_definition_uri_filter(definition_uri_filter)  # type: ignore[arg-type]
+                .do_on_addressable_area_filter(location_addressable_area_filter)  # type: ignore[arg-type]
+                .do_on_module_filter(location_module_model_filter)  # type: ignore[arg-type]
+                .do_on_labware_filter(location_definition_uri_filter)  # type: ignore[arg-type]
+                .build_query()
+            )
+            with sql_engine.begin() as transaction:
+                result = transaction.execute(query).all()
+            return list(_collate_sql_to_pydantic(result)) if result else []
+
+        start = time.perf_counter()
+        store.search()
+        load_time = time.perf_counter() - start
+
+        # Loading the index keeps the offsets in memory, so this measures both.
+        tracemalloc.start()
+        before, _ = tracemalloc.get_traced_memory()
+        other_store = LabwareOffsetStore(sql_engine, sql_worker)
+        other_store.search()
+        after, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del other_store
+
+        searches = _make_searches(rng, labware_count)
+        sql_time = _time_per_search(sql_search, searches, repeat)
+        index_time = _time_per_search(store.search, searches, repeat)
+
+    print(
+        f"{count:>7} offsets: SQL {sql_time * 1e6:9.1f} µs/search,"
+        f" index {index_time * 1e6:7.1f} µs/search"
+        f" ({sql_time / index_time:6.1f}x),"
+        f" index load {load_time:6.2f} s,"
+        f" index memory ~{(after - before) / 2**20:6.1f} MiB"
+    )
+
+
+def main() -> None:  # noqa: D103
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--counts", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    for count in args.counts:
+        asyncio.run(_benchmark(count, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""Measure how long it takes `ProtocolStore` to rehydrate on server boot.
+
+For each protocol count, this stores that many Python protocols, each with a
+couple of labware definition files, and then times `ProtocolStore.rehydrate()`
+in two scenarios:
+
+* full: No protocol summaries, so every protocol is read and parsed from its files.
+* summaries: Every protocol has a persisted summary, so none of them is read.
+  This also times the first `ProtocolStore.get_all()` afterwards, which rebuilds
+  every `ProtocolSource` from its summary.
+
+Run from the robot-server directory:
+`pipenv run python -m scripts.benchmark_protocol_store_rehydrate --counts 20 100 500`
+"""
+
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import shutil
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional, Tuple
+
+from opentrons.protocol_reader import ProtocolReader
+from opentrons_shared_data import get_shared_data_root
+
+from robot_server.persistence.database import sql_engine_ctx
+from robot_server.persistence.tables import metadata
+from robot_server.protocols.protocol_models import ProtocolKind
+from robot_server.protocols.protocol_store import ProtocolResource, ProtocolStore
+
+
+_LABWARE_FILES = [
+    "labware/definitions/2/opentrons_96_tiprack_300ul/1.json",
+    "labware/definitions/2/nest_96_wellplate_100ul_pcr_full_skirt/2.json",
+]
+
+_PROTOCOL = """\
+metadata = {{"protocolName": "Benchmark protocol {index}", "author": "benchmark"}}
+requirements = {{"robotType": "OT-2", "apiLevel": "2.15"}}
+
+
+def run(context):
+    tip_rack = context.load_labware("opentrons_96_tiprack_300ul", 1)
+    plate = context.load_labware("nest_96_wellplate_100ul_pcr_full_skirt", 2)
+    pipette = context.load_instrument("p300_single_gen2", "left", tip_racks=[tip_rack])
+    for well in plate.wells():
+        pipette.transfer(10, plate["A1"], well)
+"""
+
+
+async def _store_protocols(
+    protocol_store: ProtocolStore, protocols_directory: Path, count: int
+) -> None:
+    protocol_reader = ProtocolReader()
+    for index in range(count):
+        protocol_id = f"protocol-{index}"
+        protocol_directory = protocols_directory / protocol_id
+        protocol_directory.mkdir()
+        (protocol_directory / "protocol.py").write_text(_PROTOCOL.format(index=index))
+        for labware_index, labware_file in enumerate(_LABWARE_FILES):
+            shutil.copy(
+                get_shared_data_root() / labware_file,
+                protocol_directory / f"labware_{labware_index}.json",
+            )
+        source = await protocol_reader.read_saved(
+            files=list(protocol_directory.iterdir()), directory=protocol_directory
+        )
+        protocol_store.insert(
+            ProtocolResource(
+                protocol_id=protocol_id,
+                created_at=datetime.now(tz=timezone.utc),
+                source=source,
+                protocol_key=None,
+                protocol_kind=ProtocolKind.STANDARD,
+            )
+        )
+
+
+async def _time_rehydrate(
+    temp_dir: Path, summaries_directory: Optional[Path]
+) -> Tuple[float, float]:
+    with sql_engine_ctx(temp_dir / "benchmark.db") as sql_engine:
+        start = time.perf_counter()
+        protocol_store = await ProtocolStore.rehydrate(
+            sql_engine=sql_engine,
+            protocols_directory=temp_dir / "protocols",
+            protocol_reader=ProtocolReader(),
+            summaries_directory=summaries_directory,
+        )
+        rehydrated = time.perf_counter()
+        protocol_store.get_all()
+        return rehydrated - start, time.perf_counter() - rehydrated
+
+
+async def _benchmark(count: int) -> None:
+    with tempfile.TemporaryDirectory() as temp_dir_name:
+        temp_dir = Path(temp_dir_name)
+        protocols_directory = temp_dir / "protocols"
+        protocols_directory.mkdir()
+        summaries_directory = temp_dir / "protocol_summaries"
+        summaries_directory.mkdir()
+        with sql_engine_ctx(temp_dir / "benchmark.db") as sql_engine:
+            metadata.create_all(sql_engine)
+            await _store_protocols(
+                ProtocolStore.create_empty(
+                    sql_engine=sql_engine, summaries_directory=summaries_directory
+                ),
+                protocols_directory,
+                count,
+            )
+
+        full, _ = await _time_rehydrate(temp_dir, summaries_directory=None)
+        summarized, first_get_all = await _time_rehydrate(
+            temp_dir, summaries_directory=summaries_directory
+        )
+        print(f"{count:>10} {full:>10.4f} {summarized:>15.4f} {first_get_all:>19.4f}")
+
+
+def main() -> None:  # noqa: D103
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--counts",
+        type=int,
+        nargs="+",
+        default=[20, 100, 500],
+        help="Numbers of stored protocols to benchmark.",
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'protocols':>10} {'full (s)':>10} {'summaries (s)':>15} {'first get_all (s)':>19}"
+    )
+    for count in args.counts:
+        asyncio.run(_benchmark(count))
+
+
+if __name__ == "__main__":
+    main()
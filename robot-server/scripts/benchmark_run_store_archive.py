@@ -0,0 +1,127 @@
+"""Measure how long it takes `RunStore` to archive runs of various lengths.
+
+For each command count, this times `RunStore.update_run_state()` in two scenarios:
+
+* cold: No commands were persisted while the run was ongoing, so every command has
+  to be written when the run is archived.
+* incremental: All but the last few commands were already written with
+  `RunStore.insert_commands()`, the way `RunController` does while a run executes.
+
+Run from the robot-server directory:
+`pipenv run python -m scripts.benchmark_run_store_archive --counts 100 1000 10000`
+"""
+
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List
+
+from opentrons.protocol_engine import (
+    EngineStatus,
+    StateSummary,
+    commands as pe_commands,
+)
+
+from robot_server.persistence.database import sql_engine_ctx
+from robot_server.persistence.tables import metadata
+from robot_server.runs.run_store import RunStore
+
+
+_UNFLUSHED_TAIL = 10
+
+
+def _make_commands(count: int) -> List[pe_commands.Command]:
+    return [
+        pe_commands.WaitForResume(
+            id=f"command-{index}",
+            key=f"command-key-{index}",
+            status=pe_commands.CommandStatus.SUCCEEDED,
+            createdAt=datetime(year=2024, month=1, day=1, tzinfo=timezone.utc),
+            params=pe_commands.WaitForResumeParams(message=f"message {index}"),
+            result=pe_commands.WaitForResumeResult(),
+            intent=pe_commands.CommandIntent.PROTOCOL,
+        )
+        for index in range(count)
+    ]
+
+
+def _make_state_summary() -> StateSummary:
+    return StateSummary(
+        status=EngineStatus.SUCCEEDED,
+        errors=[],
+        labware=[],
+        labwareOffsets=[],
+        pipettes=[],
+        modules=[],
+        liquids=[],
+        wells=[],
+        files=[],
+        hasEverEnteredErrorRecovery=False,
+    )
+
+
+def _time_archive(
+    run_store: RunStore,
+    run_id: str,
+    commands: List[pe_commands.Command],
+    pre_persisted: int,
+) -> float:
+    run_store.insert(
+        run_id=run_id,
+        created_at=datetime.now(tz=timezone.utc),
+        protocol_id=None,
+    )
+    if pre_persisted > 0:
+        run_store.insert_commands(
+            run_id=run_id,
+            commands=commands[:pre_persisted],
+            first_index_in_run=0,
+        )
+
+    start = time.perf_counter()
+    run_store.update_run_state(
+        run_id=run_id,
+        summary=_make_state_summary(),
+        commands=commands,
+        run_time_parameters=[],
+    )
+    return time.perf_counter() - start
+
+
+def main() -> None:  # noqa: D103
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--counts",
+        type=int,
+        nargs="+",
+        default=[100, 1000, 10000],
+        help="Numbers of commands per run to benchmark.",
+    )
+    args = parser.parse_args()
+
+    print(f"{'commands':>10} {'cold (s)':>12} {'incremental (s)':>16}")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with sql_engine_ctx(Path(temp_dir) / "benchmark.db") as sql_engine:
+            metadata.create_all(sql_engine)
+            run_store = RunStore(sql_engine=sql_engine)
+            for count in args.counts:
+                commands = _make_commands(count)
+                cold = _time_archive(
+                    run_store, f"cold-{count}", commands, pre_persisted=0
+                )
+                incremental = _time_archive(
+                    run_store,
+                    f"incremental-{count}",
+                    commands,
+                    pre_persisted=max(0, count - _UNFLUSHED_TAIL),
+                )
+                print(f"{count:>10} {cold:>12.4f} {incremental:>16.4f}")
+
+
+if __name__ == "__main__":
+    main()
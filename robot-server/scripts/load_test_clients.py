@@ -0,0 +1,122 @@
+"""Measure request latency while several simulated app clients use a server at once.
+
+Each simulated client repeatedly does what an idle Opentrons App does to a robot:
+it polls the robot's health, runs, protocols, and labware offsets. Every few
+polls, it also saves a new labware offset, so the server has to handle database
+writes from several clients at the same time as reads.
+
+At the end, this prints the 50th and 99th percentile latency of each kind of
+request.
+
+Point this at a dev Flex server, like one started with `make dev-flex`:
+`pipenv run python -m scripts.load_test_clients localhost:31950 --clients 8`
+
+This saves labware offsets on the server, so don't point it at a real robot.
+"""
+
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections import defaultdict
+from typing import Dict, List
+
+import httpx
+
+
+_LABWARE_OFFSET = {
+    "data": {
+        "definitionUri": "opentrons/opentrons_96_tiprack_300ul/1",
+        "locationSequence": [
+            {"kind": "onAddressableArea", "addressableAreaName": "C2"}
+        ],
+        "vector": {"x": 1, "y": 2, "z": 3},
+    }
+}
+
+
+async def _simulate_client(
+    base_url: str,
+    deadline: float,
+    writes_every: int,
+    latencies: Dict[str, List[float]],
+) -> None:
+    async with httpx.AsyncClient(
+        base_url=base_url, headers={"opentrons-version": "*"}, timeout=30
+    ) as client:
+
+        async def timed(label: str, method: str, url: str, **kwargs: object) -> None:
+            start = time.perf_counter()
+            response = await client.request(method, url, **kwargs)  # type: ignore[arg-type]
+            latencies[label].append(time.perf_counter() - start)
+            response.raise_for_status()
+
+        poll = 0
+        while time.monotonic() < deadline:
+            await timed("GET /health", "GET", "/health")
+            await timed("GET /runs", "GET", "/runs", params={"pageLength": 20})
+            await timed("GET /protocols", "GET", "/protocols")
+            await timed("GET /labwareOffsets", "GET", "/labwareOffsets")
+            if poll % writes_every == 0:
+                await timed(
+                    "POST /labwareOffsets",
+                    "POST",
+                    "/labwareOffsets",
+                    json=_LABWARE_OFFSET,
+                )
+            poll += 1
+
+
+def _percentile(sorted_values: List[float], percentile: float) -> float:
+    index = round(percentile / 100 * (len(sorted_values) - 1))
+    return sorted_values[index]
+
+
+async def _run() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "host",
+        help="where to find the robot server, with a port, e.g. localhost:31950",
+    )
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument(
+        "--duration", type=float, default=30, help="how long to run, in seconds"
+    )
+    parser.add_argument(
+        "--writes-every",
+        type=int,
+        default=4,
+        help="how many polls each client does per labware offset it saves",
+    )
+    args = parser.parse_args()
+
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    deadline = time.monotonic() + args.duration
+    await asyncio.gather(
+        *(
+            _simulate_client(
+                base_url=f"http://{args.host}",
+                deadline=deadline,
+                writes_every=args.writes_every,
+                latencies=latencies,
+            )
+            for _ in range(args.clients)
+        )
+    )
+
+    all_latencies = [latency for values in latencies.values() for latency in values]
+    print(f"{args.clients} clients, {len(all_latencies)} requests in total")
+    for label, values in sorted(latencies.items()) + [("all", all_latencies)]:
+        values = sorted(values)
+        print(
+            f"{label:>22}: {len(values):>6} requests,"
+            f" p50 {statistics.median(values) * 1000:7.1f} ms,"
+            f" p99 {_percentile(values, 99) * 1000:7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(_run())
@@ -8,6 +8,7 @@ from decoy import Decoy
 from opentrons.protocol_reader import ProtocolSource, JsonProtocolConfig
 from sqlalchemy.engine import Engine as SQLEngine
 
+from robot_server.persistence.sql_worker import SQLWorker
 from robot_server.data_files.data_files_store import (
     DataFilesStore,
     DataFileInfo,
@@ -42,10 +43,14 @@ def data_files_directory(tmp_path: Path) -> Path:
 
 
 @pytest.fixture
-def subject(sql_engine: SQLEngine, data_files_directory: Path) -> DataFilesStore:
+def subject(
+    sql_engine: SQLEngine, sql_worker: SQLWorker, data_files_directory: Path
+) -> DataFilesStore:
     """Get a DataFilesStore test subject."""
     return DataFilesStore(
-        sql_engine=sql_engine, data_files_directory=data_files_directory
+        sql_engine=sql_engine,
+        sql_worker=sql_worker,
+        data_files_directory=data_files_directory,
     )
 
 
@@ -53,9 +58,12 @@ def subject(sql_engine: SQLEngine, data_files_directory: Path) -> DataFilesStore
 def completed_analysis_store(
     decoy: Decoy,
     sql_engine: SQLEngine,
+    sql_worker: SQLWorker,
 ) -> CompletedAnalysisStore:
     """Get a `CompletedAnalysisStore` linked to the same database as the subject under test."""
-    return CompletedAnalysisStore(sql_engine, decoy.mock(cls=MemoryCache), "2")
+    return CompletedAnalysisStore(
+        sql_engine, sql_worker, decoy.mock(cls=MemoryCache), "2"
+    )
 
 
 @pytest.fixture
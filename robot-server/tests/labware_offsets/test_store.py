@@ -1,6 +1,7 @@
 # noqa: D100
 
 from datetime import datetime, timezone
+from typing import Callable, TypeVar
 
 import pytest
 import sqlalchemy
@@ -12,6 +13,7 @@ from opentrons.protocol_engine import (
     OnAddressableAreaOffsetLocationSequenceComponent,
 )
 from opentrons.protocol_engine.types import ModuleModel
+from robot_server.persistence.sql_worker import SQLWorker
 from robot_server.persistence.tables import (
     labware_offset_location_sequence_components_table,
 )
@@ -29,9 +31,11 @@ from robot_server.labware_offsets.models import (
 
 
 @pytest.fixture
-def subject(sql_engine: sqlalchemy.engine.Engine) -> LabwareOffsetStore:
+def subject(
+    sql_engine: sqlalchemy.engine.Engine, sql_worker: SQLWorker
+) -> LabwareOffsetStore:
     """Return a test subject."""
-    return LabwareOffsetStore(sql_engine)
+    return LabwareOffsetStore(sql_engine, sql_worker)
 
 
 def _get_all(store: LabwareOffsetStore) -> list[StoredLabwareOffset]:
@@ -138,6 +142,24 @@ def _get_all(store: LabwareOffsetStore) -> list[StoredLabwareOffset]:
             ["e"],
             id="module-and-not-lw",
         ),
+        pytest.param(
+            DO_NOT_FILTER,
+            DO_NOT_FILTER,
+            "A1",
+            ModuleModel.MAGNETIC_BLOCK_V1,
+            DO_NOT_FILTER,
+            ["e"],
+            id="aa-and-module",
+        ),
+        pytest.param(
+            DO_NOT_FILTER,
+            DO_NOT_FILTER,
+            "A1",
+            ModuleModel.THERMOCYCLER_MODULE_V1,
+            "location.definitionUri a",
+            ["a"],
+            id="aa-and-module-and-lw",
+        ),
         pytest.param(
             DO_NOT_FILTER,
             DO_NOT_FILTER,
@@ -158,7 +180,7 @@ def _get_all(store: LabwareOffsetStore) -> list[StoredLabwareOffset]:
         ),
     ],
 )
-def test_filter_fields(
+async def test_filter_fields(
     subject: LabwareOffsetStore,
     id_filter: str | DoNotFilterType,
     definition_uri_filter: str | DoNotFilterType,
@@ -244,7 +266,7 @@ def test_filter_fields(
         ),
     }
     for offset in offsets.values():
-        subject.add(offset)
+        await subject.add(offset)
     results = subject.search(
         id_filter=id_filter,
         definition_uri_filter=definition_uri_filter,
@@ -267,7 +289,7 @@ def test_filter_fields(
     )
 
 
-def test_filter_combinations(subject: LabwareOffsetStore) -> None:
+async def test_filter_combinations(subject: LabwareOffsetStore) -> None:
     """Test that multiple filters are combined correctly."""
     ids_and_definition_uris = [
         ("id-1", "definition-uri-a"),
@@ -303,7 +325,7 @@ def test_filter_combinations(subject: LabwareOffsetStore) -> None:
     ]
 
     for labware_offset in labware_offsets:
-        subject.add(labware_offset)
+        await subject.add(labware_offset)
 
     # No filters:
     assert subject.search() == outgoing_offsets
@@ -330,7 +352,7 @@ def test_filter_combinations(subject: LabwareOffsetStore) -> None:
     assert result == []
 
 
-def test_delete(subject: LabwareOffsetStore) -> None:
+async def test_delete(subject: LabwareOffsetStore) -> None:
     """Test the `delete()` and `delete_all()` methods."""
     incoming_offsets = [
         IncomingStoredLabwareOffset(
@@ -362,9 +384,9 @@ def test_delete(subject: LabwareOffsetStore) -> None:
     with pytest.raises(LabwareOffsetNotFoundError):
         subject.delete("b")
 
-    subject.add(a)
-    subject.add(b)
-    subject.add(c)
+    await subject.add(a)
+    await subject.add(b)
+    await subject.add(c)
 
     assert subject.delete(b.id) == out_b
     assert _get_all(subject) == [out_a, out_c]
@@ -375,7 +397,96 @@ def test_delete(subject: LabwareOffsetStore) -> None:
     assert _get_all(subject) == []
 
 
-def test_handle_unknown(
+async def test_search_reflects_changes(
+    sql_engine: sqlalchemy.engine.Engine,
+    sql_worker: SQLWorker,
+    subject: LabwareOffsetStore,
+) -> None:
+    """Searches should reflect adds and deletes made after an earlier search."""
+    incoming_offsets = [
+        IncomingStoredLabwareOffset(
+            id=id,
+            createdAt=datetime.now(timezone.utc),
+            definitionUri=definition_uri,
+            locationSequence=[
+                OnAddressableAreaOffsetLocationSequenceComponent(
+                    addressableAreaName=addressable_area_name
+                )
+            ],
+            vector=LabwareOffsetVector(x=1, y=2, z=3),
+        )
+        for id, definition_uri, addressable_area_name in [
+            ("id-a", "definition-uri-a", "A1"),
+            ("id-b", "definition-uri-b", "A1"),
+            ("id-c", "definition-uri-a", "B1"),
+        ]
+    ]
+    out_a, out_b, out_c = [
+        StoredLabwareOffset(
+            id=offset.id,
+            createdAt=offset.createdAt,
+            definitionUri=offset.definitionUri,
+            locationSequence=offset.locationSequence,
+            vector=offset.vector,
+        )
+        for offset in incoming_offsets
+    ]
+    a, b, c = incoming_offsets
+
+    await subject.add(a)
+    assert subject.search(location_addressable_area_filter="A1") == [out_a]
+
+    await subject.add_many([b, c])
+    assert subject.search(location_addressable_area_filter="A1") == [out_a, out_b]
+    assert subject.search(definition_uri_filter="definition-uri-a") == [out_a, out_c]
+
+    subject.delete(a.id)
+    assert subject.search(location_addressable_area_filter="A1") == [out_b]
+    assert subject.search(definition_uri_filter="definition-uri-a") == [out_c]
+    assert subject.search(id_filter=a.id) == []
+
+    # A new store should find the same offsets in the database.
+    assert LabwareOffsetStore(sql_engine, sql_worker).search() == [out_b, out_c]
+
+    subject.delete_all()
+    assert subject.search(location_addressable_area_filter="A1") == []
+
+
+_T = TypeVar("_T")
+
+
+async def test_delete_all_while_adding(
+    sql_worker: SQLWorker,
+    subject: LabwareOffsetStore,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A delete that runs after an add commits, but before it returns, should stick."""
+    offset = IncomingStoredLabwareOffset(
+        id="id-a",
+        createdAt=datetime.now(timezone.utc),
+        definitionUri="definition-uri-a",
+        locationSequence=[
+            OnAddressableAreaOffsetLocationSequenceComponent(addressableAreaName="A1")
+        ],
+        vector=LabwareOffsetVector(x=1, y=2, z=3),
+    )
+    assert subject.search() == []
+    original_write = sql_worker.write
+
+    async def write_then_delete_all(
+        function: Callable[[sqlalchemy.engine.Connection], _T]
+    ) -> _T:
+        result = await original_write(function)
+        subject.delete_all()
+        return result
+
+    monkeypatch.setattr(sql_worker, "write", write_then_delete_all)
+    await subject.add(offset)
+
+    assert subject.search() == []
+
+
+async def test_handle_unknown(
     subject: LabwareOffsetStore, sql_engine: sqlalchemy.engine.Engine
 ) -> None:
     """Test returning an unknown offset."""
@@ -401,7 +512,7 @@ def test_handle_unknown(
         ],
         vector=incoming_valid.vector,
     )
-    subject.add(incoming_valid)
+    await subject.add(incoming_valid)
     with sql_engine.begin() as transaction:
         transaction.execute(
             sqlalchemy.insert(labware_offset_location_sequence_components_table).values(
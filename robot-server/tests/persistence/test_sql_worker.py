@@ -0,0 +1,133 @@
+"""Tests for robot_server.persistence.sql_worker."""
+import asyncio
+import threading
+import time
+from typing import Callable, List
+
+import pytest
+import sqlalchemy
+
+from robot_server.persistence.sql_worker import SQLWorker
+
+
+_table = sqlalchemy.Table(
+    "value",
+    sqlalchemy.MetaData(),
+    sqlalchemy.Column("value", sqlalchemy.Integer, nullable=False, unique=True),
+)
+
+
+@pytest.fixture
+def commits(sql_engine: sqlalchemy.engine.Engine) -> List[None]:
+    """Record every transaction committed through `sql_engine`."""
+    _table.create(sql_engine)
+    commits: List[None] = []
+    sqlalchemy.event.listen(sql_engine, "commit", lambda conn: commits.append(None))
+    return commits
+
+
+def _insert(value: int) -> Callable[[sqlalchemy.engine.Connection], int]:
+    def insert(transaction: sqlalchemy.engine.Connection) -> int:
+        transaction.execute(sqlalchemy.insert(_table).values(value=value))
+        return value
+
+    return insert
+
+
+def _get_values(sql_engine: sqlalchemy.engine.Engine) -> List[int]:
+    with sql_engine.begin() as transaction:
+        return [
+            row.value
+            for row in transaction.execute(sqlalchemy.select(_table).order_by("value"))
+        ]
+
+
+async def test_write(
+    sql_engine: sqlalchemy.engine.Engine, sql_worker: SQLWorker, commits: List[None]
+) -> None:
+    """It should execute a write in its own transaction and return its result."""
+    assert await sql_worker.write(_insert(1)) == 1
+    assert await sql_worker.write(_insert(2)) == 2
+
+    assert len(commits) == 2
+    assert _get_values(sql_engine) == [1, 2]
+
+
+async def test_concurrent_writes_share_a_transaction(
+    sql_engine: sqlalchemy.engine.Engine, sql_worker: SQLWorker, commits: List[None]
+) -> None:
+    """It should commit writes that are submitted together all at once."""
+    results = await asyncio.gather(*(sql_worker.write(_insert(i)) for i in range(10)))
+
+    assert results == list(range(10))
+    assert len(commits) == 1
+    assert _get_values(sql_engine) == list(range(10))
+
+
+async def test_failed_write_is_rolled_back_alone(
+    sql_engine: sqlalchemy.engine.Engine, sql_worker: SQLWorker, commits: List[None]
+) -> None:
+    """It should roll back a failed write without affecting the rest of its batch."""
+
+    def insert_then_fail(transaction: sqlalchemy.engine.Connection) -> None:
+        transaction.execute(sqlalchemy.insert(_table).values(value=100))
+        raise RuntimeError("oh no")
+
+    results = await asyncio.gather(
+        sql_worker.write(_insert(1)),
+        sql_worker.write(insert_then_fail),
+        # Violates the unique constraint.
+        sql_worker.write(_insert(1)),
+        sql_worker.write(_insert(2)),
+        return_exceptions=True,
+    )
+
+    assert results[0] == 1
+    assert isinstance(results[1], RuntimeError)
+    assert isinstance(results[2], sqlalchemy.exc.IntegrityError)
+    assert results[3] == 2
+    assert len(commits) == 1
+    assert _get_values(sql_engine) == [1, 2]
+
+
+async def test_read_then_write_with_concurrent_inline_writer(
+    sql_engine: sqlalchemy.engine.Engine, sql_worker: SQLWorker, commits: List[None]
+) -> None:
+    """It should not fail a write that reads first when another connection writes."""
+    read_done = threading.Event()
+    inline_write_started = threading.Event()
+
+    def count_then_insert(transaction: sqlalchemy.engine.Connection) -> int:
+        count: int = transaction.execute(
+            sqlalchemy.select(sqlalchemy.func.count()).select_from(_table)
+        ).scalar_one()
+        read_done.set()
+        # Give the inline writer a chance to commit between the read and the write.
+        inline_write_started.wait(timeout=1)
+        time.sleep(0.1)
+        transaction.execute(sqlalchemy.insert(_table).values(value=100 + count))
+        return count
+
+    def write_inline() -> None:
+        read_done.wait(timeout=1)
+        inline_write_started.set()
+        with sql_engine.begin() as transaction:
+            transaction.execute(sqlalchemy.insert(_table).values(value=1))
+
+    worker_write = asyncio.create_task(sql_worker.write(count_then_insert))
+    await asyncio.to_thread(write_inline)
+
+    assert await worker_write == 0
+    assert _get_values(sql_engine) == [1, 100]
+
+
+async def test_writes_after_close(
+    sql_engine: sqlalchemy.engine.Engine, commits: List[None]
+) -> None:
+    """It should fail writes once it's closed."""
+    subject = SQLWorker(sql_engine)
+    subject.close()
+
+    with pytest.raises(RuntimeError):
+        await subject.write(_insert(1))
+    assert _get_values(sql_engine) == []
@@ -90,6 +90,8 @@ async def test_initialize_analyzer(
         protocol_analyzer.create_protocol_analyzer(
             analysis_store=analysis_store,
             protocol_resource=protocol_resource,
+            analysis_result_cache=None,
+            analysis_executor=None,
         )
     ).then_return(analyzer)
 
@@ -100,7 +102,7 @@ async def test_initialize_analyzer(
         run_time_param_paths={"my_file": Path("file-path")},
     )
     decoy.verify(
-        await analyzer.load_orchestrator(
+        await analyzer.load_run_time_parameters(
             run_time_param_values={"sample_count": 123},
             run_time_param_paths={"my_file": Path("file-path")},
         )
@@ -140,10 +142,12 @@ async def test_raises_error_and_saves_result_if_initialization_errors(
         protocol_analyzer.create_protocol_analyzer(
             analysis_store=analysis_store,
             protocol_resource=protocol_resource,
+            analysis_result_cache=None,
+            analysis_executor=None,
         )
     ).then_return(analyzer)
     decoy.when(
-        await analyzer.load_orchestrator(
+        await analyzer.load_run_time_parameters(
             run_time_param_values={"sample_count": 123},
             run_time_param_paths={},
         )
@@ -0,0 +1,89 @@
+"""Tests for running protocol analyses in worker processes."""
+import asyncio
+import textwrap
+from pathlib import Path
+from typing import AsyncGenerator
+
+import pytest
+
+from opentrons.protocol_reader import ProtocolReader
+
+from robot_server.protocols.analysis_executor import (
+    AnalysisExecutor,
+    AnalysisWorkerRequest,
+)
+
+
+async def _make_request(directory: Path, run_body: str) -> AnalysisWorkerRequest:
+    directory.mkdir()
+    protocol_file = directory / "protocol.py"
+    protocol_file.write_text(
+        textwrap.dedent(
+            """
+            requirements = {"robotType": "OT-2", "apiLevel": "2.15"}
+
+            def run(protocol):
+            """
+        )
+        + textwrap.indent(textwrap.dedent(run_body), "    ")
+    )
+    protocol_source = await ProtocolReader().read_saved(
+        files=[protocol_file], directory=None
+    )
+    return AnalysisWorkerRequest(
+        protocol_source=protocol_source,
+        run_time_param_values=None,
+        run_time_param_paths=None,
+    )
+
+
+@pytest.fixture
+async def subject() -> AsyncGenerator[AnalysisExecutor, None]:
+    """Get an AnalysisExecutor with one worker, shutting it down afterwards."""
+    executor = AnalysisExecutor(max_workers=1)
+    try:
+        yield executor
+    finally:
+        executor.shutdown()
+
+
+async def test_analyze(tmp_path: Path, subject: AnalysisExecutor) -> None:
+    """It should simulate the protocol in a worker and return its result."""
+    request = await _make_request(tmp_path / "ok", 'protocol.comment("hello")\n')
+
+    result = await subject.analyze(request)
+
+    assert result.result.errors == []
+    assert [
+        command.params.message
+        for command in result.result.commands
+        if command.commandType == "comment"
+    ] == ["hello"]
+
+
+async def test_analyze_cancel(tmp_path: Path, subject: AnalysisExecutor) -> None:
+    """Cancelling an analysis should kill its worker and free up the pool."""
+    hanging_request = await _make_request(tmp_path / "hang", "while True:\n    pass\n")
+    task = asyncio.create_task(subject.analyze(hanging_request))
+    await asyncio.sleep(1)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    request = await _make_request(tmp_path / "ok", 'protocol.comment("hello")\n')
+    result = await asyncio.wait_for(subject.analyze(request), timeout=60)
+    assert result.result.errors == []
+
+
+async def test_analyze_memory_limit(tmp_path: Path) -> None:
+    """A simulation that exceeds the worker memory limit should fail."""
+    subject = AnalysisExecutor(max_workers=1, memory_limit_bytes=4 * 1024**3)
+    try:
+        request = await _make_request(
+            tmp_path / "hog", "hog = bytearray(8 * 1024**3)\n"
+        )
+        result = await subject.analyze(request)
+        assert len(result.result.errors) == 1
+        assert "MemoryError" in result.result.errors[0].detail
+    finally:
+        subject.shutdown()
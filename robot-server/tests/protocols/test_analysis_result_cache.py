@@ -0,0 +1,121 @@
+"""Tests for the persistent analysis result cache."""
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List
+
+from opentrons.protocol_engine import commands as pe_commands, types as pe_types
+from opentrons.protocol_engine.types import RunTimeParameter
+
+from robot_server.protocols.analysis_result_cache import (
+    AnalysisResultCache,
+    CachedAnalysisResult,
+)
+
+
+def _make_result(message: str) -> CachedAnalysisResult:
+    return CachedAnalysisResult(
+        commands=[
+            pe_commands.WaitForResume(
+                id="command-id",
+                key="command-key",
+                status=pe_commands.CommandStatus.SUCCEEDED,
+                createdAt=datetime(year=2022, month=2, day=2, tzinfo=timezone.utc),
+                params=pe_commands.WaitForResumeParams(message=message),
+            )
+        ],
+        labware=[],
+        modules=[],
+        pipettes=[],
+        errors=[],
+        liquids=[],
+        liquidClasses=[],
+        commandAnnotations=[],
+    )
+
+
+def _make_params(value: int) -> List[RunTimeParameter]:
+    return [
+        pe_types.NumberParameter(
+            displayName="Sample count",
+            variableName="sample_count",
+            type="int",
+            min=1,
+            max=96,
+            default=1,
+            value=value,
+        )
+    ]
+
+
+def test_make_key(tmp_path: Path) -> None:
+    """Keys should depend on everything that goes into an analysis."""
+    subject = AnalysisResultCache(directory=tmp_path, analyzer_version="1")
+    key = subject.make_key("abc123", "OT-3 Standard", _make_params(1))
+
+    assert key == subject.make_key("abc123", "OT-3 Standard", _make_params(1))
+    assert key != subject.make_key("def456", "OT-3 Standard", _make_params(1))
+    assert key != subject.make_key("abc123", "OT-2 Standard", _make_params(1))
+    assert key != subject.make_key("abc123", "OT-3 Standard", _make_params(2))
+    assert key != AnalysisResultCache(
+        directory=tmp_path, analyzer_version="2"
+    ).make_key("abc123", "OT-3 Standard", _make_params(1))
+
+
+async def test_insert_and_get(tmp_path: Path) -> None:
+    """It should return stored results, including from a new instance."""
+    subject = AnalysisResultCache(directory=tmp_path, analyzer_version="1")
+    result = _make_result("hello")
+
+    assert await subject.get("key") is None
+    await subject.insert("key", result)
+    assert await subject.get("key") == result
+
+    reloaded = AnalysisResultCache(directory=tmp_path, analyzer_version="1")
+    assert await reloaded.get("key") == result
+
+
+async def test_evicts_oldest_first(tmp_path: Path) -> None:
+    """It should evict the oldest entries when it's full."""
+    subject = AnalysisResultCache(
+        directory=tmp_path, analyzer_version="1", max_entries=2
+    )
+    await subject.insert("key-0", _make_result("0"))
+    await subject.insert("key-1", _make_result("1"))
+    # Re-inserting an existing key should not refresh its age.
+    await subject.insert("key-0", _make_result("0"))
+    await subject.insert("key-2", _make_result("2"))
+
+    assert await subject.get("key-0") is None
+    assert await subject.get("key-1") == _make_result("1")
+    assert await subject.get("key-2") == _make_result("2")
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "key-1.json",
+        "key-2.json",
+    ]
+
+
+async def test_evicts_oldest_existing_entries_on_load(tmp_path: Path) -> None:
+    """It should order entries from a previous instance by age."""
+    subject = AnalysisResultCache(directory=tmp_path, analyzer_version="1")
+    for index in range(3):
+        await subject.insert(f"key-{index}", _make_result(str(index)))
+    for age, name in enumerate(["key-2.json", "key-0.json", "key-1.json"]):
+        os.utime(tmp_path / name, (1000 + age, 1000 + age))
+
+    reloaded = AnalysisResultCache(
+        directory=tmp_path, analyzer_version="1", max_entries=2
+    )
+
+    assert await reloaded.get("key-2") is None
+    assert await reloaded.get("key-0") == _make_result("0")
+    assert await reloaded.get("key-1") == _make_result("1")
+
+
+async def test_discards_unreadable_entries(tmp_path: Path) -> None:
+    """It should treat corrupt entries as cache misses and remove them."""
+    (tmp_path / "key.json").write_text("not json")
+    subject = AnalysisResultCache(directory=tmp_path, analyzer_version="1")
+
+    assert await subject.get("key") is None
+    assert not (tmp_path / "key.json").exists()
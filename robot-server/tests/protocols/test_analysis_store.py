@@ -33,6 +33,7 @@ from opentrons.protocol_reader import (
     JsonProtocolConfig,
 )
 
+from robot_server.persistence.sql_worker import SQLWorker
 from robot_server.protocols.analysis_models import (
     AnalysisResult,
     AnalysisStatus,
@@ -73,9 +74,9 @@ def protocol_store(sql_engine: SQLEngine) -> ProtocolStore:
 
 
 @pytest.fixture
-def subject(sql_engine: SQLEngine) -> AnalysisStore:
+def subject(sql_engine: SQLEngine, sql_worker: SQLWorker) -> AnalysisStore:
     """Return the `AnalysisStore` test subject."""
-    return AnalysisStore(sql_engine=sql_engine)
+    return AnalysisStore(sql_engine=sql_engine, sql_worker=sql_worker)
 
 
 def make_dummy_protocol_resource(protocol_id: str) -> ProtocolResource:
@@ -331,7 +332,10 @@ async def test_update_adds_details_and_completes_analysis(
 
 
 async def test_update_adds_rtp_values_to_completed_store(
-    decoy: Decoy, sql_engine: SQLEngine, protocol_store: ProtocolStore
+    decoy: Decoy,
+    sql_engine: SQLEngine,
+    sql_worker: SQLWorker,
+    protocol_store: ProtocolStore,
 ) -> None:
     """It should add RTP values and defaults to completed analysis store."""
     number_param = pe_types.NumberParameter(
@@ -380,7 +384,11 @@ async def test_update_adds_rtp_values_to_completed_store(
     )
 
     mock_completed_store = decoy.mock(cls=CompletedAnalysisStore)
-    subject = AnalysisStore(sql_engine=sql_engine, completed_store=mock_completed_store)
+    subject = AnalysisStore(
+        sql_engine=sql_engine,
+        sql_worker=sql_worker,
+        completed_store=mock_completed_store,
+    )
     protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id"))
 
     subject.add_pending(
@@ -510,7 +518,10 @@ async def test_update_infers_status_from_errors(
 
 
 async def test_save_initialization_failed_analysis(
-    decoy: Decoy, sql_engine: SQLEngine, protocol_store: ProtocolStore
+    decoy: Decoy,
+    sql_engine: SQLEngine,
+    sql_worker: SQLWorker,
+    protocol_store: ProtocolStore,
 ) -> None:
     """It should save the analysis that failed during analyzer initialization."""
     validated_rtp = NumberParameter(
@@ -549,7 +560,11 @@ async def test_save_initialization_failed_analysis(
     )
 
     mock_completed_store = decoy.mock(cls=CompletedAnalysisStore)
-    subject = AnalysisStore(sql_engine=sql_engine, completed_store=mock_completed_store)
+    subject = AnalysisStore(
+        sql_engine=sql_engine,
+        sql_worker=sql_worker,
+        completed_store=mock_completed_store,
+    )
     protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id"))
 
     await subject.save_initialization_failed_analysis(
@@ -619,13 +634,18 @@ async def test_save_initialization_failed_analysis(
 async def test_matching_rtp_values_in_analysis(
     decoy: Decoy,
     sql_engine: SQLEngine,
+    sql_worker: SQLWorker,
     protocol_store: ProtocolStore,
     parameters_from_client: List[RunTimeParameter],
     expected_match: bool,
 ) -> None:
     """It should return whether the client's RTP values match with those in the last analysis of protocol."""
     mock_completed_store = decoy.mock(cls=CompletedAnalysisStore)
-    subject = AnalysisStore(sql_engine=sql_engine, completed_store=mock_completed_store)
+    subject = AnalysisStore(
+        sql_engine=sql_engine,
+        sql_worker=sql_worker,
+        completed_store=mock_completed_store,
+    )
     protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id"))
 
     decoy.when(
@@ -664,12 +684,17 @@ async def test_matching_default_rtp_values_in_analysis_with_pending_analysis(
 async def test_matching_rtp_values_in_analysis_with_no_rtps(
     decoy: Decoy,
     sql_engine: SQLEngine,
+    sql_worker: SQLWorker,
     subject: AnalysisStore,
     protocol_store: ProtocolStore,
 ) -> None:
     """It should handle the cases of no RTPs, either previously or newly, appropriately."""
     mock_completed_store = decoy.mock(cls=CompletedAnalysisStore)
-    subject = AnalysisStore(sql_engine=sql_engine, completed_store=mock_completed_store)
+    subject = AnalysisStore(
+        sql_engine=sql_engine,
+        sql_worker=sql_worker,
+        completed_store=mock_completed_store,
+    )
     protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id"))
 
     decoy.when(
@@ -8,6 +8,7 @@ import pytest
 from sqlalchemy.engine import Engine
 from decoy import Decoy
 
+from robot_server.persistence.sql_worker import SQLWorker
 from robot_server.data_files.models import DataFileSource
 from robot_server.persistence.tables import (
     analysis_table,
@@ -54,9 +55,10 @@ def memcache(decoy: Decoy) -> MemoryCache[str, CompletedAnalysisResource]:
 def subject(
     memcache: MemoryCache[str, CompletedAnalysisResource],
     sql_engine: Engine,
+    sql_worker: SQLWorker,
 ) -> CompletedAnalysisStore:
     """Get a subject."""
-    return CompletedAnalysisStore(sql_engine, memcache, "2")
+    return CompletedAnalysisStore(sql_engine, sql_worker, memcache, "2")
 
 
 @pytest.fixture
@@ -71,7 +73,9 @@ def protocol_store(sql_engine: Engine) -> ProtocolStore:
 
 
 @pytest.fixture
-def data_files_store(sql_engine: Engine, tmp_path: Path) -> DataFilesStore:
+def data_files_store(
+    sql_engine: Engine, sql_worker: SQLWorker, tmp_path: Path
+) -> DataFilesStore:
     """Return a `DataFilesStore` linked to the same database as the subject under test.
 
     `DataFilesStore` is tested elsewhere.
@@ -80,7 +84,11 @@ def data_files_store(sql_engine: Engine, tmp_path: Path) -> DataFilesStore:
     """
     data_files_dir = tmp_path / "data_files"
     data_files_dir.mkdir()
-    return DataFilesStore(sql_engine=sql_engine, data_files_directory=data_files_dir)
+    return DataFilesStore(
+        sql_engine=sql_engine,
+        sql_worker=sql_worker,
+        data_files_directory=data_files_dir,
+    )
 
 
 def make_dummy_protocol_resource(protocol_id: str) -> ProtocolResource:
@@ -24,10 +24,20 @@ from opentrons.protocol_reader import (
     PythonProtocolConfig,
 )
 from opentrons.protocol_runner.run_orchestrator import ParseMode
+from opentrons.protocols.parse import PythonParseMode
 
 import opentrons.util.helpers as datetime_helper
 
 from robot_server.protocols.analysis_store import AnalysisStore
+from robot_server.protocols.analysis_executor import (
+    AnalysisExecutor,
+    AnalysisWorkerRequest,
+    AnalysisWorkerResult,
+)
+from robot_server.protocols.analysis_result_cache import (
+    AnalysisResultCache,
+    CachedAnalysisResult,
+)
 from robot_server.protocols.protocol_models import ProtocolKind
 from robot_server.protocols.protocol_store import ProtocolResource
 from robot_server.protocols.protocol_analyzer import ProtocolAnalyzer
@@ -67,11 +77,18 @@ def analysis_store(decoy: Decoy) -> AnalysisStore:
     return decoy.mock(cls=AnalysisStore)
 
 
-async def test_load_orchestrator(
+@pytest.fixture
+def run_time_parameter_loader(decoy: Decoy) -> protocol_runner.RunTimeParameterLoader:
+    """Get a mocked out RunTimeParameterLoader."""
+    return decoy.mock(cls=protocol_runner.RunTimeParameterLoader)
+
+
+async def test_load_run_time_parameters(
     decoy: Decoy,
     analysis_store: AnalysisStore,
+    run_time_parameter_loader: protocol_runner.RunTimeParameterLoader,
 ) -> None:
-    """It should load the appropriate run orchestrator."""
+    """It should validate run time parameters without setting up a simulation."""
     robot_type: RobotType = "OT-3 Standard"
     protocol_source = ProtocolSource(
         directory=Path("/dev/null"),
@@ -89,36 +106,46 @@ async def test_load_orchestrator(
         protocol_key="dummy-data-111",
         protocol_kind=ProtocolKind.STANDARD,
     )
+    bool_parameter = pe_types.BooleanParameter(
+        displayName="Foo", variableName="Bar", default=True, value=False
+    )
     subject = ProtocolAnalyzer(
-        analysis_store=analysis_store, protocol_resource=protocol_resource
+        analysis_store=analysis_store,
+        protocol_resource=protocol_resource,
+        run_time_parameter_loader=run_time_parameter_loader,
+    )
+    decoy.when(run_time_parameter_loader.run_time_parameters).then_return(
+        [bool_parameter]
     )
 
-    run_orchestrator = decoy.mock(cls=protocol_runner.RunOrchestrator)
-    decoy.when(
-        await simulating_runner.create_simulating_orchestrator(
-            robot_type=robot_type,
-            protocol_config=PythonProtocolConfig(api_version=APIVersion(100, 200)),
-        )
-    ).then_return(run_orchestrator)
-    await subject.load_orchestrator(
+    await subject.load_run_time_parameters(
         run_time_param_values={"rtp_var": 123},
         run_time_param_paths={"csv_param": Path("file-path")},
     )
 
     decoy.verify(
-        await run_orchestrator.load(
+        await run_time_parameter_loader.load(
             protocol_source=protocol_source,
-            parse_mode=ParseMode.NORMAL,
+            python_parse_mode=PythonParseMode.NORMAL,
             run_time_param_values={"rtp_var": 123},
             run_time_param_paths={"csv_param": Path("file-path")},
         ),
         times=1,
     )
+    decoy.verify(
+        await simulating_runner.create_simulating_orchestrator(
+            robot_type=robot_type,
+            protocol_config=PythonProtocolConfig(api_version=APIVersion(100, 200)),
+        ),
+        times=0,
+    )
+    assert subject.get_verified_run_time_parameters() == [bool_parameter]
 
 
 async def test_analyze(
     decoy: Decoy,
     analysis_store: AnalysisStore,
+    run_time_parameter_loader: protocol_runner.RunTimeParameterLoader,
 ) -> None:
     """It should be able to start a protocol analysis and update the analysis store when completed."""
     robot_type: RobotType = "OT-3 Standard"
@@ -175,9 +202,11 @@ async def test_analyze(
         )
     ).then_return(orchestrator)
     subject = ProtocolAnalyzer(
-        analysis_store=analysis_store, protocol_resource=protocol_resource
+        analysis_store=analysis_store,
+        protocol_resource=protocol_resource,
+        run_time_parameter_loader=run_time_parameter_loader,
     )
-    await subject.load_orchestrator(
+    await subject.load_run_time_parameters(
         run_time_param_values={"rtp_var": 123}, run_time_param_paths={}
     )
     decoy.when(await orchestrator.run(deck_configuration=[],)).then_return(
@@ -204,6 +233,14 @@ async def test_analyze(
     await subject.analyze(
         analysis_id="analysis-id",
     )
+    decoy.verify(
+        await orchestrator.load(
+            protocol_source=protocol_resource.source,
+            parse_mode=ParseMode.NORMAL,
+            run_time_param_values={"rtp_var": 123},
+            run_time_param_paths={},
+        )
+    )
     decoy.verify(
         await analysis_store.update(
             analysis_id="analysis-id",
@@ -224,6 +261,7 @@ async def test_analyze(
 async def test_analyze_updates_pending_on_error(
     decoy: Decoy,
     analysis_store: AnalysisStore,
+    run_time_parameter_loader: protocol_runner.RunTimeParameterLoader,
 ) -> None:
     """It should update pending analysis with an internal error."""
     robot_type: RobotType = "OT-3 Standard"
@@ -267,14 +305,16 @@ async def test_analyze_updates_pending_on_error(
     ).then_return(orchestrator)
 
     subject = ProtocolAnalyzer(
-        analysis_store=analysis_store, protocol_resource=protocol_resource
+        analysis_store=analysis_store,
+        protocol_resource=protocol_resource,
+        run_time_parameter_loader=run_time_parameter_loader,
     )
     decoy.when(
         await orchestrator.run(
             deck_configuration=[],
         )
     ).then_raise(raised_exception)
-    decoy.when(orchestrator.get_run_time_parameters()).then_return([])
+    decoy.when(run_time_parameter_loader.run_time_parameters).then_return([])
     decoy.when(em.map_unexpected_error(error=raised_exception)).then_return(
         enumerated_error
     )
@@ -282,7 +322,7 @@ async def test_analyze_updates_pending_on_error(
     decoy.when(datetime_helper.utc_now()).then_return(
         datetime(year=2023, month=3, day=3)
     )
-    await subject.load_orchestrator(
+    await subject.load_run_time_parameters(
         run_time_param_values={"rtp_var": 123}, run_time_param_paths={}
     )
     await subject.analyze(
@@ -304,3 +344,255 @@ async def test_analyze_updates_pending_on_error(
             command_annotations=[],
         ),
     )
+
+
+def _make_protocol_resource(robot_type: RobotType) -> ProtocolResource:
+    return ProtocolResource(
+        protocol_id="protocol-id",
+        created_at=datetime(year=2021, month=1, day=1),
+        source=ProtocolSource(
+            directory=Path("/dev/null"),
+            main_file=Path("/dev/null/abc.json"),
+            config=JsonProtocolConfig(schema_version=123),
+            files=[],
+            metadata={},
+            robot_type=robot_type,
+            content_hash="abc123",
+        ),
+        protocol_key="dummy-data-111",
+        protocol_kind=ProtocolKind.STANDARD,
+    )
+
+
+async def test_analyze_uses_cached_result(
+    decoy: Decoy,
+    analysis_store: AnalysisStore,
+    run_time_parameter_loader: protocol_runner.RunTimeParameterLoader,
+) -> None:
+    """It should complete the analysis from the cache without running the protocol."""
+    robot_type: RobotType = "OT-3 Standard"
+    analysis_result_cache = decoy.mock(cls=AnalysisResultCache)
+    bool_parameter = pe_types.BooleanParameter(
+        displayName="Foo", variableName="Bar", default=True, value=False
+    )
+    analysis_command = pe_commands.WaitForResume(
+        id="command-id",
+        key="command-key",
+        status=pe_commands.CommandStatus.SUCCEEDED,
+        createdAt=datetime(year=2022, month=2, day=2),
+        params=pe_commands.WaitForResumeParams(message="hello world"),
+    )
+    cached_result = CachedAnalysisResult(
+        commands=[analysis_command],
+        labware=[],
+        modules=[],
+        pipettes=[],
+        errors=[],
+        liquids=[],
+        liquidClasses=[],
+        commandAnnotations=[],
+    )
+
+    decoy.when(run_time_parameter_loader.run_time_parameters).then_return(
+        [bool_parameter]
+    )
+    decoy.when(
+        analysis_result_cache.make_key(
+            content_hash="abc123",
+            robot_type=robot_type,
+            run_time_parameters=[bool_parameter],
+        )
+    ).then_return("cache-key")
+    decoy.when(await analysis_result_cache.get("cache-key")).then_return(cached_result)
+
+    subject = ProtocolAnalyzer(
+        analysis_store=analysis_store,
+        protocol_resource=_make_protocol_resource(robot_type),
+        analysis_result_cache=analysis_result_cache,
+        run_time_parameter_loader=run_time_parameter_loader,
+    )
+    await subject.load_run_time_parameters(
+        run_time_param_values={}, run_time_param_paths={}
+    )
+    await subject.analyze(analysis_id="analysis-id")
+
+    decoy.verify(
+        await simulating_runner.create_simulating_orchestrator(
+            robot_type=robot_type,
+            protocol_config=JsonProtocolConfig(schema_version=123),
+        ),
+        times=0,
+    )
+    decoy.verify(
+        await analysis_store.update(
+            analysis_id="analysis-id",
+            robot_type=robot_type,
+            run_time_parameters=[bool_parameter],
+            commands=[analysis_command],
+            labware=[],
+            modules=[],
+            pipettes=[],
+            errors=[],
+            liquids=[],
+            liquidClasses=[],
+            command_annotations=[],
+        )
+    )
+
+
+async def test_analyze_caches_result(
+    decoy: Decoy,
+    analysis_store: AnalysisStore,
+    run_time_parameter_loader: protocol_runner.RunTimeParameterLoader,
+) -> None:
+    """It should store a newly completed analysis in the cache."""
+    robot_type: RobotType = "OT-3 Standard"
+    analysis_result_cache = decoy.mock(cls=AnalysisResultCache)
+    analysis_command = pe_commands.WaitForResume(
+        id="command-id",
+        key="command-key",
+        status=pe_commands.CommandStatus.SUCCEEDED,
+        createdAt=datetime(year=2022, month=2, day=2),
+        params=pe_commands.WaitForResumeParams(message="hello world"),
+    )
+
+    orchestrator = decoy.mock(cls=protocol_runner.RunOrchestrator)
+    decoy.when(
+        await simulating_runner.create_simulating_orchestrator(
+            robot_type=robot_type,
+            protocol_config=JsonProtocolConfig(schema_version=123),
+        )
+    ).then_return(orchestrator)
+    decoy.when(run_time_parameter_loader.run_time_parameters).then_return([])
+    decoy.when(
+        analysis_result_cache.make_key(
+            content_hash="abc123", robot_type=robot_type, run_time_parameters=[]
+        )
+    ).then_return("cache-key")
+    decoy.when(await analysis_result_cache.get("cache-key")).then_return(None)
+    decoy.when(await orchestrator.run(deck_configuration=[])).then_return(
+        protocol_runner.RunResult(
+            commands=[analysis_command],
+            state_summary=StateSummary(
+                status=EngineStatus.SUCCEEDED,
+                errors=[],
+                labware=[],
+                pipettes=[],
+                modules=[],
+                labwareOffsets=[],
+                liquids=[],
+                liquidClasses=[],
+                wells=[],
+                files=[],
+                hasEverEnteredErrorRecovery=False,
+            ),
+            parameters=[],
+            command_annotations=[],
+        )
+    )
+
+    subject = ProtocolAnalyzer(
+        analysis_store=analysis_store,
+        protocol_resource=_make_protocol_resource(robot_type),
+        analysis_result_cache=analysis_result_cache,
+        run_time_parameter_loader=run_time_parameter_loader,
+    )
+    await subject.load_run_time_parameters(
+        run_time_param_values={}, run_time_param_paths={}
+    )
+    await subject.analyze(analysis_id="analysis-id")
+
+    decoy.verify(
+        await analysis_result_cache.insert(
+            "cache-key",
+            CachedAnalysisResult(
+                commands=[analysis_command],
+                labware=[],
+                modules=[],
+                pipettes=[],
+                errors=[],
+                liquids=[],
+                liquidClasses=[],
+                commandAnnotations=[],
+            ),
+        )
+    )
+
+
+async def test_analyze_in_worker(
+    decoy: Decoy,
+    analysis_store: AnalysisStore,
+    run_time_parameter_loader: protocol_runner.RunTimeParameterLoader,
+) -> None:
+    """It should simulate in the analysis executor instead of running in-process."""
+    robot_type: RobotType = "OT-3 Standard"
+    analysis_executor = decoy.mock(cls=AnalysisExecutor)
+    protocol_resource = _make_protocol_resource(robot_type)
+    bool_parameter = pe_types.BooleanParameter(
+        displayName="Foo", variableName="Bar", default=True, value=False
+    )
+    analysis_command = pe_commands.WaitForResume(
+        id="command-id",
+        key="command-key",
+        status=pe_commands.CommandStatus.SUCCEEDED,
+        createdAt=datetime(year=2022, month=2, day=2),
+        params=pe_commands.WaitForResumeParams(message="hello world"),
+    )
+
+    decoy.when(
+        await analysis_executor.analyze(
+            AnalysisWorkerRequest(
+                protocol_source=protocol_resource.source,
+                run_time_param_values={"Bar": False},
+                run_time_param_paths={},
+            )
+        )
+    ).then_return(
+        AnalysisWorkerResult(
+            runTimeParameters=[bool_parameter],
+            result=CachedAnalysisResult(
+                commands=[analysis_command],
+                labware=[],
+                modules=[],
+                pipettes=[],
+                errors=[],
+                liquids=[],
+                liquidClasses=[],
+                commandAnnotations=[],
+            ),
+        )
+    )
+
+    subject = ProtocolAnalyzer(
+        analysis_store=analysis_store,
+        protocol_resource=protocol_resource,
+        analysis_executor=analysis_executor,
+        run_time_parameter_loader=run_time_parameter_loader,
+    )
+    await subject.load_run_time_parameters(
+        run_time_param_values={"Bar": False}, run_time_param_paths={}
+    )
+    await subject.analyze(analysis_id="analysis-id")
+
+    decoy.verify(
+        await simulating_runner.create_simulating_orchestrator(
+            robot_type=robot_type,
+            protocol_config=JsonProtocolConfig(schema_version=123),
+        ),
+        times=0,
+    )
+    decoy.verify(
+        await analysis_store.update(
+            analysis_id="analysis-id",
+            robot_type=robot_type,
+            run_time_parameters=[bool_parameter],
+            commands=[analysis_command],
+            labware=[],
+            modules=[],
+            pipettes=[],
+            errors=[],
+            liquids=[],
+            liquidClasses=[],
+            command_annotations=[],
+        )
+    )
@@ -1,12 +1,13 @@
 """Tests for the ProtocolStore interface."""
 from opentrons.protocol_engine.types import CSVParameter, FileInfo
 import pytest
-from decoy import Decoy
+from decoy import Decoy, matchers
 from datetime import datetime, timezone
 from pathlib import Path
 
 from opentrons.protocols.api_support.types import APIVersion
 from opentrons.protocol_reader import (
+    ProtocolReader,
     ProtocolSource,
     ProtocolSourceFile,
     ProtocolFileRole,
@@ -14,6 +15,7 @@ from opentrons.protocol_reader import (
     PythonProtocolConfig,
 )
 
+from robot_server.persistence.sql_worker import SQLWorker
 from robot_server.data_files.data_files_store import (
     DataFilesStore,
     DataFileInfo,
@@ -72,20 +74,29 @@ def run_store(sql_engine: SQLEngine, mock_runs_publisher: RunsPublisher) -> RunS
 
 
 @pytest.fixture
-def data_files_store(sql_engine: SQLEngine, tmp_path: Path) -> DataFilesStore:
+def data_files_store(
+    sql_engine: SQLEngine, sql_worker: SQLWorker, tmp_path: Path
+) -> DataFilesStore:
     """Get a mocked out DataFilesStore."""
     data_files_dir = tmp_path / "data_files"
     data_files_dir.mkdir()
-    return DataFilesStore(sql_engine=sql_engine, data_files_directory=data_files_dir)
+    return DataFilesStore(
+        sql_engine=sql_engine,
+        sql_worker=sql_worker,
+        data_files_directory=data_files_dir,
+    )
 
 
 @pytest.fixture
 def completed_analysis_store(
     decoy: Decoy,
     sql_engine: SQLEngine,
+    sql_worker: SQLWorker,
 ) -> CompletedAnalysisStore:
     """Get a subject."""
-    return CompletedAnalysisStore(sql_engine, decoy.mock(cls=MemoryCache), "2")
+    return CompletedAnalysisStore(
+        sql_engine, sql_worker, decoy.mock(cls=MemoryCache), "2"
+    )
 
 
 async def test_insert_and_get_protocol(
@@ -677,3 +688,113 @@ async def test_get_referenced_data_files(
             source=DataFileSource.UPLOADED,
         ),
     ]
+
+
+def _write_python_protocol(protocols_directory: Path, protocol_id: str) -> Path:
+    protocol_directory = protocols_directory / protocol_id
+    protocol_directory.mkdir()
+    (protocol_directory / "protocol.py").write_text(
+        "metadata = {'protocolName': 'Summarized', 'apiLevel': '2.15'}\n"
+        "def run(context):\n"
+        "    pass\n"
+    )
+    return protocol_directory
+
+
+async def test_rehydrate_from_summaries(
+    decoy: Decoy, sql_engine: SQLEngine, tmp_path: Path
+) -> None:
+    """It should only read protocols that don't have a persisted summary."""
+    protocols_directory = tmp_path / "protocols"
+    protocols_directory.mkdir()
+    summaries_directory = tmp_path / "protocol_summaries"
+    summaries_directory.mkdir()
+    created_at = datetime(year=2021, month=1, day=1, tzinfo=timezone.utc)
+    resources = []
+    for protocol_id in ["summarized", "unsummarized"]:
+        protocol_directory = _write_python_protocol(protocols_directory, protocol_id)
+        source = await ProtocolReader().read_saved(
+            files=[protocol_directory / "protocol.py"],
+            directory=protocol_directory,
+        )
+        resources.append(
+            ProtocolResource(
+                protocol_id=protocol_id,
+                created_at=created_at,
+                source=source,
+                protocol_key=None,
+                protocol_kind=ProtocolKind.STANDARD,
+            )
+        )
+
+    ProtocolStore.create_empty(
+        sql_engine=sql_engine, summaries_directory=summaries_directory
+    ).insert(resources[0])
+    ProtocolStore.create_empty(sql_engine=sql_engine).insert(resources[1])
+    assert [p.name for p in summaries_directory.iterdir()] == ["summarized.json"]
+
+    first_boot = await ProtocolStore.rehydrate(
+        sql_engine=sql_engine,
+        protocols_directory=protocols_directory,
+        protocol_reader=ProtocolReader(),
+        summaries_directory=summaries_directory,
+    )
+    assert first_boot.get_all() == resources
+    assert sorted(p.name for p in summaries_directory.iterdir()) == [
+        "summarized.json",
+        "unsummarized.json",
+    ]
+
+    mock_protocol_reader = decoy.mock(cls=ProtocolReader)
+    second_boot = await ProtocolStore.rehydrate(
+        sql_engine=sql_engine,
+        protocols_directory=protocols_directory,
+        protocol_reader=mock_protocol_reader,
+        summaries_directory=summaries_directory,
+    )
+    assert second_boot.get_all() == resources
+    # Both protocols have the same files, so the first-added one matches.
+    assert second_boot.get_id_by_hash(resources[1].source.content_hash) == "summarized"
+    decoy.verify(
+        await mock_protocol_reader.read_saved(
+            files=matchers.Anything(),
+            directory=matchers.Anything(),
+            files_are_prevalidated=matchers.Anything(),
+            python_parse_mode=matchers.Anything(),
+        ),
+        times=0,
+    )
+
+    second_boot.remove("summarized")
+    assert [p.name for p in summaries_directory.iterdir()] == ["unsummarized.json"]
+
+
+async def test_insert_unsummarizable_protocol(
+    sql_engine: SQLEngine, protocol_file_directory: Path, tmp_path: Path
+) -> None:
+    """It should keep sources that can't be summarized exactly in memory."""
+    summaries_directory = tmp_path / "protocol_summaries"
+    summaries_directory.mkdir()
+    subject = ProtocolStore.create_empty(
+        sql_engine=sql_engine, summaries_directory=summaries_directory
+    )
+    protocol_resource = ProtocolResource(
+        protocol_id="protocol-id",
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+        source=ProtocolSource(
+            directory=protocol_file_directory,
+            main_file=(protocol_file_directory / "abc.py"),
+            config=PythonProtocolConfig(api_version=APIVersion(2, 15)),
+            files=[],
+            metadata={"tags": ("not", "a", "list")},
+            robot_type="OT-2 Standard",
+            content_hash="abc123",
+        ),
+        protocol_key=None,
+        protocol_kind=ProtocolKind.STANDARD,
+    )
+
+    subject.insert(protocol_resource)
+
+    assert subject.get("protocol-id") == protocol_resource
+    assert list(summaries_directory.iterdir()) == []
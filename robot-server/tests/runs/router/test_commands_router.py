@@ -28,6 +28,7 @@ from robot_server.runs.router.commands_router import (
     create_run_command,
     get_run_command,
     get_run_commands,
+    get_run_commands_as_pre_serialized_stream,
     get_current_run_from_url,
 )
 
@@ -455,6 +456,53 @@ async def test_get_run_commands_not_found(
     assert exc_info.value.content["errors"][0]["id"] == "RunNotFound"
 
 
+async def test_get_run_commands_as_pre_serialized_stream(
+    decoy: Decoy, mock_run_data_manager: RunDataManager
+) -> None:
+    """It should stream pre-serialized commands as newline-delimited JSON."""
+    decoy.when(
+        mock_run_data_manager.iter_commands_as_preserialized_chunks(
+            run_id="run-id", include_fixit_commands=True
+        )
+    ).then_return(
+        iter([['{"id":"command-1"}', '{"id":"command-2"}'], ['{"id":"command-3"}']])
+    )
+
+    result = await get_run_commands_as_pre_serialized_stream(
+        runId="run-id",
+        run_data_manager=mock_run_data_manager,
+        includeFixitCommands=True,
+    )
+
+    assert result.media_type == "application/x-ndjson"
+    body = [chunk async for chunk in result.body_iterator]
+    assert body == [
+        '{"id":"command-1"}\n{"id":"command-2"}\n',
+        '{"id":"command-3"}\n',
+    ]
+
+
+async def test_get_run_commands_as_pre_serialized_stream_not_found(
+    decoy: Decoy, mock_run_data_manager: RunDataManager
+) -> None:
+    """It should 404 before streaming if the run is not found."""
+    decoy.when(
+        mock_run_data_manager.iter_commands_as_preserialized_chunks(
+            run_id="run-id", include_fixit_commands=True
+        )
+    ).then_raise(RunNotFoundError("run-id"))
+
+    with pytest.raises(ApiError) as exc_info:
+        await get_run_commands_as_pre_serialized_stream(
+            runId="run-id",
+            run_data_manager=mock_run_data_manager,
+            includeFixitCommands=True,
+        )
+
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.content["errors"][0]["id"] == "RunNotFound"
+
+
 async def test_get_run_command_by_id(
     decoy: Decoy, mock_run_data_manager: RunDataManager
 ) -> None:
@@ -1,4 +1,5 @@
 """Tests for RunController."""
+import asyncio
 from typing import List
 
 import pytest
@@ -6,6 +7,7 @@ from datetime import datetime
 from decoy import Decoy, matchers
 
 from opentrons.protocol_engine import (
+    CommandSlice,
     EngineStatus,
     StateSummary,
     commands as pe_commands,
@@ -249,6 +251,76 @@ async def test_create_play_action_to_start(
     )
 
 
+async def test_play_persists_finalized_commands_during_run(
+    decoy: Decoy,
+    monkeypatch: pytest.MonkeyPatch,
+    mock_run_orchestrator_store: RunOrchestratorStore,
+    mock_run_store: RunStore,
+    mock_task_runner: TaskRunner,
+    engine_state_summary: StateSummary,
+    run_id: str,
+    subject: RunController,
+) -> None:
+    """It should write finalized commands to the run store while the run executes."""
+    monkeypatch.setattr(
+        "robot_server.runs.run_controller._COMMAND_PERSISTENCE_INTERVAL_SECONDS", 0
+    )
+    succeeded_command = pe_commands.WaitForResume.model_construct(  # type: ignore[call-arg]
+        id="command-1", status=pe_commands.CommandStatus.SUCCEEDED
+    )
+    queued_command = pe_commands.WaitForResume.model_construct(  # type: ignore[call-arg]
+        id="command-2", status=pe_commands.CommandStatus.QUEUED
+    )
+
+    decoy.when(mock_run_orchestrator_store.run_was_started()).then_return(False)
+    decoy.when(
+        mock_run_orchestrator_store.get_command_slice(
+            cursor=0, length=matchers.Anything(), include_fixit_commands=True
+        )
+    ).then_return(
+        CommandSlice(
+            commands=[succeeded_command, queued_command], cursor=0, total_length=2
+        )
+    )
+    decoy.when(
+        mock_run_orchestrator_store.get_command_slice(
+            cursor=1, length=matchers.Anything(), include_fixit_commands=True
+        )
+    ).then_return(CommandSlice(commands=[queued_command], cursor=1, total_length=2))
+
+    async def _run(deck_configuration: List[object]) -> RunResult:
+        await asyncio.sleep(0.01)
+        return RunResult(
+            commands=[succeeded_command, queued_command],
+            state_summary=engine_state_summary,
+            parameters=[],
+            command_annotations=[],
+        )
+
+    decoy.when(await mock_run_orchestrator_store.run(deck_configuration=[])).then_do(
+        _run
+    )
+
+    subject.create_action(
+        action_id="some-action-id",
+        action_type=RunActionType.PLAY,
+        created_at=datetime(year=2021, month=1, day=1),
+        action_payload=[],
+    )
+    background_task_captor = matchers.Captor()
+    decoy.verify(mock_task_runner.run(background_task_captor, deck_configuration=[]))
+    await background_task_captor.value(deck_configuration=[])
+
+    decoy.verify(
+        mock_run_store.insert_commands(
+            run_id=run_id,
+            commands=[succeeded_command],
+            first_index_in_run=0,
+        ),
+        times=1,
+    )
+
+
 def test_create_pause_action(
     decoy: Decoy,
     mock_run_orchestrator_store: RunOrchestratorStore,
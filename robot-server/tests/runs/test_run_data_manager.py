@@ -1251,6 +1251,43 @@ def test_get_all_commands_as_preserialized_list_errors_for_active_runs(
         subject.get_all_commands_as_preserialized_list("current-run-id", True)
 
 
+def test_iter_commands_as_preserialized_chunks(
+    decoy: Decoy,
+    subject: RunDataManager,
+    mock_run_store: RunStore,
+    mock_run_orchestrator_store: RunOrchestratorStore,
+) -> None:
+    """It should return the run store's pre-serialized command chunks."""
+    chunks = iter([['{"id": command-1}'], ['{"id": command-2}']])
+    decoy.when(mock_run_orchestrator_store.current_run_id).then_return(None)
+    decoy.when(
+        mock_run_store.iter_commands_as_preserialized_chunks(
+            run_id="run-id", include_fixit_commands=True
+        )
+    ).then_return(chunks)
+
+    assert (
+        subject.iter_commands_as_preserialized_chunks(
+            run_id="run-id", include_fixit_commands=True
+        )
+        is chunks
+    )
+
+
+def test_iter_commands_as_preserialized_chunks_errors_for_active_runs(
+    decoy: Decoy,
+    subject: RunDataManager,
+    mock_run_orchestrator_store: RunOrchestratorStore,
+) -> None:
+    """It should raise an error when streaming pre-serialized commands of an active run."""
+    decoy.when(mock_run_orchestrator_store.current_run_id).then_return("current-run-id")
+    decoy.when(mock_run_orchestrator_store.get_is_run_terminal()).then_return(False)
+    with pytest.raises(PreSerializedCommandsNotAvailableError):
+        subject.iter_commands_as_preserialized_chunks(
+            run_id="current-run-id", include_fixit_commands=True
+        )
+
+
 async def test_get_current_run_labware_definition(
     decoy: Decoy,
     mock_run_orchestrator_store: RunOrchestratorStore,
@@ -7,6 +7,7 @@ import warnings
 
 import pytest
 from decoy import Decoy
+from robot_server.persistence.sql_worker import SQLWorker
 from robot_server.data_files.data_files_store import (
     DataFileInfo,
     DataFilesStore,
@@ -284,7 +285,9 @@ def invalid_state_summary() -> StateSummary:
 
 
 @pytest.fixture
-def data_files_store(sql_engine: Engine, tmp_path: Path) -> DataFilesStore:
+def data_files_store(
+    sql_engine: Engine, sql_worker: SQLWorker, tmp_path: Path
+) -> DataFilesStore:
     """Return a `DataFilesStore` linked to the same database as the subject under test.
 
     `DataFilesStore` is tested elsewhere.
@@ -293,7 +296,11 @@ def data_files_store(sql_engine: Engine, tmp_path: Path) -> DataFilesStore:
     """
     data_files_dir = tmp_path / "data_files"
     data_files_dir.mkdir()
-    return DataFilesStore(sql_engine=sql_engine, data_files_directory=data_files_dir)
+    return DataFilesStore(
+        sql_engine=sql_engine,
+        sql_worker=sql_worker,
+        data_files_directory=data_files_dir,
+    )
 
 
 async def test_update_run_state(
@@ -425,6 +432,81 @@ async def test_insert_and_get_csv_rtp(
     ]
 
 
+def test_insert_commands_then_update_run_state(
+    subject: RunStore,
+    state_summary: StateSummary,
+    protocol_commands: List[pe_commands.Command],
+) -> None:
+    """It should keep incrementally inserted commands and write only the rest."""
+    subject.insert(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    )
+    subject.insert_commands(
+        run_id="run-id", commands=protocol_commands[:2], first_index_in_run=0
+    )
+
+    partial_result = subject.get_commands_slice(
+        run_id="run-id", length=10, cursor=0, include_fixit_commands=True
+    )
+    assert partial_result.commands == protocol_commands[:2]
+
+    subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        commands=protocol_commands,
+        run_time_parameters=[],
+    )
+
+    result = subject.get_commands_slice(
+        run_id="run-id", length=10, cursor=0, include_fixit_commands=True
+    )
+    assert result.commands == protocol_commands
+    assert result.total_length == len(protocol_commands)
+
+
+def test_update_run_state_replaces_mismatched_commands(
+    subject: RunStore,
+    state_summary: StateSummary,
+    protocol_commands: List[pe_commands.Command],
+) -> None:
+    """It should rewrite persisted commands that no longer match the run's commands."""
+    subject.insert(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    )
+    subject.insert_commands(
+        run_id="run-id",
+        commands=[protocol_commands[0], protocol_commands[2]],
+        first_index_in_run=0,
+    )
+
+    subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        commands=protocol_commands[:3],
+        run_time_parameters=[],
+    )
+
+    result = subject.get_commands_slice(
+        run_id="run-id", length=10, cursor=0, include_fixit_commands=True
+    )
+    assert result.commands == protocol_commands[:3]
+
+
+def test_insert_commands_run_not_found(
+    subject: RunStore,
+    protocol_commands: List[pe_commands.Command],
+) -> None:
+    """It should raise if the run does not exist."""
+    with pytest.raises(RunNotFoundError, match="run-not-found"):
+        subject.insert_commands(
+            run_id="run-not-found", commands=protocol_commands, first_index_in_run=0
+        )
+
+
 def test_update_state_run_not_found(
     subject: RunStore,
     state_summary: StateSummary,
@@ -1041,3 +1123,49 @@ def test_get_all_commands_as_preserialized_list_no_fixit(
         '"key":"command-key","status":"succeeded","params":{"message":"hey world"},"result":{},"intent":"protocol"}',
         '{"id":"pause-3","createdAt":"2023-03-03T00:00:00","commandType":"waitForResume","key":"command-key","status":"succeeded","params":{"message":"sup world"},"result":{}}',
     ]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 100])
+def test_iter_commands_as_preserialized_chunks(
+    subject: RunStore,
+    protocol_commands: List[pe_commands.Command],
+    state_summary: StateSummary,
+    chunk_size: int,
+) -> None:
+    """It should yield the same commands as the list, split into bounded chunks."""
+    subject.insert(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    )
+    subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        commands=protocol_commands,
+        run_time_parameters=[],
+    )
+
+    for include_fixit_commands in (True, False):
+        chunks = list(
+            subject.iter_commands_as_preserialized_chunks(
+                run_id="run-id",
+                include_fixit_commands=include_fixit_commands,
+                chunk_size=chunk_size,
+            )
+        )
+        assert all(0 < len(chunk) <= chunk_size for chunk in chunks)
+        assert [
+            command for chunk in chunks for command in chunk
+        ] == subject.get_all_commands_as_preserialized_list(
+            run_id="run-id", include_fixit_commands=include_fixit_commands
+        )
+
+
+def test_iter_commands_as_preserialized_chunks_run_not_found(
+    subject: RunStore,
+) -> None:
+    """It should raise eagerly if the run does not exist."""
+    with pytest.raises(RunNotFoundError):
+        subject.iter_commands_as_preserialized_chunks(
+            run_id="run-not-found", include_fixit_commands=True
+        )
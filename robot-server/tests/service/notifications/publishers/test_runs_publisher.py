@@ -1,13 +1,15 @@
 """Tests for runs publisher."""
+import asyncio
 import pytest
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, Mock
+from unittest.mock import AsyncMock, MagicMock, Mock, call
 
 from opentrons.protocol_engine import CommandPointer, EngineStatus
 
 from robot_server.service.notifications import RunsPublisher, topics
 from robot_server.service.notifications.notification_client import NotificationClient
 from robot_server.service.notifications.publisher_notifier import PublisherNotifier
+from robot_server.service.notifications.refetch_coalescer import RefetchPublishCounts
 
 
 def make_command_pointer(command_id: str) -> CommandPointer:
@@ -36,9 +38,11 @@ def publisher_notifier() -> Mock:
 async def runs_publisher(
     notification_client: Mock, publisher_notifier: Mock
 ) -> RunsPublisher:
-    """Instantiate RunsPublisher."""
+    """Instantiate RunsPublisher, publishing refetches without delay."""
     return RunsPublisher(
-        client=notification_client, publisher_notifier=publisher_notifier
+        client=notification_client,
+        publisher_notifier=publisher_notifier,
+        refetch_flush_window_seconds=0,
     )
 
 
@@ -233,3 +237,48 @@ async def test_publish_pre_serialized_commannds_notif(
     notification_client.publish_advise_refetch.assert_any_call(
         topic=f"{topics.RUNS_PRE_SERIALIZED_COMMANDS}/1234"
     )
+
+
+async def test_coalesces_refetches_within_flush_window(
+    notification_client: Mock, publisher_notifier: Mock
+) -> None:
+    """It should publish each refetch topic once per flush window."""
+    subject = RunsPublisher(
+        client=notification_client,
+        publisher_notifier=publisher_notifier,
+        refetch_flush_window_seconds=0.01,
+    )
+    subject.start_publishing_for_run("1234", AsyncMock(), AsyncMock(), AsyncMock())
+    subject.publish_runs_advise_refetch(run_id="1234")
+    subject.publish_runs_advise_refetch(run_id="1234")
+
+    notification_client.publish_advise_refetch.assert_not_called()
+
+    await asyncio.sleep(0.05)
+
+    assert notification_client.publish_advise_refetch.call_count == 2
+    notification_client.publish_advise_refetch.assert_any_call(topic=topics.RUNS)
+    notification_client.publish_advise_refetch.assert_any_call(
+        topic=f"{topics.RUNS}/1234"
+    )
+    assert subject.refetch_counts == RefetchPublishCounts(sent=2, suppressed=4)
+
+
+async def test_clean_up_run_flushes_refetches_before_unsubscribing(
+    notification_client: Mock, publisher_notifier: Mock
+) -> None:
+    """It should not hold back a run's final refetch past its unsubscribe."""
+    subject = RunsPublisher(
+        client=notification_client,
+        publisher_notifier=publisher_notifier,
+        refetch_flush_window_seconds=60,
+    )
+    subject.start_publishing_for_run("1234", AsyncMock(), AsyncMock(), AsyncMock())
+
+    subject.clean_up_run(run_id="1234")
+
+    assert notification_client.mock_calls[:3] == [
+        call.publish_advise_refetch(topic=topics.RUNS),
+        call.publish_advise_refetch(topic=f"{topics.RUNS}/1234"),
+        call.publish_advise_unsubscribe(topic=f"{topics.RUNS}/1234"),
+    ]
@@ -0,0 +1,76 @@
+"""Tests for RefetchCoalescer."""
+import asyncio
+from unittest.mock import Mock, call
+
+import pytest
+
+from robot_server.service.notifications.notification_client import NotificationClient
+from robot_server.service.notifications.refetch_coalescer import (
+    RefetchCoalescer,
+    RefetchPublishCounts,
+)
+from robot_server.service.notifications.topics import TopicName
+
+
+@pytest.fixture
+def notification_client() -> Mock:
+    """Mocked notification client."""
+    return Mock(spec_set=NotificationClient)
+
+
+async def test_publishes_each_topic_once_per_window(
+    notification_client: Mock,
+) -> None:
+    """It should drop repeated topics and publish the rest in request order."""
+    subject = RefetchCoalescer(client=notification_client, flush_window_seconds=0.01)
+
+    subject.publish_advise_refetch(TopicName("b"))
+    subject.publish_advise_refetch(TopicName("a"))
+    subject.publish_advise_refetch(TopicName("b"))
+    notification_client.publish_advise_refetch.assert_not_called()
+
+    await asyncio.sleep(0.05)
+    assert notification_client.mock_calls == [
+        call.publish_advise_refetch(topic="b"),
+        call.publish_advise_refetch(topic="a"),
+    ]
+
+    subject.publish_advise_refetch(TopicName("b"))
+    await asyncio.sleep(0.05)
+    assert notification_client.mock_calls[-1] == call.publish_advise_refetch(topic="b")
+    assert subject.counts == RefetchPublishCounts(sent=3, suppressed=1)
+
+
+async def test_unsubscribe_flushes_pending_refetches(
+    notification_client: Mock,
+) -> None:
+    """It should publish pending refetches before an unsubscribe, and not again after."""
+    subject = RefetchCoalescer(client=notification_client, flush_window_seconds=0.01)
+
+    subject.publish_advise_refetch(TopicName("a"))
+    subject.publish_advise_unsubscribe(TopicName("a"))
+    await asyncio.sleep(0.05)
+
+    assert notification_client.mock_calls == [
+        call.publish_advise_refetch(topic="a"),
+        call.publish_advise_unsubscribe(topic="a"),
+    ]
+
+
+@pytest.mark.parametrize("flush_window_seconds", [0, 0.01])
+def test_publishes_immediately_without_window_or_event_loop(
+    notification_client: Mock, flush_window_seconds: float
+) -> None:
+    """It should not delay refetches if it has nothing to schedule a flush on."""
+    subject = RefetchCoalescer(
+        client=notification_client, flush_window_seconds=flush_window_seconds
+    )
+
+    subject.publish_advise_refetch(TopicName("a"))
+    subject.publish_advise_refetch(TopicName("a"))
+
+    assert notification_client.mock_calls == [
+        call.publish_advise_refetch(topic="a"),
+        call.publish_advise_refetch(topic="a"),
+    ]
+    assert subject.counts == RefetchPublishCounts(sent=2, suppressed=0)
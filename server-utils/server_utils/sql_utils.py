@@ -51,6 +51,14 @@ def fix_transactions(engine: sqlalchemy.engine.Engine) -> None:
     These misbehaviors can make transactions not actually behave transactionally. See:
     https://docs.sqlalchemy.org/en/14/dialects/sqlite.html#serializable-isolation-savepoints-transactional-ddl
 
+    Transactions start with a deferred `BEGIN`, which doesn't take the database's
+    write lock until the transaction first writes. Under write-ahead logging, a
+    deferred transaction that reads and then writes fails right away with
+    "database is locked" if another connection commits in between. To take the
+    write lock when the transaction starts instead, waiting for it if necessary,
+    set the `sqlite_begin_immediate=True` execution option on the engine or
+    connection.
+
     This should be called once per SQLAlchemy engine, shortly after creating it,
     before doing anything substantial with it.
 
@@ -73,4 +81,37 @@ def fix_transactions(engine: sqlalchemy.engine.Engine) -> None:
     @sqlalchemy.event.listens_for(engine, "begin")  # type: ignore[misc]
     def on_begin(conn: sqlalchemy.engine.Connection) -> None:
         # emit our own BEGIN
-        conn.exec_driver_sql("BEGIN")
+        if conn.get_execution_options().get("sqlite_begin_immediate", False):
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+        else:
+            conn.exec_driver_sql("BEGIN")
+
+
+def enable_write_ahead_logging(engine: sqlalchemy.engine.Engine) -> None:
+    """Switch SQLite to write-ahead logging, and tune it for that.
+
+    With write-ahead logging, reading the database doesn't block writing it and vice
+    versa, and a write transaction costs one sync to disk instead of several.
+    See https://www.sqlite.org/wal.html.
+
+    `synchronous` stays at `FULL`, so a transaction that has been committed survives
+    a power loss.
+
+    This should be called once per SQLAlchemy engine, shortly after creating it,
+    before doing anything substantial with it.
+
+    Params:
+        engine: A SQLAlchemy engine connected to a SQLite database file.
+    """
+
+    @sqlalchemy.event.listens_for(engine, "connect")  # type: ignore[misc]
+    def on_connect(
+        # TODO(mm, 2023-08-29): Improve these type annotations when we have SQLAlchemy 2.0.
+        dbapi_connection: Any,
+        connection_record: object,
+    ) -> None:
+        cursor = dbapi_connection.cursor()
+        # journal_mode is persisted in the database file, but synchronous is not.
+        cursor.execute("PRAGMA journal_mode=WAL;")
+        cursor.execute("PRAGMA synchronous=FULL;")
+        cursor.close()
@@ -115,3 +115,13 @@ def test_fix_transaction_fixes_transactional_ddl(
         c["name"] for c in sqlalchemy.inspect(scratch_engine).get_columns("table")
     ]
     assert column_names == expected_final_column_names
+
+
+def test_enable_write_ahead_logging(scratch_engine: sqlalchemy.engine.Engine) -> None:
+    """Test that `enable_write_ahead_logging()` configures every connection."""
+    sql_utils.enable_write_ahead_logging(scratch_engine)
+
+    with scratch_engine.connect() as connection:
+        assert connection.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+        # 2 means FULL.
+        assert connection.exec_driver_sql("PRAGMA synchronous").scalar() == 2
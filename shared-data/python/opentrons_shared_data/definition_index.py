@@ -0,0 +1,136 @@
+"""A single-file, memory-mapped index of bundled definition files.
+
+Packaged builds of this library bundle hundreds of small labware, pipette and
+module definition files. Opening and reading each one separately is slow on a
+robot's storage, so `setup.py` also packs them into one index file next to them.
+`load_shared_data()` reads definitions out of that file when it exists, and falls
+back to the individual files when it doesn't (like in a source checkout).
+
+The index file is laid out as:
+
+* `MAGIC`
+* The length of the table of contents, as a little-endian 32-bit unsigned integer
+* The table of contents: a JSON object mapping each definition's path, relative
+  to the shared data root, to the `[offset, length]` of its contents
+* The contents of every definition, back to back. Offsets count from here.
+"""
+import json
+import logging
+import mmap
+import struct
+from functools import lru_cache
+from pathlib import Path, PurePath
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+log = logging.getLogger(__name__)
+
+INDEX_FILE_NAME = "definitions.index"
+
+INDEXED_DIRECTORIES = (
+    "labware/definitions",
+    "module/definitions",
+    "pipette/definitions",
+)
+
+MAGIC = b"OTDEFIDX"
+
+_TOC_LENGTH = struct.Struct("<I")
+
+
+class DefinitionIndex:
+    """Definition file contents, looked up by their path in shared data.
+
+    The index is memory-mapped, so only the definitions that are actually
+    looked up are ever read.
+    """
+
+    def __init__(self, index_path: Path) -> None:
+        """Map an index file into memory and read its table of contents.
+
+        Raises:
+            OSError: The file can't be read.
+            ValueError: The file isn't a valid index.
+        """
+        with open(index_path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if self._mmap[: len(MAGIC)] != MAGIC:
+                raise ValueError(f"{index_path} is not a definition index.")
+            (toc_length,) = _TOC_LENGTH.unpack_from(self._mmap, len(MAGIC))
+            toc_start = len(MAGIC) + _TOC_LENGTH.size
+            self._data_start = toc_start + toc_length
+            self._toc: Dict[str, Tuple[int, int]] = {
+                path: (offset, length)
+                for path, (offset, length) in json.loads(
+                    self._mmap[toc_start : self._data_start]
+                ).items()
+            }
+            data_length = len(self._mmap) - self._data_start
+            if any(
+                offset + length > data_length for offset, length in self._toc.values()
+            ):
+                raise ValueError(f"{index_path} is truncated.")
+        except (struct.error, ValueError, TypeError):
+            self._mmap.close()
+            raise ValueError(f"{index_path} is not a valid definition index.")
+
+    def get(self, path: Union[str, PurePath]) -> Optional[bytes]:
+        """Get the contents of the definition at `path`, or None if it isn't indexed.
+
+        Args:
+            path: The definition's path, relative to the shared data root.
+        """
+        try:
+            offset, length = self._toc[PurePath(path).as_posix()]
+        except KeyError:
+            return None
+        start = self._data_start + offset
+        return self._mmap[start : start + length]
+
+
+def build_definition_index(
+    root: Path,
+    destination: Path,
+    directories: Iterable[str] = INDEXED_DIRECTORIES,
+) -> int:
+    """Pack every JSON file in some shared data directories into an index file.
+
+    Args:
+        root: The shared data root that the directories are relative to.
+        destination: Where to write the index.
+        directories: The directories to index, relative to `root`.
+
+    Returns:
+        The number of definitions in the index.
+    """
+    toc: Dict[str, Tuple[int, int]] = {}
+    contents = []
+    offset = 0
+    for directory in directories:
+        for path in sorted((root / directory).glob("**/*.json")):
+            data = path.read_bytes()
+            toc[path.relative_to(root).as_posix()] = (offset, len(data))
+            contents.append(data)
+            offset += len(data)
+
+    toc_bytes = json.dumps(toc, separators=(",", ":")).encode("utf-8")
+    with open(destination, "wb") as f:
+        f.write(MAGIC)
+        f.write(_TOC_LENGTH.pack(len(toc_bytes)))
+        f.write(toc_bytes)
+        for data in contents:
+            f.write(data)
+    return len(toc)
+
+
+@lru_cache(maxsize=1)
+def get_definition_index(root: Path) -> Optional[DefinitionIndex]:
+    """Get the index in a shared data root, or None if there isn't a usable one."""
+    index_path = root / INDEX_FILE_NAME
+    if not index_path.exists():
+        return None
+    try:
+        return DefinitionIndex(index_path)
+    except (OSError, ValueError):
+        log.warning(f"Ignoring unusable definition index {index_path}", exc_info=True)
+        return None
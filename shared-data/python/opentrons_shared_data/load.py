@@ -4,6 +4,8 @@ import os
 from pathlib import Path
 from functools import lru_cache
 
+from .definition_index import get_definition_index
+
 log = logging.getLogger(__name__)
 
 ENV_SHARED_DATA_PATH = "OT_SHARED_DATA_PATH"
@@ -53,5 +55,11 @@ def load_shared_data(path: typing.Union[str, Path]) -> bytes:
 
     path is relative to the root of all shared data (ie. no "shared-data")
     """
-    with open(get_shared_data_root() / path, "rb") as f:
+    root = get_shared_data_root()
+    index = get_definition_index(root)
+    if index is not None:
+        indexed = index.get(path)
+        if indexed is not None:
+            return indexed
+    with open(root / path, "rb") as f:
         return f.read()
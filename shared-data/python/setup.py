@@ -104,6 +104,23 @@ class BuildWithData(build_py.build_py):
         )
         return files
 
+    def run(self) -> None:
+        super().run()
+        # The package being built provides the index builder.
+        from opentrons_shared_data.definition_index import (
+            INDEX_FILE_NAME,
+            build_definition_index,
+        )
+
+        data_dir = Path(self.build_lib) / "opentrons_shared_data" / DEST_BASE_PATH
+        if not data_dir.is_dir():
+            return
+        self.execute(
+            build_definition_index,
+            args=(data_dir, data_dir / INDEX_FILE_NAME),
+            msg=f"indexing definitions in {data_dir}",
+        )
+
 
 def get_version():
     buildno = os.getenv("BUILD_NUMBER")
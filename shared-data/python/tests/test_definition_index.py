@@ -0,0 +1,99 @@
+import shutil
+from pathlib import Path
+from typing import Callable, Iterator
+
+import pytest
+
+from opentrons_shared_data import get_shared_data_root, load_shared_data
+from opentrons_shared_data.definition_index import (
+    INDEX_FILE_NAME,
+    DefinitionIndex,
+    build_definition_index,
+    get_definition_index,
+)
+
+_LABWARE_PATH = "labware/definitions/2/opentrons_96_tiprack_300ul/1.json"
+_MODULE_PATH = "module/definitions/3/temperatureModuleV2.json"
+
+
+@pytest.fixture
+def index_path(tmp_path: Path) -> Path:
+    path = tmp_path / INDEX_FILE_NAME
+    build_definition_index(get_shared_data_root(), path)
+    return path
+
+
+@pytest.fixture
+def use_shared_data_root(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Iterator[Callable[[Path], None]]:
+    def _use(root: Path) -> None:
+        monkeypatch.setenv("OT_SHARED_DATA_PATH", str(root))
+        get_shared_data_root.cache_clear()
+        get_definition_index.cache_clear()
+
+    yield _use
+    monkeypatch.undo()
+    get_shared_data_root.cache_clear()
+    get_definition_index.cache_clear()
+
+
+def test_get_indexed_definitions(index_path: Path) -> None:
+    subject = DefinitionIndex(index_path)
+    root = get_shared_data_root()
+
+    for path in (_LABWARE_PATH, _MODULE_PATH):
+        assert subject.get(path) == (root / path).read_bytes()
+    assert subject.get(Path(_LABWARE_PATH)) == (root / _LABWARE_PATH).read_bytes()
+
+
+def test_get_unindexed_definition(index_path: Path) -> None:
+    subject = DefinitionIndex(index_path)
+
+    assert subject.get("labware/definitions/2/not_a_labware/1.json") is None
+    assert subject.get("labware/schemas/2.json") is None
+
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [
+        lambda data: b"NOTANIDX" + data[8:],
+        lambda data: data[:-1],
+        lambda data: data[:10],
+    ],
+)
+def test_rejects_invalid_index(
+    index_path: Path, corrupt: Callable[[bytes], bytes]
+) -> None:
+    index_path.write_bytes(corrupt(index_path.read_bytes()))
+
+    with pytest.raises(ValueError):
+        DefinitionIndex(index_path)
+
+
+def test_load_shared_data_uses_index(
+    tmp_path: Path, use_shared_data_root: Callable[[Path], None]
+) -> None:
+    root = tmp_path / "data"
+    shutil.copytree(
+        get_shared_data_root() / "labware/definitions", root / "labware/definitions"
+    )
+    build_definition_index(root, root / INDEX_FILE_NAME)
+    (root / _LABWARE_PATH).write_text("not what the index has")
+    use_shared_data_root(root)
+
+    assert load_shared_data(_LABWARE_PATH) != b"not what the index has"
+    (root / "unindexed.json").write_text("{}")
+    assert load_shared_data("unindexed.json") == b"{}"
+    with pytest.raises(FileNotFoundError):
+        load_shared_data("labware/definitions/2/not_a_labware/1.json")
+
+
+def test_load_shared_data_ignores_invalid_index(
+    tmp_path: Path, use_shared_data_root: Callable[[Path], None]
+) -> None:
+    (tmp_path / INDEX_FILE_NAME).write_bytes(b"garbage")
+    (tmp_path / "file.json").write_text("{}")
+    use_shared_data_root(tmp_path)
+
+    assert load_shared_data("file.json") == b"{}"
@@ -0,0 +1,142 @@
+"""Time validating and writing a system update, end to end.
+
+This builds a fake system update zip with a rootfs image of the requested
+size, then runs it through the same validation and partition write that a
+real update goes through. A plain file stands in for the inactive partition,
+so put ``--work-dir`` on the storage you want to measure, like a robot's
+eMMC.
+
+Run from the update-server directory:
+`pipenv run python benchmark_update.py --size-mib 256 --robot ot2`
+"""
+
+import argparse
+import binascii
+import hashlib
+import json
+import lzma
+import os
+import tempfile
+import time
+import zipfile
+from typing import Dict
+from unittest import mock
+
+from otupdate.buildroot import update_actions as ot2_update_actions
+from otupdate.common.constants import MODEL_OT2, MODEL_OT3
+from otupdate.common.update_actions import Partition
+from otupdate.openembedded import update_actions as ot3_update_actions
+
+
+def _make_rootfs(path: str, size: int, compress: bool) -> str:
+    """Write a rootfs image that is half random and half zeros, like a real one.
+
+    Return the hash of the file, as it would be packaged with the update.
+    """
+    chunk_size = 1024 * 1024
+    with (lzma.open(path, "wb") if compress else open(path, "wb")) as rootfs:
+        written = 0
+        while written < size:
+            chunk_length = min(chunk_size, size - written)
+            half = chunk_length // 2
+            rootfs.write(os.urandom(half) + bytes(chunk_length - half))
+            written += chunk_length
+    hasher = hashlib.sha256()
+    with open(path, "rb") as rootfs:
+        for chunk in iter(lambda: rootfs.read(chunk_size), b""):
+            hasher.update(chunk)
+    return binascii.hexlify(hasher.digest()).decode()
+
+
+def _make_update(work_dir: str, size: int, robot: str) -> str:
+    if robot == "ot2":
+        rootfs_name = ot2_update_actions.ROOTFS_NAME
+        hash_name = ot2_update_actions.ROOTFS_HASH_NAME
+        zip_name = ot2_update_actions.UPDATE_PKG_BR[0]
+        robot_type = MODEL_OT2
+    else:
+        rootfs_name = ot3_update_actions.ROOTFS_NAME
+        hash_name = ot3_update_actions.ROOTFS_HASH_NAME
+        zip_name = ot3_update_actions.UPDATE_PKG_OE[0]
+        robot_type = MODEL_OT3
+    source_dir = os.path.join(work_dir, "source")
+    os.mkdir(source_dir)
+    rootfs_path = os.path.join(source_dir, rootfs_name)
+    rootfs_hash = _make_rootfs(rootfs_path, size, compress=robot == "ot3")
+    update_path = os.path.join(work_dir, "download", zip_name)
+    os.mkdir(os.path.dirname(update_path))
+    with zipfile.ZipFile(update_path, "w") as update:
+        update.write(rootfs_path, rootfs_name)
+        update.writestr(hash_name, rootfs_hash)
+        update.writestr(
+            ot2_update_actions.UPDATE_PKG_VERSION_FILE,
+            json.dumps({"robot_type": robot_type}),
+        )
+    os.unlink(rootfs_path)
+    return update_path
+
+
+def _run_update(update_path: str, partition_path: str, robot: str) -> Dict[str, float]:
+    progress_calls = 0
+
+    def progress_callback(progress: float) -> None:
+        nonlocal progress_calls
+        progress_calls += 1
+
+    start = time.perf_counter()
+    if robot == "ot2":
+        ot2_actions = ot2_update_actions.OT2UpdateActions()
+        rootfs = ot2_actions.validate_update(update_path, progress_callback, None)
+        assert rootfs
+        validated = time.perf_counter()
+        ot2_update_actions.write_file(rootfs, partition_path, progress_callback)
+    else:
+        rootfs = ot3_update_actions.OT3UpdateActions(
+            root_FS_intf=ot3_update_actions.RootFSInterface(),
+            part_mngr=ot3_update_actions.PartitionManager(),
+        ).validate_update(update_path, progress_callback, None)
+        assert rootfs
+        validated = time.perf_counter()
+        # The partition is a plain file here, so don't ask blockdev for its size.
+        with mock.patch.object(
+            ot3_update_actions.PartitionManager,
+            "get_partition_size",
+            return_value=1 << 40,
+        ):
+            success, msg = ot3_update_actions.RootFSInterface().write_update(
+                rootfs, Partition(2, partition_path), progress_callback
+            )
+        assert success, msg
+    written = time.perf_counter()
+    return {
+        "validate": validated - start,
+        "write": written - validated,
+        "total": written - start,
+        "progress calls": progress_calls,
+    }
+
+
+def main() -> None:  # noqa: D103
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mib", type=int, default=256)
+    parser.add_argument("--robot", choices=["ot2", "ot3"], default="ot2")
+    parser.add_argument(
+        "--work-dir", help="where to put the update and the stand-in partition"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.work_dir) as work_dir:
+        size = args.size_mib * 1024 * 1024
+        update_path = _make_update(work_dir, size, args.robot)
+        result = _run_update(
+            update_path, os.path.join(work_dir, "partition"), args.robot
+        )
+    for name, value in result.items():
+        if name == "progress calls":
+            print(f"{name:>14}: {value:8.0f}")
+        else:
+            print(f"{name:>14}: {value:8.2f} s ({args.size_mib / value:7.1f} MiB/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,12 +17,13 @@ from typing import Callable, Generator, Optional
 from otupdate.common.constants import MODEL_OT2
 
 from otupdate.common.file_actions import (
+    CHUNK_SIZE,
     InvalidPKGName,
     InvalidRobotType,
     load_version_file,
-    unzip_update,
-    hash_file,
+    unzip_and_hash_update,
     HashMismatch,
+    ThrottledProgress,
     verify_signature,
 )
 from otupdate.common.update_actions import UpdateActionsInterface, Partition
@@ -50,8 +51,8 @@ class OT2UpdateActions(UpdateActionsInterface):
     ) -> Optional[str]:
         """Worker for validation. Call in an executor (so it can return things)
 
-        - Unzips filepath to its directory
-        - Hashes the rootfs inside
+        - Unzips filepath to its directory, hashing the rootfs inside as it
+          goes
         - If requested, checks the signature of the hash
         :param filepath: The path to the update zip file
         :param progress_callback: The function to call with progress between 0
@@ -72,16 +73,12 @@ class OT2UpdateActions(UpdateActionsInterface):
             LOG.error(msg)
             raise InvalidPKGName(msg)
 
-        def zip_callback(progress):
-            progress_callback(progress / 2.0)
-
         required = [ROOTFS_NAME, ROOTFS_HASH_NAME]
         if cert_path:
             required.append(ROOTFS_SIG_NAME)
-        files, sizes = unzip_update(filepath, zip_callback, UPDATE_FILES, required)
-
-        def hash_callback(progress):
-            progress_callback(progress / 2.0 + 0.5)
+        files, _, hashes = unzip_and_hash_update(
+            filepath, progress_callback, UPDATE_FILES, required, [ROOTFS_NAME]
+        )
 
         version_file = str(files.get("VERSION.json"))
         version_dict = load_version_file(version_file)
@@ -93,7 +90,7 @@ class OT2UpdateActions(UpdateActionsInterface):
 
         rootfs = files.get(ROOTFS_NAME)
         assert rootfs
-        rootfs_hash = hash_file(rootfs, hash_callback, file_size=sizes[ROOTFS_NAME])
+        rootfs_hash = hashes[ROOTFS_NAME]
         hashfile = files.get(ROOTFS_HASH_NAME)
         assert hashfile
         packaged_hash = open(hashfile, "rb").read().strip()
@@ -116,7 +113,7 @@ class OT2UpdateActions(UpdateActionsInterface):
         self,
         rootfs_filepath: str,
         progress_callback: Callable[[float], None],
-        chunk_size: int = 1024,
+        chunk_size: int = CHUNK_SIZE,
         file_size: Optional[int] = None,
     ) -> Partition:
         """
@@ -129,8 +126,7 @@ class OT2UpdateActions(UpdateActionsInterface):
         :param progress_callback: A callback to call periodically with progress
                                   between 0 and 1.0. May never reach precisely
                                   1.0, best only for user information.
-        :param chunk_size: The size of file chunks to copy in between progress
-                           notifications
+        :param chunk_size: The size of file chunks to copy at a time
         :param file_size: The total size of the update file (for generating
                           progress percentage). If ``None``, generated with
                           ``seek``/``tell``.
@@ -201,7 +197,7 @@ def write_file(
     infile: str,
     outfile: str,
     progress_callback: Callable[[float], None],
-    chunk_size: int = 1024,
+    chunk_size: int = CHUNK_SIZE,
     file_size: Optional[int] = None,
 ) -> None:
     """Write a file to another file with progress callbacks.
@@ -209,13 +205,13 @@ def write_file(
     :param infile: The input filepath
     :param outfile: The output filepath
     :param progress_callback: The callback to call for progress
-    :param chunk_size: The size of file chunks to copy in between progress
-                       notifications
+    :param chunk_size: The size of file chunks to copy at a time
     :param file_size: The total size of the update file (for generating
                       progress percentage). If ``None``, generated with
                       ``seek``/``tell``.
     """
     total_written = 0
+    throttled_callback = ThrottledProgress(progress_callback)
     with open(infile, "rb") as img, open(outfile, "wb") as part:
         if None is file_size:
             file_size = img.seek(0, 2)
@@ -229,7 +225,7 @@ def write_file(
             chunk = img.read(chunk_size)
             part.write(chunk)
             total_written += len(chunk)
-            progress_callback(total_written / file_size)
+            throttled_callback(total_written / file_size)
             if len(chunk) != chunk_size:
                 break
 
@@ -76,12 +76,45 @@ class InvalidRobotType(ValueError):
         return self.message
 
 
+# The size of the chunks that update files are read and written in. Large
+# chunks keep the per-chunk overhead of hashing, copying and progress reporting
+# small compared to the time spent on the data itself.
+CHUNK_SIZE = 1024 * 1024
+
+# The smallest change in progress, between 0 and 1, worth reporting.
+PROGRESS_STEP = 0.01
+
+
+class ThrottledProgress:
+    """Wrap a progress callback so that it is only called for real changes.
+
+    Progress is only passed on when it has advanced by at least ``step``
+    since it was last passed on, or when it reaches 1.0.
+    """
+
+    def __init__(
+        self, progress_callback: Callable[[float], None], step: float = PROGRESS_STEP
+    ) -> None:
+        self._progress_callback = progress_callback
+        self._step = step
+        self._last_reported: Optional[float] = None
+
+    def __call__(self, progress: float) -> None:
+        if (
+            self._last_reported is None
+            or progress - self._last_reported >= self._step
+            or (progress >= 1.0 and self._last_reported < 1.0)
+        ):
+            self._last_reported = progress
+            self._progress_callback(progress)
+
+
 def unzip_update(
     filepath: str,
     progress_callback: Callable[[float], None],
     acceptable_files: Sequence[str],
     mandatory_files: Sequence[str],
-    chunk_size: int = 1024,
+    chunk_size: int = CHUNK_SIZE,
 ) -> Tuple[Mapping[str, Optional[str]], Mapping[str, int]]:
     """Unzip an update file
 
@@ -113,48 +146,76 @@ def unzip_update(
                             not in the zip. Should probably be a subset of
                             ``acceptable_files``.
     :param chunk_size: If specified, the size of the chunk to read and write.
-                       If not specified, will default to 1024
+                       If not specified, will default to ``CHUNK_SIZE``
     :return: Two dictionaries, the first mapping file names to paths and the
              second mapping file names to sizes
 
+    :raises FileMissing: If a mandatory file is missing
+    """
+    file_paths, file_sizes, _ = unzip_and_hash_update(
+        filepath,
+        progress_callback,
+        acceptable_files,
+        mandatory_files,
+        hash_files=[],
+        chunk_size=chunk_size,
+    )
+    return file_paths, file_sizes
+
+
+def unzip_and_hash_update(
+    filepath: str,
+    progress_callback: Callable[[float], None],
+    acceptable_files: Sequence[str],
+    mandatory_files: Sequence[str],
+    hash_files: Sequence[str],
+    chunk_size: int = CHUNK_SIZE,
+    algo: str = "sha256",
+) -> Tuple[Mapping[str, Optional[str]], Mapping[str, int], Mapping[str, bytes]]:
+    """Unzip an update file, hashing some of its files as they're unzipped.
+
+    This works like :py:meth:`unzip_update`, but it also hashes each file in
+    ``hash_files`` from the same chunks that it writes, so that they don't
+    have to be read back to be hashed, like with :py:meth:`hash_file`.
+
+    :param hash_files: The files to hash, if found. Should be a subset of
+                       ``acceptable_files``.
+    :param algo: The algorithm to hash with. Can be anything used by
+                 :py:mod:`hashlib`
+    :return: Three dictionaries, the first mapping file names to paths, the
+             second mapping file names to sizes, and the third mapping the
+             names of the hashed files to their hashes as ascii hex
+
     :raises FileMissing: If a mandatory file is missing
     """
     assert chunk_size
-    total_size = 0
     written_size = 0
-    to_unzip: List[zipfile.ZipInfo] = []
     file_paths: Dict[str, Optional[str]] = {fn: None for fn in acceptable_files}
     file_sizes: Dict[str, int] = {fn: 0 for fn in acceptable_files}
+    file_hashes: Dict[str, bytes] = {}
+    throttled_callback = ThrottledProgress(progress_callback)
     LOG.info(f"Unzipping {filepath}")
     with zipfile.ZipFile(filepath, "r") as zf:
-        files = zf.infolist()
-        remaining_filenames = [fn for fn in acceptable_files]
-        for fi in files:
-            if fi.filename in acceptable_files:
-                to_unzip.append(fi)
-                total_size += fi.file_size
-                remaining_filenames.remove(fi.filename)
-                LOG.debug(f"Found {fi.filename} ({fi.file_size}B)")
-            else:
-                LOG.debug(f"Ignoring {fi.filename}")
-
-        for name in remaining_filenames:
-            if name in mandatory_files:
-                raise FileMissing(f"File {name} missing from zip")
-
+        to_unzip = _find_files_to_unzip(zf, acceptable_files, mandatory_files)
+        total_size = sum(fi.file_size for fi in to_unzip)
         for fi in to_unzip:
             uncomp_path = os.path.join(os.path.dirname(filepath), fi.filename)
+            hasher = hashlib.new(algo) if fi.filename in hash_files else None
             with zf.open(fi) as zipped, open(uncomp_path, "wb") as unzipped:
                 LOG.debug(f"Beginning unzip of {fi.filename} to {uncomp_path}")
                 while True:
                     chunk = zipped.read(chunk_size)
                     unzipped.write(chunk)
+                    if hasher:
+                        hasher.update(chunk)
                     written_size += len(chunk)
-                    progress_callback(written_size / total_size)
+                    throttled_callback(written_size / total_size)
                     if len(chunk) != chunk_size:
                         break
                 file_paths[fi.filename] = uncomp_path
                 file_sizes[fi.filename] = fi.file_size
+                if hasher:
+                    file_hashes[fi.filename] = binascii.hexlify(hasher.digest())
                 LOG.debug(f"Unzipped {fi.filename} to {uncomp_path}")
     LOG.info(
         f"Unzipped {filepath}, results: \n\t"
@@ -162,13 +223,34 @@ def unzip_update(
             [f"{k}: {file_paths[k]} ({file_sizes[k]}B)" for k in file_paths.keys()]
         )
     )
-    return file_paths, file_sizes
+    return file_paths, file_sizes, file_hashes
+
+
+def _find_files_to_unzip(
+    zf: zipfile.ZipFile,
+    acceptable_files: Sequence[str],
+    mandatory_files: Sequence[str],
+) -> List[zipfile.ZipInfo]:
+    to_unzip: List[zipfile.ZipInfo] = []
+    remaining_filenames = [fn for fn in acceptable_files]
+    for fi in zf.infolist():
+        if fi.filename in acceptable_files:
+            to_unzip.append(fi)
+            remaining_filenames.remove(fi.filename)
+            LOG.debug(f"Found {fi.filename} ({fi.file_size}B)")
+        else:
+            LOG.debug(f"Ignoring {fi.filename}")
+
+    for name in remaining_filenames:
+        if name in mandatory_files:
+            raise FileMissing(f"File {name} missing from zip")
+    return to_unzip
 
 
 def hash_file(
     path: str,
     progress_callback: Callable[[float], None],
-    chunk_size: int = 1024,
+    chunk_size: int = CHUNK_SIZE,
     file_size: Optional[int] = None,
     algo: str = "sha256",
 ) -> bytes:
@@ -179,7 +261,7 @@ def hash_file(
     :param progress_callback: The callback to call with progress between 0 and
                               1. May not ever be precisely 1.0.
     :param chunk_size: If specified, the size of the chunks to hash in one call
-                       If not specified, defaults to 1024
+                       If not specified, defaults to ``CHUNK_SIZE``
     :param file_size: If specified, the size of the file to hash (used for
                       progress callback generation). If not specified,
                       calculated internally.
@@ -190,7 +272,8 @@ def hash_file(
     hasher = hashlib.new(algo)
     have_read = 0
     if not chunk_size:
-        chunk_size = 1024
+        chunk_size = CHUNK_SIZE
+    throttled_callback = ThrottledProgress(progress_callback)
     with open(path, "rb") as to_hash:
         if not file_size:
             file_size = to_hash.seek(0, 2)
@@ -199,7 +282,7 @@ def hash_file(
             chunk = to_hash.read(chunk_size)
             hasher.update(chunk)
             have_read += len(chunk)
-            progress_callback(have_read / file_size)
+            throttled_callback(have_read / file_size)
             if len(chunk) != chunk_size:
                 break
     return binascii.hexlify(hasher.digest())
@@ -2,20 +2,22 @@
 import os
 import contextlib
 import lzma
+import struct
 import tempfile
 
 from otupdate.common.constants import MODEL_OT3
 from otupdate.common.file_actions import (
+    CHUNK_SIZE,
     InvalidRobotType,
-    unzip_update,
-    hash_file,
+    unzip_and_hash_update,
     HashMismatch,
     InvalidPKGName,
+    ThrottledProgress,
     verify_signature,
     load_version_file,
 )
 from otupdate.common.update_actions import UpdateActionsInterface, Partition
-from typing import Any, Callable, Generator, Optional, Tuple
+from typing import BinaryIO, Callable, Generator, List, Optional, Tuple
 import enum
 import subprocess
 
@@ -110,20 +112,24 @@ class RootFSInterface:
         rootfs_filepath: str,
         part: Partition,
         progress_callback: Callable[[float], None],
-        chunk_size: int = 1024,
+        chunk_size: int = CHUNK_SIZE,
     ) -> Tuple[bool, str]:
         total_size = 0
         written_size = 0
+        throttled_callback = ThrottledProgress(progress_callback)
         try:
-            # the double pass here is
-            # temporary until we have
-            # xz size decoding working
-            with lzma.open(rootfs_filepath, "rb") as fsrc:
-                while True:
-                    chunk = fsrc.read(chunk_size)
-                    total_size += len(chunk)
-                    if len(chunk) != chunk_size:
-                        break
+            maybe_total_size = get_xz_uncompressed_size(rootfs_filepath)
+            if maybe_total_size is not None:
+                total_size = maybe_total_size
+            else:
+                # This file's size isn't recorded where we can find it,
+                # so take an extra pass to count it.
+                with lzma.open(rootfs_filepath, "rb") as fsrc:
+                    while True:
+                        chunk = fsrc.read(chunk_size)
+                        total_size += len(chunk)
+                        if len(chunk) != chunk_size:
+                            break
 
             # check that the uncompressed size is greater than the partition size
             partition_size = PartitionManager.get_partition_size(part.path)
@@ -138,8 +144,8 @@ class RootFSInterface:
                 while True:
                     chunk = fsrc.read(chunk_size)
                     fdst.write(chunk)
-                    written_size += chunk_size
-                    progress_callback(written_size / total_size)
+                    written_size += len(chunk)
+                    throttled_callback(written_size / total_size)
                     if len(chunk) != chunk_size:
                         break
             return True, ""
@@ -148,6 +154,77 @@ class RootFSInterface:
             return False, "Unknown error"
 
 
+_XZ_HEADER_MAGIC = b"\xfd7zXZ\x00"
+_XZ_FOOTER_MAGIC = b"YZ"
+_XZ_HEADER_SIZE = 12
+_XZ_FOOTER_SIZE = 12
+
+
+def _read_xz_multibyte(data: bytes, offset: int) -> Tuple[int, int]:
+    """Read an xz variable-length integer. Return it, and the offset after it."""
+    value = 0
+    for i in range(9):
+        byte = data[offset + i]
+        value |= (byte & 0x7F) << (7 * i)
+        if not byte & 0x80:
+            return value, offset + i + 1
+    raise ValueError("xz integer is too long")
+
+
+def _read_xz_index(fsrc: BinaryIO, file_size: int) -> Tuple[int, List[Tuple[int, int]]]:
+    """Read the index at the end of an xz file.
+
+    Return the size of the index, and the (unpadded size, uncompressed size)
+    of each block that it lists.
+    """
+    fsrc.seek(file_size - _XZ_FOOTER_SIZE)
+    footer = fsrc.read(_XZ_FOOTER_SIZE)
+    if len(footer) != _XZ_FOOTER_SIZE or footer[10:] != _XZ_FOOTER_MAGIC:
+        raise ValueError("no xz stream footer")
+    index_size = (struct.unpack("<I", footer[4:8])[0] + 1) * 4
+    fsrc.seek(file_size - _XZ_FOOTER_SIZE - index_size)
+    index = fsrc.read(index_size)
+    if len(index) != index_size or index[0] != 0:
+        raise ValueError("no xz index")
+    record_count, offset = _read_xz_multibyte(index, 1)
+    records = []
+    for _ in range(record_count):
+        unpadded_size, offset = _read_xz_multibyte(index, offset)
+        uncompressed_size, offset = _read_xz_multibyte(index, offset)
+        records.append((unpadded_size, uncompressed_size))
+    return index_size, records
+
+
+def get_xz_uncompressed_size(path: str) -> Optional[int]:
+    """Get the size of the data in an xz file without decompressing it.
+
+    The size is read from the index at the end of the file. This only works
+    for files with a single xz stream, which is what ``xz`` writes; for anything
+    else, it returns ``None``.
+    """
+    try:
+        with open(path, "rb") as fsrc:
+            header = fsrc.read(_XZ_HEADER_SIZE)
+            file_size = fsrc.seek(0, os.SEEK_END)
+            if not header.startswith(_XZ_HEADER_MAGIC):
+                return None
+            index_size, records = _read_xz_index(fsrc, file_size)
+    except (OSError, ValueError, IndexError, struct.error):
+        LOG.exception(f"Could not read xz index of {path}")
+        return None
+    # Make sure that the blocks in the index account for the whole file, so
+    # there's no other stream that it leaves out.
+    stream_size = (
+        _XZ_HEADER_SIZE
+        + sum((unpadded_size + 3) // 4 * 4 for unpadded_size, _ in records)
+        + index_size
+        + _XZ_FOOTER_SIZE
+    )
+    if stream_size != file_size:
+        return None
+    return sum(uncompressed_size for _, uncompressed_size in records)
+
+
 class OT3UpdateActions(UpdateActionsInterface):
     """OE updater class."""
 
@@ -163,8 +240,8 @@ class OT3UpdateActions(UpdateActionsInterface):
     ) -> Optional[str]:
         """Worker for validation. Call in an executor (so it can return things)
 
-        - Unzips filepath to its directory
-        - Hashes the rootfs inside
+        - Unzips filepath to its directory, hashing the rootfs inside as it
+          goes
         - If requested, checks the signature of the hash
         :param filepath: The path to the update zip file
         :param progress_callback: The function to call with progress between 0
@@ -185,16 +262,12 @@ class OT3UpdateActions(UpdateActionsInterface):
             LOG.error(msg)
             raise InvalidPKGName(msg)
 
-        def zip_callback(progress: Any) -> None:
-            progress_callback(progress / 2.0)
-
         required = [ROOTFS_NAME, ROOTFS_HASH_NAME]
         if cert_path:
             required.append(ROOTFS_SIG_NAME)
-        files, sizes = unzip_update(filepath, zip_callback, UPDATE_FILES, required)
-
-        def hash_callback(progress: Any) -> None:
-            progress_callback(progress / 2.0 + 0.5)
+        files, _, hashes = unzip_and_hash_update(
+            filepath, progress_callback, UPDATE_FILES, required, [ROOTFS_NAME]
+        )
 
         version_file = str(files.get("VERSION.json"))
         version_dict = load_version_file(version_file)
@@ -206,7 +279,7 @@ class OT3UpdateActions(UpdateActionsInterface):
 
         rootfs = files.get(ROOTFS_NAME)
         assert rootfs
-        rootfs_hash = hash_file(rootfs, hash_callback, file_size=sizes[ROOTFS_NAME])
+        rootfs_hash = hashes[ROOTFS_NAME]
         hashfile = files.get(ROOTFS_HASH_NAME)
         assert hashfile
         packaged_hash = b""
@@ -34,9 +34,9 @@ def test_validate_hash_only(downloaded_update_file):
     # only adding 1 extra call because we don’t have a signature file
     calls = rootfs_calls + 1
 
-    # - the hashes, one for each chunk, the same chunks as unzip
-    calls += rootfs_calls
-    assert cb.call_count == calls
+    # - no separate hashing pass, since the rootfs is hashed as it's unzipped
+    assert cb.call_count <= calls
+    assert cb.call_args_list[-1].args[0] == 1.0
 
 
 def test_validate(downloaded_update_file, testing_cert):
@@ -57,9 +57,9 @@ def test_validate(downloaded_update_file, testing_cert):
             rootfs_calls += 1
     calls = rootfs_calls + 2
 
-    # - the hashes, one for each chunk, the same chunks as unzip
-    calls += rootfs_calls
-    assert cb.call_count == calls
+    # - no separate hashing pass, since the rootfs is hashed as it's unzipped
+    assert cb.call_count <= calls
+    assert cb.call_args_list[-1].args[0] == 1.0
 
 
 @pytest.mark.bad_hash
@@ -134,7 +134,8 @@ def test_write_update(extracted_update_file, testing_partition):
     if call_count * 1024 != filesize:
         call_count += 1
 
-    assert cb.call_count == call_count
+    assert cb.call_count <= call_count
+    assert cb.call_args_list[-1].args[0] == 1.0
 
     hasher = hashlib.sha256()
     hasher.update(open(testing_partition, "rb").read())
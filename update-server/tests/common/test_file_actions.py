@@ -29,7 +29,33 @@ def test_unzip(downloaded_update_file):
         calls += 1
     # - the two files that are less than a chunk
     calls += 2
-    assert cb.call_count == calls
+    assert cb.call_count <= calls
+    progress = [call.args[0] for call in cb.call_args_list]
+    assert progress == sorted(progress)
+    assert progress[-1] == 1.0
+
+
+def test_unzip_and_hash(extracted_update_file, downloaded_update_file):
+    cb = mock.Mock()
+    paths, sizes, hashes = file_actions.unzip_and_hash_update(
+        downloaded_update_file, cb, UPDATE_FILES, UPDATE_FILES, ["rootfs.ext4"]
+    )
+    assert list(hashes.keys()) == ["rootfs.ext4"]
+    assert hashes["rootfs.ext4"] == file_actions.hash_file(
+        paths["rootfs.ext4"], mock.Mock()
+    )
+    assert hashes["rootfs.ext4"] == open(paths["rootfs.ext4.hash"], "rb").read()
+
+
+def test_throttled_progress():
+    cb = mock.Mock()
+    throttled = file_actions.ThrottledProgress(cb, step=0.1)
+    for i in range(1001):
+        throttled(i / 1000)
+    progress = [call.args[0] for call in cb.call_args_list]
+    assert progress[0] == 0
+    assert progress[-1] == 1.0
+    assert len(progress) == 11
 
 
 @pytest.mark.exclude_rootfs_ext4
@@ -10,6 +10,7 @@ from otupdate.openembedded.update_actions import (
     OT3UpdateActions,
     PartitionManager,
     RootFSInterface,
+    get_xz_uncompressed_size,
 )
 
 import lzma
@@ -117,19 +118,14 @@ def test_lzma(testing_partition, tmpdir):
     the entire file decompresses correctly.
     """
     rfs_path = os.path.join(tmpdir, "rootfs.xz")
+    rootfs_contents = os.urandom(400000)
     with lzma.open(rfs_path, "w") as f:
-        f.write(os.urandom(400000))
+        f.write(rootfs_contents)
     cb = mock.Mock()
     root_FS_intf = RootFSInterface()
     p = Partition(2, testing_partition, "/media/mmcblk0p2")
-    total_size = 0
+    total_size = len(rootfs_contents)
     chunk_size = 1024 * 32
-    with lzma.open(rfs_path, "rb") as fsrc:
-        while True:
-            chunk = fsrc.read(chunk_size)
-            total_size += len(chunk)
-            if len(chunk) != chunk_size:
-                break
     with mock.patch(
         "otupdate.openembedded.update_actions.PartitionManager.get_partition_size",
         mock.Mock(return_value=99999999),
@@ -139,9 +135,28 @@ def test_lzma(testing_partition, tmpdir):
             calls = int(total_size / chunk_size) + 1
         else:
             calls = total_size / chunk_size
-        assert cb.call_count == calls
+        assert cb.call_count <= calls
+        assert cb.call_args_list[-1].args[0] == 1.0
         assert success
         assert msg == ""
+    with open(testing_partition, "rb") as partition:
+        assert partition.read() == rootfs_contents
+
+
+@pytest.mark.parametrize("size", [0, 400000])
+def test_get_xz_uncompressed_size(tmpdir, size):
+    """It should read the uncompressed size from the xz index."""
+    rfs_path = os.path.join(tmpdir, "rootfs.xz")
+    with lzma.open(rfs_path, "w") as f:
+        f.write(os.urandom(size))
+    assert get_xz_uncompressed_size(rfs_path) == size
+
+    # It can't tell the size of a file with several streams from its last index.
+    with open(rfs_path, "rb") as f:
+        contents = f.read()
+    with open(rfs_path, "wb") as f:
+        f.write(contents * 2)
+    assert get_xz_uncompressed_size(rfs_path) is None
 
 
 def test_decomp_and_write_raises_runtime_error(